@@ -7,7 +7,7 @@ TimeCardInputData를 입력받아 정규, 연장, 야간, 휴일 근무시간 
 
 import logging
 import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from decimal import Decimal, ROUND_HALF_UP
 
 from .schema import (
@@ -20,6 +20,8 @@ from .schema import (
     WorkDayDetail
 )
 from .processor import BaseCalculator
+from .period_boundary import PeriodBoundarySplitter, PeriodCarryStore
+from .period_calendar import get_period_bounds, get_next_period
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -30,17 +32,28 @@ class TimeCardBasedCalculator(BaseCalculator):
     TimeCardInputData를 입력받아 정규, 연장, 야간, 휴일 근무시간 등을 계산합니다.
     """
 
-    def __init__(self, settings: Dict[str, Any]):
+    def __init__(self, settings: Dict[str, Any], stage_cache: Optional[Any] = None):
         """
         TimeCardBasedCalculator 초기화.
 
         Args:
             settings: 회사별 및 모듈 운영 설정을 담은 딕셔너리.
+            stage_cache: 정책 조합 간 일별/주별 중간 결과를 공유하는 PolicyStageCache (선택 사항)
         """
         super().__init__(settings)
+        self.stage_cache = stage_cache
+        self._stage_holiday_cache: Dict[datetime.date, bool] = {}
         self.company_settings = settings.get("company_settings", {})
         self.minimum_wages_config = settings.get("minimum_wages_config", {})
         self.holidays_config = settings.get("holidays_config", {})
+        # 기간 경계 분할 (period_carry_dir 설정 시 말일 자정 이후 근무를 다음 기간으로 이월)
+        carry_dir = settings.get("period_carry_dir")
+        self.carry_store = PeriodCarryStore(carry_dir) if carry_dir else None
+        self.boundary_splitter = PeriodBoundarySplitter(
+            self.company_settings.get("daily_work_minutes_standard", 480),
+            night_shift_start_time=self.company_settings.get("night_shift_start_time", "22:00"),
+            night_shift_end_time=self.company_settings.get("night_shift_end_time", "06:00")
+        )
         logger.info("TimeCardBasedCalculator initialized.")
 
     def _parse_time(self, time_str: str) -> datetime.time:
@@ -247,6 +260,142 @@ class TimeCardBasedCalculator(BaseCalculator):
         Args:
             input_data: 타임카드 입력 데이터
 
+        Returns:
+            Dict[str, Any]: 계산 결과
+        """
+        if self.carry_store:
+            return self.calculate_with_period_boundary(input_data, self.carry_store)
+        return self._calculate_with_daily_provider(input_data, self._get_daily_provider())
+
+    def _get_daily_provider(self) -> Callable[[TimeCardRecord, int], WorkDayDetail]:
+        """단계 캐시 사용 여부에 따른 일별 계산 함수"""
+        return self._calculate_daily_work_details_cached if self.stage_cache is not None else self._calculate_daily_work_details
+
+    def _is_night_day(self, record: TimeCardRecord) -> bool:
+        """
+        야간 근무일 여부를 판단합니다. (_calculate_daily_work_details의 야간 감지 조건과 동일)
+
+        Args:
+            record: 일별 근태 기록
+
+        Returns:
+            bool: 야간 근무일 여부
+        """
+        night_start = self.company_settings.get("night_shift_start_time", "22:00")
+        night_end = self.company_settings.get("night_shift_end_time", "06:00")
+        # HH:MM 문자열은 사전순 비교가 시간 비교와 같음
+        return (record.start_time >= night_start) or (record.start_time <= night_end and record.end_time > record.start_time)
+
+    def _calculate_daily_work_details_cached(self, record: TimeCardRecord, date_idx: int) -> WorkDayDetail:
+        """
+        단계 캐시를 사용하여 일별 상세 근로시간을 계산합니다.
+        근무 패턴과 일별 계산이 실제로 읽는 정책 값(야간 근무일은 야간 정책 포함)이 같으면 결과를 재사용합니다.
+
+        Args:
+            record: 일별 근태 기록
+            date_idx: 날짜 인덱스
+
+        Returns:
+            WorkDayDetail: 일별 근로시간 상세 정보
+        """
+        pattern_key = self._get_pattern_key(record, self._stage_holiday_cache)
+        template = self.stage_cache.get_or_compute(
+            "daily", pattern_key, self.settings,
+            lambda: self._calculate_daily_work_details(record, date_idx),
+            policy_keys=self.stage_cache.policy_keys_for("daily", is_night_day=self._is_night_day(record))
+        )
+        return template.model_copy(update={"date": record.date, "warnings": list(template.warnings)})
+
+    def _split_last_day(self, record: TimeCardRecord, date_idx: int) -> Tuple[WorkDayDetail, Optional[Dict[str, Any]]]:
+        """
+        말일 기록을 계산하고 자정 이후 부분을 이월 정보로 분리합니다.
+
+        Args:
+            record: 말일 근태 기록
+            date_idx: 날짜 인덱스
+
+        Returns:
+            Tuple[WorkDayDetail, Optional[Dict[str, Any]]]: (조정된 말일 결과, 이월 정보 또는 None)
+        """
+        detail = self._calculate_daily_work_details(record, date_idx)
+        return self.boundary_splitter.split_detail(record, detail, self._is_holiday(record.date))
+
+    def calculate_with_period_boundary(self, input_data: TimeCardInputData,
+                                       carry_store: PeriodCarryStore) -> Dict[str, Any]:
+        """
+        기간 경계를 고려하여 타임카드 기반 근로시간을 계산합니다.
+
+        말일에 시작해 자정을 넘기는 근무는 자정 이후 부분을 이번 기간에서 제외하고 이월 파일로 저장하며,
+        이전 기간이 남긴 이월 파일이 있으면 이번 기간 첫날에 반영합니다.
+
+        Args:
+            input_data: 타임카드 입력 데이터
+            carry_store: 이월 파일 저장소
+
+        Returns:
+            Dict[str, Any]: 계산 결과
+        """
+        _, period_end = get_period_bounds(input_data.period)
+        next_period = get_next_period(input_data.period)
+        outgoing_carry = None
+        daily_provider = self._get_daily_provider()
+
+        def boundary_provider(record: TimeCardRecord, date_idx: int) -> WorkDayDetail:
+            nonlocal outgoing_carry
+            if record.date != period_end:
+                return daily_provider(record, date_idx)
+            detail, outgoing_carry = self._split_last_day(record, date_idx)
+            return detail
+
+        carry_in = carry_store.load(input_data.employee_id, input_data.period)
+        result = self._calculate_with_daily_provider(input_data, boundary_provider, carry_in=carry_in)
+
+        if outgoing_carry:
+            carry_store.save(input_data.employee_id, next_period, outgoing_carry)
+        else:
+            carry_store.clear(input_data.employee_id, next_period)
+
+        return result
+
+    def prepare_period_carry(self, input_data_list: List[TimeCardInputData],
+                             carry_store: Optional[PeriodCarryStore] = None) -> int:
+        """
+        각 기간의 말일 기록만 계산하여 다음 기간용 이월 파일을 미리 작성합니다.
+        이후 연속된 기간을 calculate_with_period_boundary로 순서와 무관하게(병렬로) 계산할 수 있습니다.
+
+        Args:
+            input_data_list: 직원/기간별 타임카드 입력 데이터 목록
+            carry_store: 이월 파일 저장소 (생략 시 설정의 저장소 사용)
+
+        Returns:
+            int: 작성된 이월 파일 수
+        """
+        carry_store = carry_store or self.carry_store
+        if carry_store is None:
+            raise ValueError("period_carry_dir is not configured")
+
+        written = 0
+        for input_data in input_data_list:
+            record = self.boundary_splitter.find_last_day_record(input_data)
+            if record is None:
+                continue
+            _, carry = self._split_last_day(record, input_data.records.index(record))
+            if carry:
+                carry_store.save(input_data.employee_id, get_next_period(input_data.period), carry)
+                written += 1
+        return written
+
+    def _calculate_with_daily_provider(self, input_data: TimeCardInputData,
+                                       daily_provider: Callable[[TimeCardRecord, int], WorkDayDetail],
+                                       carry_in: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        일별 상세 계산 함수를 받아 월별 집계 및 컴플라이언스 검사를 수행합니다.
+
+        Args:
+            input_data: 타임카드 입력 데이터
+            daily_provider: (record, date_idx)를 받아 WorkDayDetail을 반환하는 함수
+            carry_in: 이전 기간에서 이월된 근무 정보 (선택 사항)
+
         Returns:
             Dict[str, Any]: 계산 결과
         """
@@ -269,9 +418,13 @@ class TimeCardBasedCalculator(BaseCalculator):
             
             # 일별 계산
             for idx, record in enumerate(input_data.records):
-                daily_detail = self._calculate_daily_work_details(record, idx)
+                daily_detail = daily_provider(record, idx)
                 result["daily_details"].append(daily_detail)
                 result["warnings"].extend(daily_detail.warnings)
+
+            # 이전 기간 이월분 반영
+            if carry_in:
+                result["warnings"].append(self.boundary_splitter.apply_carry(result["daily_details"], carry_in))
             
             # 월별 집계
             time_summary = TimeSummary()
@@ -310,6 +463,67 @@ class TimeCardBasedCalculator(BaseCalculator):
         
         return result
 
+    def _get_pattern_key(self, record: TimeCardRecord, holiday_cache: Dict[datetime.date, bool]) -> Tuple[str, str, int, bool]:
+        """
+        일별 계산 결과를 결정하는 근무 패턴 키(출근, 퇴근, 휴게, 휴일 여부)를 반환합니다.
+
+        Args:
+            record: 일별 근태 기록
+            holiday_cache: 날짜별 휴일 여부 캐시
+
+        Returns:
+            Tuple[str, str, int, bool]: 근무 패턴 키
+        """
+        is_holiday = holiday_cache.get(record.date)
+        if is_holiday is None:
+            is_holiday = self._is_holiday(record.date)
+            holiday_cache[record.date] = is_holiday
+        return (record.start_time, record.end_time, record.break_time_minutes or 0, is_holiday)
+
+    def calculate_batch(self, input_data_list: List[TimeCardInputData]) -> Dict[str, Any]:
+        """
+        여러 직원의 타임카드를 근무 패턴 단위로 중복 제거하여 일괄 계산합니다.
+
+        동일한 (출근, 퇴근, 휴게, 휴일 여부) 패턴은 실행 전체에서 한 번만 계산하고,
+        그 결과를 날짜만 바꾸어 해당 패턴의 모든 근무일에 복사합니다.
+
+        Args:
+            input_data_list: 직원별 타임카드 입력 데이터 목록
+
+        Returns:
+            Dict[str, Any]: 입력 순서대로의 계산 결과 목록("results")과 압축 보고서("pattern_report")
+        """
+        pattern_details: Dict[Tuple[str, str, int, bool], WorkDayDetail] = {}
+        holiday_cache: Dict[datetime.date, bool] = {}
+        total_days = 0
+
+        def pattern_provider(record: TimeCardRecord, date_idx: int) -> WorkDayDetail:
+            nonlocal total_days
+            total_days += 1
+            pattern_key = self._get_pattern_key(record, holiday_cache)
+            template = pattern_details.get(pattern_key)
+            if template is None:
+                template = self._calculate_daily_work_details(record, date_idx)
+                pattern_details[pattern_key] = template
+            return template.model_copy(update={"date": record.date, "warnings": list(template.warnings)})
+
+        results = [
+            self._calculate_with_daily_provider(input_data, pattern_provider)
+            for input_data in input_data_list
+        ]
+
+        unique_patterns = len(pattern_details)
+        pattern_report = {
+            "employees": len(input_data_list),
+            "total_days": total_days,
+            "unique_patterns": unique_patterns,
+            "compression_ratio": round(total_days / unique_patterns, 2) if unique_patterns else 0.0
+        }
+        logger.info(f"Pattern dedup: {total_days} days -> {unique_patterns} patterns "
+                    f"(compression ratio {pattern_report['compression_ratio']})")
+
+        return {"results": results, "pattern_report": pattern_report}
+
     def _check_compliance(self, result: Dict[str, Any], input_data: TimeCardInputData) -> None:
         """
         근로시간 관련 법적 컴플라이언스를 검사합니다.
@@ -338,18 +552,31 @@ class TimeCardBasedCalculator(BaseCalculator):
             weekly_work_minutes[week_num] += detail.actual_work_minutes
         
         # 주간 한도 초과 검사
-        for week_num, minutes in weekly_work_minutes.items():
+        def weekly_alert(week_num: int, minutes: Decimal) -> Optional[ComplianceAlert]:
             if minutes > (weekly_limit_minutes + weekly_limit_buffer):
-                compliance_alerts.append(ComplianceAlert(
+                return ComplianceAlert(
                     alert_code="EXCESSIVE_WEEKLY_WORK",
                     message=f"{week_num}주차 근로시간이 주 52시간을 초과합니다: {minutes / 60:.2f}시간",
                     severity="error",
                     details={"week": week_num, "hours": float(minutes / 60)}
-                ))
+                )
+            return None
+
+        for week_num, minutes in weekly_work_minutes.items():
+            if self.stage_cache is not None:
+                alert = self.stage_cache.get_or_compute(
+                    "weekly", (week_num, minutes), self.settings,
+                    lambda: weekly_alert(week_num, minutes)
+                )
+            else:
+                alert = weekly_alert(week_num, minutes)
+            if alert:
+                compliance_alerts.append(alert)
         
-        # 일 연속 근로시간 검사 (휴게시간 부족)
+        # 일 연속 근로시간 검사 (휴게시간 부족, 전 기간에서 이월된 근무는 제외)
         for detail in result["daily_details"]:
-            if detail.actual_work_minutes > Decimal("240") and detail.break_minutes_applied < Decimal("30"):
+            own_work_minutes = detail.actual_work_minutes - detail.carried_in_minutes
+            if own_work_minutes > Decimal("240") and detail.break_minutes_applied < Decimal("30"):
                 compliance_alerts.append(ComplianceAlert(
                     alert_code="INSUFFICIENT_BREAK_TIME",
                     message=f"{detail.date} 4시간 이상 근무에 필요한 최소 휴게시간(30분)이 부족합니다",
@@ -357,7 +584,7 @@ class TimeCardBasedCalculator(BaseCalculator):
                     details={"date": str(detail.date), "break_minutes": float(detail.break_minutes_applied)}
                 ))
             
-            if detail.actual_work_minutes > Decimal("480") and detail.break_minutes_applied < Decimal("60"):
+            if own_work_minutes > Decimal("480") and detail.break_minutes_applied < Decimal("60"):
                 compliance_alerts.append(ComplianceAlert(
                     alert_code="INSUFFICIENT_BREAK_TIME",
                     message=f"{detail.date} 8시간 이상 근무에 필요한 최소 휴게시간(60분)이 부족합니다",
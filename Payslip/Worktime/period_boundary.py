@@ -0,0 +1,287 @@
+"""
+근로시간 자동 계산 모듈 - 기간 경계 분할
+
+이 파일은 급여 기간 마지막 날 자정을 넘겨 끝나는 근무(예: 말일 22:00 ~ 익월 1일 06:00)를
+기간 경계에서 분할하는 PeriodBoundarySplitter와, 분할된 이월 시간을 다음 기간 계산에
+전달하는 이월 파일 저장소 PeriodCarryStore를 구현합니다.
+
+이월분은 원래 근무일의 분류(연장 → 정규, 휴일연장 → 휴일 순으로 차감)와 야간 시간을 유지한 채
+다음 기간 첫날에 더해지며, 첫날의 휴게시간 검사에 포함되지 않도록 carried_in_minutes로 따로 기록됩니다.
+이월분은 말일 기록만으로 결정되므로, 모든 기간의 이월 파일을 먼저 작성해 두면
+연속된 월을 서로 독립적으로(병렬로) 계산할 수 있습니다.
+"""
+
+import os
+import json
+import datetime
+import tempfile
+import logging
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Any, List, Optional, Tuple
+
+from .schema import TimeCardInputData, TimeCardRecord, WorkDayDetail
+from .period_calendar import get_period_bounds, get_next_period
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+CARRY_MINUTE_FIELDS = ["regular_minutes", "overtime_minutes", "holiday_minutes", "holiday_overtime_minutes", "night_minutes"]
+
+
+class PeriodCarryStore:
+    """
+    기간 간 이월 시간을 직원/수령 기간별 JSON 파일로 저장하고 불러옵니다.
+    파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 병렬 실행 중에도 반쯤 쓰인 파일이 읽히지 않습니다.
+    """
+
+    def __init__(self, carry_dir: str):
+        """
+        PeriodCarryStore 초기화.
+
+        Args:
+            carry_dir: 이월 파일을 저장할 디렉토리
+        """
+        self.carry_dir = carry_dir
+        os.makedirs(carry_dir, exist_ok=True)
+
+    def _carry_path(self, employee_id: Optional[str], period: str) -> str:
+        """이월 파일 경로 (period는 이월분을 받는 기간)"""
+        return os.path.join(self.carry_dir, f"{employee_id or 'UNKNOWN'}_{period}_carry.json")
+
+    def save(self, employee_id: Optional[str], period: str, carry: Dict[str, Any]) -> str:
+        """
+        이월 정보를 저장합니다.
+
+        Args:
+            employee_id: 직원 ID
+            period: 이월분을 받는 기간
+            carry: 이월 정보 (분 단위 값은 Decimal)
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        path = self._carry_path(employee_id, period)
+        payload = {
+            key: (value.isoformat() if isinstance(value, datetime.date) else str(value) if isinstance(value, Decimal) else value)
+            for key, value in carry.items()
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.carry_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.info(f"Saved period carry for {employee_id}: {carry.get('minutes')} minutes -> {period}")
+        return path
+
+    def load(self, employee_id: Optional[str], period: str) -> Optional[Dict[str, Any]]:
+        """
+        이월 정보를 불러옵니다.
+
+        Args:
+            employee_id: 직원 ID
+            period: 이월분을 받는 기간
+
+        Returns:
+            Optional[Dict[str, Any]]: 이월 정보 (없으면 None)
+        """
+        path = self._carry_path(employee_id, period)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "r", encoding="utf-8") as f:
+            carry = json.load(f)
+
+        for key in ["minutes"] + CARRY_MINUTE_FIELDS:
+            carry[key] = Decimal(carry.get(key, "0"))
+        carry["target_date"] = datetime.date.fromisoformat(carry["target_date"])
+        return carry
+
+    def clear(self, employee_id: Optional[str], period: str) -> None:
+        """
+        이월 파일을 삭제합니다. (말일 근무가 수정되어 이월분이 사라진 경우)
+
+        Args:
+            employee_id: 직원 ID
+            period: 이월분을 받는 기간
+        """
+        path = self._carry_path(employee_id, period)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class PeriodBoundarySplitter:
+    """
+    기간 마지막 날의 자정 넘김 근무를 기간 경계에서 분할합니다.
+    """
+
+    def __init__(self, daily_work_minutes_standard: int = 480, night_shift_start_time: str = "22:00",
+                 night_shift_end_time: str = "06:00"):
+        """
+        PeriodBoundarySplitter 초기화.
+
+        Args:
+            daily_work_minutes_standard: 일 소정근로시간(분)
+            night_shift_start_time: 야간근로 시작 시각 (HH:MM)
+            night_shift_end_time: 야간근로 종료 시각 (HH:MM)
+        """
+        self.daily_regular_minutes = Decimal(daily_work_minutes_standard)
+        night_start = self._to_minutes(night_shift_start_time)
+        night_end = self._to_minutes(night_shift_end_time)
+        # 자정 이후 야간 구간 (야간 시간대가 자정을 넘기지 않으면 자정 이후 야간 없음)
+        self.night_end_after_midnight = night_end if night_end < night_start else 0
+
+    @staticmethod
+    def _to_minutes(time_str: str) -> int:
+        """HH:MM 문자열을 자정 기준 분으로 변환"""
+        hours, minutes = time_str.split(":")
+        return int(hours) * 60 + int(minutes)
+
+    @staticmethod
+    def _quantize_hours(minutes: Decimal) -> Decimal:
+        """분을 소수점 2자리 시간으로 변환"""
+        return (minutes / 60).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+    def get_carry_minutes(self, record: TimeCardRecord, detail: WorkDayDetail) -> Decimal:
+        """
+        자정 이후에 해당하는 실근로 시간(분)을 구합니다.
+        휴게시간은 자정 이전 구간에서 사용한 것으로 보고, 실근로시간을 넘지 않도록 제한합니다.
+
+        Args:
+            record: 일별 근태 기록
+            detail: 해당 기록의 일별 계산 결과
+
+        Returns:
+            Decimal: 자정 이후 근로시간 (분)
+        """
+        start_minutes = self._to_minutes(record.start_time)
+        end_minutes = self._to_minutes(record.end_time)
+        if end_minutes >= start_minutes:  # 자정을 넘기지 않음
+            return Decimal("0")
+        return min(Decimal(end_minutes), detail.actual_work_minutes)
+
+    def get_carry_night_minutes(self, carry_minutes: Decimal, detail: WorkDayDetail) -> Decimal:
+        """
+        그날 계산된 야간 근로시간 중 이월되는 자정 이후 부분(분)을 구합니다.
+        이월분은 자정부터 연속된 근로이므로 앞부분부터 야간 시간대(자정 ~ 야간 종료 시각)와 겹치며,
+        그날 계산된 야간 시간을 넘지 않도록 제한하여 분할 전후 야간 시간 합계가 같게 합니다.
+
+        Args:
+            carry_minutes: 자정 이후 근로시간 (분)
+            detail: 말일 일별 계산 결과
+
+        Returns:
+            Decimal: 이월되는 야간 근로시간 (분)
+        """
+        return min(carry_minutes, Decimal(self.night_end_after_midnight), detail.night_hours * 60)
+
+    def split_detail(self, record: TimeCardRecord, detail: WorkDayDetail,
+                     is_holiday: bool) -> Tuple[WorkDayDetail, Optional[Dict[str, Any]]]:
+        """
+        말일 근무의 자정 이후 부분을 떼어내 이월 정보로 만듭니다.
+        자정 이후 시간은 근무의 마지막 부분이므로 연장(휴일연장)에서 먼저 차감하고, 남으면 정규(휴일)에서 차감합니다.
+        말일에 남는 시간은 그날 계산값에서 이월분(다음 기간 첫날에 더해지는 값과 같은 반올림)을 빼서 구하므로,
+        분할 전후 각 시간 항목의 합계가 같습니다.
+
+        Args:
+            record: 말일 근태 기록
+            detail: 말일 일별 계산 결과
+            is_holiday: 말일 휴일 여부
+
+        Returns:
+            Tuple[WorkDayDetail, Optional[Dict[str, Any]]]: (조정된 말일 결과, 이월 정보 또는 None)
+        """
+        carry_minutes = self.get_carry_minutes(record, detail)
+        if carry_minutes <= 0:
+            return detail, None
+
+        actual_minutes = detail.actual_work_minutes
+        base_minutes = min(actual_minutes, self.daily_regular_minutes)
+        over_minutes = actual_minutes - base_minutes
+        carry_over = min(carry_minutes, over_minutes)
+        carry_base = carry_minutes - carry_over
+
+        carry_night = self.get_carry_night_minutes(carry_minutes, detail)
+        target_date = record.date + datetime.timedelta(days=1)
+        carry = {
+            "source_date": record.date.isoformat(),
+            "target_date": target_date,
+            "minutes": carry_minutes,
+            "regular_minutes": Decimal("0") if is_holiday else carry_base,
+            "overtime_minutes": Decimal("0") if is_holiday else carry_over,
+            "holiday_minutes": carry_base if is_holiday else Decimal("0"),
+            "holiday_overtime_minutes": carry_over if is_holiday else Decimal("0"),
+            "night_minutes": carry_night,
+        }
+
+        update = {key: getattr(detail, key) - value for key, value in self._carry_increments(carry).items()}
+        update["actual_work_minutes"] = actual_minutes - carry_minutes
+        update["warnings"] = detail.warnings + [f"기간 경계 분할: 자정 이후 {carry_minutes}분을 {target_date}로 이월"]
+        return detail.model_copy(update=update), carry
+
+    def _carry_increments(self, carry: Dict[str, Any]) -> Dict[str, Decimal]:
+        """이월 정보의 분 단위 값을 시간 항목별 증감(소수점 2자리 시간)으로 변환"""
+        return {
+            "regular_hours": self._quantize_hours(carry["regular_minutes"]),
+            "overtime_hours": self._quantize_hours(carry["overtime_minutes"]),
+            "holiday_hours": self._quantize_hours(carry["holiday_minutes"]),
+            "holiday_overtime_hours": self._quantize_hours(carry["holiday_overtime_minutes"]),
+            "night_hours": self._quantize_hours(carry.get("night_minutes", Decimal("0"))),
+        }
+
+    def apply_carry(self, daily_details: List[WorkDayDetail], carry: Dict[str, Any]) -> str:
+        """
+        이전 기간에서 이월된 시간을 다음 기간 첫날 결과에 더합니다.
+        해당 날짜의 결과가 없으면 새 일별 결과를 맨 앞에 추가합니다.
+        이월분은 carried_in_minutes에 따로 기록하여, 휴게시간처럼 그날 근무에만 적용되는 검사에서 제외할 수 있게 합니다.
+
+        Args:
+            daily_details: 이번 기간 일별 계산 결과 목록 (직접 수정됨)
+            carry: PeriodCarryStore.load로 읽은 이월 정보
+
+        Returns:
+            str: 이월 적용 경고 메시지
+        """
+        target_date = carry["target_date"]
+        warning = f"전 기간 이월 근무 반영: {carry['source_date']} 근무 중 {carry['minutes']}분"
+        increments = self._carry_increments(carry)
+
+        for idx, detail in enumerate(daily_details):
+            if detail.date == target_date:
+                update = {key: getattr(detail, key) + value for key, value in increments.items()}
+                update["actual_work_minutes"] = detail.actual_work_minutes + carry["minutes"]
+                update["carried_in_minutes"] = detail.carried_in_minutes + carry["minutes"]
+                update["warnings"] = detail.warnings + [warning]
+                daily_details[idx] = detail.model_copy(update=update)
+                return warning
+
+        daily_details.insert(0, WorkDayDetail(
+            date=target_date,
+            actual_work_minutes=carry["minutes"],
+            carried_in_minutes=carry["minutes"],
+            break_minutes_applied=Decimal("0"),
+            warnings=[warning],
+            **increments
+        ))
+        return warning
+
+    def find_last_day_record(self, input_data: TimeCardInputData) -> Optional[TimeCardRecord]:
+        """
+        기간 마지막 날의 기록을 찾습니다.
+
+        Args:
+            input_data: 타임카드 입력 데이터
+
+        Returns:
+            Optional[TimeCardRecord]: 말일 기록 (없으면 None)
+        """
+        _, period_end = get_period_bounds(input_data.period)
+        for record in reversed(input_data.records):
+            if record.date == period_end:
+                return record
+        return None
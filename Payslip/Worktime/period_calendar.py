@@ -0,0 +1,151 @@
+"""
+근로시간 자동 계산 모듈 - 기간 달력
+
+이 파일은 급여 기간("YYYY-MM")의 날짜 배열, 주차 구분, 휴일 여부를 한 번만 계산해
+여러 계산 엔진(기간 경계 분할, 주휴수당 등)이 공유할 수 있도록 하는 PeriodCalendar를 구현합니다.
+주는 월요일에 시작하여 일요일에 끝나는 것으로 봅니다.
+"""
+
+import calendar
+import datetime
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def get_period_bounds(period: str) -> Tuple[datetime.date, datetime.date]:
+    """
+    "YYYY-MM" 형식의 기간 문자열에서 시작일과 종료일을 구합니다.
+
+    Args:
+        period: 기간 문자열 (예: "2025-05")
+
+    Returns:
+        Tuple[datetime.date, datetime.date]: (기간 시작일, 기간 종료일)
+    """
+    try:
+        year, month = (int(part) for part in period.split("-")[:2])
+        last_day = calendar.monthrange(year, month)[1]
+    except (ValueError, calendar.IllegalMonthError) as e:
+        raise ValueError(f"Invalid period format: {period}") from e
+    return datetime.date(year, month, 1), datetime.date(year, month, last_day)
+
+
+def get_next_period(period: str) -> str:
+    """
+    다음 기간 문자열을 반환합니다.
+
+    Args:
+        period: 기간 문자열 (예: "2025-12")
+
+    Returns:
+        str: 다음 기간 문자열 (예: "2026-01")
+    """
+    _, period_end = get_period_bounds(period)
+    next_start = period_end + datetime.timedelta(days=1)
+    return f"{next_start.year:04d}-{next_start.month:02d}"
+
+
+class PeriodCalendar:
+    """
+    급여 기간의 날짜/주차/휴일 정보를 NumPy 배열로 보관하는 달력입니다.
+    """
+
+    def __init__(self, period: str, holiday_dates: Optional[Iterable[datetime.date]] = None,
+                 weekly_holiday_days: Optional[List[str]] = None):
+        """
+        PeriodCalendar 초기화.
+
+        Args:
+            period: 기간 문자열 (예: "2025-05")
+            holiday_dates: 공휴일 날짜 목록 (선택 사항)
+            weekly_holiday_days: 주간 휴일 요일 이름 목록 (기본값: ["Saturday", "Sunday"])
+        """
+        self.period = period
+        self.start_date, self.end_date = get_period_bounds(period)
+        self.num_days = (self.end_date - self.start_date).days + 1
+
+        self.dates = np.arange(np.datetime64(self.start_date), np.datetime64(self.end_date) + 1)
+        self.weekdays = (np.arange(self.num_days) + self.start_date.weekday()) % 7
+
+        # 주차 ID: 기간 첫날이 속한 주가 0 (월요일 시작)
+        self.week_ids = (np.arange(self.num_days) + self.start_date.weekday()) // 7
+        self.num_weeks = int(self.week_ids[-1]) + 1
+        first_monday = self.start_date - datetime.timedelta(days=self.start_date.weekday())
+        self.week_starts = [first_monday + datetime.timedelta(weeks=w) for w in range(self.num_weeks)]
+        self.week_ends = [week_start + datetime.timedelta(days=6) for week_start in self.week_starts]
+
+        weekly_holiday_days = weekly_holiday_days if weekly_holiday_days is not None else ["Saturday", "Sunday"]
+        weekend_numbers = [DAY_NAMES.index(day) for day in weekly_holiday_days if day in DAY_NAMES]
+        self.weekend_mask = np.isin(self.weekdays, weekend_numbers)
+
+        holiday_days = np.array(sorted({np.datetime64(d) for d in (holiday_dates or [])}), dtype="datetime64[D]")
+        self.public_holiday_mask = np.isin(self.dates, holiday_days)
+        self.holiday_mask = self.weekend_mask | self.public_holiday_mask
+
+    @classmethod
+    def from_policy_manager(cls, period: str, policy_manager) -> "PeriodCalendar":
+        """
+        PolicyManager의 공휴일 및 주간 휴일 설정으로 달력을 생성합니다.
+
+        Args:
+            period: 기간 문자열
+            policy_manager: PolicyManager 인스턴스
+
+        Returns:
+            PeriodCalendar: 생성된 달력
+        """
+        holiday_dates = [datetime.datetime.strptime(h["date"], "%Y-%m-%d").date()
+                         for h in policy_manager.holidays if h.get("date")]
+        weekly_holiday_days = policy_manager.get("company_settings.weekly_holiday_days", ["Saturday", "Sunday"])
+        return cls(period, holiday_dates, weekly_holiday_days)
+
+    def day_index(self, date: datetime.date) -> int:
+        """
+        날짜의 기간 내 인덱스를 반환합니다.
+
+        Args:
+            date: 날짜
+
+        Returns:
+            int: 0부터 시작하는 인덱스 (기간 밖이면 ValueError)
+        """
+        if not self.start_date <= date <= self.end_date:
+            raise ValueError(f"{date} is outside period {self.period}")
+        return (date - self.start_date).days
+
+    def week_index(self, date: datetime.date) -> int:
+        """
+        날짜가 속한 주차 ID를 반환합니다. (기간 밖 날짜는 음수 또는 num_weeks 이상일 수 있음)
+
+        Args:
+            date: 날짜
+
+        Returns:
+            int: 주차 ID
+        """
+        return (date - self.week_starts[0]).days // 7
+
+    def week_one_hot(self) -> np.ndarray:
+        """
+        (일수 x 주차수) 원-핫 행렬을 반환합니다. (일별 배열 @ 행렬 = 주별 합계)
+
+        Returns:
+            np.ndarray: float64 원-핫 행렬
+        """
+        return (self.week_ids[:, None] == np.arange(self.num_weeks)[None, :]).astype(np.float64)
+
+    def next_period(self) -> str:
+        """
+        다음 기간 문자열을 반환합니다.
+
+        Returns:
+            str: 다음 기간 문자열
+        """
+        return get_next_period(self.period)
@@ -23,6 +23,7 @@ class WorkDayDetail(BaseModel):
     holiday_overtime_hours: Decimal = Field(default=Decimal("0.0"))
     actual_work_minutes: Decimal = Field(default=Decimal("0.0"))
     break_minutes_applied: Decimal = Field(default=Decimal("0.0"))
+    carried_in_minutes: Decimal = Field(default=Decimal("0.0"), description="actual_work_minutes 중 전 기간 말일 근무에서 이월된 시간(분)")
     warnings: List[str] = Field(default_factory=list)
 
 # --- 공통 출력 포맷 정의 --- #
@@ -0,0 +1,267 @@
+"""
+근로시간 자동 계산 모듈 - 지각/조퇴 공제 계산 엔진
+
+이 파일은 policies.tardiness_early_leave 정책(standard_start_time, standard_end_time,
+deduction_unit, apply_deduction)에 따라 여러 직원의 월간 출퇴근 기록을 표준 출퇴근 시각과
+일괄 비교하여 지각/조퇴 공제 시간(분)과 공제 금액(원)을 계산하는 TardinessDeductionEngine을 구현합니다.
+
+- 기록에 shift_start_time/shift_end_time이 있으면 정책 표준 시각 대신 해당 스케줄과 비교합니다.
+- 근무 시작/종료와 출퇴근 시각은 하나의 시간축(근무 시작일 자정 기준 분)에 놓고 비교하므로,
+  자정을 넘기는 야간 근무(예: 21:00 ~ 06:00)의 자정 이후 출근(지각)과 종료 전 퇴근(조퇴)도 판정합니다.
+- 부족 시간은 일 단위로 deduction_unit(분) 단위 올림합니다.
+- 공제 금액은 공제 시간 / 60 x 통상시급이며 원 단위 미만은 절사합니다.
+- 휴가(leave_type) 기록과 휴일 근무 기록은 지각/조퇴 판정에서 제외합니다.
+- 계산 결과는 급여 JSON의 deductions.lateness_deduction / early_leave_deduction에 반영할 수 있습니다.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+HOLIDAY_DAY_TYPES = ("sunday", "public_holiday")
+
+
+class TardinessDeductionEngine:
+    """
+    월간 출퇴근 기록 배열에서 지각/조퇴 공제 시간과 금액을 일괄 계산하는 엔진입니다.
+    """
+
+    SUMMARY_COLUMNS = [
+        "late_count", "late_minutes", "late_deduction_minutes",
+        "early_leave_count", "early_leave_minutes", "early_leave_deduction_minutes",
+        "lateness_deduction", "early_leave_deduction"
+    ]
+
+    def __init__(self, policy: Optional[Dict[str, Any]] = None):
+        """
+        TardinessDeductionEngine 초기화.
+
+        Args:
+            policy: 지각/조퇴 정책 (PolicyManager.get_tardiness_early_leave_policy 형식)
+        """
+        policy = policy or {}
+        self.standard_start_minutes = self._to_minutes(policy.get("standard_start_time", "09:00"))
+        self.standard_end_minutes = self._to_minutes(policy.get("standard_end_time", "18:00"))
+        self.deduction_unit = int(policy.get("deduction_unit", 30) or 1)
+        self.apply_deduction = bool(policy.get("apply_deduction", True))
+        self._time_minutes_cache: Dict[str, int] = {}
+
+        if self.standard_start_minutes < 0 or self.standard_end_minutes < 0:
+            raise ValueError("Invalid standard_start_time/standard_end_time in tardiness_early_leave policy")
+
+    @classmethod
+    def from_policy_manager(cls, policy_manager) -> "TardinessDeductionEngine":
+        """
+        PolicyManager 설정으로 엔진을 생성합니다.
+
+        Args:
+            policy_manager: PolicyManager 인스턴스
+
+        Returns:
+            TardinessDeductionEngine: 생성된 엔진
+        """
+        return cls(policy_manager.get_tardiness_early_leave_policy())
+
+    @staticmethod
+    def _to_minutes(time_str: Optional[str]) -> int:
+        """HH:MM 문자열을 자정 기준 분으로 변환 (형식 오류 시 -1)"""
+        try:
+            hours, minutes = str(time_str).split(":")
+            hours, minutes = int(hours), int(minutes)
+        except (ValueError, AttributeError):
+            return -1
+        if not (0 <= hours < 24 and 0 <= minutes < 60):
+            return -1
+        return hours * 60 + minutes
+
+    def _intern_time_minutes(self, time_str: Optional[str]) -> int:
+        """시간 문자열을 분으로 변환하며 결과를 캐시합니다."""
+        if not time_str:
+            return -1
+        minutes = self._time_minutes_cache.get(time_str)
+        if minutes is None:
+            minutes = self._to_minutes(time_str)
+            self._time_minutes_cache[time_str] = minutes
+        return minutes
+
+    @staticmethod
+    def _anchor_times(scheduled_start: np.ndarray, scheduled_end: np.ndarray, clock_in: np.ndarray,
+                      clock_out: np.ndarray) -> tuple:
+        """
+        근무 스케줄과 출퇴근 시각을 근무 시작일 자정 기준의 한 시간축으로 옮깁니다.
+
+        - 종료 시각이 시작 시각 이전이면(자정 넘김 근무) 종료 시각은 다음 날(+1440분)입니다.
+        - 출근 시각은 근무 시작 시각 전후 12시간 안으로 옮깁니다. (21:00 근무에 00:30 출근 -> 다음 날 00:30)
+        - 퇴근 시각은 출근 이후 처음 돌아오는 같은 시각입니다. (출근보다 이르면 다음 날 퇴근)
+
+        Args:
+            scheduled_start: 근무 시작 시각 (분)
+            scheduled_end: 근무 종료 시각 (분)
+            clock_in: 출근 시각 (분)
+            clock_out: 퇴근 시각 (분)
+
+        Returns:
+            (근무 종료, 출근, 퇴근) 시각 배열 (근무 시작일 자정 기준 분)
+        """
+        end = np.where(scheduled_end <= scheduled_start, scheduled_end + 1440, scheduled_end)
+        anchored_in = scheduled_start + np.mod(clock_in - scheduled_start + 720, 1440) - 720
+        anchored_out = anchored_in + np.mod(clock_out - anchored_in, 1440)
+        return end, anchored_in, anchored_out
+
+    def _round_up_to_unit(self, minutes: np.ndarray) -> np.ndarray:
+        """부족 시간을 공제 단위로 올림합니다."""
+        return np.ceil(minutes / self.deduction_unit) * self.deduction_unit
+
+    def calculate_daily(self, timecards_by_employee: Dict[str, List[dict]]) -> pd.DataFrame:
+        """
+        직원별 일별 기록을 표준 출퇴근 시각과 비교하여 일별 지각/조퇴 시간을 계산합니다.
+
+        Args:
+            timecards_by_employee: 직원 ID별 일별 근태 기록 리스트
+                (date, actual_clock_in, actual_clock_out, shift_start_time, shift_end_time,
+                day_type, is_holiday_work, leave_type)
+
+        Returns:
+            pd.DataFrame: (employee_id, date) MultiIndex를 가진 일별 지각/조퇴 시간
+        """
+        employee_ids, dates, clock_in, clock_out, excluded = [], [], [], [], []
+        standard_start, standard_end = [], []
+
+        for employee_id, records in timecards_by_employee.items():
+            for record in records:
+                employee_ids.append(employee_id)
+                dates.append(record.get("date"))
+                clock_in.append(self._intern_time_minutes(record.get("actual_clock_in")))
+                clock_out.append(self._intern_time_minutes(record.get("actual_clock_out")))
+                # 기록에 개별 근무 스케줄이 있으면 정책 표준 시각 대신 사용
+                shift_start = self._intern_time_minutes(record.get("shift_start_time"))
+                shift_end = self._intern_time_minutes(record.get("shift_end_time"))
+                standard_start.append(shift_start if shift_start >= 0 else self.standard_start_minutes)
+                standard_end.append(shift_end if shift_end >= 0 else self.standard_end_minutes)
+                excluded.append(
+                    bool(record.get("leave_type"))
+                    or record.get("day_type", "weekday") in HOLIDAY_DAY_TYPES
+                    or bool(record.get("is_holiday_work", False))
+                )
+
+        start = np.array(clock_in, dtype=np.float64)
+        end = np.array(clock_out, dtype=np.float64)
+        valid = (start >= 0) & (end >= 0) & ~np.array(excluded, dtype=bool)
+
+        scheduled_start = np.array(standard_start, dtype=np.float64)
+        scheduled_end = np.array(standard_end, dtype=np.float64)
+
+        # 자정을 넘기는 근무/출퇴근도 같은 시간축에서 비교
+        scheduled_end, start, end = self._anchor_times(scheduled_start, scheduled_end, start, end)
+        late = np.where(valid, np.maximum(start - scheduled_start, 0), 0)
+        early = np.where(valid, np.maximum(scheduled_end - end, 0), 0)
+
+        frame = pd.DataFrame({
+            "employee_id": employee_ids,
+            "date": pd.to_datetime(dates),
+            "late_minutes": late,
+            "late_deduction_minutes": self._round_up_to_unit(late),
+            "early_leave_minutes": early,
+            "early_leave_deduction_minutes": self._round_up_to_unit(early),
+        })
+        return frame.set_index(["employee_id", "date"]).sort_index()
+
+    def calculate_batch(self, timecards_by_employee: Dict[str, List[dict]],
+                        hourly_wages: Dict[str, float]) -> pd.DataFrame:
+        """
+        여러 직원의 월간 지각/조퇴 공제 시간과 공제 금액을 한 번에 계산합니다.
+
+        Args:
+            timecards_by_employee: 직원 ID별 일별 근태 기록 리스트
+            hourly_wages: 직원 ID별 통상시급 (원)
+
+        Returns:
+            pd.DataFrame: 직원 ID를 인덱스로 하는 SUMMARY_COLUMNS 결과
+        """
+        daily = self.calculate_daily(timecards_by_employee)
+        by_employee = daily.groupby(level="employee_id")
+
+        summary = pd.DataFrame(index=pd.Index(list(timecards_by_employee), name="employee_id"))
+        summary["late_count"] = (daily["late_minutes"] > 0).groupby(level="employee_id").sum()
+        summary["late_minutes"] = by_employee["late_minutes"].sum()
+        summary["late_deduction_minutes"] = by_employee["late_deduction_minutes"].sum()
+        summary["early_leave_count"] = (daily["early_leave_minutes"] > 0).groupby(level="employee_id").sum()
+        summary["early_leave_minutes"] = by_employee["early_leave_minutes"].sum()
+        summary["early_leave_deduction_minutes"] = by_employee["early_leave_deduction_minutes"].sum()
+        summary = summary.fillna(0)
+        summary[["late_count", "early_leave_count"]] = summary[["late_count", "early_leave_count"]].astype(int)
+
+        wages = summary.index.map(lambda employee_id: float(hourly_wages.get(employee_id, 0) or 0)).to_numpy(dtype=np.float64)
+        missing_wages = [employee_id for employee_id in summary.index if employee_id not in hourly_wages]
+        if missing_wages:
+            logger.warning(f"Hourly wage missing for {len(missing_wages)} employees, deduction amount set to 0: {missing_wages[:5]}")
+
+        if self.apply_deduction:
+            summary["lateness_deduction"] = np.floor(summary["late_deduction_minutes"].to_numpy() / 60 * wages)
+            summary["early_leave_deduction"] = np.floor(summary["early_leave_deduction_minutes"].to_numpy() / 60 * wages)
+        else:
+            summary["lateness_deduction"] = 0.0
+            summary["early_leave_deduction"] = 0.0
+
+        return summary[self.SUMMARY_COLUMNS]
+
+
+def apply_deductions_to_payroll(payroll: Dict[str, Any], deduction_row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    지각/조퇴 공제 금액을 급여 JSON에 반영하고 공제 합계와 실수령액을 다시 계산합니다.
+
+    Args:
+        payroll: 급여 JSON 딕셔너리 (output/json/*_payroll.json 구조, 직접 수정됨)
+        deduction_row: lateness_deduction, early_leave_deduction을 담은 행 (dict 또는 pd.Series)
+
+    Returns:
+        Dict[str, Any]: 수정된 급여 딕셔너리
+    """
+    deductions = payroll.setdefault("deductions", {})
+    deductions["lateness_deduction"] = float(deduction_row["lateness_deduction"])
+    deductions["early_leave_deduction"] = float(deduction_row["early_leave_deduction"])
+
+    deductions["total_other_deductions"] = float(
+        deductions.get("unpaid_leave_deduction", 0)
+        + deductions["lateness_deduction"]
+        + deductions["early_leave_deduction"]
+    )
+    deductions["total_all_deductions"] = float(
+        deductions["total_other_deductions"] + deductions.get("total_statutory_deductions", 0)
+    )
+    payroll["net_pay"] = float(payroll.get("gross_pay", 0) - deductions["total_all_deductions"])
+
+    summary = payroll.get("work_time_summary", {}).get("summary")
+    if isinstance(summary, dict):
+        if "late_count" in deduction_row:
+            summary["total_late_days"] = int(deduction_row["late_count"])
+        if "early_leave_count" in deduction_row:
+            summary["total_early_leave_days"] = int(deduction_row["early_leave_count"])
+
+    return payroll
+
+
+def apply_deductions_to_payroll_batch(payrolls: Dict[str, Dict[str, Any]],
+                                      deduction_frame: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    TardinessDeductionEngine.calculate_batch 결과를 직원별 급여 JSON에 일괄 반영합니다.
+
+    Args:
+        payrolls: 직원 ID별 급여 JSON 딕셔너리
+        deduction_frame: calculate_batch 반환값
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 수정된 급여 딕셔너리 (입력과 동일 객체)
+    """
+    for employee_id, row in deduction_frame.to_dict(orient="index").items():
+        payroll = payrolls.get(employee_id)
+        if payroll is None:
+            logger.warning(f"No payroll found for employee {employee_id}, skipping deduction")
+            continue
+        apply_deductions_to_payroll(payroll, row)
+    return payrolls
@@ -0,0 +1,273 @@
+"""
+근로시간 자동 계산 모듈 - 주휴수당 일괄 계산 엔진
+
+이 파일은 policies.weekly_holiday 정책(min_hours, allowance_hours, include_first_week)에 따라
+전 직원의 일별 근로시간(분) 행렬에서 주별 주휴수당 발생 여부와 주휴 시간을 일괄 계산하는
+WeeklyHolidayAllowanceEngine을 구현합니다.
+
+- 주별 근로시간은 PeriodCalendar의 주차(월~일) 기준으로 합산합니다.
+- 주 근로시간이 min_hours 이상이면 주휴수당이 발생합니다.
+- 주휴 시간은 allowance_hours x min(주 근로시간 / 주 소정근로시간, 1)로 비례 계산합니다.
+- 입사일이 주 중간에 있는 첫 주는 include_first_week가 false이면 제외합니다.
+- 퇴사일이 주 마지막 날 이전이면 해당 주는 제외합니다.
+- 주의 마지막 날(일요일)이 다음 기간에 속하는 주는 다음 기간에서 판정합니다.
+- 이전 기간에서 시작된 첫 주는 이전 기간에 속한 날의 근로시간(leading_minutes, build_leading_minutes로 계산)이
+  주어질 때만 판정하고, 주어지지 않으면 미완결 주(is_complete=False)로 남겨 미발생으로 판정하지 않습니다.
+"""
+
+import datetime
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .period_calendar import PeriodCalendar
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def build_minutes_matrix(batch_frame: pd.DataFrame, period_calendar: PeriodCalendar,
+                         column: str = "recognized_work_minutes") -> Dict[str, Any]:
+    """
+    WorkTimeCalculator.calculate_monthly_work_hours_batch 결과를 (직원 x 일) 분 행렬로 변환합니다.
+
+    Args:
+        batch_frame: (employee_id, date) MultiIndex를 가진 일별 계산 결과
+        period_calendar: 기간 달력
+        column: 사용할 분 단위 컬럼 (기본값: 유급휴가 포함 인정 근로시간)
+
+    Returns:
+        Dict[str, Any]: {"employee_ids": 직원 ID 목록, "minutes": (직원 x 일) float64 행렬}
+    """
+    employee_ids = list(batch_frame.index.get_level_values("employee_id").unique())
+    minutes = np.zeros((len(employee_ids), period_calendar.num_days), dtype=np.float64)
+    if not employee_ids:
+        return {"employee_ids": employee_ids, "minutes": minutes}
+
+    row_index = pd.Index(employee_ids).get_indexer(batch_frame.index.get_level_values("employee_id"))
+    dates = batch_frame.index.get_level_values("date").values.astype("datetime64[D]")
+    day_index = (dates - period_calendar.dates[0]).astype(np.int64)
+    in_period = (day_index >= 0) & (day_index < period_calendar.num_days)
+
+    # 같은 날짜의 기록이 여러 건이면 합산
+    np.add.at(minutes, (row_index[in_period], day_index[in_period]),
+              batch_frame[column].to_numpy(dtype=np.float64)[in_period])
+    return {"employee_ids": employee_ids, "minutes": minutes}
+
+
+def build_leading_minutes(previous_batch_frame: pd.DataFrame, period_calendar: PeriodCalendar,
+                          employee_ids: List[str], column: str = "recognized_work_minutes") -> np.ndarray:
+    """
+    이전 기간 일별 계산 결과에서 첫 주 중 이전 기간에 속한 날의 직원별 근로시간(분) 합계를 구합니다.
+
+    Args:
+        previous_batch_frame: 이전 기간의 (employee_id, date) MultiIndex 일별 계산 결과
+        period_calendar: 이번 기간 달력
+        employee_ids: 직원 ID 목록 (분 행렬의 행 순서)
+        column: 사용할 분 단위 컬럼 (기본값: 유급휴가 포함 인정 근로시간)
+
+    Returns:
+        np.ndarray: 직원별 leading_minutes (이전 기간 기록이 없는 직원은 0)
+    """
+    leading = np.zeros(len(employee_ids), dtype=np.float64)
+    if previous_batch_frame.empty:
+        return leading
+
+    row_index = pd.Index(employee_ids).get_indexer(previous_batch_frame.index.get_level_values("employee_id"))
+    dates = previous_batch_frame.index.get_level_values("date").values.astype("datetime64[D]")
+    in_first_week = ((row_index >= 0) & (dates >= np.datetime64(period_calendar.week_starts[0]))
+                     & (dates < np.datetime64(period_calendar.start_date)))
+    np.add.at(leading, row_index[in_first_week],
+              previous_batch_frame[column].to_numpy(dtype=np.float64)[in_first_week])
+    return leading
+
+
+class WeeklyHolidayAllowanceEngine:
+    """
+    전 직원의 주휴수당 발생 여부와 주휴 시간을 벡터 연산으로 계산하는 엔진입니다.
+    """
+
+    def __init__(self, policy: Optional[Dict[str, Any]] = None, weekly_work_minutes_standard: int = 2400):
+        """
+        WeeklyHolidayAllowanceEngine 초기화.
+
+        Args:
+            policy: 주휴수당 정책 (PolicyManager.get_weekly_holiday_policy 형식)
+            weekly_work_minutes_standard: 주 소정근로시간(분), 비례 주휴 시간 계산 기준
+        """
+        policy = policy or {}
+        self.min_hours = float(policy.get("min_hours", 15))
+        self.allowance_hours = float(policy.get("allowance_hours", 8))
+        self.include_first_week = bool(policy.get("include_first_week", False))
+        self.weekly_standard_hours = weekly_work_minutes_standard / 60
+
+    @classmethod
+    def from_policy_manager(cls, policy_manager) -> "WeeklyHolidayAllowanceEngine":
+        """
+        PolicyManager 설정으로 엔진을 생성합니다.
+
+        Args:
+            policy_manager: PolicyManager 인스턴스
+
+        Returns:
+            WeeklyHolidayAllowanceEngine: 생성된 엔진
+        """
+        return cls(policy_manager.get_weekly_holiday_policy(),
+                   policy_manager.get("company_settings.weekly_work_minutes_standard", 2400))
+
+    @staticmethod
+    def _to_date_column(dates: Optional[List[Optional[datetime.date]]], num_employees: int) -> np.ndarray:
+        """직원별 날짜 목록을 (직원 x 1) datetime64 배열로 변환 (None은 NaT)"""
+        dates = dates or [None] * num_employees
+        return np.array([np.datetime64(d) if d else np.datetime64("NaT") for d in dates],
+                        dtype="datetime64[D]")[:, None]
+
+    def _weekly_arrays(self, period_calendar: PeriodCalendar, num_employees: int, minutes_matrix: np.ndarray,
+                       hire_dates: Optional[List[Optional[datetime.date]]] = None,
+                       resignation_dates: Optional[List[Optional[datetime.date]]] = None,
+                       leading_minutes: Optional[np.ndarray] = None):
+        """
+        주별 근로시간과 min_hours를 제외한 판정 조건을 (직원 x 주) 배열로 계산합니다.
+        leading_minutes가 없으면 이전 기간에서 시작된 첫 주는 근로시간 일부만 알 수 있으므로 미완결 주로 둡니다.
+
+        Returns:
+            (week_hours, base_eligible, is_first_week, is_complete)
+        """
+        minutes = np.asarray(minutes_matrix, dtype=np.float64)
+        if minutes.shape != (num_employees, period_calendar.num_days):
+            raise ValueError(f"minutes_matrix shape {minutes.shape} does not match "
+                             f"({num_employees}, {period_calendar.num_days})")
+
+        # 주별 근로시간 (직원 x 주)
+        week_minutes = minutes @ period_calendar.week_one_hot()
+        if leading_minutes is not None:
+            week_minutes[:, 0] += np.asarray(leading_minutes, dtype=np.float64)
+        week_hours = week_minutes / 60
+
+        week_starts = np.array(period_calendar.week_starts, dtype="datetime64[D]")[None, :]
+        week_ends = np.array(period_calendar.week_ends, dtype="datetime64[D]")[None, :]
+
+        # 주 마지막 날이 기간 안에 있는 주만 이번 기간에 판정
+        is_complete = week_ends <= np.datetime64(period_calendar.end_date)
+        if leading_minutes is None:
+            is_complete = is_complete & (week_starts >= np.datetime64(period_calendar.start_date))
+        is_complete = np.broadcast_to(is_complete, (num_employees, period_calendar.num_weeks))
+
+        # 입사 전 주, 입사일이 주 중간에 있는 첫 주 (NaT 비교는 항상 False)
+        hire = self._to_date_column(hire_dates, num_employees)
+        before_hire = hire > week_ends
+        is_first_week = (hire > week_starts) & (hire <= week_ends)
+
+        # 퇴사 후 주, 퇴사일이 주 마지막 날 이전인 주
+        resignation = self._to_date_column(resignation_dates, num_employees)
+        after_resignation = resignation < week_starts
+        left_mid_week = (resignation >= week_starts) & (resignation < week_ends)
+
+        base_eligible = is_complete & ~before_hire & ~after_resignation & ~left_mid_week
+        if not self.include_first_week:
+            base_eligible = base_eligible & ~is_first_week
+        return week_hours, base_eligible, is_first_week, is_complete
+
+    def calculate(self, period_calendar: PeriodCalendar, employee_ids: List[str], minutes_matrix: np.ndarray,
+                  hire_dates: Optional[List[Optional[datetime.date]]] = None,
+                  resignation_dates: Optional[List[Optional[datetime.date]]] = None,
+                  leading_minutes: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        직원별/주별 주휴수당 발생 여부와 주휴 시간을 계산합니다.
+
+        Args:
+            period_calendar: 기간 달력
+            employee_ids: 직원 ID 목록 (행렬의 행 순서)
+            minutes_matrix: (직원 x 일) 일별 근로시간(분) 행렬
+            hire_dates: 직원별 입사일 목록 (선택 사항)
+            resignation_dates: 직원별 퇴사일 목록 (선택 사항)
+            leading_minutes: 첫 주 중 이전 기간에 속한 날의 직원별 근로시간(분) 합계
+                (선택 사항, 없으면 이전 기간에서 시작된 첫 주는 판정하지 않음)
+
+        Returns:
+            pd.DataFrame: (employee_id, week_start) MultiIndex를 가진 주별 결과
+                (week_end, week_hours, eligible, allowance_hours, is_first_week, is_complete)
+        """
+        week_hours, base_eligible, is_first_week, is_complete = self._weekly_arrays(
+            period_calendar, len(employee_ids), minutes_matrix, hire_dates, resignation_dates, leading_minutes
+        )
+        num_employees = len(employee_ids)
+        eligible = base_eligible & (week_hours >= self.min_hours)
+
+        ratio = np.minimum(week_hours / self.weekly_standard_hours, 1.0) if self.weekly_standard_hours else 1.0
+        allowance = np.where(eligible, np.round(self.allowance_hours * ratio, 2), 0.0)
+
+        index = pd.MultiIndex.from_product(
+            [employee_ids, pd.to_datetime(period_calendar.week_starts)], names=["employee_id", "week_start"]
+        )
+        frame = pd.DataFrame({
+            "week_end": np.tile(pd.to_datetime(period_calendar.week_ends), num_employees),
+            "week_hours": np.round(week_hours, 2).ravel(),
+            "eligible": eligible.ravel(),
+            "allowance_hours": allowance.ravel(),
+            "is_first_week": is_first_week.ravel(),
+            "is_complete": is_complete.ravel(),
+        }, index=index)
+
+        logger.info(f"Weekly holiday allowance calculated: {num_employees} employees x "
+                    f"{period_calendar.num_weeks} weeks, {int(eligible.sum())} eligible weeks")
+        return frame
+
+    def sweep_min_hours(self, period_calendar: PeriodCalendar, minutes_matrix: np.ndarray,
+                        min_hours_values: np.ndarray,
+                        hire_dates: Optional[List[Optional[datetime.date]]] = None,
+                        resignation_dates: Optional[List[Optional[datetime.date]]] = None,
+                        leading_minutes: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        min_hours 후보 값 전체에 대한 주휴수당 발생 주 수와 주휴 시간 합계를 한 번에 계산합니다.
+
+        min_hours를 제외한 판정 조건을 만족하는 주를 근로시간 순으로 정렬하고 주휴 시간의 누적합을 구한 뒤,
+        각 후보 값에 대해 이진 탐색으로 "근로시간 >= min_hours"인 주의 수와 합계를 찾습니다.
+
+        Args:
+            period_calendar: 기간 달력
+            minutes_matrix: (직원 x 일) 일별 근로시간(분) 행렬
+            min_hours_values: min_hours 후보 값 배열
+            hire_dates: 직원별 입사일 목록 (선택 사항)
+            resignation_dates: 직원별 퇴사일 목록 (선택 사항)
+            leading_minutes: 첫 주 중 이전 기간에 속한 날의 직원별 근로시간(분) 합계
+                (선택 사항, 없으면 이전 기간에서 시작된 첫 주는 판정하지 않음)
+
+        Returns:
+            pd.DataFrame: min_hours를 인덱스로 하는 eligible_weeks, allowance_hours
+        """
+        minutes = np.atleast_2d(np.asarray(minutes_matrix, dtype=np.float64))
+        week_hours, base_eligible, _, _ = self._weekly_arrays(
+            period_calendar, minutes.shape[0], minutes, hire_dates, resignation_dates, leading_minutes
+        )
+
+        candidate_hours = np.sort(week_hours[base_eligible])
+        ratio = np.minimum(candidate_hours / self.weekly_standard_hours, 1.0) if self.weekly_standard_hours else 1.0
+        allowance = np.round(self.allowance_hours * np.broadcast_to(ratio, candidate_hours.shape), 2)
+        # 근로시간 상위 주부터의 누적합 (suffix_sum[i] = allowance[i:].sum())
+        suffix_sum = np.concatenate([np.cumsum(allowance[::-1])[::-1], [0.0]])
+
+        values = np.asarray(min_hours_values, dtype=np.float64)
+        first_eligible = np.searchsorted(candidate_hours, values, side="left")
+        return pd.DataFrame({
+            "eligible_weeks": (candidate_hours.size - first_eligible).astype(int),
+            "allowance_hours": np.round(suffix_sum[first_eligible], 2),
+        }, index=pd.Index(values, name="min_hours"))
+
+    def summarize(self, weekly_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        주별 결과를 직원별 합계로 집계합니다.
+
+        Args:
+            weekly_frame: calculate 반환값
+
+        Returns:
+            pd.DataFrame: 직원 ID를 인덱스로 하는 eligible_weeks, allowance_hours
+        """
+        by_employee = weekly_frame.groupby(level="employee_id", sort=False)
+        return pd.DataFrame({
+            "eligible_weeks": by_employee["eligible"].sum().astype(int),
+            "allowance_hours": by_employee["allowance_hours"].sum().round(2),
+        })
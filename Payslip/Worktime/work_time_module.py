@@ -7,7 +7,10 @@
 
 import datetime
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+import pandas as pd
 
 # 로깅 설정 (필요시)
 import logging
@@ -28,6 +31,10 @@ class WorkTimeCalculator:
         self.overtime_start_hour_weekday = self.company_settings.get("overtime_start_hour_weekday", 8) # 일 소정근로 8시간 초과 시 연장
         self.night_work_start_hour = self.company_settings.get("night_work_start_hour", 22) # 22시
         self.night_work_end_hour = self.company_settings.get("night_work_end_hour", 6) # 익일 06시
+        # 배치 계산용 인턴 캐시 (동일한 시간/날짜 문자열은 한 번만 파싱)
+        self._time_minutes_cache: Dict[str, int] = {}
+        self._date_cache: Dict[str, Optional[datetime.date]] = {}
+        self._shift_minutes_cache: Dict[Tuple[str, str], int] = {}
 
     def _parse_time(self, time_str: str) -> datetime.time | None:
         """HH:MM 형식의 시간 문자열을 datetime.time 객체로 변환"""
@@ -308,6 +315,193 @@ class WorkTimeCalculator:
 
         return monthly_summary
 
+    # --- 배치 계산 (다수 직원 일괄 처리) --- #
+
+    # calculate_daily_work_details 결과 중 시간 단위 버킷 컬럼
+    BATCH_HOUR_COLUMNS = [
+        "regular_hours", "overtime_weekdays_1_5x", "overtime_holidays_1_5x", "overtime_holidays_2_0x",
+        "night_hours", "holiday_work_hours_within_8", "holiday_work_hours_over_8"
+    ]
+    BATCH_MINUTE_COLUMNS = ["actual_work_minutes_for_day", "break_time_minutes_applied", "recognized_work_minutes"]
+
+    def _intern_time_minutes(self, time_str: Optional[str]) -> int:
+        """HH:MM 문자열을 자정 기준 분(int)으로 변환합니다. 같은 문자열은 한 번만 파싱합니다. (오류 시 -1)"""
+        if not time_str:
+            return -1
+        minutes = self._time_minutes_cache.get(time_str)
+        if minutes is None:
+            parsed = self._parse_time(time_str)
+            minutes = parsed.hour * 60 + parsed.minute if parsed else -1
+            self._time_minutes_cache[time_str] = minutes
+        return minutes
+
+    def _intern_date(self, date_str: Optional[str]) -> Optional[datetime.date]:
+        """YYYY-MM-DD 문자열을 날짜로 변환합니다. 같은 문자열은 한 번만 파싱합니다. (오류 시 None)"""
+        if date_str not in self._date_cache:
+            try:
+                self._date_cache[date_str] = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+            except (TypeError, ValueError):
+                logger.error(f"잘못된 날짜 형식: {date_str}")
+                self._date_cache[date_str] = None
+        return self._date_cache[date_str]
+
+    def _intern_shift_minutes(self, shift_start_str: str, shift_end_str: str) -> int:
+        """소정근로 시작/종료 조합의 총 길이(분)를 계산합니다. (익일 종료 고려, 오류 시 -1)"""
+        shift_key = (shift_start_str, shift_end_str)
+        minutes = self._shift_minutes_cache.get(shift_key)
+        if minutes is None:
+            start = self._intern_time_minutes(shift_start_str)
+            end = self._intern_time_minutes(shift_end_str)
+            if start < 0 or end < 0:
+                minutes = -1
+            else:
+                minutes = end - start if end >= start else end + 1440 - start
+            self._shift_minutes_cache[shift_key] = minutes
+        return minutes
+
+    @staticmethod
+    def _is_recognized_leave(leave_type: Optional[str]) -> bool:
+        """소정근로시간으로 인정되는 유급휴가 유형인지 확인합니다."""
+        if not leave_type:
+            return False
+        return "paid" in leave_type.lower() or leave_type == "annual" or "annual_half" in leave_type
+
+    @staticmethod
+    def _minutes_to_rounded_hours(minutes: np.ndarray) -> np.ndarray:
+        """분 배열을 시간 단위로 변환하여 소수점 2자리로 반올림(ROUND_HALF_UP)합니다."""
+        return np.floor(minutes * 100 / 60 + 0.5 + 1e-9) / 100
+
+    def calculate_monthly_work_hours_batch(self, timecards_by_employee: Dict[str, List[dict]],
+                                           period_start_date_str: str, period_end_date_str: str) -> pd.DataFrame:
+        """
+        여러 직원의 일별 근태 기록을 한 번에 계산합니다.
+
+        calculate_daily_work_details와 동일한 규칙을 적용하되, 반복되는 시간/날짜/소정근로 문자열은
+        한 번만 파싱(인턴)하고 정규/연장/휴일/야간 버킷은 NumPy 배열 연산으로 일괄 계산합니다.
+        시간 값은 Decimal 대신 float(소수점 2자리 반올림)로 반환됩니다.
+
+        Args:
+            timecards_by_employee: 직원 ID별 일별 근태 기록 리스트 (work_time_data_structure.md 구조)
+            period_start_date_str: 기간 시작일 (YYYY-MM-DD)
+            period_end_date_str: 기간 종료일 (YYYY-MM-DD)
+
+        Returns:
+            pd.DataFrame: (employee_id, date) MultiIndex를 가진 일별 계산 결과
+        """
+        period_start = datetime.datetime.strptime(period_start_date_str, "%Y-%m-%d").date()
+        period_end = datetime.datetime.strptime(period_end_date_str, "%Y-%m-%d").date()
+        default_break_for_scheduled = self.company_settings.get("default_break_for_scheduled", 60)
+
+        employee_ids, dates, warnings = [], [], []
+        clock_in, clock_out, shift_minutes, break_minutes = [], [], [], []
+        is_holiday, is_weekday_type, leave_minutes, is_valid = [], [], [], []
+
+        for employee_id, timecard_data in timecards_by_employee.items():
+            for daily_record in timecard_data:
+                record_date = self._intern_date(daily_record.get("date"))
+                if record_date is None or not (period_start <= record_date <= period_end):
+                    continue
+
+                actual_clock_in_str = daily_record.get("actual_clock_in")
+                actual_clock_out_str = daily_record.get("actual_clock_out")
+                in_minutes = self._intern_time_minutes(actual_clock_in_str)
+                out_minutes = self._intern_time_minutes(actual_clock_out_str)
+                scheduled_minutes = self._intern_shift_minutes(
+                    daily_record.get("shift_start_time", "09:00"), daily_record.get("shift_end_time", "18:00")
+                )
+
+                row_warnings = []
+                if not actual_clock_in_str or not actual_clock_out_str:
+                    row_warnings.append("필수 시간 정보(날짜, 출/퇴근) 누락")
+                elif in_minutes < 0 or out_minutes < 0 or scheduled_minutes < 0:
+                    row_warnings.append("시간 형식 오류")
+
+                day_type = daily_record.get("day_type", "weekday")
+                leave_type = daily_record.get("leave_type")
+
+                employee_ids.append(employee_id)
+                dates.append(record_date)
+                warnings.append(row_warnings)
+                clock_in.append(in_minutes)
+                clock_out.append(out_minutes)
+                shift_minutes.append(scheduled_minutes)
+                break_minutes.append(float(daily_record.get("break_time_minutes", 0) or 0))
+                is_holiday.append(day_type in ("sunday", "public_holiday") or bool(daily_record.get("is_holiday_work", False)))
+                is_weekday_type.append(day_type in ("weekday", "saturday"))
+                leave_minutes.append(
+                    float(daily_record.get("leave_hours", 0) or 0) * 60 if self._is_recognized_leave(leave_type) else 0.0
+                )
+                is_valid.append(not row_warnings)
+
+        valid = np.array(is_valid, dtype=bool)
+        start = np.array(clock_in, dtype=np.float64)
+        end = np.array(clock_out, dtype=np.float64)
+        breaks = np.array(break_minutes, dtype=np.float64)
+        holiday = np.array(is_holiday, dtype=bool)
+        weekday_type = np.array(is_weekday_type, dtype=bool)
+        leave = np.array(leave_minutes, dtype=np.float64)
+        scheduled = np.array(shift_minutes, dtype=np.float64) - default_break_for_scheduled
+
+        # 1. 총 체류 시간 및 실근로 시간 (익일 퇴근 고려)
+        stay = end - start
+        stay = np.where(stay < 0, stay + 1440, stay)
+        actual = np.where(valid, np.maximum(stay - breaks, 0), 0)
+
+        # 2. 실근무 없이 유급휴가만 있는 날 (소정근로시간 한도 내 정규근로로 인정)
+        leave_only = valid & (actual == 0) & (leave > 0)
+        worked = valid & ~leave_only
+        leave_recognized = np.minimum(leave, scheduled)
+
+        # 3. 정규/연장/휴일 근로 버킷
+        daily_limit = self.overtime_start_hour_weekday * 60
+        regular = np.minimum(actual, daily_limit)
+        overtime_total = actual - regular
+        holiday_work = worked & holiday
+        weekday_work = worked & ~holiday & weekday_type
+
+        # 4. 야간 근로 (당일 야간 시작 ~ 익일 야간 종료 구간과의 교집합)
+        night_start = self.night_work_start_hour * 60
+        night_end = 1440 + self.night_work_end_hour * 60
+        night = np.clip(np.minimum(start + stay, night_end) - np.maximum(start, night_start), 0, None)
+
+        to_hours = self._minutes_to_rounded_hours
+        zeros = np.zeros(len(valid))
+        frame = pd.DataFrame({
+            "employee_id": employee_ids,
+            "date": pd.to_datetime(dates),
+            "regular_hours": np.where(leave_only, leave_recognized / 60, np.where(worked, to_hours(regular), 0)),
+            "overtime_weekdays_1_5x": np.where(weekday_work, to_hours(overtime_total), zeros),
+            "overtime_holidays_1_5x": np.where(holiday_work, to_hours(regular), zeros),
+            "overtime_holidays_2_0x": np.where(holiday_work, to_hours(overtime_total), zeros),
+            "night_hours": np.where(worked, to_hours(night), zeros),
+            "holiday_work_hours_within_8": np.where(holiday_work, to_hours(regular), zeros),
+            "holiday_work_hours_over_8": np.where(holiday_work, to_hours(overtime_total), zeros),
+            "actual_work_minutes_for_day": actual,
+            "break_time_minutes_applied": breaks,
+            "recognized_work_minutes": np.where(leave_only, leave_recognized, np.where(worked, actual + leave, 0)),
+            "warnings": warnings,
+        })
+        return frame.set_index(["employee_id", "date"]).sort_index()
+
+    def summarize_monthly_batch(self, batch_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        calculate_monthly_work_hours_batch 결과를 직원별 월 합계로 집계합니다.
+
+        Args:
+            batch_frame: calculate_monthly_work_hours_batch 반환값
+
+        Returns:
+            pd.DataFrame: 직원 ID를 인덱스로 하는 월별 시간 합계
+        """
+        by_employee = batch_frame.groupby(level="employee_id")
+        summary = by_employee[self.BATCH_HOUR_COLUMNS].sum().round(2)
+        worked_days = (batch_frame["actual_work_minutes_for_day"] > 0) | (batch_frame["recognized_work_minutes"] > 0)
+        summary["total_work_days"] = worked_days.groupby(level="employee_id").sum().astype(int)
+        summary["total_actual_work_hours"] = (by_employee["actual_work_minutes_for_day"].sum() / 60).round(2)
+        summary["total_recognized_work_hours"] = (by_employee["recognized_work_minutes"].sum() / 60).round(2)
+        summary["total_break_time_hours"] = (by_employee["break_time_minutes_applied"].sum() / 60).round(2)
+        return summary
+
 # 사용 예시 (테스트용)
 if __name__ == '__main__':
     calculator = WorkTimeCalculator()
@@ -0,0 +1,266 @@
+"""
+기준 결과 대비 차이(delta) 저장소 모듈
+
+정책 조합 시뮬레이션 결과는 대부분의 날짜가 기준(baseline) 결과와 같습니다. 이 모듈은 기준 결과를
+한 번만 보관하고, 각 조합에 대해서는 기준과 다른 (날짜, 필드) 값만 희소(COO) 형식으로 저장합니다.
+전체 결과는 필요할 때 복원하며, 기준 대비 일별 차이는 복원 없이 저장된 항목만으로 계산합니다.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Dict, List, Any, Optional, Sequence
+
+import numpy as np
+
+from .Worktime.schema import WorkTimeCalculationResult, WorkDayDetail
+from .result_comparator import SUMMARY_FIELDS, stack_summaries, _daily_items
+
+logger = logging.getLogger(__name__)
+
+DELTA_DAILY_FIELDS = ("regular_hours", "overtime_hours", "night_hours", "holiday_hours",
+                      "holiday_overtime_hours", "actual_work_minutes", "break_minutes_applied",
+                      "carried_in_minutes")
+
+# 일별 상세/시간 요약 외에 기준과 다를 때만 저장하는 결과 필드
+RESULT_OTHER_FIELDS = ("employee_id", "period", "processing_mode", "attendance_summary", "salary_basis",
+                       "warnings", "compliance_alerts", "error", "processed_timestamp", "custom_fields")
+
+
+def to_calculation_result(raw: Any, employee_id: Optional[str] = None, period: str = "") -> WorkTimeCalculationResult:
+    """
+    시뮬레이터 계산 결과 딕셔너리(time_summary, daily_details, warnings, ...)를 WorkTimeCalculationResult로 변환합니다.
+
+    Args:
+        raw: 계산 결과 딕셔너리 (WorkTimeCalculationResult이면 그대로 반환)
+        employee_id: 직원 ID
+        period: 기간 (YYYY-MM)
+
+    Returns:
+        WorkTimeCalculationResult
+    """
+    if isinstance(raw, WorkTimeCalculationResult):
+        return raw
+    return WorkTimeCalculationResult(
+        employee_id=employee_id,
+        period=period,
+        processing_mode="error" if raw.get("error") else "timecard",
+        time_summary=raw.get("time_summary"),
+        daily_calculation_details=raw.get("daily_details"),
+        warnings=raw.get("warnings") or [],
+        compliance_alerts=raw.get("compliance_alerts") or [],
+        error=raw.get("error")
+    )
+
+
+def _to_decimal(value: float) -> Decimal:
+    """저장된 float 값을 Decimal로 복원합니다."""
+    return Decimal(str(value))
+
+
+class BaselineDeltaStore:
+    """
+    기준 결과 대비 차이 저장소 클래스
+
+    일별 상세는 (날짜 순번, 필드 순번, 값) 희소 배열로, 시간 요약은 다른 지표만, 나머지 결과 필드는
+    기준과 다른 필드만 저장합니다. 기준 결과에 없는 날짜는 저장소 날짜 색인에 추가됩니다.
+    """
+
+    def __init__(self, baseline_name: str, baseline_result: WorkTimeCalculationResult,
+                 fields: Sequence[str] = DELTA_DAILY_FIELDS):
+        """
+        BaselineDeltaStore 초기화
+
+        Args:
+            baseline_name: 기준 결과 이름
+            baseline_result: 기준 계산 결과
+            fields: 차이를 저장할 일별 숫자 필드
+        """
+        self.baseline_name = baseline_name
+        self.baseline = baseline_result
+        self.fields = list(fields)
+
+        baseline_items = _daily_items(baseline_result)
+        self.dates: List[str] = [str(date) for date, _ in baseline_items]
+        self._date_values: List[Any] = [date for date, _ in baseline_items]
+        self._date_index: Dict[str, int] = {date: i for i, date in enumerate(self.dates)}
+        self._baseline_days: Dict[str, WorkDayDetail] = {str(date): detail for date, detail in baseline_items}
+        self._baseline_values = self._day_matrix(baseline_items)
+        self._baseline_summary = stack_summaries([baseline_result], SUMMARY_FIELDS)[0]
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def _day_matrix(self, items: List[Any]) -> np.ndarray:
+        """(날짜, 일별 상세) 목록을 (날짜 x 필드) 행렬로 변환합니다."""
+        values = np.zeros((len(items), len(self.fields)), dtype=np.float64)
+        for i, (_, detail) in enumerate(items):
+            for j, name in enumerate(self.fields):
+                values[i, j] = float(getattr(detail, name, 0) or 0)
+        return values
+
+    def _date_position(self, date: Any) -> int:
+        """날짜의 저장소 색인 순번 (없으면 추가)"""
+        key = str(date)
+        if key not in self._date_index:
+            self._date_index[key] = len(self.dates)
+            self.dates.append(key)
+            self._date_values.append(date)
+        return self._date_index[key]
+
+    def add(self, name: str, result: WorkTimeCalculationResult, policy_set: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+        """
+        결과를 기준 대비 차이로 저장합니다.
+
+        Args:
+            name: 결과(정책 조합) 이름
+            result: 계산 결과
+            policy_set: 정책 조합 (선택 사항)
+
+        Returns:
+            저장된 일별 값 수(stored_values)와 밀집 저장 시 값 수(dense_values)
+        """
+        items = _daily_items(result)
+        dates = [str(date) for date, _ in items]
+        values = self._day_matrix(items)
+
+        # 기준에 있는 날짜는 다른 칸만, 기준에 없는 날짜는 0이 아닌 칸만 저장
+        shared = np.array([date in self._baseline_days for date in dates], dtype=bool)
+        base_rows = np.array([self._date_index[date] if shared[k] else 0 for k, date in enumerate(dates)], dtype=np.int64)
+        reference = np.where(shared[:, None], self._baseline_values[base_rows], 0.0)
+        changed = values != reference
+        rows, cols = np.nonzero(changed)
+
+        positions = np.array([self._date_position(date) for date, _ in items], dtype=np.int32)
+        day_warnings = {}
+        for k, (date, detail) in enumerate(items):
+            base_day = self._baseline_days.get(dates[k])
+            warnings = list(getattr(detail, "warnings", []) or [])
+            if warnings != (list(base_day.warnings) if base_day is not None else []):
+                day_warnings[int(positions[k])] = warnings
+
+        summary = stack_summaries([result], SUMMARY_FIELDS)[0]
+        summary_changed = ~((summary == self._baseline_summary) | (np.isnan(summary) & np.isnan(self._baseline_summary)))
+        other = {field: getattr(result, field) for field in RESULT_OTHER_FIELDS
+                 if getattr(result, field, None) != getattr(self.baseline, field, None)}
+        if (result.time_summary is None) != (self.baseline.time_summary is None):
+            # 한쪽에만 시간 요약이 있으면 요약 전체를 저장
+            other["time_summary"] = result.time_summary
+            summary_changed[:] = False
+
+        self._entries[name] = {
+            "day_index": positions[rows],
+            "field_index": cols.astype(np.int8),
+            "values": values[rows, cols],
+            "present_days": np.sort(positions),
+            "day_warnings": day_warnings,
+            "summary_index": np.flatnonzero(summary_changed).astype(np.int8),
+            "summary_values": summary[summary_changed],
+            "other": other,
+            "policy_set": policy_set,
+        }
+        return {"stored_values": int(rows.size), "dense_values": int(values.size)}
+
+    def _present_dates(self, entry: Dict[str, Any]) -> set:
+        """결과에 있는 날짜 집합"""
+        return {self.dates[i] for i in entry["present_days"]}
+
+    def get(self, name: str) -> WorkTimeCalculationResult:
+        """
+        저장된 차이로 전체 결과를 복원합니다.
+
+        Args:
+            name: 결과 이름 (기준 결과 이름이면 기준 결과 반환)
+
+        Returns:
+            WorkTimeCalculationResult
+        """
+        if name == self.baseline_name:
+            return self.baseline
+        entry = self._entries[name]
+
+        updates_by_day: Dict[int, Dict[str, Decimal]] = {}
+        for day, field, value in zip(entry["day_index"].tolist(), entry["field_index"].tolist(), entry["values"].tolist()):
+            updates_by_day.setdefault(day, {})[self.fields[field]] = _to_decimal(value)
+
+        daily_details = []
+        for day in entry["present_days"].tolist():
+            date = self.dates[day]
+            update = dict(updates_by_day.get(day, {}))
+            if day in entry["day_warnings"]:
+                update["warnings"] = list(entry["day_warnings"][day])
+            base_day = self._baseline_days.get(date)
+            if base_day is not None:
+                daily_details.append(base_day.model_copy(update=update) if update else base_day)
+            else:
+                update.setdefault("warnings", [])
+                daily_details.append(WorkDayDetail.model_construct(
+                    date=self._date_values[day], **{field: update.get(field, Decimal("0.0")) for field in self.fields},
+                    **{key: value for key, value in update.items() if key not in self.fields}
+                ))
+        daily_details.sort(key=lambda detail: str(detail.date))
+
+        time_summary = self.baseline.time_summary
+        if entry["summary_index"].size:
+            summary_update = {SUMMARY_FIELDS[i]: _to_decimal(v)
+                              for i, v in zip(entry["summary_index"].tolist(), entry["summary_values"].tolist())}
+            time_summary = time_summary.model_copy(update=summary_update) if time_summary is not None else None
+
+        update = {"daily_calculation_details": daily_details, "time_summary": time_summary}
+        update.update(entry["other"])
+        return self.baseline.model_copy(update=update)
+
+    def diff(self, name: str) -> Dict[str, Any]:
+        """
+        기준 대비 일별 차이를 저장된 항목만으로 계산합니다. (PolicySimulator._compare_daily_details와 같은 형식)
+
+        Args:
+            name: 결과 이름
+
+        Returns:
+            only_in_a(기준에만 있는 날짜), only_in_b(결과에만 있는 날짜), daily_diffs(날짜 -> 필드 -> a/b/diff)
+        """
+        entry = self._entries[name]
+        present = self._present_dates(entry)
+        daily_diffs: Dict[str, Dict[str, Any]] = {}
+        for day, field, value in zip(entry["day_index"].tolist(), entry["field_index"].tolist(), entry["values"].tolist()):
+            date = self.dates[day]
+            if date not in self._baseline_days:
+                continue
+            base_value = float(self._baseline_values[day, field])
+            daily_diffs.setdefault(date, {})[self.fields[field]] = {
+                "a": base_value, "b": value, "diff": value - base_value
+            }
+        return {
+            "only_in_a": sorted(set(self._baseline_days) - present),
+            "only_in_b": sorted(present - set(self._baseline_days)),
+            "daily_diffs": daily_diffs
+        }
+
+    def policy_set(self, name: str) -> Optional[Dict[str, Any]]:
+        """저장된 결과의 정책 조합"""
+        return self._entries[name]["policy_set"]
+
+    @property
+    def names(self) -> List[str]:
+        """기준 결과를 포함한 저장된 결과 이름 목록"""
+        return [self.baseline_name] + list(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        저장소 통계를 반환합니다.
+
+        Returns:
+            entries, stored_values(희소 저장 값 수), dense_values(전체 저장 시 값 수), compression_ratio
+        """
+        stored = sum(int(entry["values"].size) for entry in self._entries.values())
+        dense = sum(int(entry["present_days"].size) * len(self.fields) for entry in self._entries.values())
+        return {
+            "entries": len(self._entries),
+            "stored_values": stored,
+            "dense_values": dense,
+            "compression_ratio": round(dense / stored, 2) if stored else None
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries) + 1
+
+    def __contains__(self, name: str) -> bool:
+        return name == self.baseline_name or name in self._entries
@@ -0,0 +1,340 @@
+"""
+정책 조합 최적화 모듈
+
+모든 정책 조합을 시뮬레이션하는 대신, 사용자가 지정한 목표 지표에 대해 상위 k개 또는
+파레토 최적 조합만 찾는 탐색기를 제공합니다. 무작위 유효 조합에서 시작하여 한 카테고리의 옵션만
+바꾼 이웃 조합을 평가하는 지역 탐색을 반복하고, 결과 집합(frontier)이 일정 라운드 동안 변하지 않으면
+탐색을 조기 종료합니다.
+"""
+
+import logging
+import random
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+from .combination_runner import (
+    _compile_conflict_masks,
+    _execute_simulations,
+    count_valid_combinations,
+    iter_valid_combinations,
+    EXECUTION_BACKENDS
+)
+
+logger = logging.getLogger(__name__)
+
+OPTIMIZATION_MODES = ("top_k", "pareto")
+OBJECTIVE_DIRECTIONS = ("min", "max")
+
+
+class PolicyCombinationOptimizer:
+    """
+    정책 조합 최적화 클래스
+
+    정책 조합을 카테고리별 옵션 순번의 튜플로 표현하고, 이웃 탐색으로 목표 지표의
+    상위 k개 조합(top_k) 또는 파레토 최적 조합(pareto)을 찾습니다.
+    """
+
+    def __init__(self, policy_options: Dict[str, List[Dict[str, Any]]], objectives: Dict[str, str],
+                 mode: str = "top_k", k: int = 5):
+        """
+        PolicyCombinationOptimizer 초기화
+
+        Args:
+            policy_options: 카테고리별 정책 옵션
+            objectives: 목표 지표별 방향 ({"total_pay": "max", "total_hours": "min"} 형식).
+                top_k 모드에서는 선언 순서대로 사전식 비교합니다.
+            mode: 최적화 모드 ("top_k", "pareto")
+            k: top_k 모드에서 반환할 조합 수
+        """
+        if mode not in OPTIMIZATION_MODES:
+            raise ValueError(f"지원하지 않는 최적화 모드: {mode} (사용 가능: {', '.join(OPTIMIZATION_MODES)})")
+        if not objectives:
+            raise ValueError("목표 지표가 지정되지 않았습니다.")
+        for metric, direction in objectives.items():
+            if direction not in OBJECTIVE_DIRECTIONS:
+                raise ValueError(f"목표 지표 {metric}의 방향이 올바르지 않습니다: {direction} (min 또는 max)")
+
+        self.policy_options = policy_options
+        self.objectives = dict(objectives)
+        self.mode = mode
+        self.k = max(1, int(k))
+
+        self.categories, self.options_list, self.conflict_masks, _ = _compile_conflict_masks(policy_options)
+        self._offsets = []
+        offset = 0
+        for options in self.options_list:
+            self._offsets.append(offset)
+            offset += len(options)
+
+        # 평가 캐시: 상태 -> (목표 지표 벡터(최소화 기준), 결과 항목). 오류 조합은 벡터가 None
+        self._evaluations: Dict[Tuple[int, ...], Tuple[Optional[Tuple[float, ...]], Dict[str, Any]]] = {}
+        self._order: Dict[Tuple[int, ...], int] = {}
+
+    def is_valid(self, state: Tuple[int, ...]) -> bool:
+        """
+        조합(옵션 순번 튜플)에 충돌이 없는지 확인합니다.
+
+        Args:
+            state: 카테고리별 옵션 순번
+
+        Returns:
+            bool: 유효 여부
+        """
+        chosen_mask = 0
+        for depth, option_index in enumerate(state):
+            if self.conflict_masks[depth][option_index] & chosen_mask:
+                return False
+            chosen_mask |= 1 << (self._offsets[depth] + option_index)
+        return True
+
+    def build_combination(self, state: Tuple[int, ...]) -> Dict[str, Any]:
+        """
+        옵션 순번 튜플을 generate_policy_combination_matrix와 같은 형식의 정책 조합으로 변환합니다.
+
+        Args:
+            state: 카테고리별 옵션 순번
+
+        Returns:
+            정책 조합
+        """
+        combo = [self.options_list[depth][option_index] for depth, option_index in enumerate(state)]
+        return {
+            "name": " + ".join([option.get("name", "unknown") for option in combo]),
+            "policies": combo,
+            "categories": {self.categories[i]: combo[i].get("name", "unknown") for i in range(len(self.categories))}
+        }
+
+    def neighbors(self, state: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        """
+        한 카테고리의 옵션만 바꾼 유효한 이웃 조합 목록을 반환합니다.
+
+        Args:
+            state: 카테고리별 옵션 순번
+
+        Returns:
+            이웃 조합 목록
+        """
+        result = []
+        for depth, options in enumerate(self.options_list):
+            for option_index in range(len(options)):
+                if option_index == state[depth]:
+                    continue
+                candidate = state[:depth] + (option_index,) + state[depth + 1:]
+                if self.is_valid(candidate):
+                    result.append(candidate)
+        return result
+
+    def random_states(self, count: int, rng: random.Random, max_attempts: Optional[int] = None) -> List[Tuple[int, ...]]:
+        """
+        평가되지 않은 무작위 유효 조합을 생성합니다.
+
+        Args:
+            count: 생성할 조합 수
+            rng: 난수 생성기
+            max_attempts: 최대 시도 횟수 (기본값: count * 20)
+
+        Returns:
+            조합 목록
+        """
+        states = []
+        seen = set()
+        for _ in range(max_attempts or count * 20):
+            if len(states) >= count:
+                break
+            state = tuple(rng.randrange(len(options)) for options in self.options_list)
+            if state in seen or self.is_evaluated(state) or not self.is_valid(state):
+                continue
+            seen.add(state)
+            states.append(state)
+        return states
+
+    def _objective_vector(self, result_item: Dict[str, Any]) -> Optional[Tuple[float, ...]]:
+        """결과 항목에서 최소화 기준 목표 지표 벡터를 만듭니다. (max 지표는 부호 반전)"""
+        if "result" not in result_item:
+            return None
+        time_summary = result_item["result"].get("time_summary", {})
+        if hasattr(time_summary, "model_dump"):
+            time_summary = time_summary.model_dump()
+        vector = []
+        for metric, direction in self.objectives.items():
+            if metric not in time_summary:
+                # 없는 지표를 0으로 두면 모든 조합이 같은 값이 되어 임의의 결과가 반환되므로 오류로 처리
+                raise ValueError(f"목표 지표 {metric}이(가) 시뮬레이션 결과에 없습니다. "
+                                 f"(급여 지표는 hourly_wage를 지정해야 계산됩니다)")
+            value = float(time_summary[metric] or 0)
+            vector.append(value if direction == "min" else -value)
+        return tuple(vector)
+
+    def is_evaluated(self, state: Tuple[int, ...]) -> bool:
+        """조합이 이미 평가되었는지 확인합니다."""
+        return state in self._evaluations
+
+    def record(self, state: Tuple[int, ...], result_item: Dict[str, Any]) -> None:
+        """
+        평가 결과를 캐시에 기록합니다.
+
+        Args:
+            state: 카테고리별 옵션 순번
+            result_item: 시뮬레이션 결과 항목 ({"policy_set", "result"} 또는 {"policy_set", "error"})
+        """
+        self._order.setdefault(state, len(self._order))
+        self._evaluations[state] = (self._objective_vector(result_item), result_item)
+
+    def frontier(self) -> List[Tuple[int, ...]]:
+        """
+        현재까지 평가된 조합 중 결과 집합(top_k 또는 파레토 최적)을 반환합니다.
+
+        Returns:
+            조합 목록 (top_k는 순위 순, pareto는 첫 번째 목표 지표 순)
+        """
+        scored = [(vector, self._order[state], state) for state, (vector, _) in self._evaluations.items()
+                  if vector is not None]
+        scored.sort()
+        if self.mode == "top_k":
+            return [state for _, _, state in scored[:self.k]]
+
+        front: List[Tuple[Tuple[float, ...], int, Tuple[int, ...]]] = []
+        for candidate in scored:
+            # 정렬되어 있으므로 이후 조합이 이전 조합을 지배할 수 없음
+            if not any(_dominates(member[0], candidate[0]) for member in front):
+                front.append(candidate)
+        return [state for _, _, state in front]
+
+    def evaluation_item(self, state: Tuple[int, ...]) -> Dict[str, Any]:
+        """
+        평가된 조합의 결과 항목을 목표 지표 값과 함께 반환합니다.
+
+        Args:
+            state: 카테고리별 옵션 순번
+
+        Returns:
+            결과 항목
+        """
+        vector, result_item = self._evaluations[state]
+        objectives = {}
+        for (metric, direction), value in zip(self.objectives.items(), vector or ()):
+            objectives[metric] = value if direction == "min" else -value
+        return {
+            "policy_set": result_item["policy_set"].get("name", "unknown"),
+            "combination": result_item["policy_set"],
+            "objectives": objectives,
+            "result": result_item.get("result")
+        }
+
+    @property
+    def evaluations_count(self) -> int:
+        """평가된 조합 수"""
+        return len(self._evaluations)
+
+
+def _dominates(a: Tuple[float, ...], b: Tuple[float, ...]) -> bool:
+    """최소화 기준 벡터 a가 b를 지배하는지 확인합니다."""
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+
+def optimize_policy_combinations(input_data: Any, policy_options: Dict[str, List[Dict[str, Any]]],
+                                 objectives: Dict[str, str], mode: str = "top_k", k: int = 5,
+                                 initial_samples: int = 8, restarts_per_round: int = 2, patience: int = 3,
+                                 max_evaluations: Optional[int] = None, seed: Optional[int] = 0,
+                                 backend: str = "inline", max_workers: Optional[int] = 4,
+                                 simulator_factory: Optional[Callable[[], Any]] = None,
+                                 hourly_wage: Optional[float] = None) -> Dict[str, Any]:
+    """
+    목표 지표에 대한 상위 k개 또는 파레토 최적 정책 조합을 탐색합니다.
+
+    무작위 유효 조합으로 시작하여 매 라운드마다 결과 집합에 속한 조합의 이웃(한 카테고리만 변경)과
+    소수의 무작위 조합을 평가합니다. 결과 집합이 patience 라운드 연속으로 변하지 않거나,
+    새로 평가할 조합이 없거나, 평가 횟수 한도에 도달하면 종료합니다. 평가 결과는 캐시되어
+    같은 조합은 한 번만 시뮬레이션합니다.
+
+    Args:
+        input_data: 시뮬레이션 입력 데이터
+        policy_options: 카테고리별 정책 옵션
+        objectives: 목표 지표별 방향 ({"total_pay": "max", "total_hours": "min"} 형식)
+        mode: 최적화 모드 ("top_k", "pareto")
+        k: top_k 모드에서 반환할 조합 수
+        initial_samples: 초기 무작위 조합 수
+        restarts_per_round: 라운드마다 추가로 평가할 무작위 조합 수 (지역 최적 탈출용)
+        patience: 결과 집합이 변하지 않은 채 허용하는 라운드 수
+        max_evaluations: 최대 평가 조합 수 (None이면 제한 없음)
+        seed: 난수 시드
+        backend: 라운드별 평가 실행 백엔드 ("process", "thread", "inline")
+        max_workers: 병렬 처리 작업자 수
+        simulator_factory: 시뮬레이터 생성 함수 (기본값: PolicySimulator)
+        hourly_wage: 통상시급 (total_pay 등 급여 지표를 목표로 할 때 필요)
+
+    Returns:
+        최적화 결과
+    """
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(f"지원하지 않는 실행 백엔드: {backend} (사용 가능: {', '.join(EXECUTION_BACKENDS)})")
+
+    optimizer = PolicyCombinationOptimizer(policy_options, objectives, mode=mode, k=k)
+    counts = count_valid_combinations(policy_options)
+    rng = random.Random(seed)
+    budget = min(max_evaluations, counts["valid"]) if max_evaluations else counts["valid"]
+
+    def evaluate(states: List[Tuple[int, ...]]) -> None:
+        states = states[:max(0, budget - optimizer.evaluations_count)]
+        if not states:
+            return
+        combinations = [optimizer.build_combination(state) for state in states]
+        results, _ = _execute_simulations(input_data, combinations, backend=backend, max_workers=max_workers,
+                                          simulator_factory=simulator_factory, hourly_wage=hourly_wage)
+        for state, result_item in zip(states, results):
+            optimizer.record(state, result_item)
+
+    evaluate(optimizer.random_states(initial_samples, rng))
+    if optimizer.evaluations_count == 0 and counts["valid"] > 0:
+        # 충돌이 많아 무작위 추출이 실패한 경우 첫 번째 유효 조합에서 시작
+        first = next(iter_valid_combinations(policy_options))
+        state = tuple(
+            next(i for i, option in enumerate(options) if option is chosen)
+            for options, chosen in zip(optimizer.options_list, first["policies"])
+        )
+        evaluate([state])
+
+    rounds = 0
+    stable_rounds = 0
+    stopped_reason = "exhausted"
+    current = optimizer.frontier()
+    while optimizer.evaluations_count < budget:
+        rounds += 1
+        candidates = []
+        seen = set()
+        for state in current:
+            for neighbor in optimizer.neighbors(state):
+                if neighbor not in seen and not optimizer.is_evaluated(neighbor):
+                    seen.add(neighbor)
+                    candidates.append(neighbor)
+        candidates += [state for state in optimizer.random_states(restarts_per_round, rng) if state not in seen]
+        if not candidates:
+            stopped_reason = "no_candidates"
+            break
+
+        evaluate(candidates)
+        updated = optimizer.frontier()
+        stable_rounds = stable_rounds + 1 if updated == current else 0
+        current = updated
+        if stable_rounds >= patience:
+            stopped_reason = "stable_frontier"
+            break
+    else:
+        if optimizer.evaluations_count >= budget and budget < counts["valid"]:
+            stopped_reason = "max_evaluations"
+
+    logger.info(f"정책 조합 최적화 완료: {optimizer.evaluations_count}/{counts['valid']}개 평가, "
+                f"{rounds}라운드 ({stopped_reason})")
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "metadata": {
+            "mode": mode,
+            "objectives": dict(objectives),
+            "evaluations": optimizer.evaluations_count,
+            "valid_combinations": counts["valid"],
+            "rounds": rounds,
+            "stopped_reason": stopped_reason
+        },
+        "results": [optimizer.evaluation_item(state) for state in current]
+    }
@@ -6,17 +6,224 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Callable, Iterator
 import logging
 import json
 from datetime import datetime
 import itertools
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import math
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from .simulation_checkpoint import SimulationCheckpoint, SimulationProgress, canonical_hash
+from .policy_canonical import plan_policy_dedupe, DefaultsSource
+from .baseline_delta_store import BaselineDeltaStore, to_calculation_result
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 작업자별 상태 (초기화 함수에서 한 번만 설정)
+_WORKER_STATE: Dict[str, Any] = {}
+
+EXECUTION_BACKENDS = ("process", "thread", "inline")
+
+
+def _default_simulator_factory():
+    """기본 시뮬레이터(PolicySimulator)를 생성합니다."""
+    from .policy_simulator import PolicySimulator
+    return PolicySimulator()
+
+
+def _init_simulation_worker(input_data: Any, simulator_factory: Callable[[], Any],
+                            hourly_wage: Optional[float] = None) -> None:
+    """
+    작업자 초기화 함수. 입력 데이터와 시뮬레이터를 작업자당 한 번만 준비합니다.
+
+    Args:
+        input_data: 시뮬레이션 입력 데이터
+        simulator_factory: 시뮬레이터 생성 함수 (프로세스 백엔드에서는 pickle 가능해야 함)
+        hourly_wage: 통상시급 (지정 시 시뮬레이터에 전달)
+    """
+    _WORKER_STATE["input_data"] = input_data
+    _WORKER_STATE["simulator"] = simulator_factory()
+    _WORKER_STATE["hourly_wage"] = hourly_wage
+
+
+def _simulate_chunk(indexed_policy_sets: List[Tuple[int, Dict[str, Any]]],
+                    input_data: Any = None, simulator: Any = None,
+                    hourly_wage: Optional[float] = None) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    정책 조합 묶음(chunk)을 순서대로 시뮬레이션합니다.
+
+    Args:
+        indexed_policy_sets: (원래 순번, 정책 조합) 목록
+        input_data: 입력 데이터 (생략 시 작업자 초기화 상태 사용)
+        simulator: 시뮬레이터 (생략 시 작업자 초기화 상태 사용)
+        hourly_wage: 통상시급 (simulator 생략 시 작업자 초기화 상태 사용)
+
+    Returns:
+        (원래 순번, 결과 항목) 목록
+    """
+    input_data = input_data if input_data is not None else _WORKER_STATE["input_data"]
+    if simulator is None:
+        simulator = _WORKER_STATE["simulator"]
+        hourly_wage = _WORKER_STATE.get("hourly_wage")
+    # 시급이 없으면 시뮬레이터 기본 호출 형식 유지 (시급 인자를 받지 않는 시뮬레이터 지원)
+    simulate_kwargs = {"hourly_wage": hourly_wage} if hourly_wage is not None else {}
+
+    chunk_results = []
+    for index, policy_set in indexed_policy_sets:
+        try:
+            result = simulator.simulate(input_data, policy_set, **simulate_kwargs)
+            chunk_results.append((index, {"policy_set": policy_set, "result": result}))
+        except Exception as e:
+            name = policy_set.get("name", "unknown") if isinstance(policy_set, dict) else "unknown"
+            logger.error(f"정책 조합 {name} 시뮬레이션 중 오류 발생: {e}", exc_info=True)
+            chunk_results.append((index, {"policy_set": policy_set, "error": str(e)}))
+    return chunk_results
+
+
+def _chunk_policy_sets(policy_combinations: List[Dict[str, Any]], chunk_size: int) -> List[List[Tuple[int, Dict[str, Any]]]]:
+    """정책 조합을 (순번, 조합) 묶음으로 나눕니다."""
+    indexed = list(enumerate(policy_combinations))
+    return [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+
+
+def _resolve_chunk_size(total: int, max_workers: int, chunk_size: Optional[int]) -> int:
+    """묶음 크기 결정 (기본값: 작업자당 약 4개 묶음)"""
+    if chunk_size:
+        return max(1, int(chunk_size))
+    return max(1, math.ceil(total / (max_workers * 4)))
+
+
+def _dispatch_chunks(task: Callable[..., Any], chunks: List[Any], backend: str, max_workers: int,
+                     initializer: Callable[..., None], initargs: Tuple[Any, ...],
+                     local_kwargs_factory: Callable[[], Dict[str, Any]],
+                     on_output: Optional[Callable[[Any], None]] = None) -> Tuple[List[Any], str]:
+    """
+    작업 묶음을 지정된 실행 백엔드로 실행합니다.
+    프로세스 풀을 사용할 수 없으면 스레드, 스레드도 사용할 수 없으면 현재 프로세스에서 순차 실행합니다.
+    프로세스 풀 전환은 작업자로 보낼 객체를 pickle할 수 없거나 작업자를 시작/유지할 수 없는 경우
+    (BrokenProcessPool)로 한정하며, 작업 결과 처리나 on_output 콜백에서 발생한 예외는 그대로 전달합니다.
+    전환 시 이전 시도의 부분 결과는 버리므로 호출자는 결과를 중복 집계하지 않습니다.
+
+    Args:
+        task: 묶음 하나를 처리하는 함수 (프로세스 백엔드에서는 작업자 상태 사용, 그 외에는 local_kwargs 사용)
+        chunks: 작업 묶음 목록
+        backend: 실행 백엔드 ("process", "thread", "inline")
+        max_workers: 병렬 처리 작업자 수
+        initializer: 프로세스 작업자 초기화 함수
+        initargs: 초기화 함수 인자
+        local_kwargs_factory: 스레드/순차 실행 시 task에 전달할 인자를 만드는 함수
+        on_output: 묶음이 완료될 때마다 호출할 함수 (현재 프로세스에서 호출되며, 백엔드 전환 시 다시 호출될 수 있음)
+
+    Returns:
+        (묶음별 결과 목록(완료 순서), 실제 사용된 백엔드)
+    """
+    def completed(output: Any, outputs: List[Any]) -> None:
+        outputs.append(output)
+        if on_output:
+            on_output(output)
+
+    if backend == "process":
+        try:
+            # 작업자로 보낼 객체를 미리 직렬화해 보아 pickle 불가(로컬 함수, 람다 등)를 제출 전에 판별
+            pickle.dumps((task, initializer, initargs, chunks), protocol=pickle.HIGHEST_PROTOCOL)
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+        except (pickle.PicklingError, AttributeError, TypeError, OSError) as e:
+            logger.warning(f"프로세스 풀을 사용할 수 없어 스레드 백엔드로 전환합니다: {e}")
+            backend = "thread"
+        else:
+            try:
+                outputs = []
+                with executor:
+                    try:
+                        futures = [executor.submit(task, chunk) for chunk in chunks]
+                    except OSError as e:  # 작업자 프로세스 시작 실패
+                        raise BrokenProcessPool(str(e)) from e
+                    for future in as_completed(futures):
+                        completed(future.result(), outputs)
+                return outputs, "process"
+            except BrokenProcessPool as e:
+                logger.warning(f"프로세스 풀 실행 실패, 스레드 백엔드로 전환합니다: {e}")
+                backend = "thread"
+
+    # 스레드/순차 실행은 메모리를 공유하므로 입력 데이터와 시뮬레이터를 그대로 전달
+    local_kwargs = local_kwargs_factory()
+    if backend == "thread":
+        try:
+            outputs = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for future in as_completed([executor.submit(task, chunk, **local_kwargs) for chunk in chunks]):
+                    completed(future.result(), outputs)
+            return outputs, "thread"
+        except RuntimeError as e:
+            logger.warning(f"스레드 풀 실행 실패, 순차 실행으로 전환합니다: {e}")
+
+    outputs = []
+    for chunk in chunks:
+        completed(task(chunk, **local_kwargs), outputs)
+    return outputs, "inline"
+
+
+def _execute_simulations(input_data: Any, policy_combinations: List[Dict[str, Any]], backend: str = "thread",
+                         max_workers: Optional[int] = 4, chunk_size: Optional[int] = None,
+                         simulator_factory: Optional[Callable[[], Any]] = None,
+                         on_chunk_complete: Optional[Callable[[List[Tuple[int, Dict[str, Any]]]], None]] = None,
+                         hourly_wage: Optional[float] = None) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    지정된 실행 백엔드로 정책 조합 시뮬레이션을 실행합니다.
+    프로세스 풀을 사용할 수 없으면 스레드, 스레드도 사용할 수 없으면 현재 프로세스에서 순차 실행합니다.
+
+    Args:
+        input_data: 시뮬레이션 입력 데이터
+        policy_combinations: 정책 조합 목록
+        backend: 실행 백엔드 ("process", "thread", "inline")
+        max_workers: 병렬 처리 작업자 수 (None이면 CPU 수)
+        chunk_size: 작업 제출 단위 묶음 크기 (None이면 자동)
+        simulator_factory: 시뮬레이터 생성 함수 (기본값: PolicySimulator)
+        on_chunk_complete: 묶음이 완료될 때마다 (순번, 결과 항목) 목록으로 호출할 함수
+        hourly_wage: 통상시급 (지정 시 시뮬레이터가 time_summary에 급여 지표를 포함)
+
+    Returns:
+        (입력 순서대로의 결과 항목 목록, 실제 사용된 백엔드)
+    """
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(f"지원하지 않는 실행 백엔드: {backend} (사용 가능: {', '.join(EXECUTION_BACKENDS)})")
+
+    simulator_factory = simulator_factory or _default_simulator_factory
+    max_workers = max_workers or os.cpu_count() or 1
+    if not policy_combinations:
+        return [], backend
+
+    chunks = _chunk_policy_sets(policy_combinations, _resolve_chunk_size(len(policy_combinations), max_workers, chunk_size))
+    chunk_outputs, used_backend = _dispatch_chunks(
+        _simulate_chunk, chunks, backend, max_workers,
+        initializer=_init_simulation_worker, initargs=(input_data, simulator_factory, hourly_wage),
+        local_kwargs_factory=lambda: {"input_data": input_data, "simulator": simulator_factory(),
+                                      "hourly_wage": hourly_wage},
+        on_output=on_chunk_complete
+    )
+
+    ordered_results: List[Optional[Dict[str, Any]]] = [None] * len(policy_combinations)
+    for chunk_results in chunk_outputs:
+        for index, item in chunk_results:
+            ordered_results[index] = item
+    return ordered_results, used_backend
+
+
 def run_simulations_on_combinations(input_data: Dict[str, Any], policy_combinations: List[Dict[str, Any]], 
-                                   max_workers: int = 4) -> Dict[str, Any]:
+                                   max_workers: int = 4, backend: str = "thread",
+                                   chunk_size: Optional[int] = None,
+                                   simulator_factory: Optional[Callable[[], Any]] = None,
+                                   checkpoint_path: Optional[str] = None,
+                                   progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                   dedupe: bool = True,
+                                   policy_defaults: Optional[DefaultsSource] = None,
+                                   policy_version: Optional[str] = None,
+                                   delta_baseline: Optional[int] = None) -> Dict[str, Any]:
     """
     여러 정책 조합에 대해 시뮬레이션을 실행합니다.
     
@@ -24,139 +231,505 @@ def run_simulations_on_combinations(input_data: Dict[str, Any], policy_combinati
         input_data: 시뮬레이션 입력 데이터
         policy_combinations: 정책 조합 목록
         max_workers: 병렬 처리 작업자 수
+        backend: 실행 백엔드 ("process", "thread", "inline"). 시뮬레이션은 순수 Python CPU 작업이므로
+            대량 조합은 GIL의 영향을 받지 않는 "process"가 빠르지만, Streamlit 재실행이나 Windows(spawn)에서도
+            안전하도록 기본값은 스레드입니다. 프로세스 풀을 사용할 수 없으면 스레드/순차 실행으로 전환됩니다.
+        chunk_size: 작업 제출 단위 묶음 크기 (None이면 자동)
+        simulator_factory: 시뮬레이터 생성 함수 (기본값: PolicySimulator)
+        checkpoint_path: 체크포인트 JSONL 파일 경로 (지정 시 완료된 조합 결과를 기록하고,
+            같은 입력으로 재실행하면 이미 완료된 조합은 건너뜀. 오류 조합은 기록하지 않아 재실행 시 다시 시도)
+        progress_callback: 묶음 완료 시마다 진행 상황(completed, total, resumed, throughput, eta_seconds)을
+            전달받을 함수
+        dedupe: 실질적으로 같은 정책 조합(이름/키 순서/점 표기 여부만 다르거나 기본값을 명시한 조합)을
+            한 번만 시뮬레이션하고 결과를 모든 별칭에 나누어 줄지 여부
+        policy_defaults: 점 표기 키별 기본값 또는 조회 함수 (시뮬레이터가 실제로 적용하는 기반 정책 값,
+            예: PolicySimulator.base_policy_manager.get. 같은 값은 정규화 시 제거)
+        policy_version: 체크포인트 키에 포함할 기반 정책/설정 버전 (생략 시 시뮬레이터의 policy_version 속성 사용)
+        delta_baseline: 기준 조합 순번 (지정 시 기준 조합을 먼저 계산하고, 나머지 조합은 완료되는 대로
+            기준 대비 차이만 "delta_store"(BaselineDeltaStore)에 기록. 결과 항목에는 time_summary와
+            저장소 이름(delta_name)만 남으며 전체 결과는 delta_store.get(이름)으로 복원)
         
     Returns:
         시뮬레이션 결과
     """
-    from .policy_simulator import PolicySimulator
-    
     # 결과 초기화
     simulation_results = {
         "timestamp": datetime.now().isoformat(),
         "metadata": {
-            "input_data_id": input_data.get("id", "unknown"),
+            "input_data_id": input_data.get("id", "unknown") if isinstance(input_data, dict) else getattr(input_data, "employee_id", "unknown"),
             "combinations_count": len(policy_combinations),
-            "simulation_parameters": input_data.get("parameters", {})
+            "simulation_parameters": input_data.get("parameters", {}) if isinstance(input_data, dict) else {}
         },
         "results": [],
         "metrics_summary": {},
         "best_combinations": {}
     }
     
-    # 시뮬레이터 초기화
-    simulator = PolicySimulator()
-    
-    # 병렬 처리로 시뮬레이션 실행
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_policy = {
-            executor.submit(simulator.simulate, input_data, policy_set): policy_set
-            for policy_set in policy_combinations
-        }
-        
-        for future in as_completed(future_to_policy):
-            policy_set = future_to_policy[future]
-            try:
-                result = future.result()
-                # 결과 저장
-                simulation_results["results"].append({
-                    "policy_set": policy_set,
-                    "result": result
-                })
-            except Exception as e:
-                logger.error(f"정책 조합 {policy_set.get('name', 'unknown')} 시뮬레이션 중 오류 발생: {e}", exc_info=True)
-                simulation_results["results"].append({
-                    "policy_set": policy_set,
-                    "error": str(e)
-                })
-    
-    # 주요 지표 요약
-    metrics = ["total_hours", "overtime_hours", "night_hours", "holiday_hours", 
-               "base_pay", "overtime_pay", "night_pay", "holiday_pay", "total_pay"]
+    # 실질적으로 같은 정책 조합은 대표 조합 하나만 시뮬레이션
+    dedupe_plan = plan_policy_dedupe(policy_combinations, policy_defaults) if dedupe else None
+    unique_combinations = ([policy_combinations[index] for index in dedupe_plan.unique_indices]
+                           if dedupe_plan else policy_combinations)
+
+    # 체크포인트에서 완료된 조합 복원
+    # 기반 정책이나 설정 파일이 바뀐 뒤에는 이전 실행의 결과를 재사용하지 않도록 정책 버전을 키에 포함
+    if checkpoint_path and policy_version is None:
+        policy_version = getattr((simulator_factory or _default_simulator_factory)(), "policy_version", None)
+    checkpoint = SimulationCheckpoint(checkpoint_path, input_data, policy_version) if checkpoint_path else None
+    combination_hashes = [canonical_hash(combo) for combo in unique_combinations] if checkpoint else []
+    completed_results = checkpoint.load() if checkpoint else {}
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(unique_combinations)
+    # 지표 행렬을 미리 할당하고 결과가 도착하는 대로(체크포인트 복원, 기준 조합, 묶음 완료 순) 행을 채움
+    metrics_matrix = np.full((len(unique_combinations), len(SUMMARY_METRICS)), np.nan, dtype=np.float64)
+    pending_indices = []
+    for index, policy_set in enumerate(unique_combinations):
+        if checkpoint and combination_hashes[index] in completed_results:
+            results[index] = {"policy_set": policy_set, "result": completed_results[combination_hashes[index]]}
+            _fill_metrics_row(metrics_matrix, index, results[index])
+        else:
+            pending_indices.append(index)
+
+    progress = SimulationProgress(len(unique_combinations), len(unique_combinations) - len(pending_indices),
+                                  callback=progress_callback)
+    finished = set()
+
+    # 기준 조합만 전체 결과로 보관하고, 나머지 조합은 완료되는 대로 기준 대비 차이만 저장
+    delta_store, baseline_position = None, None
+    if delta_baseline is not None:
+        baseline_position = (next(g for g, group in enumerate(dedupe_plan.groups) if delta_baseline in group)
+                             if dedupe_plan else delta_baseline)
+        if results[baseline_position] is None:
+            results[baseline_position] = _simulate_chunk(
+                [(baseline_position, unique_combinations[baseline_position])], input_data,
+                (simulator_factory or _default_simulator_factory)()
+            )[0][1]
+            pending_indices.remove(baseline_position)
+            _fill_metrics_row(metrics_matrix, baseline_position, results[baseline_position])
+            if checkpoint and "result" in results[baseline_position]:
+                checkpoint.append([(combination_hashes[baseline_position], results[baseline_position]["result"])])
+            progress.update(1)
+        if "result" not in results[baseline_position]:
+            raise ValueError(f"기준 조합 시뮬레이션 실패: {results[baseline_position].get('error')}")
+
+        employee_id = (input_data.get("employee_id") if isinstance(input_data, dict)
+                       else getattr(input_data, "employee_id", None))
+        period = (input_data.get("period") if isinstance(input_data, dict) else getattr(input_data, "period", None)) or ""
+        names = [policy_combinations[index].get("name", f"조합_{index + 1}")
+                 for index in (dedupe_plan.unique_indices if dedupe_plan else range(len(unique_combinations)))]
+        delta_store = BaselineDeltaStore(names[baseline_position],
+                                         to_calculation_result(results[baseline_position]["result"], employee_id, period))
+
+    def store_delta(position: int, item: Dict[str, Any], is_new: bool = True) -> None:
+        """결과 항목을 기준 대비 차이로 저장하고 항목에는 time_summary만 남깁니다."""
+        if delta_store is None or position == baseline_position or "result" not in item or "delta_name" in item:
+            return
+        if is_new:
+            delta_store.add(names[position], to_calculation_result(item["result"], employee_id, period),
+                            item["policy_set"])
+        item["result"] = {"time_summary": item["result"].get("time_summary")}
+        item["delta_name"] = names[position]
+
+    for position, item in enumerate(results):
+        if item is not None:
+            store_delta(position, item)
+
+    def on_chunk_complete(chunk_results: List[Tuple[int, Dict[str, Any]]]) -> None:
+        # 백엔드 전환 시 같은 묶음이 다시 완료될 수 있으므로 처음 완료된 조합만 반영
+        new_items = [(pending_indices[i], item) for i, item in chunk_results if i not in finished]
+        if checkpoint:
+            checkpoint.append([(combination_hashes[index], item["result"])
+                               for index, item in new_items if "result" in item])
+        for index, item in new_items:
+            _fill_metrics_row(metrics_matrix, index, item)
+        for i, item in chunk_results:
+            store_delta(pending_indices[i], item, is_new=i not in finished)
+        finished.update(i for i, _ in chunk_results)
+        progress.update(len(new_items))
+
+    # 시뮬레이션 실행
+    pending_results, used_backend = _execute_simulations(
+        input_data, [unique_combinations[index] for index in pending_indices], backend=backend,
+        max_workers=max_workers, chunk_size=chunk_size, simulator_factory=simulator_factory,
+        on_chunk_complete=on_chunk_complete
+    )
+    for index, item in zip(pending_indices, pending_results):
+        results[index] = item
+
+    if dedupe_plan:
+        # 대표 조합 결과를 별칭에 나누어 주되, 각 항목의 policy_set은 원래 조합 유지
+        results = [dict(item, policy_set=policy_set)
+                   for item, policy_set in zip(dedupe_plan.fan_out(results), policy_combinations)]
+        metrics_matrix = metrics_matrix[dedupe_plan.fan_out(list(range(dedupe_plan.unique_count)))]
+        simulation_results["metadata"]["unique_combinations"] = dedupe_plan.unique_count
+        simulation_results["metadata"]["policy_aliases"] = dedupe_plan.aliases(policy_combinations)
+
+    simulation_results["results"] = results
+    simulation_results["metadata"]["execution_backend"] = used_backend
+    simulation_results["metadata"]["resumed_combinations"] = progress.resumed
+    if delta_store is not None:
+        simulation_results["delta_store"] = delta_store
     
+    return _summarize_simulation_results(simulation_results, metrics_matrix)
+
+
+# 결과 요약 및 히트맵 지표
+SUMMARY_METRICS = ("total_hours", "overtime_hours", "night_hours", "holiday_hours",
+                   "base_pay", "overtime_pay", "night_pay", "holiday_pay", "total_pay")
+
+
+def build_metrics_matrix(results: List[Optional[Dict[str, Any]]],
+                         metrics: Tuple[str, ...] = SUMMARY_METRICS) -> np.ndarray:
+    """
+    시뮬레이션 결과 항목을 미리 할당한 (조합 × 지표) 행렬에 한 번에 채웁니다.
+    time_summary가 없는 행(오류 조합)은 NaN, time_summary에 없는 지표는 0입니다.
+
+    Args:
+        results: 입력 순서대로의 결과 항목 목록
+        metrics: 지표 목록 (열 순서)
+
+    Returns:
+        np.ndarray: (조합 수 × 지표 수) float64 행렬
+    """
+    matrix = np.full((len(results), len(metrics)), np.nan, dtype=np.float64)
+    for row, result_item in enumerate(results):
+        _fill_metrics_row(matrix, row, result_item, metrics)
+    return matrix
+
+
+def _fill_metrics_row(matrix: np.ndarray, row: int, result_item: Optional[Dict[str, Any]],
+                      metrics: Tuple[str, ...] = SUMMARY_METRICS) -> None:
+    """결과 항목 하나의 지표 값을 행렬의 한 행에 채웁니다. (time_summary가 없으면 NaN 유지)"""
+    if result_item and "result" in result_item and "time_summary" in result_item["result"]:
+        time_summary = result_item["result"]["time_summary"]
+        matrix[row] = [time_summary.get(metric, 0) for metric in metrics]
+
+
+def _summarize_simulation_results(simulation_results: Dict[str, Any],
+                                  metrics_matrix: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    시뮬레이션 결과 목록으로부터 지표 요약과 최적 조합을 계산합니다.
+    모든 요약 통계와 최적 조합 선택은 (조합 × 지표) 행렬의 열 연산으로 계산하며,
+    행렬은 후속 시각화를 위해 "metrics_matrix"로 함께 반환합니다.
+
+    Args:
+        simulation_results: "results"가 채워진 시뮬레이션 결과
+        metrics_matrix: 미리 채워진 지표 행렬 (생략 시 결과 목록에서 생성)
+
+    Returns:
+        지표 요약, 최적 조합, 지표 행렬이 추가된 시뮬레이션 결과
+    """
+    results = simulation_results["results"]
+    metrics = list(SUMMARY_METRICS)
+    matrix = metrics_matrix if metrics_matrix is not None else build_metrics_matrix(results)
+    policy_sets = [(item or {}).get("policy_set", {}).get("name", "unknown") for item in results]
+    column = {metric: matrix[:, i] for i, metric in enumerate(metrics)}
+
+    # 주요 지표 요약 (성공한 조합만 대상)
+    succeeded = ~np.isnan(matrix).all(axis=1)
     metrics_data = {}
-    for metric in metrics:
-        values = []
-        for result_item in simulation_results["results"]:
-            if "result" in result_item and "time_summary" in result_item["result"]:
-                values.append(result_item["result"]["time_summary"].get(metric, 0))
-        
-        if values:
+    if succeeded.any():
+        valid = matrix[succeeded]
+        mins = np.nanmin(valid, axis=0)
+        maxs = np.nanmax(valid, axis=0)
+        means = np.nanmean(valid, axis=0)
+        # 기존 sorted(values)[n // 2]와 같은 위쪽 중앙값
+        medians = np.nanquantile(valid, 0.5, axis=0, method="higher")
+        stds = np.nanstd(valid, axis=0)
+        for i, metric in enumerate(metrics):
             metrics_data[metric] = {
-                "min": min(values),
-                "max": max(values),
-                "avg": sum(values) / len(values),
-                "median": sorted(values)[len(values) // 2],
-                "std": np.std(values)
+                "min": float(mins[i]),
+                "max": float(maxs[i]),
+                "avg": float(means[i]),
+                "median": float(medians[i]),
+                "std": float(stds[i])
             }
-    
+
     simulation_results["metrics_summary"] = metrics_data
-    
+
     # 최적 조합 찾기
     best_combinations = {}
-    
-    # 최소 총 근무시간
-    if "total_hours" in metrics_data:
+
+    if metrics_data:
+        # 최소 총 근무시간
         min_total_hours = metrics_data["total_hours"]["min"]
-        best_total_hours = []
-        
-        for result_item in simulation_results["results"]:
-            if "result" in result_item and "time_summary" in result_item["result"]:
-                if result_item["result"]["time_summary"].get("total_hours", 0) == min_total_hours:
-                    best_total_hours.append({
-                        "policy_set": result_item["policy_set"].get("name", "unknown"),
-                        "total_hours": min_total_hours
-                    })
-        
-        best_combinations["min_total_hours"] = best_total_hours
-    
-    # 최대 총 급여
-    if "total_pay" in metrics_data:
+        best_combinations["min_total_hours"] = [
+            {"policy_set": policy_sets[row], "total_hours": min_total_hours}
+            for row in np.flatnonzero(column["total_hours"] == min_total_hours)
+        ]
+
+        # 최대 총 급여
         max_total_pay = metrics_data["total_pay"]["max"]
-        best_total_pay = []
-        
-        for result_item in simulation_results["results"]:
-            if "result" in result_item and "time_summary" in result_item["result"]:
-                if result_item["result"]["time_summary"].get("total_pay", 0) == max_total_pay:
-                    best_total_pay.append({
-                        "policy_set": result_item["policy_set"].get("name", "unknown"),
-                        "total_pay": max_total_pay
-                    })
-        
-        best_combinations["max_total_pay"] = best_total_pay
-    
+        best_combinations["max_total_pay"] = [
+            {"policy_set": policy_sets[row], "total_pay": max_total_pay}
+            for row in np.flatnonzero(column["total_pay"] == max_total_pay)
+        ]
+
     # 최적 비용 효율 (시간당 급여)
     best_efficiency = []
-    max_efficiency = 0
-    
-    for result_item in simulation_results["results"]:
-        if "result" in result_item and "time_summary" in result_item["result"]:
-            total_hours = result_item["result"]["time_summary"].get("total_hours", 0)
-            total_pay = result_item["result"]["time_summary"].get("total_pay", 0)
-            
-            if total_hours > 0:
-                efficiency = total_pay / total_hours
-                if not best_efficiency or efficiency > max_efficiency:
-                    max_efficiency = efficiency
-                    best_efficiency = [{
-                        "policy_set": result_item["policy_set"].get("name", "unknown"),
-                        "efficiency": efficiency,
-                        "total_pay": total_pay,
-                        "total_hours": total_hours
-                    }]
-                elif efficiency == max_efficiency:
-                    best_efficiency.append({
-                        "policy_set": result_item["policy_set"].get("name", "unknown"),
-                        "efficiency": efficiency,
-                        "total_pay": total_pay,
-                        "total_hours": total_hours
-                    })
-    
+    hours, pay = column["total_hours"], column["total_pay"]
+    positive = np.flatnonzero(hours > 0)
+    if positive.size:
+        efficiency = pay[positive] / hours[positive]
+        max_efficiency = efficiency.max()
+        for row, value in zip(positive[efficiency == max_efficiency], efficiency[efficiency == max_efficiency]):
+            best_efficiency.append({
+                "policy_set": policy_sets[row],
+                "efficiency": float(value),
+                "total_pay": float(pay[row]),
+                "total_hours": float(hours[row])
+            })
+
     best_combinations["best_efficiency"] = best_efficiency
-    
+
     simulation_results["best_combinations"] = best_combinations
-    
+    simulation_results["metrics_matrix"] = {
+        "metrics": metrics,
+        "policy_sets": policy_sets,
+        "values": matrix
+    }
+
     return simulation_results
 
+def benchmark_execution_backends(input_data: Any, policy_combinations: List[Dict[str, Any]],
+                                 backends: Tuple[str, ...] = EXECUTION_BACKENDS, max_workers: Optional[int] = 4,
+                                 chunk_size: Optional[int] = None, repeat: int = 1,
+                                 simulator_factory: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """
+    실행 백엔드별 시뮬레이션 소요 시간을 측정합니다. 기준은 기존 경로인 스레드 백엔드입니다.
+
+    Args:
+        input_data: 시뮬레이션 입력 데이터
+        policy_combinations: 정책 조합 목록
+        backends: 측정할 백엔드 목록
+        max_workers: 병렬 처리 작업자 수
+        chunk_size: 작업 제출 단위 묶음 크기 (None이면 자동)
+        repeat: 백엔드별 반복 횟수 (최소 소요 시간 사용)
+        simulator_factory: 시뮬레이터 생성 함수 (기본값: PolicySimulator)
+
+    Returns:
+        백엔드별 소요 시간(초), 처리량(조합/초), 스레드 대비 속도 향상 배율, 실제 사용된 백엔드
+    """
+    benchmark = {
+        "combinations_count": len(policy_combinations),
+        "max_workers": max_workers or os.cpu_count(),
+        "backends": {}
+    }
+
+    for backend in backends:
+        timings = []
+        used_backend = backend
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            _, used_backend = _execute_simulations(
+                input_data, policy_combinations, backend=backend, max_workers=max_workers,
+                chunk_size=chunk_size, simulator_factory=simulator_factory
+            )
+            timings.append(time.perf_counter() - started)
+
+        elapsed = min(timings)
+        benchmark["backends"][backend] = {
+            "elapsed_seconds": elapsed,
+            "throughput": len(policy_combinations) / elapsed if elapsed > 0 else float("inf"),
+            "used_backend": used_backend
+        }
+        logger.info(f"백엔드 {backend}({used_backend}): {elapsed:.3f}초, 조합 {len(policy_combinations)}개")
+
+    baseline = benchmark["backends"].get("thread")
+    for stats in benchmark["backends"].values():
+        stats["speedup_vs_thread"] = (baseline["elapsed_seconds"] / stats["elapsed_seconds"]
+                                      if baseline and stats["elapsed_seconds"] > 0 else None)
+
+    return benchmark
+
+# 직원 × 정책 조합 매트릭스 집계 지표
+WORKFORCE_SUM_METRICS = ("total_hours", "regular_hours", "overtime_hours", "night_hours",
+                         "holiday_hours", "holiday_overtime_hours", "premium_hours", "total_pay")
+PREMIUM_HOUR_METRICS = ("overtime_hours", "night_hours", "holiday_hours", "holiday_overtime_hours")
+
+
+def _init_workforce_worker(policy_combinations: List[Dict[str, Any]], simulator_factory: Callable[[], Any],
+                           hourly_wage: Optional[Union[float, Dict[str, float]]] = None) -> None:
+    """
+    직원 샤드 작업자 초기화 함수. 정책 조합과 시뮬레이터를 작업자당 한 번만 준비합니다.
+
+    Args:
+        policy_combinations: 정책 조합 목록
+        simulator_factory: 시뮬레이터 생성 함수
+        hourly_wage: 통상시급 또는 직원 ID별 통상시급
+    """
+    _WORKER_STATE["policy_combinations"] = policy_combinations
+    _WORKER_STATE["simulator"] = simulator_factory()
+    _WORKER_STATE["hourly_wage"] = hourly_wage
+
+
+def _employee_hourly_wage(input_data: Any, hourly_wage: Optional[Union[float, Dict[str, float]]]) -> Optional[float]:
+    """직원 입력 데이터에 적용할 통상시급 (직원 ID별 딕셔너리면 employee_id로 조회)"""
+    if not isinstance(hourly_wage, dict):
+        return hourly_wage
+    employee_id = input_data.get("employee_id") if isinstance(input_data, dict) else getattr(input_data, "employee_id", None)
+    return hourly_wage.get(employee_id)
+
+
+def _time_summary_dict(result: Dict[str, Any]) -> Dict[str, Any]:
+    """시뮬레이션 결과의 time_summary를 딕셔너리로 반환합니다."""
+    time_summary = result.get("time_summary") or {}
+    return time_summary.model_dump() if hasattr(time_summary, "model_dump") else time_summary
+
+
+def _extract_workforce_metrics(result: Dict[str, Any]) -> List[float]:
+    """
+    시뮬레이션 결과의 time_summary에서 매트릭스 집계 지표 값을 추출합니다.
+    total_pay는 시뮬레이터가 시급으로 계산해 돌려준 경우에만 값이 있습니다.
+    """
+    time_summary = _time_summary_dict(result)
+    values = {metric: float(time_summary.get(metric, 0) or 0) for metric in WORKFORCE_SUM_METRICS}
+    if "premium_hours" not in time_summary:
+        values["premium_hours"] = sum(values[metric] for metric in PREMIUM_HOUR_METRICS)
+    if "total_hours" not in time_summary:
+        values["total_hours"] = float(time_summary.get("total_net_work_hours", 0) or 0)
+    return [values[metric] for metric in WORKFORCE_SUM_METRICS]
+
+
+def _empty_workforce_aggregate(combinations_count: int) -> Dict[str, np.ndarray]:
+    """빈 조합별 집계를 생성합니다."""
+    return {
+        "sums": np.zeros((combinations_count, len(WORKFORCE_SUM_METRICS)), dtype=np.float64),
+        "employees": np.zeros(combinations_count, dtype=np.int64),
+        "errors": np.zeros(combinations_count, dtype=np.int64),
+        "compliance_alerts": np.zeros(combinations_count, dtype=np.int64),
+        "paid_employees": np.zeros(combinations_count, dtype=np.int64),
+    }
+
+
+def _simulate_employee_shard(employee_shard: List[Any], policy_combinations: Optional[List[Dict[str, Any]]] = None,
+                             simulator: Any = None,
+                             hourly_wage: Optional[Union[float, Dict[str, float]]] = None) -> Dict[str, np.ndarray]:
+    """
+    직원 묶음(shard)에 대해 모든 정책 조합을 시뮬레이션하고 조합별 부분 집계만 반환합니다.
+    직원별 결과는 집계 후 바로 버려지므로 묶음 크기와 무관하게 메모리 사용량은 조합 수에 비례합니다.
+
+    Args:
+        employee_shard: 직원별 입력 데이터 목록
+        policy_combinations: 정책 조합 목록 (생략 시 작업자 초기화 상태 사용)
+        simulator: 시뮬레이터 (생략 시 작업자 초기화 상태 사용)
+        hourly_wage: 통상시급 또는 직원 ID별 통상시급 (simulator 생략 시 작업자 초기화 상태 사용)
+
+    Returns:
+        조합별 부분 집계 (sums: 조합 × 지표, employees/errors/compliance_alerts/paid_employees: 조합별 개수)
+    """
+    policy_combinations = policy_combinations if policy_combinations is not None else _WORKER_STATE["policy_combinations"]
+    if simulator is None:
+        simulator = _WORKER_STATE["simulator"]
+        hourly_wage = _WORKER_STATE.get("hourly_wage")
+
+    aggregate = _empty_workforce_aggregate(len(policy_combinations))
+    for input_data in employee_shard:
+        wage = _employee_hourly_wage(input_data, hourly_wage)
+        # 시급이 없으면 시뮬레이터 기본 호출 형식 유지 (시급 인자를 받지 않는 시뮬레이터 지원)
+        simulate_kwargs = {"hourly_wage": wage} if wage is not None else {}
+        for index, policy_set in enumerate(policy_combinations):
+            try:
+                result = simulator.simulate(input_data, policy_set, **simulate_kwargs)
+            except Exception as e:
+                name = policy_set.get("name", "unknown") if isinstance(policy_set, dict) else "unknown"
+                logger.error(f"정책 조합 {name} 시뮬레이션 중 오류 발생: {e}", exc_info=True)
+                aggregate["errors"][index] += 1
+                continue
+
+            if result.get("error"):
+                aggregate["errors"][index] += 1
+                continue
+            aggregate["sums"][index] += _extract_workforce_metrics(result)
+            aggregate["employees"][index] += 1
+            aggregate["paid_employees"][index] += "total_pay" in _time_summary_dict(result)
+            aggregate["compliance_alerts"][index] += len(result.get("compliance_alerts") or [])
+    return aggregate
+
+
+def run_workforce_simulation_matrix(input_data_list: List[Any], policy_combinations: List[Dict[str, Any]],
+                                    max_workers: Optional[int] = 4, backend: str = "thread",
+                                    shard_size: Optional[int] = None,
+                                    simulator_factory: Optional[Callable[[], Any]] = None,
+                                    hourly_wage: Optional[Union[float, Dict[str, float]]] = None) -> Dict[str, Any]:
+    """
+    전체 직원 × 정책 조합 매트릭스를 시뮬레이션하여 조합별 집계를 반환합니다.
+
+    직원을 묶음(shard)으로 나누어 작업자에 분배하고, 각 작업자는 조합별 부분 합계만 돌려줍니다.
+    부분 합계를 더해 조합별 총 근로시간, 가산 근로시간(연장/야간/휴일), 컴플라이언스 경고 수를 계산하므로
+    직원별 결과는 메모리에 남지 않습니다.
+
+    Args:
+        input_data_list: 직원별 입력 데이터 목록
+        policy_combinations: 정책 조합 목록
+        max_workers: 병렬 처리 작업자 수 (None이면 CPU 수)
+        backend: 실행 백엔드 ("process", "thread", "inline")
+        shard_size: 작업자에 전달하는 직원 묶음 크기 (None이면 자동)
+        simulator_factory: 시뮬레이터 생성 함수 (기본값: PolicySimulator)
+        hourly_wage: 통상시급 또는 직원 ID별 통상시급 (지정 시 시뮬레이터에 전달하여 급여 합계 계산)
+
+    Returns:
+        조합별 집계 결과 (total_pay는 시뮬레이터가 급여를 계산한 경우에만 포함)
+    """
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(f"지원하지 않는 실행 백엔드: {backend} (사용 가능: {', '.join(EXECUTION_BACKENDS)})")
+
+    simulator_factory = simulator_factory or _default_simulator_factory
+    max_workers = max_workers or os.cpu_count() or 1
+    shard_size = _resolve_chunk_size(len(input_data_list), max_workers, shard_size)
+    shards = [input_data_list[i:i + shard_size] for i in range(0, len(input_data_list), shard_size)]
+
+    total = _empty_workforce_aggregate(len(policy_combinations))
+    used_backend = backend
+    if shards and policy_combinations:
+        partials, used_backend = _dispatch_chunks(
+            _simulate_employee_shard, shards, backend, max_workers,
+            initializer=_init_workforce_worker, initargs=(policy_combinations, simulator_factory, hourly_wage),
+            local_kwargs_factory=lambda: {"policy_combinations": policy_combinations, "simulator": simulator_factory(),
+                                          "hourly_wage": hourly_wage}
+        )
+        for partial in partials:
+            for key in total:
+                total[key] += partial[key]
+
+    # 급여를 계산한 결과가 없으면 total_pay는 0이 아니라 알 수 없는 값이므로 집계에서 제외
+    metrics = [metric for metric in WORKFORCE_SUM_METRICS if metric != "total_pay" or total["paid_employees"].any()]
+    aggregates = []
+    for index, policy_set in enumerate(policy_combinations):
+        employees = int(total["employees"][index])
+        totals = {metric: round(float(value), 2) for metric, value in zip(WORKFORCE_SUM_METRICS, total["sums"][index])
+                  if metric in metrics}
+        aggregates.append({
+            "policy_set": policy_set.get("name", f"조합_{index + 1}"),
+            "employees": employees,
+            "errors": int(total["errors"][index]),
+            "compliance_alerts": int(total["compliance_alerts"][index]),
+            "totals": totals,
+            "averages": {metric: round(value / employees, 2) if employees else 0.0 for metric, value in totals.items()}
+        })
+
+    best_combinations = {}
+    for metric in ("total_hours", "premium_hours", "total_pay"):
+        if aggregates and metric in metrics:
+            best_value = min(item["totals"][metric] for item in aggregates)
+            best_combinations[f"min_{metric}"] = [
+                {"policy_set": item["policy_set"], metric: best_value}
+                for item in aggregates if item["totals"][metric] == best_value
+            ]
+
+    logger.info(f"직원 {len(input_data_list)}명 × 정책 조합 {len(policy_combinations)}개 매트릭스 시뮬레이션 완료 ({used_backend})")
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "metadata": {
+            "employees_count": len(input_data_list),
+            "combinations_count": len(policy_combinations),
+            "shards_count": len(shards),
+            "execution_backend": used_backend
+        },
+        "aggregates": aggregates,
+        "best_combinations": best_combinations
+    }
+
+
 def generate_heatmap(results_matrix: Dict[str, Any]) -> Dict[str, Any]:
     """
     시뮬레이션 결과를 히트맵 형태로 변환합니다.
@@ -183,18 +756,18 @@ def generate_heatmap(results_matrix: Dict[str, Any]) -> Dict[str, Any]:
     policy_sets = [result["policy_set"].get("name", f"정책 {i+1}") for i, result in enumerate(results)]
     
     # 주요 지표 추출
-    metrics = ["total_hours", "overtime_hours", "night_hours", "holiday_hours", 
-               "base_pay", "overtime_pay", "night_pay", "holiday_pay", "total_pay"]
+    metrics = list(SUMMARY_METRICS)
     
+    # 요약 단계에서 만든 지표 행렬 재사용 (오류 조합은 0)
+    metrics_matrix = results_matrix.get("metrics_matrix")
+    if metrics_matrix is None or list(metrics_matrix["metrics"]) != metrics:
+        metrics_matrix = {"metrics": metrics, "values": build_metrics_matrix(results)}
+    matrix_values = np.nan_to_num(metrics_matrix["values"], nan=0.0)
+
     # 지표별 히트맵 데이터 생성
-    for metric in metrics:
+    for i, metric in enumerate(metrics):
         # 지표 값 추출
-        values = []
-        for result in results:
-            if "result" in result and "time_summary" in result["result"]:
-                values.append(result["result"]["time_summary"].get(metric, 0))
-            else:
-                values.append(0)
+        values = matrix_values[:, i].tolist()
         
         # 최소/최대값 계산
         min_value = min(values) if values else 0
@@ -284,6 +857,147 @@ def filter_valid_combinations(combinations: List[Dict[str, Any]]) -> List[Dict[s
     
     return valid_combinations
 
+def _compile_conflict_masks(policy_options: Dict[str, List[Dict[str, Any]]]) -> Tuple[List[str], List[List[Dict[str, Any]]], List[List[int]], List[int]]:
+    """
+    정책 옵션별 충돌 비트셋을 미리 계산합니다.
+
+    모든 옵션에 전역 번호를 부여하고, 옵션마다 함께 선택될 수 없는 옵션들의 번호를 비트로 표시합니다.
+    filter_valid_combinations와 동일하게 어느 한쪽의 conflicts_with에 상대 이름이 있으면 충돌로 봅니다.
+
+    Args:
+        policy_options: 카테고리별 정책 옵션
+
+    Returns:
+        (카테고리 목록, 카테고리별 옵션 목록, 카테고리별 옵션 충돌 비트셋, 깊이별 이후 카테고리 충돌 비트셋 합집합)
+    """
+    categories = list(policy_options.keys())
+    options_list = [policy_options[category] for category in categories]
+
+    # 전역 번호 및 이름별 번호 목록
+    global_ids = []
+    ids_by_name: Dict[str, List[int]] = {}
+    next_id = 0
+    for options in options_list:
+        ids = []
+        for option in options:
+            ids.append(next_id)
+            ids_by_name.setdefault(option.get("name", ""), []).append(next_id)
+            next_id += 1
+        global_ids.append(ids)
+
+    conflict_masks_flat = [0] * next_id
+    for options, ids in zip(options_list, global_ids):
+        for option, option_id in zip(options, ids):
+            for conflict_name in option.get("conflicts_with", []):
+                for other_id in ids_by_name.get(conflict_name, []):
+                    if other_id != option_id:
+                        conflict_masks_flat[option_id] |= 1 << other_id
+                        conflict_masks_flat[other_id] |= 1 << option_id
+
+    conflict_masks = [[conflict_masks_flat[option_id] for option_id in ids] for ids in global_ids]
+
+    # 깊이 d 이후에 선택될 옵션들이 충돌하는 옵션 비트 (카운트 메모이제이션 키 축소용)
+    future_masks = [0] * (len(categories) + 1)
+    for depth in range(len(categories) - 1, -1, -1):
+        combined = future_masks[depth + 1]
+        for mask in conflict_masks[depth]:
+            combined |= mask
+        future_masks[depth] = combined
+
+    return categories, options_list, conflict_masks, future_masks
+
+
+def iter_valid_combinations(policy_options: Dict[str, List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    충돌 없는 정책 조합을 하나씩 생성합니다.
+
+    generate_policy_combination_matrix + filter_valid_combinations와 같은 조합을 같은 순서로 반환하지만,
+    전체 곱집합을 만들지 않고 카테고리를 순서대로 선택하면서 이미 선택된 옵션과 충돌하는 가지는 즉시 잘라냅니다.
+
+    Args:
+        policy_options: 카테고리별 정책 옵션
+
+    Yields:
+        정책 조합 (generate_policy_combination_matrix와 동일한 형식)
+    """
+    categories, options_list, conflict_masks, _ = _compile_conflict_masks(policy_options)
+    if not categories:
+        yield {"name": "", "policies": [], "categories": {}}
+        return
+
+    # 카테고리 옵션 번호의 시작값 (옵션 비트 번호 = offset + 옵션 순번)
+    offsets = []
+    offset = 0
+    for options in options_list:
+        offsets.append(offset)
+        offset += len(options)
+
+    last_depth = len(categories) - 1
+    chosen: List[Dict[str, Any]] = []
+
+    def visit(depth: int, chosen_mask: int) -> Iterator[Dict[str, Any]]:
+        for option_index, option in enumerate(options_list[depth]):
+            if conflict_masks[depth][option_index] & chosen_mask:
+                continue
+            chosen.append(option)
+            if depth == last_depth:
+                combo = tuple(chosen)
+                yield {
+                    "name": " + ".join([opt.get("name", "unknown") for opt in combo]),
+                    "policies": list(combo),
+                    "categories": {categories[i]: combo[i].get("name", "unknown") for i in range(len(categories))}
+                }
+            else:
+                yield from visit(depth + 1, chosen_mask | (1 << (offsets[depth] + option_index)))
+            chosen.pop()
+
+    yield from visit(0, 0)
+
+
+def count_valid_combinations(policy_options: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+    """
+    조합을 생성하지 않고 전체/유효/제외 조합 수를 계산합니다.
+
+    선택된 옵션 비트 중 이후 카테고리와 충돌할 수 있는 비트만 남긴 (깊이, 비트셋)을 키로
+    하위 조합 수를 메모이제이션하므로 충돌이 드문 경우 카테고리 수에 거의 선형으로 계산됩니다.
+
+    Args:
+        policy_options: 카테고리별 정책 옵션
+
+    Returns:
+        {"total": 전체 조합 수, "valid": 유효 조합 수, "pruned": 충돌로 제외된 조합 수}
+    """
+    categories, options_list, conflict_masks, future_masks = _compile_conflict_masks(policy_options)
+
+    total = 1
+    for options in options_list:
+        total *= len(options)
+
+    offsets = []
+    offset = 0
+    for options in options_list:
+        offsets.append(offset)
+        offset += len(options)
+
+    memo: Dict[Tuple[int, int], int] = {}
+
+    def count(depth: int, chosen_mask: int) -> int:
+        if depth == len(categories):
+            return 1
+        key = (depth, chosen_mask & future_masks[depth])
+        if key in memo:
+            return memo[key]
+        subtotal = 0
+        for option_index in range(len(options_list[depth])):
+            if conflict_masks[depth][option_index] & chosen_mask:
+                continue
+            subtotal += count(depth + 1, chosen_mask | (1 << (offsets[depth] + option_index)))
+        memo[key] = subtotal
+        return subtotal
+
+    valid = count(0, 0)
+    return {"total": total, "valid": valid, "pruned": total - valid}
+
 def export_simulation_results_to_html(simulation_results: Dict[str, Any], output_path: str) -> bool:
     """
     시뮬레이션 결과를 HTML 파일로 내보냅니다.
@@ -443,6 +1157,16 @@ def export_simulation_results_to_html(simulation_results: Dict[str, Any], output
         logger.error(f"시뮬레이션 결과 생성 중 오류 발생: {e}", exc_info=True)
         return False
 
+def _json_default(value: Any) -> Any:
+    """JSON 직렬화 보조 함수 (NumPy 배열/스칼라 변환, NaN은 null)"""
+    if isinstance(value, np.ndarray):
+        return np.where(np.isnan(value), None, value).tolist() if value.dtype.kind == "f" else value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, BaselineDeltaStore):
+        return {"baseline_name": value.baseline_name, "names": value.names, **value.stats()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 def export_simulation_results_to_json(simulation_results: Dict[str, Any], output_path: str) -> bool:
     """
     시뮬레이션 결과를 JSON 파일로 내보냅니다.
@@ -456,7 +1180,7 @@ def export_simulation_results_to_json(simulation_results: Dict[str, Any], output
     """
     try:
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(simulation_results, f, ensure_ascii=False, indent=2) # 수정된 부분
+            json.dump(simulation_results, f, ensure_ascii=False, indent=2, default=_json_default) # 수정된 부분
         logger.info(f"시뮬레이션 결과가 {output_path}에 저장되었습니다.")
         return True
     except Exception as e:
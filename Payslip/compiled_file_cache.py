@@ -0,0 +1,161 @@
+"""
+컴파일된 설정 파일 캐시 모듈
+
+YAML 설정/시나리오 파일을 파싱하고 검증한 결과(컴파일된 구조)를 pickle 바이너리로 저장하여,
+파일 내용과 로더 버전이 같으면 다음 로드 때 파싱과 검증을 건너뛸 수 있게 합니다.
+캐시 키는 파일 내용의 SHA-256과 로더 버전이므로 파일이 바뀌거나 로더가 바뀌면 자동으로 무효화됩니다.
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+from typing import Any, Callable, Dict, Optional, Union
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# libyaml이 설치되어 있으면 C 구현 로더 사용
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml_fast(source: Union[str, bytes]) -> Any:
+    """
+    YAML 텍스트를 안전하게 파싱합니다. (가능하면 yaml.CSafeLoader 사용)
+
+    Args:
+        source: YAML 텍스트
+
+    Returns:
+        파싱된 데이터
+    """
+    return yaml.load(source, Loader=YAML_SAFE_LOADER)
+
+
+def file_sha256(path: str) -> str:
+    """
+    파일 내용의 SHA-256을 계산합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        str: 16진수 해시
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CompiledFileCache:
+    """
+    컴파일된 파일 캐시 클래스
+
+    (파일 내용 해시, 로더 버전)을 키로 컴파일 결과를 캐시 디렉터리에 pickle 파일로 저장합니다.
+    캐시 파일이 손상되었거나 읽을 수 없으면 캐시 미스로 처리하고 다시 컴파일합니다.
+    """
+
+    def __init__(self, namespace: str, version: str, cache_dir: Optional[str] = None):
+        """
+        CompiledFileCache 초기화
+
+        Args:
+            namespace: 캐시 이름 공간 (로더 종류, 예: "scenario")
+            version: 로더 버전 (컴파일 결과 구조가 바뀌면 올려야 함)
+            cache_dir: 캐시 디렉터리 (None이면 원본 파일 옆의 .compiled_cache 디렉터리)
+        """
+        self.namespace = namespace
+        self.version = str(version)
+        self.cache_dir = cache_dir
+        self.stats = {"hits": 0, "misses": 0}
+
+    def cache_path(self, path: str, content_hash: Optional[str] = None) -> str:
+        """
+        원본 파일에 대한 캐시 파일 경로를 반환합니다.
+
+        Args:
+            path: 원본 파일 경로
+            content_hash: 파일 내용 해시 (None이면 계산)
+
+        Returns:
+            캐시 파일 경로
+        """
+        content_hash = content_hash or file_sha256(path)
+        key = hashlib.sha256(f"{self.namespace}:{self.version}:{content_hash}".encode("utf-8")).hexdigest()
+        directory = self.cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), ".compiled_cache")
+        return os.path.join(directory, f"{self.namespace}-{key[:32]}.pickle")
+
+    def load(self, path: str, content_hash: Optional[str] = None) -> Optional[Any]:
+        """
+        캐시된 컴파일 결과를 읽습니다.
+
+        Args:
+            path: 원본 파일 경로
+            content_hash: 파일 내용 해시 (None이면 계산)
+
+        Returns:
+            컴파일 결과 (없거나 읽을 수 없으면 None)
+        """
+        cache_path = self.cache_path(path, content_hash)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"손상된 컴파일 캐시를 무시합니다: {cache_path} ({e})")
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != self.version:
+            return None
+        return payload.get("compiled")
+
+    def store(self, path: str, compiled: Any, content_hash: Optional[str] = None) -> Optional[str]:
+        """
+        컴파일 결과를 캐시 파일로 저장합니다. (임시 파일에 쓴 뒤 교체하여 중간 상태를 남기지 않음)
+
+        Args:
+            path: 원본 파일 경로
+            compiled: 컴파일 결과 (pickle 가능해야 함)
+            content_hash: 파일 내용 해시 (None이면 계산)
+
+        Returns:
+            저장된 캐시 파일 경로 (저장 실패 시 None)
+        """
+        cache_path = self.cache_path(path, content_hash)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": self.version, "source": os.path.abspath(path), "compiled": compiled},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+            return cache_path
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"컴파일 캐시를 저장하지 못했습니다: {cache_path} ({e})")
+            return None
+
+    def get_or_compile(self, path: str, compile_fn: Callable[[str], Any]) -> Any:
+        """
+        캐시된 컴파일 결과를 반환하거나, 없으면 컴파일하여 저장한 뒤 반환합니다.
+
+        Args:
+            path: 원본 파일 경로
+            compile_fn: 원본 파일 경로를 받아 컴파일 결과를 반환하는 함수
+
+        Returns:
+            컴파일 결과
+        """
+        content_hash = file_sha256(path)
+        compiled = self.load(path, content_hash)
+        if compiled is not None:
+            self.stats["hits"] += 1
+            return compiled
+
+        self.stats["misses"] += 1
+        compiled = compile_fn(path)
+        self.store(path, compiled, content_hash)
+        return compiled
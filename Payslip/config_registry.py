@@ -0,0 +1,157 @@
+"""
+설정 파일 레지스트리 모듈
+
+settings.yaml, minimum_wage.yaml, holidays.yaml 같은 설정 파일을 프로세스 전체에서 한 번만 읽고
+파싱하여 공유합니다. 항목은 (절대 경로, 파서)로 구분되며 파일의 수정 시각(mtime)과 크기가 바뀌면
+다음 조회 때 자동으로 다시 읽습니다. 반환되는 데이터는 여러 PolicyManager가 공유하므로 수정하면 안 되며,
+수정이 필요한 쪽에서 복사해야 합니다. (PolicyManager는 get의 하위 트리, holidays, minimum_wages를
+복사본으로 반환하고, set은 처음 수정할 때 설정 트리를 복사)
+"""
+
+import os
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .compiled_file_cache import load_yaml_fast
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConfigEntry:
+    """레지스트리 항목 (파일 상태와 파싱 결과)"""
+    path: str
+    mtime_ns: int
+    size: int
+    data: Any
+
+    @property
+    def stamp(self) -> Tuple[int, int]:
+        """변경 감지용 (mtime, 크기)"""
+        return self.mtime_ns, self.size
+
+
+def _file_stamp(path: str) -> Tuple[int, int]:
+    """파일의 (mtime, 크기) (파일이 없으면 OSError)"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ConfigRegistry:
+    """
+    설정 파일 레지스트리 클래스
+
+    같은 파일과 파서에 대해서는 파일이 바뀌지 않는 한 처음 파싱한 결과를 그대로 반환합니다.
+    파싱에 실패한 파일은 캐시하지 않으므로 예외가 그대로 호출자에게 전달됩니다.
+    """
+
+    def __init__(self):
+        """ConfigRegistry 초기화"""
+        self._entries: Dict[Tuple[str, Callable[[Any], Any]], ConfigEntry] = {}
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "loads": 0, "reloads": 0}
+
+    def load(self, path: str, parser: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        설정 파일을 읽어 파싱한 결과를 반환합니다. (변경되지 않은 파일은 공유 결과 재사용)
+
+        Args:
+            path: 설정 파일 경로
+            parser: 파싱된 YAML 데이터를 받아 최종 결과를 만드는 함수 (None이면 YAML 데이터 그대로)
+
+        Returns:
+            파싱 결과 (공유 객체이므로 수정 금지)
+
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+            Exception: YAML 또는 파서 오류
+        """
+        return self.entry(path, parser).data
+
+    def entry(self, path: str, parser: Optional[Callable[[Any], Any]] = None) -> ConfigEntry:
+        """
+        설정 파일 항목을 반환합니다. (파일이 바뀌었으면 다시 읽음)
+
+        Args:
+            path: 설정 파일 경로
+            parser: 파싱된 YAML 데이터를 받아 최종 결과를 만드는 함수
+
+        Returns:
+            ConfigEntry
+        """
+        key = (os.path.abspath(path), parser)
+        stamp = _file_stamp(key[0])
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached.stamp == stamp:
+                self.stats["hits"] += 1
+                return cached
+
+            with open(key[0], "r", encoding="utf-8") as f:
+                data = load_yaml_fast(f.read())
+            if parser is not None:
+                data = parser(data)
+            # 읽기 전 파일 상태를 기록하므로 읽는 도중 파일이 바뀌면 다음 조회 때 다시 읽음
+            entry = ConfigEntry(key[0], stamp[0], stamp[1], data)
+            self._entries[key] = entry
+            self.stats["reloads" if cached is not None else "loads"] += 1
+            if cached is not None:
+                logger.info(f"설정 파일 변경 감지, 다시 로드: {key[0]}")
+            return entry
+
+    def is_current(self, path: str, parser: Optional[Callable[[Any], Any]] = None, data: Any = None) -> bool:
+        """
+        data가 파일의 현재 내용으로 만든 공유 결과인지 확인합니다. (파일 상태만 확인하고 다시 읽지는 않음)
+
+        Args:
+            path: 설정 파일 경로
+            parser: load에 사용한 파서
+            data: 확인할 파싱 결과
+
+        Returns:
+            bool: 현재 결과이면 True
+        """
+        key = (os.path.abspath(path), parser)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is None or cached.data is not data:
+            return False
+        try:
+            return cached.stamp == _file_stamp(key[0])
+        except OSError:
+            return False
+
+    def reload_if_changed(self) -> int:
+        """
+        등록된 모든 파일을 확인하여 바뀐 파일을 다시 읽습니다. (삭제된 파일은 항목 제거)
+
+        Returns:
+            int: 다시 읽은 파일 수
+        """
+        with self._lock:
+            keys = list(self._entries)
+        reloaded = 0
+        for path, parser in keys:
+            previous = self._entries.get((path, parser))
+            try:
+                if self.entry(path, parser) is not previous:
+                    reloaded += 1
+            except Exception as e:
+                logger.warning(f"설정 파일을 다시 읽지 못해 항목을 제거합니다: {path} ({e})")
+                with self._lock:
+                    self._entries.pop((path, parser), None)
+        return reloaded
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 프로세스 전체 공유 레지스트리
+CONFIG_REGISTRY = ConfigRegistry()
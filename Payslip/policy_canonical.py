@@ -0,0 +1,211 @@
+"""
+정책 조합 정규화 모듈
+
+이름이나 키 순서만 다르거나, 기본값과 같은 값을 명시적으로 지정했을 뿐인 정책 조합들은 실제로 적용되는
+정책이 같습니다. 이 모듈은 정책 조합을 점 표기 키의 평탄한 딕셔너리로 정규화하고 기본값과 같은 항목을 제거한 뒤
+해시하여, 실질적으로 다른 정책만 한 번씩 시뮬레이션하고 그 결과를 모든 별칭(alias)에 나누어 줄 수 있게 합니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union, Callable, Mapping
+
+from .simulation_checkpoint import canonical_hash
+
+logger = logging.getLogger(__name__)
+
+# 정책 값이 아닌 정책 조합 메타 정보 키
+POLICY_SET_META_KEYS = frozenset({"name", "description", "metadata", "categories", "conflicts_with"})
+
+_MISSING = object()
+
+DefaultsSource = Union[Mapping[str, Any], Callable[[str, Any], Any]]
+
+
+def _normalize_value(value: Any) -> Any:
+    """값을 정규화합니다. (정수 값 float -> int, 튜플 -> 리스트, 딕셔너리는 재귀)"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(k): _normalize_value(v) for k, v in value.items()}
+    return value
+
+
+def _flatten(prefix: str, value: Any, target: Dict[str, Any]) -> None:
+    """중첩 딕셔너리를 점 표기 키로 평탄화합니다. (빈 딕셔너리는 그대로 유지)"""
+    if isinstance(value, dict) and value:
+        for key, child in value.items():
+            _flatten(f"{prefix}.{key}" if prefix else str(key), child, target)
+    else:
+        target[prefix] = value
+
+
+def policy_set_overrides(policy_set: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    정책 조합을 시뮬레이터가 기반 정책에 덮어쓸 점 표기 키-값 딕셔너리로 변환합니다.
+    메타 정보(name, description, categories 등)는 제외하며, 중첩 딕셔너리는 말단 키까지 평탄화하므로
+    지정하지 않은 형제 정책은 기반 값이 유지됩니다.
+
+    지원 형식:
+        - 평탄한 정책 딕셔너리 ({"policies.weekly_holiday.min_hours": 15, ...})
+        - 중첩 정책 딕셔너리 ({"policies": {"weekly_holiday": {"min_hours": 15}}})
+        - 시나리오 정책 조합 형식 ({"name": ..., "policies": {"policies.weekly_holiday.min_hours": 15}})
+        - generate_policy_combination_matrix 형식 ({"name": ..., "policies": [{"name": ..., "config": {...}}, ...]})
+          (선택된 옵션의 config를 순서대로 적용하므로 같은 키는 뒤 옵션 값 사용)
+
+    Args:
+        policy_set: 정책 조합
+
+    Returns:
+        점 표기 키 -> 값 딕셔너리
+    """
+    policies = policy_set.get("policies")
+    overrides: Dict[str, Any] = {}
+    if isinstance(policies, list):
+        for option in policies:
+            if isinstance(option, dict):
+                _flatten("", option.get("config") or {}, overrides)
+    elif isinstance(policies, dict) and "name" in policy_set and any("." in str(key) for key in policies):
+        _flatten("", policies, overrides)
+    else:
+        _flatten("", {key: value for key, value in policy_set.items() if key not in POLICY_SET_META_KEYS}, overrides)
+    overrides.pop("", None)
+    return overrides
+
+
+def _lookup_default(defaults: Optional[DefaultsSource], key: str) -> Any:
+    """기본값 조회 (없으면 내부 누락 표식)"""
+    if defaults is None:
+        return _MISSING
+    if callable(defaults):
+        return defaults(key, _MISSING)
+    return defaults.get(key, _MISSING)
+
+
+def normalize_policy_set(policy_set: Dict[str, Any], defaults: Optional[DefaultsSource] = None) -> Dict[str, Any]:
+    """
+    정책 조합을 정규화합니다.
+    점 표기 키의 평탄한 딕셔너리로 변환하고, 기본값과 같은 항목은 제거하며, 키를 정렬합니다.
+
+    Args:
+        policy_set: 정책 조합
+        defaults: 점 표기 키별 기본값 (딕셔너리 또는 PolicyManager.get 형식의 조회 함수)
+
+    Returns:
+        정규화된 정책 딕셔너리
+    """
+    # 시뮬레이터가 실제로 적용하는 덮어쓰기 값과 같은 평탄화를 사용해야 별칭 판정이 적용 결과와 일치함
+    flat = policy_set_overrides(policy_set)
+
+    normalized = {}
+    for key in sorted(flat):
+        value = _normalize_value(flat[key])
+        default = _lookup_default(defaults, key)
+        if default is not _MISSING and _normalize_value(default) == value:
+            continue
+        normalized[key] = value
+    return normalized
+
+
+def canonical_policy_hash(policy_set: Dict[str, Any], defaults: Optional[DefaultsSource] = None) -> str:
+    """
+    정규화된 정책 조합의 해시를 계산합니다.
+
+    Args:
+        policy_set: 정책 조합
+        defaults: 점 표기 키별 기본값
+
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    return canonical_hash(normalize_policy_set(policy_set, defaults))
+
+
+def schema_defaults(policy_schema: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    정책 스키마(policy_schema)에서 점 표기 키별 기본값을 추출합니다.
+
+    Args:
+        policy_schema: 정책 키별 스키마 (PolicySchemaInfo 또는 딕셔너리)
+
+    Returns:
+        기본값이 정의된 키의 기본값 딕셔너리
+    """
+    defaults = {}
+    for key, schema in policy_schema.items():
+        default = schema.get("default") if isinstance(schema, dict) else getattr(schema, "default", None)
+        if default is not None:
+            defaults[key] = default
+    return defaults
+
+
+@dataclass
+class PolicyDedupePlan:
+    """정책 조합 중복 제거 계획"""
+    unique_indices: List[int]
+    groups: List[List[int]]
+    hashes: List[str]
+    total: int
+
+    @property
+    def unique_count(self) -> int:
+        """실질적으로 다른 정책 조합 수"""
+        return len(self.unique_indices)
+
+    def aliases(self, policy_sets: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        대표 정책 조합 이름별 별칭 이름 목록을 반환합니다.
+
+        Args:
+            policy_sets: 원래 정책 조합 목록
+
+        Returns:
+            대표 이름 -> 같은 정책의 다른 조합 이름 목록
+        """
+        def name(index: int) -> str:
+            return policy_sets[index].get("name", f"조합_{index + 1}")
+        return {name(group[0]): [name(i) for i in group[1:]] for group in self.groups if len(group) > 1}
+
+    def fan_out(self, unique_results: List[Any]) -> List[Any]:
+        """
+        대표 조합의 결과를 원래 순서의 모든 조합에 나누어 줍니다.
+
+        Args:
+            unique_results: unique_indices 순서의 결과 목록
+
+        Returns:
+            원래 정책 조합 순서의 결과 목록 (같은 정책의 별칭은 같은 결과 객체를 공유)
+        """
+        results: List[Any] = [None] * self.total
+        for group, result in zip(self.groups, unique_results):
+            for index in group:
+                results[index] = result
+        return results
+
+
+def plan_policy_dedupe(policy_sets: List[Dict[str, Any]], defaults: Optional[DefaultsSource] = None) -> PolicyDedupePlan:
+    """
+    정책 조합 목록에서 실질적으로 같은 정책 조합을 묶습니다.
+
+    Args:
+        policy_sets: 정책 조합 목록
+        defaults: 점 표기 키별 기본값
+
+    Returns:
+        PolicyDedupePlan: 대표 조합 순번(처음 나온 조합), 그룹, 정규화 해시
+    """
+    hashes = [canonical_policy_hash(policy_set, defaults) for policy_set in policy_sets]
+    group_by_hash: Dict[str, List[int]] = {}
+    for index, policy_hash in enumerate(hashes):
+        group_by_hash.setdefault(policy_hash, []).append(index)
+
+    groups = list(group_by_hash.values())
+    plan = PolicyDedupePlan(unique_indices=[group[0] for group in groups], groups=groups,
+                            hashes=hashes, total=len(policy_sets))
+    if plan.unique_count < plan.total:
+        logger.info(f"정책 조합 {plan.total}개 중 실질적으로 다른 조합 {plan.unique_count}개만 시뮬레이션합니다.")
+    return plan
@@ -0,0 +1,252 @@
+"""
+정책 적용 조건 컴파일 모듈
+
+정책 스키마의 applicability_condition 식(예: "num_employees >= 5", "weekly_hours < 15")을
+허용된 AST 노드만으로 안전하게 컴파일하여, 직원 한 명의 속성 딕셔너리에 대한 판정 함수이자
+직원 속성 DataFrame 전체에 대한 벡터화 판정 함수로 사용할 수 있게 합니다.
+같은 조건식의 컴파일 결과는 캐시됩니다.
+"""
+
+import ast
+import logging
+import operator
+from functools import lru_cache
+from typing import Dict, List, Any, Callable, Mapping, Optional, Iterable, FrozenSet
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 조건식 리터럴 이름 (YAML에서 소문자 true/false 사용)
+CONDITION_LITERALS = {"true": True, "false": False, "True": True, "False": False, "None": None}
+
+# 조건식 이름 별칭 (시나리오 입력 데이터의 custom_fields 이름)
+CONDITION_NAME_ALIASES = {"num_employees": "company_size"}
+
+_COMPARE_OPERATORS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+_BINARY_OPERATORS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.Mod: operator.mod,
+}
+
+
+class ConditionError(ValueError):
+    """적용 조건식 컴파일/평가 오류"""
+
+
+def _is_vector(value: Any) -> bool:
+    return np.ndim(value) > 0
+
+
+def _membership(value: Any, container: Any) -> Any:
+    """in 연산 (벡터이면 원소별 포함 여부)"""
+    if _is_vector(value):
+        return np.isin(np.asarray(value), list(container))
+    return value in container
+
+
+class CompiledCondition:
+    """
+    컴파일된 적용 조건 클래스
+
+    evaluate(속성 딕셔너리)는 bool을, evaluate_frame(DataFrame)은 행별 bool 배열을 반환합니다.
+    """
+
+    def __init__(self, expression: str, evaluator: Callable[[Callable[[str], Any]], Any], names: FrozenSet[str]):
+        self.expression = expression
+        self.names = names
+        self._evaluator = evaluator
+
+    def __call__(self, attributes: Mapping[str, Any]) -> bool:
+        return self.evaluate(attributes)
+
+    def evaluate(self, attributes: Mapping[str, Any]) -> bool:
+        """
+        직원 한 명의 속성으로 조건을 평가합니다.
+
+        Args:
+            attributes: 속성 이름 -> 값
+
+        Returns:
+            bool: 조건 충족 여부
+        """
+        return bool(self._evaluator(lambda name: _resolve(attributes, name, self.expression)))
+
+    def evaluate_frame(self, frame: pd.DataFrame) -> np.ndarray:
+        """
+        직원 속성 DataFrame 전체에 대해 조건을 한 번에 평가합니다.
+
+        Args:
+            frame: 직원별 속성 DataFrame (조건식 이름을 컬럼으로 가짐)
+
+        Returns:
+            np.ndarray: 행별 bool 배열
+        """
+        result = self._evaluator(lambda name: _resolve(frame, name, self.expression, vector=True))
+        return np.broadcast_to(np.asarray(result, dtype=bool), (len(frame),)).copy()
+
+    def __repr__(self) -> str:
+        return f"CompiledCondition({self.expression!r})"
+
+
+def _resolve(source: Any, name: str, expression: str, vector: bool = False) -> Any:
+    """조건식 이름을 속성 값(또는 컬럼 배열)으로 해석합니다."""
+    for candidate in (name, CONDITION_NAME_ALIASES.get(name)):
+        if candidate is not None and candidate in source:
+            value = source[candidate]
+            return value.to_numpy() if vector else value
+    raise ConditionError(f"적용 조건 '{expression}'의 속성 '{name}'을(를) 찾을 수 없습니다.")
+
+
+def _build(node: ast.AST, names: set) -> Callable[[Callable[[str], Any]], Any]:
+    """AST 노드를 평가 함수로 변환합니다. (허용되지 않은 노드는 ConditionError)"""
+    if isinstance(node, ast.Expression):
+        return _build(node.body, names)
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool, type(None))):
+        value = node.value
+        return lambda lookup: value
+
+    if isinstance(node, ast.Name):
+        if node.id in CONDITION_LITERALS:
+            value = CONDITION_LITERALS[node.id]
+            return lambda lookup: value
+        name = node.id
+        names.add(name)
+        return lambda lookup: lookup(name)
+
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = [_build(element, names) for element in node.elts]
+        return lambda lookup: [item(lookup) for item in items]
+
+    if isinstance(node, ast.BoolOp):
+        operands = [_build(value, names) for value in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+
+        def bool_op(lookup):
+            result = operands[0](lookup)
+            for operand in operands[1:]:
+                # 스칼라 평가에서는 단락 평가 유지
+                if not _is_vector(result) and bool(result) == isinstance(node.op, ast.Or):
+                    return bool(result)
+                result = combine(result, operand(lookup))
+            return result
+        return bool_op
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.USub, ast.UAdd)):
+        operand = _build(node.operand, names)
+        if isinstance(node.op, ast.Not):
+            return lambda lookup: np.logical_not(operand(lookup))
+        if isinstance(node.op, ast.USub):
+            return lambda lookup: -operand(lookup)
+        return operand
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left, right = _build(node.left, names), _build(node.right, names)
+        op = _BINARY_OPERATORS[type(node.op)]
+        return lambda lookup: op(left(lookup), right(lookup))
+
+    if isinstance(node, ast.Compare):
+        left = _build(node.left, names)
+        comparators = [_build(comparator, names) for comparator in node.comparators]
+        ops = []
+        for op in node.ops:
+            if type(op) in _COMPARE_OPERATORS:
+                ops.append(_COMPARE_OPERATORS[type(op)])
+            elif isinstance(op, ast.In):
+                ops.append(_membership)
+            elif isinstance(op, ast.NotIn):
+                ops.append(lambda value, container: np.logical_not(_membership(value, container)))
+            else:
+                raise ConditionError(f"허용되지 않은 비교 연산자: {type(op).__name__}")
+
+        def compare(lookup):
+            # a < b < c 형태의 연쇄 비교는 각 비교의 논리곱
+            result, current = True, left(lookup)
+            for op, comparator in zip(ops, comparators):
+                following = comparator(lookup)
+                result = np.logical_and(result, op(current, following))
+                current = following
+            return result
+        return compare
+
+    raise ConditionError(f"허용되지 않은 구문: {type(node).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(expression: Optional[str]) -> CompiledCondition:
+    """
+    적용 조건식을 컴파일합니다. (같은 식은 캐시된 결과 반환)
+
+    허용 구문: 숫자/문자열/true/false 리터럴, 속성 이름, 비교(==, !=, <, <=, >, >=, in, not in),
+    and/or/not, 사칙 연산, 리스트/튜플 리터럴. 함수 호출, 속성 접근, 인덱싱 등은 허용되지 않습니다.
+
+    Args:
+        expression: 조건식 (None 또는 빈 문자열은 항상 참)
+
+    Returns:
+        CompiledCondition
+
+    Raises:
+        ConditionError: 구문 오류 또는 허용되지 않은 구문
+    """
+    text = (expression or "").strip() or "true"
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as e:
+        raise ConditionError(f"적용 조건 구문 오류: '{text}' ({e.msg})") from e
+    names: set = set()
+    evaluator = _build(tree, names)
+    return CompiledCondition(text, evaluator, frozenset(names))
+
+
+def employee_attribute_frame(input_data: Iterable[Any]) -> pd.DataFrame:
+    """
+    타임카드 입력 데이터 목록에서 직원 속성 DataFrame을 만듭니다.
+    employee_id와 custom_fields의 스칼라 값(employment_type, company_size, weekly_hours 등)을 컬럼으로 사용합니다.
+
+    Args:
+        input_data: TimeCardInputData 또는 속성 딕셔너리 목록
+
+    Returns:
+        pd.DataFrame: 직원별 속성
+    """
+    rows = []
+    for item in input_data:
+        if isinstance(item, Mapping):
+            rows.append(dict(item))
+            continue
+        row = {"employee_id": getattr(item, "employee_id", None)}
+        custom_fields = getattr(item, "custom_fields", None) or {}
+        row.update({key: value for key, value in custom_fields.items() if np.ndim(value) == 0 and not isinstance(value, dict)})
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def applicable_policy_matrix(conditions: Mapping[str, Optional[str]], employees: pd.DataFrame) -> pd.DataFrame:
+    """
+    정책별 적용 조건을 직원 속성 DataFrame 전체에 대해 평가합니다.
+    같은 조건식은 한 번만 평가하여 해당 정책 컬럼들에 공유합니다.
+
+    Args:
+        conditions: 정책 키 -> 적용 조건식
+        employees: 직원 속성 DataFrame
+
+    Returns:
+        pd.DataFrame: 직원 행 x 정책 키 컬럼의 bool 행렬 (인덱스는 employees와 동일)
+    """
+    by_expression: Dict[str, List[str]] = {}
+    for key, expression in conditions.items():
+        by_expression.setdefault((expression or "").strip() or "true", []).append(key)
+
+    columns: Dict[str, np.ndarray] = {}
+    for expression, keys in by_expression.items():
+        mask = compile_condition(expression).evaluate_frame(employees)
+        for key in keys:
+            columns[key] = mask
+    return pd.DataFrame(columns, index=employees.index, columns=list(conditions))
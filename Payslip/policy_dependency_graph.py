@@ -0,0 +1,256 @@
+"""
+정책 의존성 그래프 및 증분 재계산 모듈
+
+시나리오 파일의 policy_dependencies(depends_on, affects)와 계산 단계별 정책 키로부터
+정책 -> 계산 단계 의존성 그래프를 만들고 단계를 위상 정렬합니다. 사용자가 정책 키 하나를 바꾸면
+그 키의 하위(downstream) 단계만 다시 계산하고 나머지 단계는 이전 결과를 재사용하며,
+각 단계의 재사용/재계산 여부를 추적(trace)으로 남깁니다.
+"""
+
+import time
+import logging
+from graphlib import TopologicalSorter, CycleError
+from typing import Dict, List, Any, Optional, Callable, Iterable, Mapping, Set
+
+from .policy_manager import _freeze_value
+from .policy_stage_cache import STAGE_POLICY_KEYS, get_policy_value
+
+logger = logging.getLogger(__name__)
+
+# 계산 단계: 단계가 직접 읽는 정책 키와 상위 단계
+DEFAULT_COMPUTATION_STAGES: Dict[str, Dict[str, List[str]]] = {
+    # 일별/주별 근로시간 계산
+    "worktime": {
+        "policy_keys": STAGE_POLICY_KEYS["daily"] + STAGE_POLICY_KEYS["daily_night"] + STAGE_POLICY_KEYS["weekly"],
+        "upstream": [],
+    },
+    # 근로시간 요약
+    "time_summary": {"policy_keys": [], "upstream": ["worktime"]},
+    # 주휴수당 판정
+    "weekly_holiday": {
+        "policy_keys": ["policies.weekly_holiday", "company_settings.weekly_work_minutes_standard"],
+        "upstream": ["worktime"],
+    },
+    # 시간급 합계
+    "pay": {
+        "policy_keys": ["calculation_mode.simple_mode_options", "policies.small_business"],
+        "upstream": ["time_summary", "weekly_holiday"],
+    },
+}
+
+# 시나리오 파일 affects 항목 -> 계산 단계
+AFFECTS_STAGES: Dict[str, str] = {
+    "정규 근로시간": "worktime",
+    "연장 근로시간": "worktime",
+    "야간 근로시간": "worktime",
+    "주휴수당": "weekly_holiday",
+    "연장 근로수당": "pay",
+    "야간 근로수당": "pay",
+}
+
+
+def _key_matches(changed_key: str, policy_key: str) -> bool:
+    """점 표기 키가 같거나 한쪽이 다른 쪽의 상위 키이면 일치로 봅니다."""
+    return (changed_key == policy_key or changed_key.startswith(policy_key + ".")
+            or policy_key.startswith(changed_key + "."))
+
+
+def _dependency_field(info: Any, name: str) -> List[str]:
+    """PolicyDependencyInfo 또는 딕셔너리에서 목록 필드를 가져옵니다."""
+    value = info.get(name) if isinstance(info, Mapping) else getattr(info, name, None)
+    return list(value or [])
+
+
+class PolicyDependencyGraph:
+    """
+    정책 -> 계산 단계 의존성 그래프 클래스
+
+    정책 A가 정책 B에 의존(depends_on)하면 B가 바뀔 때 A가 영향을 주는 단계도 다시 계산합니다.
+    """
+
+    def __init__(self, policy_dependencies: Optional[Mapping[str, Any]] = None,
+                 stages: Optional[Mapping[str, Mapping[str, List[str]]]] = None,
+                 affects_stages: Optional[Mapping[str, str]] = None):
+        """
+        PolicyDependencyGraph 초기화
+
+        Args:
+            policy_dependencies: 정책 키 -> PolicyDependencyInfo(또는 depends_on/affects 딕셔너리)
+            stages: 단계 이름 -> {"policy_keys", "upstream"} (기본값: DEFAULT_COMPUTATION_STAGES)
+            affects_stages: affects 항목 -> 단계 이름 (기본값: AFFECTS_STAGES)
+
+        Raises:
+            ValueError: 단계 또는 정책 의존성에 순환이 있거나 알 수 없는 상위 단계를 참조하는 경우
+        """
+        self.stages = {name: {"policy_keys": list(spec.get("policy_keys", [])), "upstream": list(spec.get("upstream", []))}
+                       for name, spec in (stages or DEFAULT_COMPUTATION_STAGES).items()}
+        affects_stages = affects_stages or AFFECTS_STAGES
+        policy_dependencies = policy_dependencies or {}
+
+        for name, spec in self.stages.items():
+            unknown = [upstream for upstream in spec["upstream"] if upstream not in self.stages]
+            if unknown:
+                raise ValueError(f"단계 '{name}'이(가) 알 수 없는 상위 단계를 참조합니다: {', '.join(unknown)}")
+        try:
+            self.stage_order: List[str] = list(TopologicalSorter(
+                {name: spec["upstream"] for name, spec in self.stages.items()}).static_order())
+        except CycleError as e:
+            raise ValueError(f"계산 단계 의존성에 순환이 있습니다: {e.args[1]}") from e
+
+        # 정책 키 -> 직접 영향을 주는 단계
+        self._policy_stages: Dict[str, Set[str]] = {}
+        for name, spec in self.stages.items():
+            for key in spec["policy_keys"]:
+                self._policy_stages.setdefault(key, set()).add(name)
+        for key, info in policy_dependencies.items():
+            stages_for_key = self._policy_stages.setdefault(key, set())
+            for label in _dependency_field(info, "affects"):
+                if affects_stages.get(label) in self.stages:
+                    stages_for_key.add(affects_stages[label])
+                else:
+                    logger.debug(f"정책 '{key}'의 영향 항목 '{label}'에 대응하는 계산 단계가 없습니다.")
+
+        # 정책 키 -> 그 정책에 (전이적으로) 의존하는 정책들
+        policy_graph = {key: _dependency_field(info, "depends_on") for key, info in policy_dependencies.items()}
+        try:
+            policy_order = list(TopologicalSorter(policy_graph).static_order())
+        except CycleError as e:
+            raise ValueError(f"정책 의존성에 순환이 있습니다: {e.args[1]}") from e
+        self._dependents: Dict[str, Set[str]] = {key: set() for key in policy_order}
+        for key in reversed(policy_order):
+            for upstream in policy_graph.get(key, []):
+                self._dependents.setdefault(upstream, set()).update({key} | self._dependents.get(key, set()))
+
+        # 단계 -> 하위 단계
+        self._downstream: Dict[str, Set[str]] = {name: set() for name in self.stages}
+        for name in reversed(self.stage_order):
+            for upstream in self.stages[name]["upstream"]:
+                self._downstream[upstream].update({name} | self._downstream[name])
+
+    @property
+    def watched_keys(self) -> List[str]:
+        """단계에 영향을 주는 정책 키 목록 (변경 감지 대상)"""
+        return sorted(key for key, stages in self._policy_stages.items() if stages)
+
+    def stages_for_key(self, key: str) -> Set[str]:
+        """
+        정책 키가 직접 영향을 주는 단계 (그 키에 의존하는 정책의 단계 포함)
+
+        Args:
+            key: 점 표기 정책 키 (상위/하위 키도 일치로 처리)
+
+        Returns:
+            단계 이름 집합
+        """
+        stages: Set[str] = set()
+        for policy_key, policy_stages in self._policy_stages.items():
+            if _key_matches(key, policy_key):
+                stages |= policy_stages
+                for dependent in self._dependents.get(policy_key, ()):
+                    stages |= self._policy_stages.get(dependent, set())
+        return stages
+
+    def affected_stages(self, changed_keys: Iterable[str]) -> List[str]:
+        """
+        변경된 정책 키의 영향을 받는 단계를 위상 순서로 반환합니다. (하위 단계 포함)
+        어떤 단계에도 연결되지 않은 키가 있으면 안전하게 모든 단계를 반환합니다.
+
+        Args:
+            changed_keys: 변경된 정책 키 목록
+
+        Returns:
+            단계 이름 목록 (위상 순서)
+        """
+        affected: Set[str] = set()
+        for key in changed_keys:
+            stages = self.stages_for_key(key)
+            if not stages:
+                logger.info(f"정책 '{key}'은(는) 의존성 그래프에 없어 모든 단계를 다시 계산합니다.")
+                return list(self.stage_order)
+            for stage in stages:
+                affected |= {stage} | self._downstream[stage]
+        return [stage for stage in self.stage_order if stage in affected]
+
+
+class IncrementalRecomputer:
+    """
+    증분 재계산기 클래스
+
+    단계 함수(stage_functions)를 위상 순서로 실행하고 결과를 보관합니다. 다음 실행에서는 바뀐 정책 키의
+    하위 단계만 다시 실행하고 나머지 단계는 이전 결과를 재사용합니다.
+    """
+
+    def __init__(self, graph: PolicyDependencyGraph,
+                 stage_functions: Mapping[str, Callable[[Any, Dict[str, Any]], Any]]):
+        """
+        IncrementalRecomputer 초기화
+
+        Args:
+            graph: 정책 의존성 그래프
+            stage_functions: 단계 이름 -> 함수(정책 조회 대상, 상위 단계 결과 딕셔너리) (함수가 없는 단계는 건너뜀)
+        """
+        self.graph = graph
+        self.stage_functions = dict(stage_functions)
+        self._results: Dict[str, Any] = {}
+        self._snapshot: Optional[Dict[str, Any]] = None
+
+    def _take_snapshot(self, policy_source: Any) -> Dict[str, Any]:
+        """감시 대상 정책 키의 현재 값"""
+        return {key: _freeze_value(get_policy_value(policy_source, key)) for key in self.graph.watched_keys}
+
+    def run(self, policy_source: Any, changed_keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        단계들을 실행합니다. 감시 대상 키의 값 변화는 자동으로 감지하며, 그래프에 없는 키를 바꿨다면
+        changed_keys로 알려야 합니다.
+
+        Args:
+            policy_source: 정책 조회 대상 (PolicyManager/PolicyOverlay 또는 설정 딕셔너리)
+            changed_keys: 추가로 변경된 것으로 간주할 정책 키 목록
+
+        Returns:
+            results(단계별 결과), trace(단계별 reused/recomputed 기록), recomputed, reused
+        """
+        snapshot = self._take_snapshot(policy_source)
+        changed = set(changed_keys or [])
+        if self._snapshot is not None:
+            changed |= {key for key, value in snapshot.items() if self._snapshot.get(key) != value}
+
+        dirty = set(self.graph.affected_stages(changed)) if changed else set()
+        # 변경 키가 직접 영향을 주는 단계 (나머지 dirty 단계는 상위 단계 재계산에 따른 것)
+        direct = {stage: sorted(key for key in changed
+                                if stage in self.graph.stages_for_key(key) or not self.graph.stages_for_key(key))
+                  for stage in dirty}
+
+        trace = []
+        for stage in self.graph.stage_order:
+            function = self.stage_functions.get(stage)
+            if function is None:
+                continue
+            entry: Dict[str, Any] = {"stage": stage}
+            if stage in self._results and stage not in dirty:
+                entry.update(action="reused", elapsed_ms=0.0)
+                trace.append(entry)
+                continue
+
+            if stage not in self._results:
+                entry["reason"] = "initial"
+            elif direct[stage]:
+                entry.update(reason="policy_changed", changed_keys=direct[stage])
+            else:
+                entry["reason"] = "upstream_recomputed"
+            upstream = {name: self._results.get(name) for name in self.graph.stages[stage]["upstream"]}
+            started = time.perf_counter()
+            self._results[stage] = function(policy_source, upstream)
+            entry.update(action="recomputed", elapsed_ms=round((time.perf_counter() - started) * 1000, 3))
+            trace.append(entry)
+
+        self._snapshot = snapshot
+        recomputed = [item["stage"] for item in trace if item["action"] == "recomputed"]
+        reused = [item["stage"] for item in trace if item["action"] == "reused"]
+        logger.info(f"증분 재계산: 재계산 {recomputed}, 재사용 {reused}")
+        return {"results": dict(self._results), "trace": trace, "recomputed": recomputed, "reused": reused}
+
+    def invalidate(self) -> None:
+        """보관된 결과를 모두 버립니다. (다음 실행은 전체 계산)"""
+        self._results.clear()
+        self._snapshot = None
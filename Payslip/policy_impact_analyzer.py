@@ -7,14 +7,14 @@
 import os
 import json
 import datetime
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Union, Tuple
 from decimal import Decimal
 
-from Payslip.work_time_schema import WorkTimeCalculationResult
+from Payslip.Worktime.schema import WorkTimeCalculationResult
 from Payslip.policy_simulator import PolicySimulator
+from Payslip import policy_impact_batch
 
 
 class PolicyImpactAnalyzer:
@@ -101,6 +101,23 @@ class PolicyImpactAnalyzer:
         
         return impact_analysis
     
+    def analyze_impact_batch(self, base_result: Dict[str, Any], comparison_results: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+        """
+        정책 영향도 일괄 분석 (수백 개의 비교 결과를 지표 행렬로 쌓아 벡터 연산으로 점수 계산)
+        
+        점수 규칙은 analyze_impact와 같으며, 결과는 종합 영향도 점수 순으로 정렬됩니다.
+        
+        Args:
+            base_result: 기준 결과
+            comparison_results: 비교 결과 딕셔너리
+            
+        Returns:
+            정책 이름을 인덱스로 하는 순위별 영향도 DataFrame
+        """
+        return policy_impact_batch.analyze_impact_batch(
+            base_result, comparison_results, time_metrics=self.impact_metrics['time_metrics']
+        )
+    
     def _analyze_time_impact(self, base_summary, comparison_summary) -> Dict[str, Any]:
         """
         시간 영향도 분석
@@ -496,5 +513,4 @@ class PolicyVisualizationTool:
         }
         
         # 출력 디렉토리 생성
-        os.mak
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+        os.makedirs(self.output_dir, exist_ok=True)
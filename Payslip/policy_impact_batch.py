@@ -0,0 +1,268 @@
+"""
+정책 영향도 일괄 분석 모듈
+
+PolicyImpactAnalyzer.analyze_impact가 비교 결과마다 항목별로 계산하는 영향도 점수를,
+수백 개의 비교 결과를 쌓은 지표 행렬에 대해 벡터 연산으로 한 번에 계산합니다.
+점수 규칙(영향도 수준 구간, 수준별 점수, 가중치)은 analyze_impact와 같습니다.
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .policy_manager import _freeze_value
+
+logger = logging.getLogger(__name__)
+
+# 시간 영향도 지표 (PolicyImpactAnalyzer.impact_metrics['time_metrics'])
+TIME_METRICS = ['regular_hours', 'overtime_hours', 'night_hours', 'holiday_hours', 'total_hours', 'total_net_work_hours']
+
+# 시간 영향도 점수 가중치
+TIME_SCORE_WEIGHTS = {
+    'total_net_work_hours': 0.4,
+    'regular_hours': 0.2,
+    'overtime_hours': 0.2,
+    'night_hours': 0.1,
+    'holiday_hours': 0.1
+}
+
+# 영향도 수준: (백분율 차이 절댓값 하한, 수준, 점수) - 위에서부터 판정
+IMPACT_LEVELS = [(20, 'high', 100), (10, 'medium', 60)]
+LOW_IMPACT_LEVEL = ('low', 30)
+NO_IMPACT_LEVEL = ('none', 0)
+
+# 종합 영향도 점수 가중치
+OVERALL_SCORE_WEIGHTS = {'time': 0.5, 'compliance': 0.3, 'policy_application': 0.2}
+
+
+def _attribute(source: Any, name: str, default: Any = None) -> Any:
+    """객체 속성 또는 딕셔너리 값"""
+    if isinstance(source, Mapping):
+        return source.get(name, default)
+    return getattr(source, name, default)
+
+
+def _metric_value(summary: Any, metric: str) -> float:
+    """시간 요약의 지표 값 (없으면 NaN)"""
+    value = _attribute(summary, metric)
+    return float(value) if value is not None else np.nan
+
+
+def _warning_messages(result: Any) -> List[str]:
+    """경고 메시지 목록 (analyze_impact와 같이 메시지 기준으로 식별)"""
+    return [warning.get('message', '') for warning in (_attribute(result, 'warnings') or [])]
+
+
+def _policy_signatures(result: Any) -> Dict[str, Any]:
+    """정책 키 -> 적용 항목 목록의 비교용 값 (policy_applied 항목만)"""
+    grouped: Dict[str, List[Any]] = {}
+    for entry in _attribute(result, 'trace') or []:
+        if entry.get('type') == 'policy_applied' and entry.get('policy_key', ''):
+            grouped.setdefault(entry['policy_key'], []).append(entry)
+    return {key: _freeze_value(entries) for key, entries in grouped.items()}
+
+
+def _incidence(rows: Sequence[Any], vocabulary: Dict[Any, int]) -> np.ndarray:
+    """행별 항목 집합 -> 행 x 어휘 bool 행렬"""
+    matrix = np.zeros((len(rows), len(vocabulary)), dtype=bool)
+    for i, items in enumerate(rows):
+        matrix[i, [vocabulary[item] for item in items]] = True
+    return matrix
+
+
+def stack_impact_metrics(base_result: Any, comparison_results: Sequence[Any],
+                         time_metrics: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    기준 결과와 비교 결과들을 점수 계산용 행렬로 쌓습니다.
+
+    Args:
+        base_result: 기준 WorkTimeCalculationResult (time_summary, warnings, trace 사용)
+        comparison_results: 비교 결과 목록
+        time_metrics: 시간 지표 목록 (기본값: TIME_METRICS)
+
+    Returns:
+        time_metrics, base_time(M), time(NxM), warnings_base, warnings_comparison, new_warnings,
+        resolved_warnings, new_policies, removed_policies, modified_policies, unchanged_policies (각 N)
+    """
+    time_metrics = list(time_metrics or TIME_METRICS)
+    base_summary = _attribute(base_result, 'time_summary') if base_result is not None else None
+    base_time = np.array([_metric_value(base_summary, metric) for metric in time_metrics], dtype=np.float64)
+    time = np.array([[_metric_value(_attribute(result, 'time_summary'), metric) for metric in time_metrics]
+                     for result in comparison_results], dtype=np.float64).reshape(len(comparison_results), len(time_metrics))
+
+    # 경고: 메시지 어휘에 대한 포함 행렬로 새 경고/해결된 경고 수 계산
+    base_messages = _warning_messages(base_result) if base_result is not None else []
+    messages = [_warning_messages(result) for result in comparison_results]
+    vocabulary: Dict[Any, int] = {}
+    for items in [base_messages] + messages:
+        for message in items:
+            vocabulary.setdefault(message, len(vocabulary))
+    base_present = _incidence([base_messages], vocabulary)[0]
+    present = _incidence(messages, vocabulary)
+
+    # 정책 적용: 정책 키 어휘에 대한 포함 행렬과 적용 항목 값 코드
+    base_policies = _policy_signatures(base_result) if base_result is not None else {}
+    policies = [_policy_signatures(result) for result in comparison_results]
+    keys: Dict[Any, int] = {}
+    codes: Dict[Any, int] = {}
+    for items in [base_policies] + policies:
+        for key, signature in items.items():
+            keys.setdefault(key, len(keys))
+            codes.setdefault(signature, len(codes))
+    policy_codes = np.full((len(policies), len(keys)), -1, dtype=np.int64)
+    for i, items in enumerate(policies):
+        for key, signature in items.items():
+            policy_codes[i, keys[key]] = codes[signature]
+    base_codes = np.full(len(keys), -1, dtype=np.int64)
+    for key, signature in base_policies.items():
+        base_codes[keys[key]] = codes[signature]
+    policy_present, base_policy_present = policy_codes >= 0, base_codes >= 0
+    both = policy_present & base_policy_present
+
+    return {
+        'time_metrics': time_metrics,
+        'base_time': base_time,
+        'time': time,
+        'warnings_base': np.full(len(comparison_results), len(base_messages), dtype=np.int64),
+        'warnings_comparison': np.array([len(items) for items in messages], dtype=np.int64),
+        'new_warnings': (present & ~base_present).sum(axis=1),
+        'resolved_warnings': (base_present & ~present).sum(axis=1),
+        'new_policies': (policy_present & ~base_policy_present).sum(axis=1),
+        'removed_policies': (~policy_present & base_policy_present).sum(axis=1),
+        'modified_policies': (both & (policy_codes != base_codes)).sum(axis=1),
+        'unchanged_policies': (both & (policy_codes == base_codes)).sum(axis=1),
+    }
+
+
+def percentage_diff(base: np.ndarray, comparison: np.ndarray) -> np.ndarray:
+    """
+    백분율 차이 (기준 값이 0이면 비교 값이 양수일 때 100, 아니면 0)
+
+    Args:
+        base: 기준 값 배열
+        comparison: 비교 값 배열 (base와 브로드캐스트 가능)
+
+    Returns:
+        np.ndarray: 백분율 차이
+    """
+    base, comparison = np.broadcast_arrays(np.asarray(base, dtype=np.float64), np.asarray(comparison, dtype=np.float64))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(base == 0, np.where(comparison > 0, 100.0, 0.0), (comparison - base) / base * 100)
+
+
+def impact_levels(percentage: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    백분율 차이 배열의 영향도 수준과 수준별 점수 (NaN은 수준 None, 점수 NaN)
+
+    Args:
+        percentage: 백분율 차이 배열
+
+    Returns:
+        (수준 배열(object), 점수 배열(float))
+    """
+    magnitude = np.abs(percentage)
+    conditions = [magnitude >= threshold for threshold, _, _ in IMPACT_LEVELS] + [magnitude > 0]
+    levels = np.select(conditions, [level for _, level, _ in IMPACT_LEVELS] + [LOW_IMPACT_LEVEL[0]],
+                       NO_IMPACT_LEVEL[0]).astype(object)
+    scores = np.select(conditions, [score for _, _, score in IMPACT_LEVELS] + [LOW_IMPACT_LEVEL[1]],
+                       NO_IMPACT_LEVEL[1]).astype(np.float64)
+    missing = np.isnan(percentage)
+    levels[missing] = None
+    scores[missing] = np.nan
+    return levels, scores
+
+
+def score_impact_matrix(stacked: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    쌓인 지표 행렬로 영향도 점수를 계산합니다.
+
+    Args:
+        stacked: stack_impact_metrics 반환값
+
+    Returns:
+        percentage(NxM), levels(NxM), time_impact_score, compliance_delta, compliance_impact_score,
+        policy_application_impact_score, overall_impact_score (각 N)
+    """
+    time_metrics = stacked['time_metrics']
+    time, base_time = stacked['time'], stacked['base_time']
+    # 기준 또는 비교 값이 없는 지표는 analyze_impact와 같이 점수에서 제외
+    available = ~np.isnan(time) & ~np.isnan(base_time)
+    percentage = np.where(available, percentage_diff(base_time, time), np.nan)
+    levels, level_scores = impact_levels(percentage)
+
+    weights = np.array([TIME_SCORE_WEIGHTS.get(metric, 0.0) for metric in time_metrics], dtype=np.float64)
+    weight_sum = (available * weights).sum(axis=1)
+    weighted = np.where(available, level_scores, 0.0) @ weights
+    time_score = np.divide(weighted, weight_sum, out=np.zeros_like(weighted), where=weight_sum > 0)
+
+    base_count = stacked['warnings_base'].astype(np.float64)
+    comparison_count = stacked['warnings_comparison'].astype(np.float64)
+    base_score = np.select([comparison_count > base_count, comparison_count < base_count], [70.0, 30.0], 50.0)
+    resolved_ratio = np.divide(stacked['resolved_warnings'], base_count, out=np.zeros_like(base_count), where=base_count > 0)
+    new_ratio = np.divide(stacked['new_warnings'], comparison_count, out=np.zeros_like(comparison_count),
+                          where=comparison_count > 0)
+    compliance_score = np.clip(base_score - resolved_ratio * 30 + new_ratio * 30, 0, 100)
+
+    changed = (stacked['new_policies'] + stacked['removed_policies'] + stacked['modified_policies']).astype(np.float64)
+    total = changed + stacked['unchanged_policies']
+    policy_score = np.divide(changed * 100, total, out=np.zeros_like(changed), where=total > 0)
+
+    overall = (time_score * OVERALL_SCORE_WEIGHTS['time']
+               + compliance_score * OVERALL_SCORE_WEIGHTS['compliance']
+               + policy_score * OVERALL_SCORE_WEIGHTS['policy_application'])
+    return {
+        'percentage': percentage,
+        'levels': levels,
+        'time_impact_score': time_score,
+        'compliance_delta': stacked['warnings_comparison'] - stacked['warnings_base'],
+        'compliance_impact_score': compliance_score,
+        'policy_application_impact_score': policy_score,
+        'overall_impact_score': overall,
+    }
+
+
+def analyze_impact_batch(base_result: Dict[str, Any], comparison_results: Dict[str, Dict[str, Any]],
+                         time_metrics: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    여러 비교 결과의 정책 영향도를 한 번에 분석하여 종합 점수 순으로 정렬한 DataFrame을 반환합니다.
+
+    Args:
+        base_result: 기준 결과 ({"result": WorkTimeCalculationResult, ...})
+        comparison_results: 정책 이름 -> 비교 결과 ({"result", "description"}) (result가 없는 항목은 제외)
+        time_metrics: 시간 지표 목록 (기본값: TIME_METRICS)
+
+    Returns:
+        pd.DataFrame: 정책 이름 인덱스, rank, overall_impact_score, 영역별 점수, 지표별 percentage_diff/impact_level,
+        경고/정책 적용 변화 수 컬럼 (overall_impact_score 내림차순)
+    """
+    names = [name for name, data in comparison_results.items() if data.get('result')]
+    results = [comparison_results[name]['result'] for name in names]
+    stacked = stack_impact_metrics(base_result.get('result'), results, time_metrics)
+    scores = score_impact_matrix(stacked)
+
+    frame = pd.DataFrame({
+        'description': [comparison_results[name].get('description', '') for name in names],
+        'overall_impact_score': scores['overall_impact_score'],
+        'time_impact_score': scores['time_impact_score'],
+        'compliance_impact_score': scores['compliance_impact_score'],
+        'policy_application_impact_score': scores['policy_application_impact_score'],
+        'compliance_delta': scores['compliance_delta'],
+        'warnings_base': stacked['warnings_base'],
+        'warnings_comparison': stacked['warnings_comparison'],
+        'new_warnings': stacked['new_warnings'],
+        'resolved_warnings': stacked['resolved_warnings'],
+        'new_policies': stacked['new_policies'],
+        'removed_policies': stacked['removed_policies'],
+        'modified_policies': stacked['modified_policies'],
+        'unchanged_policies': stacked['unchanged_policies'],
+    }, index=pd.Index(names, name='policy_name'))
+    for j, metric in enumerate(stacked['time_metrics']):
+        frame[f'{metric}_percentage_diff'] = scores['percentage'][:, j]
+        frame[f'{metric}_impact_level'] = scores['levels'][:, j]
+
+    frame = frame.sort_values('overall_impact_score', ascending=False, kind='mergesort')
+    frame.insert(0, 'rank', np.arange(1, len(frame) + 1))
+    logger.info(f"정책 영향도 일괄 분석 완료: {len(frame)}개 비교 결과")
+    return frame
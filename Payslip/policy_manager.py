@@ -6,12 +6,18 @@
 """
 
 import os
+import copy
 import yaml
 import logging
 import datetime
+from types import MappingProxyType
+from collections.abc import Mapping
 from decimal import Decimal
 from typing import Dict, List, Any, Optional, Union
 
+from .config_registry import CONFIG_REGISTRY
+from .simulation_checkpoint import canonical_hash
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
@@ -22,16 +28,31 @@ class PolicyManager:
     설정 파일에서 정책을 로드하고 관리하는 클래스입니다.
     계층적 접근(dot notation)을 지원합니다.
     """
+
+    # freeze() 호출 후에는 set으로 수정할 수 없음 (PolicyOverlay의 공유 기반으로 사용)
+    _frozen = False
+    # 평탄화된 정책 스냅샷 (처음 조회할 때 생성, set 호출 시 무효화)
+    _snapshot = None
+    # settings가 설정 레지스트리의 공유 객체인지 여부 (set으로 처음 수정할 때 복사)
+    _settings_shared = False
+    # 설정 레지스트리가 공유하는 공휴일/최저임금 원본 (외부에는 복사본만 반환)
+    _holidays = ()
+    _minimum_wages = None
     
-    def __init__(self, settings_path=None, minimum_wage_path=None, holidays_path=None):
+    def __init__(self, settings_path=None, minimum_wage_path=None, holidays_path=None, registry=None):
         """
         PolicyManager 초기화
         
+        설정 파일은 설정 레지스트리를 통해 읽으므로 같은 파일을 사용하는 PolicyManager들은
+        파싱된 설정을 공유하며, 파일이 바뀌면 다음 생성 때 자동으로 다시 읽습니다.
+        
         Args:
             settings_path: 설정 파일 경로 (기본값: settings.yaml)
             minimum_wage_path: 최저임금 설정 파일 경로 (기본값: minimum_wage.yaml)
             holidays_path: 공휴일 설정 파일 경로 (기본값: holidays.yaml)
+            registry: 설정 레지스트리 (기본값: 프로세스 공유 CONFIG_REGISTRY)
         """
+        self.registry = registry if registry is not None else CONFIG_REGISTRY
         self.settings = {}
         self.minimum_wages = {}
         self.holidays = []
@@ -54,6 +75,8 @@ class PolicyManager:
             holidays_path = os.path.join(base_dir, "holidays.yaml")
         self._load_holidays(holidays_path)
         
+        self.config_paths = {"settings": settings_path, "minimum_wages": minimum_wage_path, "holidays": holidays_path}
+        
         logger.info("PolicyManager initialized with settings from %s", settings_path)
     
     def _load_settings(self, file_path):
@@ -64,29 +87,13 @@ class PolicyManager:
             file_path: 설정 파일 경로
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.settings = yaml.safe_load(f)
-                
-                # 단순계산모드 기본값 설정 (사용자 요청에 따라 기본값을 True로 설정)
-                if "calculation_mode" not in self.settings:
-                    self.settings["calculation_mode"] = {
-                        "simple_mode": True,
-                        "simple_mode_options": {
-                            "overtime_multiplier": 1.5,
-                            "holiday_work_method": "HOURLY"
-                        }
-                    }
-                elif "simple_mode" not in self.settings.get("calculation_mode", {}):
-                    self.settings.setdefault("calculation_mode", {})["simple_mode"] = True
-                    self.settings["calculation_mode"].setdefault("simple_mode_options", {
-                        "overtime_multiplier": 1.5,
-                        "holiday_work_method": "HOURLY"
-                    })
-                
-                logger.info("Settings loaded from %s", file_path)
+            self.settings = self.registry.load(file_path, _parse_settings)
+            self._settings_shared = True
+            logger.info("Settings loaded from %s", file_path)
         except Exception as e:
             logger.error(f"Failed to load settings from {file_path}: {e}")
             # 기본 설정 생성
+            self._settings_shared = False
             self.settings = {
                 "environment": "production",
                 "test_mode": False,
@@ -142,10 +149,8 @@ class PolicyManager:
             file_path: 최저임금 설정 파일 경로
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                self.minimum_wages = {item['year']: item for item in data.get('minimum_wages', [])}
-                logger.info("Minimum wages loaded from %s", file_path)
+            self.minimum_wages = self.registry.load(file_path, _parse_minimum_wages)
+            logger.info("Minimum wages loaded from %s", file_path)
         except Exception as e:
             logger.error(f"Failed to load minimum wages from {file_path}: {e}")
             # 기본 최저임금 설정
@@ -164,10 +169,8 @@ class PolicyManager:
             file_path: 공휴일 설정 파일 경로
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                self.holidays = data.get('holidays', [])
-                logger.info("Holidays loaded from %s", file_path)
+            self.holidays = self.registry.load(file_path, _parse_holidays)
+            logger.info("Holidays loaded from %s", file_path)
         except Exception as e:
             logger.error(f"Failed to load holidays from {file_path}: {e}")
             # 기본 공휴일 설정 (2025년 주요 공휴일)
@@ -193,16 +196,42 @@ class PolicyManager:
         Returns:
             정책 값 또는 기본값
         """
-        keys = key.split('.')
-        value = self.settings
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        return self.snapshot.get(key, default)
+    
+    @property
+    def snapshot(self):
+        """
+        설정 트리를 점 표기 경로로 한 번 평탄화한 읽기 전용 스냅샷 (settings 객체가 바뀌면 다시 생성)
         
-        return value
+        Returns:
+            PolicySnapshot 인스턴스
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.source is not self.settings:
+            snapshot = self._snapshot = PolicySnapshot(_flatten_settings(self.settings), source=self.settings)
+        return snapshot
+    
+    @property
+    def holidays(self):
+        """공휴일 목록 (설정 레지스트리 공유 데이터이므로 복사본 반환)"""
+        return copy.deepcopy(list(self._holidays))
+    
+    @holidays.setter
+    def holidays(self, value):
+        self._holidays = value
+    
+    @property
+    def minimum_wages(self):
+        """연도별 최저임금 (설정 레지스트리 공유 데이터이므로 복사본 반환)"""
+        return copy.deepcopy(dict(self._minimum_wages or {}))
+    
+    @minimum_wages.setter
+    def minimum_wages(self, value):
+        self._minimum_wages = value
+    
+    def invalidate_snapshot(self):
+        """settings를 set 없이 직접 수정한 경우 스냅샷을 버립니다."""
+        self._snapshot = None
     
     def set(self, key, value):
         """
@@ -212,6 +241,14 @@ class PolicyManager:
             key: 정책 키 (예: "policies.working_days.hire_date")
             value: 설정할 값
         """
+        if self._frozen:
+            raise RuntimeError(f"Frozen PolicyManager cannot be modified: {key}. Use overlay() instead.")
+        
+        # 공유 설정은 처음 수정할 때 복사 (다른 PolicyManager에 영향 없음)
+        if self._settings_shared:
+            self.settings = copy.deepcopy(self.settings)
+            self._settings_shared = False
+        
         keys = key.split('.')
         target = self.settings
         
@@ -223,8 +260,79 @@ class PolicyManager:
         
         # 마지막 키에 값 설정
         target[keys[-1]] = value
+        self._snapshot = None
         logger.debug("Policy value set: %s = %s", key, value)
     
+    def freeze(self):
+        """
+        정책 관리자를 읽기 전용으로 고정합니다. 고정된 관리자는 여러 PolicyOverlay가 공유하는 기반이 됩니다.
+        
+        Returns:
+            고정된 자기 자신 (PolicyManager)
+        """
+        self._frozen = True
+        return self
+    
+    @property
+    def is_frozen(self):
+        """읽기 전용 고정 여부"""
+        return self._frozen
+    
+    @property
+    def version_hash(self):
+        """
+        정책 버전 해시 (설정 트리, 최저임금, 공휴일 내용 기준)
+        설정 파일이나 덮어쓰기 값이 바뀌면 달라지므로 저장된 시뮬레이션 결과의 유효성 확인에 사용합니다.
+        
+        Returns:
+            str: SHA-256 16진수 문자열
+        """
+        return canonical_hash({"settings": self.settings, "minimum_wages": self._minimum_wages,
+                               "holidays": self._holidays})
+    
+    def reload_if_changed(self):
+        """
+        설정 파일이 디스크에서 바뀌었으면 설정 레지스트리에서 다시 읽습니다.
+        set으로 수정한 설정은 덮어쓰지 않습니다. (기존 오버레이는 이전 설정을 계속 사용)
+        
+        Returns:
+            bool: 다시 읽었으면 True
+        """
+        paths = getattr(self, "config_paths", None)
+        if not paths:
+            return False
+        
+        def changed(name, parser, data):
+            # 파일이 없어 기본값을 사용하는 경우는 다시 읽지 않음
+            return os.path.exists(paths[name]) and not self.registry.is_current(paths[name], parser, data)
+        
+        reloaded = False
+        if self._settings_shared and changed("settings", _parse_settings, self.settings):
+            self._load_settings(paths["settings"])
+            reloaded = True
+        if changed("minimum_wages", _parse_minimum_wages, self._minimum_wages):
+            self._load_minimum_wages(paths["minimum_wages"])
+            reloaded = True
+        if changed("holidays", _parse_holidays, self._holidays):
+            self._load_holidays(paths["holidays"])
+            reloaded = True
+        return reloaded
+    
+    def overlay(self, overrides=None):
+        """
+        이 관리자를 기반으로 일부 정책 값만 덮어쓴 오버레이를 생성합니다.
+        기반 관리자는 자동으로 고정(freeze)됩니다.
+        
+        Args:
+            overrides: 덮어쓸 정책 키-값 딕셔너리 (예: {"policies.weekly_holiday.min_hours": 20})
+        
+        Returns:
+            PolicyOverlay 인스턴스
+        """
+        if isinstance(self, PolicyOverlay):
+            return self.with_overrides(overrides)
+        return PolicyOverlay(self.freeze(), overrides)
+    
     def save_settings(self, file_path=None):
         """
         설정을 파일에 저장
@@ -255,7 +363,7 @@ class PolicyManager:
         Returns:
             최저임금 정보 딕셔너리 또는 None
         """
-        return self.minimum_wages.get(year)
+        return copy.deepcopy((self._minimum_wages or {}).get(year))
     
     def is_holiday(self, date):
         """
@@ -268,7 +376,7 @@ class PolicyManager:
             공휴일 여부 (bool)
         """
         date_str = date.strftime("%Y-%m-%d")
-        return any(holiday['date'] == date_str for holiday in self.holidays)
+        return any(holiday['date'] == date_str for holiday in self._holidays)
     
     def is_weekend(self, date):
         """
@@ -280,9 +388,7 @@ class PolicyManager:
         Returns:
             주말 여부 (bool)
         """
-        weekday = date.strftime("%A")
-        weekly_holiday_days = self.get("company_settings.weekly_holiday_days", ["Saturday", "Sunday"])
-        return weekday in weekly_holiday_days
+        return date.strftime("%A") in self.snapshot.weekly_holiday_days
     
     def is_simple_mode(self):
         """
@@ -291,7 +397,7 @@ class PolicyManager:
         Returns:
             단순계산모드 여부 (bool)
         """
-        return self.get("calculation_mode.simple_mode", True)
+        return self.snapshot.simple_mode
     
     def get_simple_mode_options(self):
         """
@@ -300,10 +406,7 @@ class PolicyManager:
         Returns:
             단순계산모드 옵션 딕셔너리
         """
-        return self.get("calculation_mode.simple_mode_options", {
-            "overtime_multiplier": 1.5,
-            "holiday_work_method": "HOURLY"
-        })
+        return self.snapshot.simple_mode_options
     
     def get_validation_policy(self):
         """
@@ -363,11 +466,7 @@ class PolicyManager:
         Returns:
             주휴수당 정책 딕셔너리
         """
-        return {
-            "min_hours": self.get("policies.weekly_holiday.min_hours", 15),
-            "allowance_hours": self.get("policies.weekly_holiday.allowance_hours", 8),
-            "include_first_week": self.get("policies.weekly_holiday.include_first_week", False)
-        }
+        return dict(self.snapshot.weekly_holiday_policy)
     
     def get_tardiness_early_leave_policy(self):
         """
@@ -376,12 +475,7 @@ class PolicyManager:
         Returns:
             지각/조퇴 정책 딕셔너리
         """
-        return {
-            "standard_start_time": self.get("policies.tardiness_early_leave.standard_start_time", "09:00"),
-            "standard_end_time": self.get("policies.tardiness_early_leave.standard_end_time", "18:00"),
-            "deduction_unit": self.get("policies.tardiness_early_leave.deduction_unit", 30),
-            "apply_deduction": self.get("policies.tardiness_early_leave.apply_deduction", True)
-        }
+        return dict(self.snapshot.tardiness_early_leave_policy)
     
     def get_warnings_policy(self):
         """
@@ -390,10 +484,7 @@ class PolicyManager:
         Returns:
             경고 메시지 정책 딕셔너리
         """
-        return {
-            "enabled": self.get("policies.warnings.enabled", True),
-            "test_mode_override": self.get("policies.warnings.test_mode_override", True)
-        }
+        return dict(self.snapshot.warnings_policy)
     
     def get_working_days_policy(self):
         """
@@ -402,10 +493,7 @@ class PolicyManager:
         Returns:
             근무일 처리 정책 딕셔너리
         """
-        return {
-            "hire_date": self.get("policies.working_days.hire_date", "EXCLUDE_HIRE_DATE"),
-            "resignation_date": self.get("policies.working_days.resignation_date", "EXCLUDE_RESIGNATION_DATE")
-        }
+        return dict(self.snapshot.working_days_policy)
     
     def get_daily_work_minutes_standard(self):
         """
@@ -414,7 +502,7 @@ class PolicyManager:
         Returns:
             일일 표준 근무시간(분)
         """
-        return self.get("company_settings.daily_work_minutes_standard", 480)
+        return self.snapshot.daily_work_minutes_standard
     
     def get_night_shift_times(self):
         """
@@ -423,6 +511,413 @@ class PolicyManager:
         Returns:
             (야간 시작 시간, 야간 종료 시간) 튜플
         """
-        night_start = self.get("company_settings.night_shift_start_time", "22:00")
-        night_end = self.get("company_settings.night_shift_end_time", "06:00")
-        return night_start, night_end
+        return self.snapshot.night_shift_times
+
+
+def _parse_settings(data):
+    """
+    settings.yaml 파싱 결과에 단순계산모드 기본값을 채웁니다. (설정 레지스트리 파서)
+    
+    Args:
+        data: YAML 데이터
+    
+    Returns:
+        설정 딕셔너리
+    """
+    # 단순계산모드 기본값 설정 (사용자 요청에 따라 기본값을 True로 설정)
+    if "calculation_mode" not in data:
+        data["calculation_mode"] = {
+            "simple_mode": True,
+            "simple_mode_options": {
+                "overtime_multiplier": 1.5,
+                "holiday_work_method": "HOURLY"
+            }
+        }
+    elif "simple_mode" not in data.get("calculation_mode", {}):
+        data.setdefault("calculation_mode", {})["simple_mode"] = True
+        data["calculation_mode"].setdefault("simple_mode_options", {
+            "overtime_multiplier": 1.5,
+            "holiday_work_method": "HOURLY"
+        })
+    return data
+
+
+def _parse_minimum_wages(data):
+    """minimum_wage.yaml -> 연도별 최저임금 딕셔너리 (설정 레지스트리 파서)"""
+    return {item['year']: item for item in data.get('minimum_wages', [])}
+
+
+def _parse_holidays(data):
+    """holidays.yaml -> 공휴일 목록 (설정 레지스트리 파서)"""
+    return data.get('holidays', [])
+
+
+_MISSING = object()
+
+
+def _flatten_settings(settings, prefix=""):
+    """
+    설정 트리를 점 표기 경로 -> 값 딕셔너리로 평탄화합니다. (중간 경로의 하위 트리도 포함)
+    점이 들어간 키나 문자열이 아닌 키는 점 표기로 조회할 수 없으므로 제외합니다.
+    
+    Args:
+        settings: 설정 딕셔너리
+        prefix: 경로 접두사 (예: "policies.")
+    
+    Returns:
+        점 표기 경로 -> 값 딕셔너리
+    """
+    values = {}
+    if not isinstance(settings, dict):
+        return values
+    for k, value in settings.items():
+        if not isinstance(k, str) or '.' in k:
+            continue
+        path = prefix + k
+        values[path] = value
+        if isinstance(value, dict):
+            values.update(_flatten_settings(value, path + '.'))
+    return values
+
+
+class PolicySnapshot:
+    """
+    정책 스냅샷 클래스
+    
+    점 표기 경로 -> 값으로 평탄화된 읽기 전용 정책 인덱스입니다. get은 키 분할과 트리 탐색 없이
+    딕셔너리 조회 한 번으로 끝나며, 계산기가 반복 호출하는 정책 접근자 값은 속성으로 미리 계산합니다.
+    """
+    
+    def __init__(self, values, source=None):
+        """
+        PolicySnapshot 초기화
+        
+        Args:
+            values: 점 표기 경로 -> 값 딕셔너리
+            source: 스냅샷을 만든 설정 트리 (PolicyManager가 교체 여부 확인에 사용)
+        """
+        self._values = values
+        self.source = source
+        
+        get = self.get
+        self.simple_mode = get("calculation_mode.simple_mode", True)
+        self.simple_mode_options = get("calculation_mode.simple_mode_options", {
+            "overtime_multiplier": 1.5,
+            "holiday_work_method": "HOURLY"
+        })
+        self.weekly_holiday_policy = MappingProxyType({
+            "min_hours": get("policies.weekly_holiday.min_hours", 15),
+            "allowance_hours": get("policies.weekly_holiday.allowance_hours", 8),
+            "include_first_week": get("policies.weekly_holiday.include_first_week", False)
+        })
+        self.tardiness_early_leave_policy = MappingProxyType({
+            "standard_start_time": get("policies.tardiness_early_leave.standard_start_time", "09:00"),
+            "standard_end_time": get("policies.tardiness_early_leave.standard_end_time", "18:00"),
+            "deduction_unit": get("policies.tardiness_early_leave.deduction_unit", 30),
+            "apply_deduction": get("policies.tardiness_early_leave.apply_deduction", True)
+        })
+        self.warnings_policy = MappingProxyType({
+            "enabled": get("policies.warnings.enabled", True),
+            "test_mode_override": get("policies.warnings.test_mode_override", True)
+        })
+        self.working_days_policy = MappingProxyType({
+            "hire_date": get("policies.working_days.hire_date", "EXCLUDE_HIRE_DATE"),
+            "resignation_date": get("policies.working_days.resignation_date", "EXCLUDE_RESIGNATION_DATE")
+        })
+        self.daily_work_minutes_standard = get("company_settings.daily_work_minutes_standard", 480)
+        self.night_shift_times = (
+            get("company_settings.night_shift_start_time", "22:00"),
+            get("company_settings.night_shift_end_time", "06:00")
+        )
+        weekly_holiday_days = get("company_settings.weekly_holiday_days", ["Saturday", "Sunday"]) or ()
+        self.weekly_holiday_days = frozenset([weekly_holiday_days] if isinstance(weekly_holiday_days, str) else weekly_holiday_days)
+    
+    @property
+    def values(self):
+        """점 표기 경로 -> 값 (읽기 전용 뷰)"""
+        return MappingProxyType(self._values)
+    
+    def get(self, key, default=None):
+        """
+        정책 값 가져오기 (평탄화된 인덱스 조회)
+        하위 트리(dict)나 목록 값은 여러 PolicyManager가 공유하는 설정이므로 복사본을 반환합니다.
+        
+        Args:
+            key: 정책 키 (예: "policies.working_days.hire_date")
+            default: 기본값
+        
+        Returns:
+            정책 값 또는 기본값
+        """
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+    
+    def __contains__(self, key):
+        return key in self._values
+    
+    def __len__(self):
+        return len(self._values)
+
+
+class _OverlayValues(Mapping):
+    """
+    덮어쓰기 인덱스 -> 공유 기반 인덱스 순서로 조회하는 평탄화 인덱스 (PolicyOverlay 스냅샷용)
+    덮어쓴 키의 하위 경로는 기반 값이 아닌 덮어쓴 값에서만 찾습니다.
+    """
+    
+    def __init__(self, overlay_values, overridden_keys, base_values):
+        """
+        _OverlayValues 초기화
+        
+        Args:
+            overlay_values: 덮어쓰기로 바뀐 점 표기 경로 -> 값 (덮어쓴 키, 그 하위 경로, 상위 경로)
+            overridden_keys: 덮어쓴 키 집합 (기반 인덱스의 하위 경로를 가리는 접두사)
+            base_values: 공유 기반의 평탄화 인덱스
+        """
+        self._overlay_values = overlay_values
+        self._overridden_keys = overridden_keys
+        self._base_values = base_values
+        self._keys = None
+    
+    def _shadowed(self, key):
+        """기반 인덱스의 키가 덮어쓴 상위 키에 가려지는지 여부"""
+        index = key.rfind('.')
+        while index > 0:
+            if key[:index] in self._overridden_keys:
+                return True
+            index = key.rfind('.', 0, index)
+        return False
+    
+    def __getitem__(self, key):
+        if key in self._overlay_values:
+            return self._overlay_values[key]
+        if self._shadowed(key):
+            raise KeyError(key)
+        return self._base_values[key]
+    
+    def get(self, key, default=None):
+        if key in self._overlay_values:
+            return self._overlay_values[key]
+        if self._shadowed(key):
+            return default
+        return self._base_values.get(key, default)
+    
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def _key_list(self):
+        """전체 키 목록 (len/반복 시에만 한 번 생성)"""
+        if self._keys is None:
+            keys = list(self._overlay_values)
+            keys.extend(k for k in self._base_values if k not in self._overlay_values and not self._shadowed(k))
+            self._keys = keys
+        return self._keys
+    
+    def __iter__(self):
+        return iter(self._key_list())
+    
+    def __len__(self):
+        return len(self._key_list())
+
+
+def _freeze_value(value):
+    """
+    정책 값을 해시 가능한 형태로 변환 (dict/list/set -> 정렬된 tuple)
+    
+    Args:
+        value: 정책 값
+    
+    Returns:
+        해시 가능한 값
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, set):
+        return tuple(sorted(_freeze_value(v) for v in value))
+    return value
+
+
+class PolicyOverlay(PolicyManager):
+    """
+    정책 오버레이 클래스
+    
+    고정된(freeze) 기반 PolicyManager 위에 일부 정책 키만 덮어쓴 가벼운 읽기 전용 관리자입니다.
+    조회는 오버레이를 먼저 확인한 뒤 공유 기반으로 넘어가므로, 정책 조합마다 설정 트리·공휴일·최저임금을
+    deepcopy할 필요가 없습니다. 같은 기반과 같은 덮어쓰기 값을 가진 오버레이는 같은 해시를 가지므로
+    캐시 키로 사용할 수 있습니다.
+    """
+    
+    _frozen = True
+    
+    def __init__(self, base, overrides=None):
+        """
+        PolicyOverlay 초기화
+        
+        Args:
+            base: 고정된 기반 PolicyManager
+            overrides: 덮어쓸 정책 키-값 딕셔너리 (점 표기 키)
+        """
+        if isinstance(base, PolicyOverlay):
+            overrides = {**base.overrides, **(overrides or {})}
+            base = base.base
+        if not base.is_frozen:
+            raise ValueError("PolicyOverlay base must be frozen. Call base.freeze() or base.overlay() first.")
+        
+        self.base = base
+        self.overrides = dict(overrides or {})
+        # 공휴일/최저임금은 기반 객체를 그대로 공유 (외부에는 복사본만 반환)
+        self._minimum_wages = base._minimum_wages
+        self._holidays = base._holidays
+        
+        # 덮어쓴 키의 상위 경로 (하위 트리 병합이 필요한 조회 판별용)
+        self._override_ancestors = set()
+        for key in self.overrides:
+            parts = key.split('.')
+            for i in range(1, len(parts)):
+                self._override_ancestors.add('.'.join(parts[:i]))
+        
+        self._subtree_cache = {}
+        self._settings_cache = None
+        self._hash_key = (id(base), _freeze_value(self.overrides))
+        self._hash = hash(self._hash_key)
+    
+    def __hash__(self):
+        return self._hash
+    
+    def __eq__(self, other):
+        if not isinstance(other, PolicyOverlay):
+            return NotImplemented
+        return self._hash_key == other._hash_key
+    
+    def __repr__(self):
+        return f"PolicyOverlay(overrides={self.overrides!r})"
+    
+    @property
+    def cache_key(self):
+        """기반 객체와 덮어쓰기 값으로 구성된 해시 가능한 캐시 키"""
+        return self._hash_key
+    
+    @property
+    def settings(self):
+        """덮어쓰기가 반영된 전체 설정 트리 (처음 접근할 때 한 번만 생성)"""
+        if self._settings_cache is None:
+            merged = copy.deepcopy(self.base.settings)
+            for key, value in self.overrides.items():
+                _set_nested(merged, key, copy.deepcopy(value))
+            self._settings_cache = merged
+        return self._settings_cache
+    
+    @property
+    def snapshot(self):
+        """
+        공유 기반의 평탄화 인덱스 위에 덮어쓰기만 얹은 읽기 전용 스냅샷 (처음 접근할 때 한 번만 생성)
+        기반 인덱스는 복사하지 않고, 조회 시 덮어쓰기 인덱스를 먼저 확인한 뒤 기반 인덱스로 넘어갑니다.
+        
+        Returns:
+            PolicySnapshot 인스턴스
+        """
+        if self._snapshot is None:
+            values = {}
+            # 상위 키 덮어쓰기를 먼저 반영해야 하위 키 덮어쓰기가 그 위에 적용됨
+            for key in sorted(self.overrides, key=lambda k: k.count('.')):
+                prefix = key + '.'
+                for existing in [k for k in values if k.startswith(prefix)]:
+                    del values[existing]
+                value = self.overrides[key]
+                values[key] = value
+                values.update(_flatten_settings(value, prefix))
+            for ancestor in self._override_ancestors - set(self.overrides):
+                values[ancestor] = self._resolve(ancestor)
+            self._snapshot = PolicySnapshot(_OverlayValues(values, set(self.overrides), self.base.snapshot._values))
+        return self._snapshot
+    
+    def get(self, key, default=None):
+        """
+        정책 값 가져오기 (덮어쓰기가 반영된 스냅샷 조회)
+        
+        Args:
+            key: 정책 키 (예: "policies.working_days.hire_date")
+            default: 기본값
+        
+        Returns:
+            정책 값 또는 기본값
+        """
+        return self.snapshot.get(key, default)
+    
+    def _resolve(self, key, default=None):
+        """
+        정책 값 가져오기 (오버레이 -> 공유 기반 순서로 조회)
+        
+        Args:
+            key: 정책 키 (예: "policies.working_days.hire_date")
+            default: 기본값
+        
+        Returns:
+            정책 값 또는 기본값
+        """
+        # 1. 정확히 덮어쓴 키
+        if key in self.overrides:
+            return self.overrides[key]
+        
+        # 2. 하위 키가 덮어써진 경우: 기반 하위 트리에 덮어쓰기를 병합
+        if key in self._override_ancestors:
+            if key not in self._subtree_cache:
+                base_value = self.base.get(key)
+                merged = copy.deepcopy(base_value) if isinstance(base_value, dict) else {}
+                prefix = key + '.'
+                for override_key, value in self.overrides.items():
+                    if override_key.startswith(prefix):
+                        _set_nested(merged, override_key[len(prefix):], copy.deepcopy(value))
+                self._subtree_cache[key] = merged
+            return self._subtree_cache[key]
+        
+        # 3. 상위 키가 덮어써진 경우: 덮어쓴 값 내부를 탐색
+        parts = key.split('.')
+        for i in range(len(parts) - 1, 0, -1):
+            parent_key = '.'.join(parts[:i])
+            if parent_key in self.overrides:
+                value = self.overrides[parent_key]
+                for k in parts[i:]:
+                    if isinstance(value, dict) and k in value:
+                        value = value[k]
+                    else:
+                        return default
+                return value
+        
+        # 4. 공유 기반
+        return self.base.get(key, default)
+    
+    def with_overrides(self, overrides=None):
+        """
+        현재 덮어쓰기에 추가 값을 더한 새 오버레이를 생성합니다. (자기 자신은 변경되지 않음)
+        
+        Args:
+            overrides: 추가로 덮어쓸 정책 키-값 딕셔너리
+        
+        Returns:
+            새 PolicyOverlay 인스턴스
+        """
+        return PolicyOverlay(self.base, {**self.overrides, **(overrides or {})})
+
+
+def _set_nested(target, key, value):
+    """
+    점 표기 키로 중첩 딕셔너리에 값 설정 (중간 경로가 없으면 생성)
+    
+    Args:
+        target: 대상 딕셔너리
+        key: 점 표기 키
+        value: 설정할 값
+    """
+    keys = key.split('.')
+    for k in keys[:-1]:
+        if k not in target or not isinstance(target[k], dict):
+            target[k] = {}
+        target = target[k]
+    target[keys[-1]] = value
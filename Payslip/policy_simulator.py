@@ -12,12 +12,24 @@ from typing import Dict, List, Any, Optional, Union, Tuple
 from decimal import Decimal
 import datetime
 
+import numpy as np
+import pandas as pd
+
 from Payslip.Worktime.schema import  (
     TimeCardInputData, TimeCardRecord, WorkTimeCalculationResult,
     TimeSummary, WorkDayDetail, ErrorDetails, ComplianceAlert
 )
 from Payslip.policy_manager import PolicyManager
-from Payslip.timecard_calculator import TimeCardBasedCalculator # "_refactored" 부분을 삭제!
+from Payslip.policy_stage_cache import PolicyStageCache
+from Payslip.simulation_checkpoint import canonical_hash
+from Payslip.simulation_result_cache import SimulationResultCache
+from Payslip import policy_sweep
+from Payslip import simulation_result_store
+from Payslip import result_comparator
+from Payslip.baseline_delta_store import BaselineDeltaStore, to_calculation_result
+from Payslip.policy_dependency_graph import PolicyDependencyGraph, IncrementalRecomputer
+from Payslip.policy_canonical import policy_set_overrides
+from Payslip.Worktime.calculator import TimeCardBasedCalculator as WorktimeCalculator
 
 class PolicySimulator:
     """
@@ -26,13 +38,228 @@ class PolicySimulator:
     여러 정책 조합을 동일한 입력 데이터에 적용하고 결과를 비교하는 시뮬레이션 엔진입니다.
     """
     
-    def __init__(self):
+    def __init__(self, cache_max_entries: Optional[int] = 1000, cache_max_bytes: Optional[int] = 256 * 1024 * 1024):
         """
         정책 시뮬레이터 초기화
+
+        Args:
+            cache_max_entries: 결과 캐시 최대 항목 수
+            cache_max_bytes: 결과 캐시 최대 바이트 크기
+        """
+        # 기반 정책은 고정(freeze)하여 모든 정책 조합의 오버레이가 공유
+        self.base_policy_manager = PolicyManager().freeze()
+        # (입력 해시, 정책 조합 해시) 키의 크기 제한 LRU 결과 캐시
+        self.results_cache = SimulationResultCache(max_entries=cache_max_entries, max_bytes=cache_max_bytes)
+        # 정책 조합 간 일별/주별 중간 결과 공유 캐시 (단계가 읽는 정책 키만 캐시 키에 포함)
+        self.stage_cache = PolicyStageCache()
+        # 증분 재계산용 정책 -> 계산 단계 의존성 그래프와 (입력, 시급)별 재계산기
+        self.dependency_graph = PolicyDependencyGraph()
+        self._incremental_sessions: Dict[Tuple[str, Optional[float]], IncrementalRecomputer] = {}
+
+    def simulate(self, input_data: Union[TimeCardInputData, Dict[str, Any]], policy_set: Dict[str, Any],
+                 hourly_wage: Optional[float] = None) -> Dict[str, Any]:
+        """
+        단일 정책 조합에 대해 단계 캐시를 사용하여 근로시간을 계산합니다.
+
+        Args:
+            input_data: 타임카드 입력 데이터 (딕셔너리도 허용)
+            policy_set: 정책 조합 (정책 키-값 딕셔너리 또는 generate_policy_combination_matrix 조합)
+            hourly_wage: 통상시급 (지정 시 time_summary에 시간급 합계 포함)
+
+        Returns:
+            계산 결과 딕셔너리 (time_summary는 시간 항목별 float 값, 시급 지정 시 overtime_pay/weekly_holiday_pay/total_pay 포함)
+        """
+        input_data = self._coerce_input(input_data)
+        policy_manager = self._policy_overlay(policy_set)
+        result = self._calculate_worktime(input_data, policy_manager)
+
+        time_summary = {key: float(value) for key, value in result["time_summary"].model_dump().items()}
+        time_summary["total_hours"] = time_summary.get("total_net_work_hours", 0.0)
+        if hourly_wage is not None:
+            weekly_holiday = self._weekly_holiday_summary(result, input_data, policy_manager, hourly_wage)
+            time_summary.update(self._pay_summary(time_summary, weekly_holiday, policy_manager, hourly_wage))
+        result["time_summary"] = time_summary
+        return result
+
+    @property
+    def policy_version(self) -> str:
+        """기반 정책/설정 파일 버전 해시 (체크포인트 키에 사용)"""
+        return self.base_policy_manager.version_hash
+
+    def refresh_base_policies(self) -> bool:
+        """
+        설정 파일이 바뀌었으면 기반 정책을 다시 읽고 이전 설정으로 계산한 캐시를 비웁니다.
+        (세션 동안 유지되는 시뮬레이터에서 실행 전에 호출)
+
+        Returns:
+            bool: 다시 읽었으면 True
+        """
+        if not self.base_policy_manager.reload_if_changed():
+            return False
+        self.results_cache.clear()
+        self.stage_cache.clear()
+        self._incremental_sessions.clear()
+        return True
+
+    def simulate_incremental(
+        self,
+        input_data: TimeCardInputData,
+        policy_set: Dict[str, Any],
+        hourly_wage: Optional[float] = None,
+        changed_keys: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        같은 입력에 대해 정책을 하나씩 바꿔 가며 반복 계산할 때, 바뀐 정책 키의 하위 단계만 다시 계산합니다.
+        (근로시간 -> 근로시간 요약/주휴수당 -> 시간급 합계)
+
+        Args:
+            input_data: 타임카드 입력 데이터
+            policy_set: 정책 조합 (정책 키-값 쌍의 딕셔너리)
+            hourly_wage: 통상시급 (지정 시 pay 단계 계산)
+            changed_keys: 의존성 그래프에 없는 정책 키를 바꾼 경우 그 키 목록
+
+        Returns:
+            단계별 결과(results)와 재사용/재계산 추적(trace)
         """
-        self.base_policy_manager = PolicyManager()
-        self.results_cache = {}
+        self.refresh_base_policies()
+        session_key = (canonical_hash(input_data), hourly_wage)
+        recomputer = self._incremental_sessions.pop(session_key, None)
+        if recomputer is None or recomputer.graph is not self.dependency_graph:
+            recomputer = IncrementalRecomputer(self.dependency_graph,
+                                               self._incremental_stage_functions(input_data, hourly_wage))
+        # 최근 사용한 세션만 유지
+        self._incremental_sessions[session_key] = recomputer
+        while len(self._incremental_sessions) > 8:
+            self._incremental_sessions.pop(next(iter(self._incremental_sessions)))
+
+        return recomputer.run(self._policy_overlay(policy_set), changed_keys=changed_keys)
+
+    def _incremental_stage_functions(self, input_data: TimeCardInputData,
+                                     hourly_wage: Optional[float]) -> Dict[str, Any]:
+        """증분 재계산 단계 함수 (정책 조회 대상, 상위 단계 결과) -> 단계 결과"""
+        def time_summary(policy_manager, upstream):
+            summary = {key: float(value) for key, value in upstream["worktime"]["time_summary"].model_dump().items()}
+            summary["total_hours"] = summary.get("total_net_work_hours", 0.0)
+            return summary
+
+        def weekly_holiday(policy_manager, upstream):
+            return self._weekly_holiday_summary(upstream["worktime"], input_data, policy_manager, hourly_wage)
+
+        def pay(policy_manager, upstream):
+            if hourly_wage is None:
+                return None
+            return self._pay_summary(upstream["time_summary"], upstream["weekly_holiday"], policy_manager, hourly_wage)
+
+        return {
+            "worktime": lambda policy_manager, upstream: self._calculate_worktime(input_data, policy_manager),
+            "time_summary": time_summary,
+            "weekly_holiday": weekly_holiday,
+            "pay": pay,
+        }
+
+    @staticmethod
+    def _weekly_holiday_summary(worktime: Dict[str, Any], input_data: TimeCardInputData,
+                                policy_manager: PolicyManager, hourly_wage: Optional[float]) -> Dict[str, float]:
+        """현재 min_hours 정책의 주휴수당 발생 주 수와 주휴 시간 (시급 지정 시 allowance_pay 포함)"""
+        min_hours = policy_manager.get("policies.weekly_holiday.min_hours", 15)
+        frame = policy_sweep.sweep_parameter(worktime, "policies.weekly_holiday.min_hours",
+                                             [min_hours], input_data, policy_manager.get, hourly_wage=hourly_wage)
+        return {key: float(value) for key, value in frame.iloc[0].items()}
+
+    @staticmethod
+    def _pay_summary(time_summary: Dict[str, float], weekly_holiday: Dict[str, float],
+                     policy_manager: PolicyManager, hourly_wage: float) -> Dict[str, float]:
+        """현재 연장근로 배수 정책의 시간급 합계 (연장근로수당, 주휴수당 포함)"""
+        options = policy_manager.get("calculation_mode.simple_mode_options", {}) or {}
+        frame = policy_sweep.sweep_overtime_multiplier(
+            time_summary, [options.get("overtime_multiplier", 1.5)], hourly_wage,
+            apply_night_premium=options.get("apply_night_premium", True))
+        result = {key: float(value) for key, value in frame.iloc[0].items()}
+        result["weekly_holiday_pay"] = weekly_holiday.get("allowance_pay", 0.0)
+        result["total_pay"] += result["weekly_holiday_pay"]
+        return result
+
+    def _policy_overlay(self, policy_set: Optional[Dict[str, Any]]) -> PolicyManager:
+        """
+        정책 조합의 메타 정보를 제외하고 점 표기 덮어쓰기 값만 기반 정책 위에 얹은 오버레이를 생성합니다.
+        (조합 행렬의 옵션 목록은 각 옵션의 config를 적용하며, 중복 제거와 같은 평탄화 함수 사용)
+        """
+        return self.base_policy_manager.overlay(policy_set_overrides(policy_set or {}))
+
+    @staticmethod
+    def _coerce_input(input_data: Union[TimeCardInputData, Dict[str, Any]]) -> TimeCardInputData:
+        """딕셔너리 입력을 TimeCardInputData로 변환"""
+        if isinstance(input_data, dict):
+            return TimeCardInputData.model_validate(input_data)
+        return input_data
+
+    def _calculate_worktime(self, input_data: TimeCardInputData, policy_manager: PolicyManager) -> Dict[str, Any]:
+        """정책 오버레이 설정으로 근로시간을 계산합니다. (단계 캐시 공유)"""
+        calculator = WorktimeCalculator({
+            "company_settings": policy_manager.get("company_settings", {}),
+            "policies": policy_manager.get("policies", {}),
+            "holidays_config": {"holidays": policy_manager.holidays},
+        }, stage_cache=self.stage_cache)
+        return calculator.calculate(input_data)
+
+    def sweep_parameter(
+        self,
+        input_data: TimeCardInputData,
+        parameter: str,
+        values: Union[List[float], np.ndarray],
+        policy_set: Optional[Dict[str, Any]] = None,
+        hourly_wage: Optional[float] = None
+    ) -> pd.DataFrame:
+        """
+        수치 정책 파라미터의 후보 값 전체에 대한 민감도 곡선 계산
+
+        근로시간은 한 번만 계산하고, 파라미터 값별 급여/판정 결과는 벡터 연산으로 구합니다.
+
+        Args:
+            input_data: 타임카드 입력 데이터
+            parameter: 점 표기 정책 키 (policy_sweep.SWEEPABLE_PARAMETERS 중 하나)
+            values: 파라미터 후보 값 (예: np.linspace(1.0, 3.0, 1000))
+            policy_set: 기반 정책에 덮어쓸 정책 조합 (선택 사항)
+            hourly_wage: 통상시급 (급여 결과 계산 시 필요)
+
+        Returns:
+            파라미터 값을 인덱스로 하는 결과 DataFrame
+        """
+        input_data = self._coerce_input(input_data)
+        policy_manager = self._policy_overlay(policy_set)
+        result = self._calculate_worktime(input_data, policy_manager)
+        return policy_sweep.sweep_parameter(result, parameter, values, input_data, policy_manager.get,
+                                            hourly_wage=hourly_wage)
     
+    def simulate_workforce(
+        self,
+        input_data_list: List[TimeCardInputData],
+        policy_sets: List[Dict[str, Any]],
+        max_workers: Optional[int] = 4,
+        backend: str = "thread",
+        shard_size: Optional[int] = None,
+        hourly_wage: Optional[Union[float, Dict[str, float]]] = None
+    ) -> Dict[str, Any]:
+        """
+        전체 직원 × 정책 조합 매트릭스 시뮬레이션 실행 (직원별 결과 없이 조합별 집계만 반환)
+
+        Args:
+            input_data_list: 직원별 타임카드 입력 데이터 목록
+            policy_sets: 정책 조합 목록
+            max_workers: 병렬 처리 작업자 수
+            backend: 실행 백엔드 ("process", "thread", "inline")
+            shard_size: 작업자에 전달하는 직원 묶음 크기 (None이면 자동)
+            hourly_wage: 통상시급 또는 직원 ID별 통상시급 (지정 시 total_pay 집계)
+
+        Returns:
+            조합별 집계 결과
+        """
+        from Payslip.combination_runner import run_workforce_simulation_matrix
+        return run_workforce_simulation_matrix(
+            input_data_list, policy_sets, max_workers=max_workers, backend=backend,
+            shard_size=shard_size, simulator_factory=PolicySimulator, hourly_wage=hourly_wage
+        )
+
     def simulate_across_policies(
         self, 
         input_data: TimeCardInputData, 
@@ -56,16 +283,26 @@ class PolicySimulator:
         if policy_set_names is None:
             policy_set_names = [f"정책조합_{i+1}" for i in range(len(policy_sets))]
         
+        input_data = self._coerce_input(input_data)
+        input_hash = canonical_hash(input_data)
+        
         # 각 정책 조합에 대해 시뮬레이션 실행
         for i, (policy_set, policy_name) in enumerate(zip(policy_sets, policy_set_names)):
-            # 정책 관리자 생성 및 정책 설정
-            policy_manager = copy.deepcopy(self.base_policy_manager)
-            for key, value in policy_set.items():
-                policy_manager.set(key, value)
+            # 같은 입력과 정책 조합의 결과가 캐시에 있으면 재사용
+            policy_hash = canonical_hash(policy_set)
+            cached = self.results_cache.get(input_hash, policy_hash)
+            if cached is not None:
+                # 다른 이름으로 저장된 결과여도 이 이름으로 비교할 수 있도록 별칭 등록
+                self.results_cache.add_alias(input_hash, policy_hash, policy_name)
+                results[policy_name] = cached
+                continue
+            
+            # 공유 기반 위에 정책 조합만 덮어쓴 오버레이 생성 (설정 트리 복사 없음)
+            policy_manager = self._policy_overlay(policy_set)
             
-            # 계산기 생성 및 계산 실행
-            calculator = TimeCardBasedCalculator(policy_manager=policy_manager)
-            result = calculator.calculate(input_data)
+            # 계산 실행 (단계 캐시 공유) 후 비교용 결과 모델로 변환
+            raw = self._calculate_worktime(input_data, policy_manager)
+            result = to_calculation_result(raw, input_data.employee_id, input_data.period)
             
             # 결과 저장
             results[policy_name] = {
@@ -73,10 +310,9 @@ class PolicySimulator:
                 "policy_set": policy_set,
                 "timestamp": datetime.datetime.now().isoformat()
             }
-        
-        # 결과 캐시에 저장
-        cache_key = f"{input_data.employee_id}_{input_data.period}"
-        self.results_cache[cache_key] = results
+            
+            # 결과 캐시에 저장
+            self.results_cache.put(input_hash, policy_hash, policy_name, results[policy_name])
         
         return results
     
@@ -99,11 +335,10 @@ class PolicySimulator:
         """
         # 결과 이름이 제공된 경우 캐시에서 결과 가져오기
         if isinstance(result_a, str) and isinstance(result_b, str):
-            for cache_key, cached_results in self.results_cache.items():
-                if result_a in cached_results and result_b in cached_results:
-                    result_a = cached_results[result_a]["result"]
-                    result_b = cached_results[result_b]["result"]
-                    break
+            cached_pair = self.results_cache.find_by_names(result_a, result_b)
+            if cached_pair is not None:
+                result_a = cached_pair[0]["result"]
+                result_b = cached_pair[1]["result"]
         
         # 결과 객체가 아닌 경우 오류
         if not isinstance(result_a, WorkTimeCalculationResult) or not isinstance(result_b, WorkTimeCalculationResult):
@@ -128,6 +363,55 @@ class PolicySimulator:
         
         return comparison
     
+    def compare_results_nway(
+        self,
+        results: Union[List[str], Dict[str, Any]],
+        baseline: Optional[Union[str, int]] = None,
+        include_daily: bool = True
+    ) -> Dict[str, Any]:
+        """
+        N개 계산 결과를 한 번에 비교 (모든 쌍 또는 기준 결과 대비 차이 텐서)
+        
+        Args:
+            results: 결과 이름 목록 (같은 입력의 캐시된 결과 사용) 또는 이름 -> 계산 결과 딕셔너리
+            baseline: 기준 결과 이름 또는 순번 (None이면 모든 쌍 비교)
+            include_daily: 일별 상세 차이 포함 여부
+            
+        Returns:
+            result_comparator.compare_results_nway 반환값
+        """
+        if not isinstance(results, dict):
+            names = list(results)
+            cached = self.results_cache.find_by_names(*names)
+            if cached is None:
+                raise ValueError(f"캐시에서 결과를 찾을 수 없습니다: {', '.join(names)}")
+            results = {name: entry["result"] for name, entry in zip(names, cached)}
+        
+        return result_comparator.compare_results_nway(results, baseline=baseline, include_daily=include_daily)
+    
+    def build_delta_store(self, results: Dict[str, Any], baseline_name: str) -> BaselineDeltaStore:
+        """
+        시뮬레이션 결과를 기준 결과 대비 차이 저장소로 변환
+        
+        기준 결과는 한 번만 보관하고, 나머지 결과는 기준과 다른 일별 값만 저장합니다.
+        store.get(이름)으로 전체 결과를 복원하고, store.diff(이름)으로 복원 없이 기준 대비 일별 차이를 얻습니다.
+        
+        Args:
+            results: simulate_across_policies 반환값 (이름 -> {"result", "policy_set", "timestamp"})
+            baseline_name: 기준 결과 이름
+            
+        Returns:
+            BaselineDeltaStore
+        """
+        if baseline_name not in results:
+            raise ValueError(f"기준 결과를 찾을 수 없습니다: {baseline_name}")
+        
+        store = BaselineDeltaStore(baseline_name, results[baseline_name]["result"])
+        for policy_name, entry in results.items():
+            if policy_name != baseline_name:
+                store.add(policy_name, entry["result"], entry.get("policy_set"))
+        return store
+    
     def _compare_time_summary(self, summary_a: TimeSummary, summary_b: TimeSummary) -> Dict[str, Any]:
         """
         두 시간 요약 비교
@@ -491,17 +775,22 @@ class PolicySimulator:
         
         return summary
     
-    def save_simulation_results(self, results: Dict[str, Any], output_path: str) -> str:
+    def save_simulation_results(self, results: Dict[str, Any], output_path: str, format: str = "json") -> str:
         """
         시뮬레이션 결과 저장
         
         Args:
             results: 시뮬레이션 결과 딕셔너리
-            output_path: 출력 파일 경로
+            output_path: 출력 파일 경로 (parquet/arrow 형식이면 디렉터리 경로)
+            format: 저장 형식 ("json", "parquet", "arrow"). 대량 결과는 컬럼형 형식이 훨씬 작고 빠르게 로드됩니다.
             
         Returns:
             저장된 파일 경로
         """
+        if format != "json":
+            simulation_result_store.save_results_columnar(results, output_path, format=format)
+            return output_path
+        
         # 결과 직렬화
         serialized_results = {}
         
@@ -572,6 +861,12 @@ class PolicySimulator:
         Returns:
             시뮬레이션 결과 딕셔너리
         """
+        # 컬럼형 저장소 디렉터리
+        if simulation_result_store.is_columnar_store(input_path):
+            results = simulation_result_store.load_results_columnar(input_path)
+            self._cache_loaded_results(input_path, results)
+            return results
+        
         # JSON 파일에서 로드
         with open(input_path, 'r', encoding='utf-8') as f:
             serialized_results = json.load(f)
@@ -638,10 +933,35 @@ class PolicySimulator:
                 "timestamp": result_data["timestamp"]
             }
         
-        # 결과 캐시에 저장
-        self.results_cache["loaded_results"] = results
-        
+        self._cache_loaded_results(input_path, results)
         return results
+    
+    def _cache_loaded_results(self, input_path: str, results: Dict[str, Any]) -> None:
+        """로드한 결과를 결과 캐시에 저장합니다. (파일 경로를 입력 해시로 사용)"""
+        input_hash = canonical_hash({"loaded_results": os.path.abspath(input_path)})
+        for policy_name, entry in results.items():
+            self.results_cache.put(input_hash, canonical_hash(entry["policy_set"]), policy_name, entry)
+    
+    def load_simulation_table(
+        self,
+        input_path: str,
+        table: str = "summaries",
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None
+    ) -> pd.DataFrame:
+        """
+        컬럼형 저장소에서 필요한 컬럼과 행만 메모리 맵으로 읽어 DataFrame으로 반환합니다.
+        
+        Args:
+            input_path: save_simulation_results(format="parquet"/"arrow")로 저장한 디렉터리
+            table: 테이블 이름 ("summaries", "daily_details", "alerts")
+            columns: 읽을 컬럼 목록 (None이면 전체)
+            filters: (컬럼, 연산자, 값) 조건 목록 (예: [("total_net_work_hours", ">", 200)])
+            
+        Returns:
+            pd.DataFrame
+        """
+        return simulation_result_store.load_results_frame(input_path, table, columns=columns, filters=filters)
 
 
 # 사용 예시
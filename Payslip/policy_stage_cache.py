@@ -0,0 +1,179 @@
+"""
+정책 단계별 계산 캐시 모듈
+
+여러 정책 조합을 시뮬레이션할 때 일별/주별 중간 계산 결과를 재사용하기 위한 캐시입니다.
+각 계산 단계(stage)가 실제로 읽는 정책 키만 캐시 키에 포함하므로, 경고/검증 정책처럼 시간 계산에
+영향을 주지 않는 정책만 다른 조합들은 같은 결과를 공유합니다. 야간 근무 분류 정책처럼 특정 날에만
+영향을 주는 정책은 해당 날(야간 근무일)의 키에만 포함됩니다.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterable
+
+from .policy_manager import _freeze_value
+
+logger = logging.getLogger(__name__)
+
+# 단계별로 읽는 정책 키 (점 표기)
+STAGE_POLICY_KEYS: Dict[str, List[str]] = {
+    # 일별 정규/연장/휴일 시간 계산
+    "daily": [
+        "company_settings.daily_work_minutes_standard",
+        "company_settings.break_time_rules",
+        "company_settings.night_shift_start_time",
+        "company_settings.night_shift_end_time",
+    ],
+    # 야간 근무일에만 추가로 영향을 주는 정책
+    "daily_night": [
+        "policies.work_classification.overlap_policy",
+        "policies.work_classification.break_time_policy",
+    ],
+    # 주별 근로시간 한도 검사
+    "weekly": [
+        "company_settings.weekly_work_minutes_standard",
+        "company_settings.weekly_overtime_limit_buffer",
+    ],
+}
+
+_MISSING = object()
+
+
+def get_policy_value(policy_source: Any, key: str) -> Any:
+    """
+    PolicyManager(또는 get 메서드를 가진 객체)나 중첩 딕셔너리에서 점 표기 키 값을 조회합니다.
+
+    Args:
+        policy_source: PolicyManager/PolicyOverlay 또는 설정 딕셔너리
+        key: 점 표기 정책 키
+
+    Returns:
+        정책 값 (없으면 내부 누락 표식)
+    """
+    if hasattr(policy_source, "get") and not isinstance(policy_source, dict):
+        return policy_source.get(key, _MISSING)
+
+    value = policy_source
+    for k in key.split('.'):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return _MISSING
+    return value
+
+
+class PolicyStageCache:
+    """
+    정책 단계별 계산 캐시 클래스
+
+    (단계, 입력 키, 단계가 읽는 정책 값)을 키로 중간 결과를 저장합니다.
+    스레드 백엔드에서는 여러 스레드가 한 시뮬레이터(와 캐시)를 공유하므로 항목/통계 접근은 잠금으로 보호합니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 100000, stage_policy_keys: Optional[Dict[str, List[str]]] = None):
+        """
+        PolicyStageCache 초기화
+
+        Args:
+            max_entries: 최대 저장 항목 수 (None이면 무제한, 초과 시 가장 오래 사용되지 않은 항목 제거)
+            stage_policy_keys: 단계별 정책 키 (기본값: STAGE_POLICY_KEYS)
+        """
+        self.max_entries = max_entries
+        self.stage_policy_keys = dict(stage_policy_keys or STAGE_POLICY_KEYS)
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def policy_keys_for(self, stage: str, is_night_day: bool = False) -> List[str]:
+        """
+        단계가 읽는 정책 키 목록을 반환합니다. 일별 단계는 야간 근무일에만 야간 정책 키를 포함합니다.
+
+        Args:
+            stage: 단계 이름
+            is_night_day: 야간 근무일 여부 (일별 단계에서만 사용)
+
+        Returns:
+            정책 키 목록
+        """
+        keys = list(self.stage_policy_keys.get(stage, []))
+        if stage == "daily" and is_night_day:
+            keys += self.stage_policy_keys.get("daily_night", [])
+        return keys
+
+    def make_key(self, stage: str, input_key: Any, policy_source: Any, policy_keys: Iterable[str]) -> Tuple:
+        """
+        캐시 키를 생성합니다.
+
+        Args:
+            stage: 단계 이름
+            input_key: 입력 데이터 키 (해시 가능해야 함)
+            policy_source: 정책 값 조회 대상 (PolicyManager 또는 설정 딕셔너리)
+            policy_keys: 단계가 읽는 정책 키 목록
+
+        Returns:
+            해시 가능한 캐시 키
+        """
+        policy_values = tuple(
+            (key, _freeze_value(get_policy_value(policy_source, key))) for key in policy_keys
+        )
+        return (stage, input_key, policy_values)
+
+    def get_or_compute(self, stage: str, input_key: Any, policy_source: Any, compute: Callable[[], Any],
+                       policy_keys: Optional[Iterable[str]] = None) -> Any:
+        """
+        캐시된 단계 결과를 반환하거나, 없으면 계산 후 저장합니다.
+
+        Args:
+            stage: 단계 이름
+            input_key: 입력 데이터 키
+            policy_source: 정책 값 조회 대상
+            compute: 결과 계산 함수
+            policy_keys: 단계가 읽는 정책 키 목록 (기본값: policy_keys_for(stage))
+
+        Returns:
+            단계 결과 (캐시된 객체를 그대로 반환하므로 호출자는 수정하지 않아야 함)
+        """
+        keys = list(policy_keys) if policy_keys is not None else self.policy_keys_for(stage)
+        cache_key = self.make_key(stage, input_key, policy_source, keys)
+        with self._lock:
+            stats = self._stats.setdefault(stage, {"hits": 0, "misses": 0})
+            value = self._entries.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(cache_key)
+                stats["hits"] += 1
+                return value
+            stats["misses"] += 1
+
+        # 계산은 잠금 밖에서 수행 (같은 키를 동시에 계산하면 먼저 저장된 결과를 공유)
+        value = compute()
+        with self._lock:
+            value = self._entries.setdefault(cache_key, value)
+            self._entries.move_to_end(cache_key)
+            if self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        단계별 적중/미적중 통계를 반환합니다.
+
+        Returns:
+            단계별 hits, misses, hit_ratio
+        """
+        report = {}
+        with self._lock:
+            snapshot = {stage: dict(stats) for stage, stats in self._stats.items()}
+        for stage, stats in snapshot.items():
+            total = stats["hits"] + stats["misses"]
+            report[stage] = dict(stats, hit_ratio=round(stats["hits"] / total, 4) if total else 0.0)
+        return report
+
+    def clear(self) -> None:
+        """캐시와 통계를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
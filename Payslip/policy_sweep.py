@@ -0,0 +1,171 @@
+"""
+연속 정책 파라미터 스윕 모듈
+
+연장근로 배수나 주휴수당 최소 근로시간처럼 근로시간 계산 자체에는 영향을 주지 않는 수치 파라미터는,
+근로시간을 한 번만 계산한 뒤 파라미터 후보 값 전체에 대한 급여/판정 결과를 벡터 연산으로 구할 수 있습니다.
+이 모듈은 계산 결과(TimeCardBasedCalculator.calculate 반환값)로부터 이러한 민감도 곡선을 계산합니다.
+"""
+
+import datetime
+import logging
+from typing import Dict, Any, List, Optional, Callable
+
+import numpy as np
+import pandas as pd
+
+from .Worktime.period_calendar import PeriodCalendar
+from .Worktime.weekly_holiday import WeeklyHolidayAllowanceEngine
+
+logger = logging.getLogger(__name__)
+
+# 법정 가산율 (근로기준법 제56조: 야간 50% 가산, 휴일 8시간 이내 150%, 8시간 초과 200%)
+NIGHT_PREMIUM_RATE = 0.5
+HOLIDAY_MULTIPLIER = 1.5
+HOLIDAY_OVERTIME_MULTIPLIER = 2.0
+
+
+def _hours(time_summary: Any, key: str) -> float:
+    """시간 요약(TimeSummary 또는 딕셔너리)에서 시간 값을 float로 가져옵니다."""
+    value = time_summary.get(key, 0) if isinstance(time_summary, dict) else getattr(time_summary, key, 0)
+    return float(value or 0)
+
+
+def sweep_overtime_multiplier(time_summary: Any, values: np.ndarray, hourly_wage: float,
+                              apply_night_premium: bool = True) -> pd.DataFrame:
+    """
+    연장근로 배수 후보 값 전체에 대한 연장근로수당과 총 시간급 합계를 계산합니다.
+    총액은 배수에 대해 선형이므로 배수와 무관한 부분을 한 번만 계산합니다.
+
+    Args:
+        time_summary: 근로시간 요약 (regular/overtime/night/holiday/holiday_overtime 시간)
+        values: 연장근로 배수 후보 값 배열
+        hourly_wage: 통상시급
+        apply_night_premium: 야간 근로 가산 적용 여부
+
+    Returns:
+        pd.DataFrame: overtime_multiplier를 인덱스로 하는 overtime_pay, total_pay
+    """
+    multipliers = np.asarray(values, dtype=np.float64)
+    fixed_pay = hourly_wage * (
+        _hours(time_summary, "regular_hours")
+        + _hours(time_summary, "holiday_hours") * HOLIDAY_MULTIPLIER
+        + _hours(time_summary, "holiday_overtime_hours") * HOLIDAY_OVERTIME_MULTIPLIER
+        + (_hours(time_summary, "night_hours") * NIGHT_PREMIUM_RATE if apply_night_premium else 0.0)
+    )
+    overtime_pay = np.floor(_hours(time_summary, "overtime_hours") * hourly_wage * multipliers)
+    return pd.DataFrame({
+        "overtime_pay": overtime_pay,
+        "total_pay": np.floor(fixed_pay) + overtime_pay,
+    }, index=pd.Index(multipliers, name="overtime_multiplier"))
+
+
+def daily_minutes_vector(daily_details: List[Any], period_calendar: PeriodCalendar) -> np.ndarray:
+    """
+    일별 상세(WorkDayDetail 목록)를 기간 일수 길이의 실근로시간(분) 벡터로 변환합니다.
+
+    Args:
+        daily_details: 일별 상세 목록 (date, actual_work_minutes 속성 또는 키)
+        period_calendar: 기간 달력
+
+    Returns:
+        np.ndarray: (1 x 일) 분 행렬
+    """
+    minutes = np.zeros((1, period_calendar.num_days), dtype=np.float64)
+    for detail in daily_details:
+        date = detail.get("date") if isinstance(detail, dict) else detail.date
+        work_minutes = detail.get("actual_work_minutes", 0) if isinstance(detail, dict) else detail.actual_work_minutes
+        if isinstance(date, str):
+            date = datetime.date.fromisoformat(date)
+        if period_calendar.start_date <= date <= period_calendar.end_date:
+            minutes[0, period_calendar.day_index(date)] += float(work_minutes or 0)
+    return minutes
+
+
+def sweep_weekly_holiday_min_hours(daily_details: List[Any], period: str, values: np.ndarray,
+                                   weekly_holiday_policy: Optional[Dict[str, Any]] = None,
+                                   weekly_work_minutes_standard: int = 2400,
+                                   hire_date: Optional[datetime.date] = None,
+                                   resignation_date: Optional[datetime.date] = None,
+                                   hourly_wage: Optional[float] = None) -> pd.DataFrame:
+    """
+    주휴수당 최소 근로시간(min_hours) 후보 값 전체에 대한 주휴수당 발생 주 수와 주휴 시간을 계산합니다.
+
+    Args:
+        daily_details: 일별 상세 목록
+        period: 기간 (YYYY-MM)
+        values: min_hours 후보 값 배열
+        weekly_holiday_policy: 주휴수당 정책 (min_hours 외 allowance_hours, include_first_week 사용)
+        weekly_work_minutes_standard: 주 소정근로시간(분)
+        hire_date: 입사일 (선택 사항)
+        resignation_date: 퇴사일 (선택 사항)
+        hourly_wage: 통상시급 (지정 시 allowance_pay 포함)
+
+    Returns:
+        pd.DataFrame: min_hours를 인덱스로 하는 eligible_weeks, allowance_hours (, allowance_pay)
+    """
+    period_calendar = PeriodCalendar(period)
+    engine = WeeklyHolidayAllowanceEngine(weekly_holiday_policy, weekly_work_minutes_standard)
+    frame = engine.sweep_min_hours(period_calendar, daily_minutes_vector(daily_details, period_calendar), values,
+                                   hire_dates=[hire_date], resignation_dates=[resignation_date])
+    if hourly_wage is not None:
+        frame["allowance_pay"] = np.floor(frame["allowance_hours"].to_numpy() * hourly_wage)
+    return frame
+
+
+def _sweep_overtime_multiplier_parameter(calculation_result: Dict[str, Any], values: np.ndarray,
+                                         context: Dict[str, Any]) -> pd.DataFrame:
+    """연장근로 배수 스윕 (sweep_parameter용 어댑터)"""
+    if context.get("hourly_wage") is None:
+        raise ValueError("연장근로 배수 스윕에는 hourly_wage가 필요합니다.")
+    simple_mode_options = context["get_policy"]("calculation_mode.simple_mode_options", {}) or {}
+    return sweep_overtime_multiplier(calculation_result["time_summary"], values, context["hourly_wage"],
+                                     apply_night_premium=simple_mode_options.get("apply_night_premium", True))
+
+
+def _sweep_weekly_holiday_min_hours_parameter(calculation_result: Dict[str, Any], values: np.ndarray,
+                                              context: Dict[str, Any]) -> pd.DataFrame:
+    """주휴수당 최소 근로시간 스윕 (sweep_parameter용 어댑터)"""
+    input_data = context["input_data"]
+    get_policy = context["get_policy"]
+    return sweep_weekly_holiday_min_hours(
+        calculation_result["daily_details"], input_data.period, values,
+        weekly_holiday_policy=get_policy("policies.weekly_holiday", {}),
+        weekly_work_minutes_standard=get_policy("company_settings.weekly_work_minutes_standard", 2400),
+        hire_date=getattr(input_data, "hire_date", None),
+        resignation_date=getattr(input_data, "resignation_date", None),
+        hourly_wage=context.get("hourly_wage")
+    )
+
+
+# 근로시간 재계산 없이 스윕 가능한 파라미터 (점 표기 정책 키 -> 계산 함수)
+SWEEPABLE_PARAMETERS: Dict[str, Callable[[Dict[str, Any], np.ndarray, Dict[str, Any]], pd.DataFrame]] = {
+    "calculation_mode.simple_mode_options.overtime_multiplier": _sweep_overtime_multiplier_parameter,
+    "policies.weekly_holiday.min_hours": _sweep_weekly_holiday_min_hours_parameter,
+}
+
+
+def sweep_parameter(calculation_result: Dict[str, Any], parameter: str, values: np.ndarray,
+                    input_data: Any, get_policy: Callable[[str, Any], Any],
+                    hourly_wage: Optional[float] = None) -> pd.DataFrame:
+    """
+    한 번 계산된 근로시간 결과로 수치 파라미터 후보 값 전체의 결과를 계산합니다.
+
+    Args:
+        calculation_result: TimeCardBasedCalculator.calculate 반환값
+        parameter: 점 표기 정책 키 (SWEEPABLE_PARAMETERS 중 하나)
+        values: 파라미터 후보 값 배열
+        input_data: 계산에 사용한 타임카드 입력 데이터
+        get_policy: 정책 조회 함수 (PolicyManager.get 형식)
+        hourly_wage: 통상시급 (급여 결과 계산 시 필요)
+
+    Returns:
+        pd.DataFrame: 파라미터 값을 인덱스로 하는 결과
+    """
+    if parameter not in SWEEPABLE_PARAMETERS:
+        raise ValueError(f"스윕을 지원하지 않는 파라미터: {parameter} "
+                         f"(사용 가능: {', '.join(SWEEPABLE_PARAMETERS)})")
+    values = np.asarray(values, dtype=np.float64)
+    context = {"input_data": input_data, "get_policy": get_policy, "hourly_wage": hourly_wage}
+    frame = SWEEPABLE_PARAMETERS[parameter](calculation_result, values, context)
+    logger.info(f"파라미터 스윕 완료: {parameter}, {len(values)}개 값")
+    return frame
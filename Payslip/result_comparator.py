@@ -0,0 +1,270 @@
+"""
+N개 결과 비교 모듈
+
+두 결과씩 필드별로 비교하는 대신, N개 계산 결과의 시간 요약과 일별 상세를 배열로 쌓아
+모든 쌍의 차이 텐서(또는 기준 결과 대비 차이)를 NumPy 연산 한 번으로 계산합니다.
+비교 결과는 차이 테이블과 히트맵 데이터로 바로 변환할 수 있습니다.
+"""
+
+import logging
+import datetime
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FIELDS = ("regular_hours", "overtime_hours", "night_hours", "holiday_hours",
+                  "holiday_overtime_hours", "total_net_work_hours")
+DAILY_FIELDS = ("regular_hours", "overtime_hours", "night_hours", "holiday_hours", "holiday_overtime_hours")
+
+# 중요 차이 판정 기준 (변화율 %, compare_worktime_outputs와 동일하게 급여 5%, 그 외 10%)
+PAY_SIGNIFICANCE_PERCENT = 5.0
+DEFAULT_SIGNIFICANCE_PERCENT = 10.0
+
+METRIC_LABELS = {
+    "regular_hours": ("근무시간", "정규 근무시간", "시간"),
+    "overtime_hours": ("근무시간", "연장 근무시간", "시간"),
+    "night_hours": ("근무시간", "야간 근무시간", "시간"),
+    "holiday_hours": ("근무시간", "휴일 근무시간", "시간"),
+    "holiday_overtime_hours": ("근무시간", "휴일 연장 근무시간", "시간"),
+    "total_net_work_hours": ("근무시간", "총 실근로시간", "시간"),
+    "total_hours": ("근무시간", "총 근무시간", "시간"),
+    "base_pay": ("급여", "기본급", "원"),
+    "overtime_pay": ("급여", "연장근로수당", "원"),
+    "night_pay": ("급여", "야간근로수당", "원"),
+    "holiday_pay": ("급여", "휴일근로수당", "원"),
+    "total_pay": ("급여", "총 지급액", "원"),
+}
+
+
+def _field(source: Any, name: str) -> Any:
+    """객체 속성 또는 딕셔너리 키 값을 가져옵니다."""
+    return source.get(name) if isinstance(source, dict) else getattr(source, name, None)
+
+
+def _result_of(entry: Any) -> Any:
+    """결과 항목({"result": ...}) 또는 결과 자체에서 결과를 꺼냅니다."""
+    return entry["result"] if isinstance(entry, dict) and "result" in entry else entry
+
+
+def stack_summaries(results: Sequence[Any], metrics: Sequence[str] = SUMMARY_FIELDS) -> np.ndarray:
+    """
+    결과들의 시간 요약을 (결과 x 지표) 행렬로 쌓습니다.
+
+    Args:
+        results: 계산 결과 목록 (WorkTimeCalculationResult 또는 time_summary를 가진 딕셔너리)
+        metrics: 지표 이름 목록
+
+    Returns:
+        np.ndarray: float64 행렬 (요약이 없거나 값이 없는 칸은 NaN)
+    """
+    values = np.full((len(results), len(metrics)), np.nan, dtype=np.float64)
+    for i, entry in enumerate(results):
+        summary = _field(_result_of(entry), "time_summary")
+        if summary is None:
+            continue
+        for j, metric in enumerate(metrics):
+            value = _field(summary, metric)
+            if value is not None:
+                values[i, j] = float(value)
+    return values
+
+
+def _daily_items(result: Any) -> List[Tuple[datetime.date, Any]]:
+    """결과의 (날짜, 일별 상세) 목록 (daily_calculation_details 목록 또는 날짜별 daily_details 딕셔너리)"""
+    details = _field(result, "daily_calculation_details")
+    if details is not None:
+        return [(_field(detail, "date"), detail) for detail in details]
+    details = _field(result, "daily_details") or {}
+    if isinstance(details, dict):
+        return list(details.items())
+    return [(_field(detail, "date"), detail) for detail in details]
+
+
+def stack_daily_details(results: Sequence[Any], fields: Sequence[str] = DAILY_FIELDS) -> Tuple[List[Any], np.ndarray]:
+    """
+    결과들의 일별 상세를 (결과 x 날짜 x 필드) 배열로 쌓습니다. 날짜는 모든 결과의 합집합입니다.
+
+    Args:
+        results: 계산 결과 목록
+        fields: 일별 필드 이름 목록
+
+    Returns:
+        (정렬된 날짜 목록, float64 배열. 해당 날짜 상세가 없는 결과는 0)
+    """
+    per_result = [_daily_items(_result_of(entry)) for entry in results]
+    dates = sorted({str(date) for items in per_result for date, _ in items})
+    date_index = {date: k for k, date in enumerate(dates)}
+
+    values = np.zeros((len(results), len(dates), len(fields)), dtype=np.float64)
+    for i, items in enumerate(per_result):
+        for date, detail in items:
+            row = values[i, date_index[str(date)]]
+            for j, name in enumerate(fields):
+                value = _field(detail, name)
+                if value is not None:
+                    row[j] += float(value)
+    return dates, values
+
+
+def _percent_change(deltas: np.ndarray, base: np.ndarray) -> np.ndarray:
+    """변화율(%)을 계산합니다. 기준 값이 0이면 차이가 없을 때 0, 있을 때 부호 있는 무한대입니다."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = deltas / np.abs(base) * 100.0
+        zero_base = base == 0
+        percent = np.where(zero_base & (deltas == 0), 0.0, percent)
+        return np.where(zero_base & (deltas != 0), np.sign(deltas) * np.inf, percent)
+
+
+def _significance_thresholds(metrics: Sequence[str]) -> np.ndarray:
+    """지표별 중요 차이 기준 변화율"""
+    return np.array([PAY_SIGNIFICANCE_PERCENT if metric.endswith("_pay") else DEFAULT_SIGNIFICANCE_PERCENT
+                     for metric in metrics], dtype=np.float64)
+
+
+def compare_results_nway(results: Union[Dict[str, Any], Sequence[Any]], names: Optional[Sequence[str]] = None,
+                         metrics: Sequence[str] = SUMMARY_FIELDS, baseline: Optional[Union[str, int]] = None,
+                         include_daily: bool = True) -> Dict[str, Any]:
+    """
+    N개 결과를 한 번에 비교합니다.
+
+    기준(baseline)이 없으면 모든 쌍의 차이 텐서 deltas[i, j, m] = values[j, m] - values[i, m] (N x N x M)를,
+    기준이 있으면 기준 대비 차이 deltas[j, m] = values[j, m] - values[b, m] (N x M)를 계산합니다.
+
+    Args:
+        results: 이름 -> 결과 딕셔너리 또는 결과 목록
+        names: 결과 이름 목록 (results가 목록일 때, 기본값: "결과_1", ...)
+        metrics: 비교할 시간 요약 지표
+        baseline: 기준 결과 이름 또는 순번 (None이면 모든 쌍 비교)
+        include_daily: 일별 상세 차이 포함 여부
+
+    Returns:
+        names, metrics, values, mode("pairwise"/"baseline"), baseline_index, delta_tensor, percent_tensor,
+        significant, daily(dates, fields, values, delta_tensor)
+    """
+    if isinstance(results, dict):
+        names = list(results.keys())
+        results = list(results.values())
+    else:
+        results = list(results)
+        names = list(names) if names is not None else [f"결과_{i + 1}" for i in range(len(results))]
+    if len(names) != len(results):
+        raise ValueError("결과 이름 수와 결과 수가 다릅니다.")
+
+    baseline_index = None
+    if baseline is not None:
+        baseline_index = names.index(baseline) if isinstance(baseline, str) else int(baseline)
+        if not 0 <= baseline_index < len(results):
+            raise ValueError(f"기준 결과 순번이 범위를 벗어났습니다: {baseline}")
+
+    metrics = list(metrics)
+    values = stack_summaries(results, metrics)
+    if baseline_index is None:
+        base = values[:, None, :]
+        deltas = values[None, :, :] - base
+        percent = _percent_change(deltas, np.broadcast_to(base, deltas.shape))
+    else:
+        base = values[baseline_index]
+        deltas = values - base
+        percent = _percent_change(deltas, np.broadcast_to(base, deltas.shape))
+
+    comparison = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "names": names,
+        "metrics": metrics,
+        "values": values,
+        "mode": "pairwise" if baseline_index is None else "baseline",
+        "baseline_index": baseline_index,
+        "delta_tensor": deltas,
+        "percent_tensor": percent,
+        "significant": np.abs(percent) >= _significance_thresholds(metrics),
+    }
+
+    if include_daily:
+        dates, daily_values = stack_daily_details(results)
+        daily_deltas = (daily_values[None, :, :, :] - daily_values[:, None, :, :] if baseline_index is None
+                        else daily_values - daily_values[baseline_index])
+        comparison["daily"] = {"dates": dates, "fields": list(DAILY_FIELDS), "values": daily_values,
+                               "delta_tensor": daily_deltas}
+    return comparison
+
+
+def _baseline_slice(comparison: Dict[str, Any], baseline: Optional[Union[str, int]]) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """비교 결과에서 기준 결과 대비 (순번, 차이, 변화율, 중요 차이) 행렬을 꺼냅니다."""
+    if comparison["mode"] == "baseline":
+        return (comparison["baseline_index"], comparison["delta_tensor"], comparison["percent_tensor"],
+                comparison["significant"])
+    index = 0 if baseline is None else (comparison["names"].index(baseline) if isinstance(baseline, str) else int(baseline))
+    return (index, comparison["delta_tensor"][index], comparison["percent_tensor"][index],
+            comparison["significant"][index])
+
+
+def nway_diff_table(comparison: Dict[str, Any], baseline: Optional[Union[str, int]] = None) -> pd.DataFrame:
+    """
+    N개 비교 결과를 기준 결과 대비 차이 테이블로 변환합니다.
+
+    Args:
+        comparison: compare_results_nway 반환값
+        baseline: 모든 쌍 비교 결과에서 사용할 기준 결과 이름 또는 순번 (기본값: 첫 번째 결과)
+
+    Returns:
+        pd.DataFrame: 카테고리, 지표, 기준 정책, 비교 정책, 기준 값, 비교 값, 차이, 변화율, 중요 차이
+    """
+    columns = ["카테고리", "지표", "기준 정책", "비교 정책", "기준 값", "비교 값", "차이", "변화율", "중요 차이"]
+    index, deltas, percent, significant = _baseline_slice(comparison, baseline)
+    names, metrics, values = comparison["names"], comparison["metrics"], comparison["values"]
+
+    table_data = []
+    for j, name in enumerate(names):
+        if j == index:
+            continue
+        for m, metric in enumerate(metrics):
+            category, label, unit = METRIC_LABELS.get(metric, ("기타", metric, ""))
+            table_data.append({
+                "카테고리": category,
+                "지표": label,
+                "기준 정책": names[index],
+                "비교 정책": name,
+                "기준 값": f"{values[index, m]:,} {unit}",
+                "비교 값": f"{values[j, m]:,} {unit}",
+                "차이": f"{deltas[j, m]:+,} {unit}",
+                "변화율": f"{percent[j, m]:+.1f}%",
+                "중요 차이": "예" if significant[j, m] else "아니오"
+            })
+
+    if not table_data:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame(table_data, columns=columns).sort_values(by=["카테고리", "지표", "비교 정책"])
+
+
+def nway_heatmap(comparison: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    N개 비교 결과를 지표별 히트맵 데이터로 변환합니다.
+    모든 쌍 비교이면 (N x N) 차이 행렬을, 기준 비교이면 기준 대비 차이 벡터를 사용합니다.
+
+    Args:
+        comparison: compare_results_nway 반환값
+
+    Returns:
+        generate_heatmap과 같은 형식의 히트맵 데이터 (heatmaps[지표]에 values, normalized_values, min/max 포함)
+    """
+    heatmap_data = {
+        "timestamp": comparison["timestamp"],
+        "metadata": {"mode": comparison["mode"], "baseline_index": comparison["baseline_index"]},
+        "heatmaps": {}
+    }
+    deltas = np.nan_to_num(comparison["delta_tensor"], nan=0.0)
+    for m, metric in enumerate(comparison["metrics"]):
+        values = deltas[..., m]
+        min_value, max_value = (float(values.min()), float(values.max())) if values.size else (0.0, 0.0)
+        normalized = (values - min_value) / (max_value - min_value) if max_value > min_value else np.full(values.shape, 0.5)
+        heatmap_data["heatmaps"][metric] = {
+            "policy_sets": list(comparison["names"]),
+            "values": values.tolist(),
+            "normalized_values": normalized.tolist(),
+            "min_value": min_value,
+            "max_value": max_value
+        }
+    return heatmap_data
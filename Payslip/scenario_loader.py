@@ -14,11 +14,26 @@ from typing import Dict, List, Any, Optional, Union, Tuple, Set
 from decimal import Decimal
 from dataclasses import dataclass, field
 
-from Payslip.work_time_schema import (  
+import pandas as pd
+
+from Payslip.Worktime.schema import (
     TimeCardInputData, TimeCardRecord, WorkTimeCalculationResult
 )
 from Payslip.policy_simulator import PolicySimulator
 from Payslip.policy_manager import PolicyManager
+from Payslip.policy_canonical import plan_policy_dedupe, schema_defaults, policy_set_overrides
+from Payslip.compiled_file_cache import CompiledFileCache, load_yaml_fast
+from Payslip.policy_conditions import compile_condition, applicable_policy_matrix, employee_attribute_frame
+from Payslip.policy_dependency_graph import PolicyDependencyGraph
+
+# 로더 버전 (컴파일된 구조나 검증 규칙이 바뀌면 올려서 기존 컴파일 캐시를 무효화)
+SCENARIO_LOADER_VERSION = "3"
+
+# 컴파일 캐시에 저장되는 로더 상태
+COMPILED_SCENARIO_FIELDS = (
+    'metadata', 'policy_schema', 'policy_dependencies', 'employment_types', 'input_data', 'policy_sets',
+    'scenarios', 'visualization_settings', 'comparison_settings', 'policy_snapshot_settings', 'validation_errors'
+)
 
 @dataclass
 class PolicySchemaInfo:
@@ -84,16 +99,21 @@ class EnhancedScenarioLoader:
     확장된 YAML 형식으로 정의된 정책 시나리오를 로드하고 검증합니다.
     """
     
-    def __init__(self, simulator: Optional[PolicySimulator] = None, policy_manager: Optional[PolicyManager] = None):
+    def __init__(self, simulator: Optional[PolicySimulator] = None, policy_manager: Optional[PolicyManager] = None,
+                 use_compiled_cache: bool = True, cache_dir: Optional[str] = None):
         """
         확장된 정책 시나리오 로더 초기화
         
         Args:
             simulator: 정책 시뮬레이터 인스턴스 (제공되지 않으면 새로 생성)
             policy_manager: 정책 관리자 인스턴스 (제공되지 않으면 새로 생성)
+            use_compiled_cache: 검증된 시나리오 구조를 바이너리 캐시로 저장/재사용할지 여부
+            cache_dir: 컴파일 캐시 디렉터리 (None이면 시나리오 파일 옆의 .compiled_cache)
         """
         self.simulator = simulator or PolicySimulator()
         self.policy_manager = policy_manager or PolicyManager()
+        self.compiled_cache = (CompiledFileCache("scenario", SCENARIO_LOADER_VERSION, cache_dir)
+                               if use_compiled_cache else None)
         
         # 데이터 저장소
         self.metadata = {}
@@ -114,14 +134,48 @@ class EnhancedScenarioLoader:
         """
         시나리오 파일 로드
         
+        파일 내용과 로더 버전이 같은 컴파일 캐시가 있으면 YAML 파싱과 검증을 건너뛰고 캐시된 구조를 사용합니다.
+        
         Args:
             file_path: 시나리오 파일 경로
             
         Returns:
             로드된 시나리오 데이터 요약
         """
+        if self.compiled_cache is not None:
+            compiled = self.compiled_cache.get_or_compile(file_path, self._compile_scenario_file)
+        else:
+            compiled = self._compile_scenario_file(file_path)
+        
+        for name in COMPILED_SCENARIO_FIELDS:
+            setattr(self, name, compiled[name])
+        
+        return {
+            'metadata': self.metadata,
+            'policy_schema_count': len(self.policy_schema),
+            'policy_dependencies_count': len(self.policy_dependencies),
+            'employment_types_count': len(self.employment_types),
+            'input_data_count': len(self.input_data),
+            'policy_sets_count': len(self.policy_sets),
+            'scenarios_count': len(self.scenarios),
+            'has_visualization_settings': bool(self.visualization_settings),
+            'has_comparison_settings': bool(self.comparison_settings),
+            'has_policy_snapshot_settings': bool(self.policy_snapshot_settings),
+            'validation_errors_count': len(self.validation_errors)
+        }
+    
+    def _compile_scenario_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        시나리오 파일을 파싱, 변환, 검증하여 컴파일된 구조를 만듭니다.
+        
+        Args:
+            file_path: 시나리오 파일 경로
+            
+        Returns:
+            COMPILED_SCENARIO_FIELDS 이름 -> 로드된 구조
+        """
         with open(file_path, 'r', encoding='utf-8') as f:
-            scenario_data = yaml.safe_load(f)
+            scenario_data = load_yaml_fast(f.read()) or {}
         
         # 메타데이터 로드
         self.metadata = scenario_data.get('metadata', {})
@@ -156,19 +210,7 @@ class EnhancedScenarioLoader:
         # 데이터 검증
         self._validate_loaded_data()
         
-        return {
-            'metadata': self.metadata,
-            'policy_schema_count': len(self.policy_schema),
-            'policy_dependencies_count': len(self.policy_dependencies),
-            'employment_types_count': len(self.employment_types),
-            'input_data_count': len(self.input_data),
-            'policy_sets_count': len(self.policy_sets),
-            'scenarios_count': len(self.scenarios),
-            'has_visualization_settings': bool(self.visualization_settings),
-            'has_comparison_settings': bool(self.comparison_settings),
-            'has_policy_snapshot_settings': bool(self.policy_snapshot_settings),
-            'validation_errors_count': len(self.validation_errors)
-        }
+        return {name: getattr(self, name) for name in COMPILED_SCENARIO_FIELDS}
     
     def _load_policy_schema(self, schema_dict: Dict[str, Any]) -> Dict[str, PolicySchemaInfo]:
         """
@@ -462,4 +504,167 @@ class EnhancedScenarioLoader:
                     message=f"정책 스키마 '{key}'의 적용 조건 ('{schema.applicability_condition}') 검증 중 오류: {e}", # 상세한 오류 메시지
                     policy_key=key,                           # 현재 검사 중인 정책의 키
                     field='applicability_condition'           # 오류가 발생한 필드명
-                ))
\ No newline at end of file
+                ))
+
+    def _validate_policy_dependencies(self) -> None:
+        """정책 의존성 검증 (의존/충돌 대상 정책이 스키마에 정의되어 있는지 확인)"""
+        if not self.policy_schema:
+            return
+        for key, dependency in self.policy_dependencies.items():
+            for field_name in ('depends_on', 'conflicts_with'):
+                for target in getattr(dependency, field_name):
+                    if target not in self.policy_schema:
+                        self.validation_errors.append(ValidationError(
+                            error_type='dependency_unknown_policy',
+                            message=f"정책 의존성 '{key}'의 {field_name} 대상 '{target}'이 정책 스키마에 없습니다.",
+                            policy_key=key,
+                            field=field_name
+                        ))
+    
+    def _validate_employment_types(self) -> None:
+        """고용형태 정보 검증 (적용 정책이 스키마에 정의되어 있는지 확인)"""
+        if not self.policy_schema:
+            return
+        for key, employment_type in self.employment_types.items():
+            for policy_key in employment_type.applicable_policies:
+                if policy_key not in self.policy_schema:
+                    self.validation_errors.append(ValidationError(
+                        error_type='employment_type_unknown_policy',
+                        message=f"고용형태 '{key}'의 적용 정책 '{policy_key}'이 정책 스키마에 없습니다.",
+                        policy_key=policy_key,
+                        field='applicable_policies'
+                    ))
+    
+    def _validate_input_data(self) -> None:
+        """입력 데이터 검증 (기간 형식과 근무 기록의 기간 포함 여부)"""
+        for key, input_data in self.input_data.items():
+            if not re.match(r'^\d{4}-(0[1-9]|1[0-2])$', input_data.period or ''):
+                self.validation_errors.append(ValidationError(
+                    error_type='input_period_invalid',
+                    message=f"입력 데이터 '{key}'의 기간 '{input_data.period}'이 YYYY-MM 형식이 아닙니다.",
+                    field='period'
+                ))
+                continue
+            outside = [record.date.isoformat() for record in input_data.records
+                       if record.date.strftime('%Y-%m') != input_data.period]
+            if outside:
+                self.validation_errors.append(ValidationError(
+                    error_type='input_record_outside_period',
+                    message=f"입력 데이터 '{key}'에 기간 밖의 근무 기록이 있습니다: {', '.join(outside)}",
+                    field='records'
+                ))
+    
+    def _validate_policy_sets(self) -> None:
+        """정책 조합 검증 (스키마에 정의된 정책 값이 유효성 검증 규칙을 만족하는지 확인)"""
+        for key, policy_set in self.policy_sets.items():
+            for policy_key, value in policy_set_overrides({'policies': policy_set.policies}).items():
+                schema = self.policy_schema.get(policy_key)
+                if schema is None or not schema.validation:
+                    continue
+                rule = schema.validation
+                if rule.get('type') == 'enum' and value not in rule.get('allowed_values', []):
+                    message = f"허용되지 않은 값 '{value}' (허용 값: {rule.get('allowed_values')})"
+                elif (rule.get('type') == 'range' and isinstance(value, (int, float))
+                      and not rule.get('min', value) <= value <= rule.get('max', value)):
+                    message = f"범위를 벗어난 값 {value} (범위: {rule.get('min')} ~ {rule.get('max')})"
+                else:
+                    continue
+                self.validation_errors.append(ValidationError(
+                    error_type='policy_value_invalid',
+                    message=f"정책 조합 '{key}'의 정책 '{policy_key}': {message}",
+                    policy_key=policy_key,
+                    policy_set=key
+                ))
+    
+    def _validate_scenarios(self) -> None:
+        """시나리오 검증 (참조하는 입력 데이터와 정책 조합이 정의되어 있는지 확인)"""
+        for key, scenario in self.scenarios.items():
+            if scenario.input not in self.input_data:
+                self.validation_errors.append(ValidationError(
+                    error_type='scenario_unknown_input',
+                    message=f"시나리오 '{key}'의 입력 데이터 '{scenario.input}'이 정의되어 있지 않습니다.",
+                    scenario=key,
+                    field='input'
+                ))
+            for policy_set_key in scenario.policy_sets:
+                if policy_set_key not in self.policy_sets:
+                    self.validation_errors.append(ValidationError(
+                        error_type='scenario_unknown_policy_set',
+                        message=f"시나리오 '{key}'의 정책 조합 '{policy_set_key}'이 정의되어 있지 않습니다.",
+                        policy_set=policy_set_key,
+                        scenario=key,
+                        field='policy_sets'
+                    ))
+    
+    def get_policy_defaults(self) -> Dict[str, Any]:
+        """
+        정책 스키마의 점 표기 키별 기본값을 반환합니다.
+        
+        Returns:
+            기본값이 정의된 정책 키의 기본값 딕셔너리
+        """
+        return schema_defaults(self.policy_schema)
+    
+    def plan_policy_set_dedupe(self, policy_set_keys: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        로드된 정책 조합 중 실질적으로 같은 조합(기본값을 명시했을 뿐인 조합 등)을 묶습니다.
+        기본값은 스키마 기본값이 아니라 시뮬레이터가 실제로 적용하는 기반 정책 값으로 판정합니다.
+        (스키마 기본값이 기반 정책과 다르면 결과가 다른 조합이 별칭으로 묶일 수 있음)
+        
+        Args:
+            policy_set_keys: 대상 정책 조합 키 목록 (None이면 전체)
+        
+        Returns:
+            unique_policy_sets(시뮬레이션할 대표 정책 조합 키 목록), aliases(대표 키 -> 별칭 키 목록),
+            plan(PolicyDedupePlan)
+        """
+        keys = list(policy_set_keys) if policy_set_keys is not None else list(self.policy_sets)
+        policy_sets = [{"name": key, "policies": self.policy_sets[key].policies} for key in keys]
+        plan = plan_policy_dedupe(policy_sets, self.simulator.base_policy_manager.get)
+        return {
+            'unique_policy_sets': [keys[index] for index in plan.unique_indices],
+            'aliases': plan.aliases(policy_sets),
+            'plan': plan
+        }
+    
+    def _validate_condition_expression(self, expression: Optional[str]) -> None:
+        """
+        적용 조건식 검증 (허용된 구문만으로 컴파일되는지 확인)
+        
+        Args:
+            expression: 적용 조건식
+        
+        Raises:
+            ConditionError: 구문 오류 또는 허용되지 않은 구문
+        """
+        compile_condition(expression)
+    
+    def get_applicable_policy_matrix(self, employees: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        직원별로 적용되는 정책을 적용 조건식의 벡터화 평가로 한 번에 계산합니다.
+        
+        Args:
+            employees: 직원 속성 DataFrame (None이면 로드된 입력 데이터의 custom_fields로 생성)
+        
+        Returns:
+            pd.DataFrame: 직원 행 x 정책 키 컬럼의 bool 행렬
+        """
+        if employees is None:
+            employees = employee_attribute_frame(self.input_data.values())
+        conditions = {key: schema.applicability_condition for key, schema in self.policy_schema.items()}
+        return applicable_policy_matrix(conditions, employees)
+    
+    def build_policy_dependency_graph(self) -> PolicyDependencyGraph:
+        """
+        로드된 정책 의존성(policy_dependencies)으로 정책 -> 계산 단계 의존성 그래프를 만들고
+        시뮬레이터의 증분 재계산(simulate_incremental)에 사용하도록 설정합니다.
+        
+        Returns:
+            PolicyDependencyGraph
+        
+        Raises:
+            ValueError: 정책 의존성에 순환이 있는 경우
+        """
+        graph = PolicyDependencyGraph(self.policy_dependencies)
+        self.simulator.dependency_graph = graph
+        return graph
@@ -0,0 +1,240 @@
+"""
+시뮬레이션 체크포인트 모듈
+
+대량의 정책 조합 시뮬레이션 도중 프로세스가 중단되거나 Streamlit이 재실행되어도 완료된 결과를
+잃지 않도록, 완료된 조합의 결과를 JSONL 파일에 추가 기록하고 재실행 시 건너뛸 수 있게 합니다.
+각 줄은 입력 데이터 해시, 정책 조합 해시, 기반 정책(설정 파일) 버전으로 식별되며, 결과의 Decimal/날짜/
+pydantic 모델은 형식 표시와 함께 기록되어 재개 시 원래 형식으로 복원됩니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import importlib
+import datetime
+from decimal import Decimal
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def _canonical_default(value: Any) -> Any:
+    """정규화 JSON 직렬화 보조 함수"""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+# 체크포인트에서 복원할 수 있는 pydantic 모델의 패키지 (다른 모듈의 클래스는 딕셔너리로 남김)
+_RESTORABLE_MODEL_PACKAGE = __name__.split(".")[0]
+
+
+def _checkpoint_default(value: Any) -> Any:
+    """체크포인트 JSON 직렬화 보조 함수 (복원할 수 있도록 형식 표시를 남김)"""
+    if hasattr(value, "model_dump"):
+        cls = type(value)
+        return {"__model__": f"{cls.__module__}:{cls.__qualname__}", "data": value.model_dump(mode="json")}
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": sorted(value, key=str)}
+    return str(value)
+
+
+def _restore_checkpoint_value(obj: Dict[str, Any]) -> Any:
+    """_checkpoint_default로 기록한 값을 원래 형식으로 복원합니다. (json.loads object_hook)"""
+    if len(obj) == 1:
+        if "__decimal__" in obj:
+            return Decimal(obj["__decimal__"])
+        if "__date__" in obj:
+            return datetime.date.fromisoformat(obj["__date__"])
+        if "__datetime__" in obj:
+            return datetime.datetime.fromisoformat(obj["__datetime__"])
+        if "__set__" in obj:
+            return set(obj["__set__"])
+    elif len(obj) == 2 and "__model__" in obj and "data" in obj:
+        module_name, _, qualname = obj["__model__"].partition(":")
+        if module_name.split(".")[0] == _RESTORABLE_MODEL_PACKAGE:
+            try:
+                cls = importlib.import_module(module_name)
+                for part in qualname.split("."):
+                    cls = getattr(cls, part)
+                return cls.model_validate(obj["data"])
+            except Exception as e:
+                logger.warning(f"체크포인트 모델 {obj['__model__']}을(를) 복원하지 못해 딕셔너리로 유지합니다: {e}")
+        return obj["data"]
+    return obj
+
+
+def canonical_hash(value: Any) -> str:
+    """
+    값의 정규화 해시를 계산합니다. 딕셔너리 키 순서와 무관하게 같은 내용이면 같은 해시를 반환합니다.
+
+    Args:
+        value: 해시할 값 (정책 조합, 입력 데이터 등)
+
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_canonical_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SimulationCheckpoint:
+    """
+    시뮬레이션 체크포인트 클래스
+
+    완료된 정책 조합 결과를 JSONL 파일에 한 줄씩 추가합니다. 입력 데이터나 기반 정책 버전이 다른 실행의
+    기록은 무시하므로, 같은 파일을 여러 입력에 재사용하거나 설정 파일을 수정한 뒤 재실행해도 안전합니다.
+    """
+
+    def __init__(self, path: str, input_data: Any, policy_version: Optional[str] = None):
+        """
+        SimulationCheckpoint 초기화
+
+        Args:
+            path: 체크포인트 JSONL 파일 경로
+            input_data: 시뮬레이션 입력 데이터 (해시로 실행을 식별)
+            policy_version: 기반 정책/설정 파일 버전 해시 (예: PolicyManager.version_hash)
+        """
+        self.path = path
+        self.input_hash = canonical_hash(input_data)
+        self.policy_version = policy_version
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        현재 입력 데이터와 기반 정책 버전으로 완료된 조합 결과를 원래 형식으로 복원하여 불러옵니다.
+        중단 시 잘린 마지막 줄은 무시합니다.
+
+        Returns:
+            정책 조합 해시별 시뮬레이션 결과
+        """
+        completed: Dict[str, Dict[str, Any]] = {}
+        if not os.path.exists(self.path):
+            return completed
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line, object_hook=_restore_checkpoint_value)
+                except json.JSONDecodeError:
+                    logger.warning(f"체크포인트 {self.path} {line_number}번째 줄을 읽을 수 없어 건너뜁니다.")
+                    continue
+                if (entry.get("input_hash") == self.input_hash
+                        and entry.get("policy_version") == self.policy_version):
+                    completed[entry["combination_hash"]] = entry["result"]
+
+        logger.info(f"체크포인트에서 완료된 조합 {len(completed)}개를 불러왔습니다: {self.path}")
+        return completed
+
+    def append(self, entries: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        완료된 조합 결과를 체크포인트에 추가합니다.
+
+        Args:
+            entries: (정책 조합 해시, 시뮬레이션 결과) 목록
+        """
+        if not entries:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        lines = [
+            json.dumps({"input_hash": self.input_hash, "policy_version": self.policy_version,
+                        "combination_hash": combination_hash, "result": result},
+                       ensure_ascii=False, default=_checkpoint_default)
+            for combination_hash, result in entries
+        ]
+        # 중단으로 잘린 마지막 줄이 있으면 새 줄에서 시작
+        prefix = ""
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                prefix = "" if f.read(1) == b"\n" else "\n"
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(prefix + "\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """체크포인트 파일을 삭제합니다."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class SimulationProgress:
+    """
+    시뮬레이션 진행률 추적 클래스
+
+    완료/전체 조합 수와 이번 실행의 처리량(조합/초), 남은 시간 추정치를 계산합니다.
+    """
+
+    def __init__(self, total: int, already_completed: int = 0,
+                 callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        SimulationProgress 초기화
+
+        Args:
+            total: 전체 조합 수
+            already_completed: 체크포인트에서 복원된 조합 수
+            callback: 진행 상황을 전달받을 함수 (선택 사항)
+        """
+        self.total = total
+        self.resumed = already_completed
+        self.completed = already_completed
+        self.callback = callback
+        self._started = time.perf_counter()
+
+    def update(self, count: int) -> Dict[str, Any]:
+        """
+        완료된 조합 수를 반영하고 진행 상황을 보고합니다.
+
+        Args:
+            count: 새로 완료된 조합 수
+
+        Returns:
+            진행 상황 (completed, total, resumed, throughput, eta_seconds)
+        """
+        self.completed += count
+        report = self.report()
+        logger.info(f"시뮬레이션 진행: {report['completed']}/{report['total']} "
+                    f"({report['throughput']:.1f}조합/초)")
+        if self.callback:
+            self.callback(report)
+        return report
+
+    def report(self) -> Dict[str, Any]:
+        """
+        현재 진행 상황을 반환합니다.
+
+        Returns:
+            진행 상황 (completed, total, resumed, throughput, eta_seconds)
+        """
+        elapsed = time.perf_counter() - self._started
+        processed = self.completed - self.resumed
+        throughput = processed / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.completed
+        return {
+            "completed": self.completed,
+            "total": self.total,
+            "resumed": self.resumed,
+            "throughput": throughput,
+            "eta_seconds": remaining / throughput if throughput > 0 else None
+        }
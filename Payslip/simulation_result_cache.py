@@ -0,0 +1,223 @@
+"""
+시뮬레이션 결과 캐시 모듈
+
+장시간 실행되는 Streamlit 프로세스에서 정책 시뮬레이션 결과가 무한히 쌓이지 않도록,
+항목 수와 바이트 크기로 제한되는 LRU 캐시를 제공합니다. 항목은 입력 데이터 해시와 정책 조합 해시로
+식별되며, 정책 조합 이름으로 결과를 찾을 수 있도록 이름 색인을 함께 유지합니다.
+이름이 다른 같은 정책 조합은 한 항목을 공유하므로 한 키에 여러 이름이 등록될 수 있습니다.
+"""
+
+import sys
+import pickle
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+def estimate_size(value: Any) -> int:
+    """
+    캐시 항목의 대략적인 바이트 크기를 추정합니다. (pickle 직렬화 크기, 불가능하면 sys.getsizeof)
+
+    Args:
+        value: 크기를 추정할 값
+
+    Returns:
+        int: 바이트 크기
+    """
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class SimulationResultCache:
+    """
+    시뮬레이션 결과 LRU 캐시 클래스
+
+    (입력 해시, 정책 조합 해시)를 키로 결과 항목을 저장하고, 항목 수 또는 바이트 합계가 한도를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = 256 * 1024 * 1024,
+                 size_estimator: Callable[[Any], int] = estimate_size):
+        """
+        SimulationResultCache 초기화
+
+        Args:
+            max_entries: 최대 항목 수 (None이면 무제한)
+            max_bytes: 최대 바이트 합계 (None이면 무제한)
+            size_estimator: 항목 크기 추정 함수
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_estimator = size_estimator
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[CacheKey, int] = {}
+        # 정책 조합 이름 -> {입력 해시: 캐시 키}
+        self._name_index: Dict[str, Dict[str, CacheKey]] = {}
+        self._names: Dict[CacheKey, Set[str]] = {}
+        # 키별 마지막 사용 순번 (이름 조회 시 최근 입력 선택용)
+        self._last_used: Dict[CacheKey, int] = {}
+        self._clock = 0
+        self.total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "evicted_bytes": 0}
+
+    def get(self, input_hash: str, policy_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 결과 항목을 조회합니다.
+
+        Args:
+            input_hash: 입력 데이터 해시
+            policy_hash: 정책 조합 해시
+
+        Returns:
+            결과 항목 (없으면 None)
+        """
+        key = (input_hash, policy_hash)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+        self._touch(key)
+        self._stats["hits"] += 1
+        return entry
+
+    def _touch(self, key: CacheKey) -> None:
+        """항목을 가장 최근 사용으로 표시합니다."""
+        self._entries.move_to_end(key)
+        self._clock += 1
+        self._last_used[key] = self._clock
+
+    def put(self, input_hash: str, policy_hash: str, name: str, entry: Dict[str, Any]) -> None:
+        """
+        결과 항목을 저장하고 한도를 넘으면 오래된 항목을 제거합니다.
+
+        Args:
+            input_hash: 입력 데이터 해시
+            policy_hash: 정책 조합 해시
+            name: 정책 조합 이름
+            entry: 결과 항목 ({"result", "policy_set", "timestamp"})
+        """
+        key = (input_hash, policy_hash)
+        # 같은 항목을 다시 저장하면 기존 별칭 이름은 유지
+        names = self._names.get(key, set())
+        if key in self._entries:
+            self._remove(key)
+
+        size = self.size_estimator(entry)
+        if self.max_bytes is not None and size > self.max_bytes:
+            logger.warning(f"결과 항목 {name}의 크기({size}바이트)가 캐시 한도를 넘어 저장하지 않습니다.")
+            return
+
+        self._entries[key] = entry
+        self._touch(key)
+        self._sizes[key] = size
+        self._names[key] = set()
+        for alias in names | {name}:
+            self._index_name(key, alias)
+        self.total_bytes += size
+
+        while self._entries and ((self.max_entries is not None and len(self._entries) > self.max_entries) or
+                                 (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            evicted_key = next(iter(self._entries))
+            self._stats["evictions"] += 1
+            self._stats["evicted_bytes"] += self._sizes[evicted_key]
+            self._remove(evicted_key)
+
+    def add_alias(self, input_hash: str, policy_hash: str, name: str) -> bool:
+        """
+        이미 캐시된 항목에 정책 조합 이름을 추가로 등록합니다. (캐시 적중 시 다른 이름으로 요청된 경우)
+
+        Args:
+            input_hash: 입력 데이터 해시
+            policy_hash: 정책 조합 해시
+            name: 추가할 정책 조합 이름
+
+        Returns:
+            bool: 등록했으면 True (항목이 없으면 False)
+        """
+        key = (input_hash, policy_hash)
+        if key not in self._entries:
+            return False
+        self._index_name(key, name)
+        return True
+
+    def _index_name(self, key: CacheKey, name: str) -> None:
+        """이름 색인에 등록합니다. (같은 입력에서 이 이름이 가리키던 다른 항목의 이름은 해제)"""
+        index = self._name_index.setdefault(name, {})
+        previous = index.get(key[0])
+        if previous is not None and previous != key:
+            self._names.get(previous, set()).discard(name)
+        index[key[0]] = key
+        self._names[key].add(name)
+
+    def find_by_names(self, *names: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        같은 입력 데이터로 계산된, 주어진 이름들의 결과 항목을 이름 색인으로 찾습니다.
+        여러 입력에 같은 이름들이 있으면 가장 최근에 사용된 입력의 결과를 반환합니다.
+
+        Args:
+            names: 정책 조합 이름 목록
+
+        Returns:
+            이름 순서대로의 결과 항목 목록 (없으면 None)
+        """
+        indexes = [self._name_index.get(name, {}) for name in names]
+        if not indexes or not all(indexes):
+            self._stats["misses"] += 1
+            return None
+
+        common_inputs = set(indexes[0]).intersection(*indexes[1:])
+        if not common_inputs:
+            self._stats["misses"] += 1
+            return None
+
+        # 가장 최근에 사용된 항목이 속한 입력 선택
+        input_hash = max(common_inputs, key=lambda h: max(self._last_used[index[h]] for index in indexes))
+        keys = [index[input_hash] for index in indexes]
+        for key in keys:
+            self._touch(key)
+        self._stats["hits"] += 1
+        return [self._entries[key] for key in keys]
+
+    def _remove(self, key: CacheKey) -> None:
+        """항목과 색인을 제거합니다."""
+        self._entries.pop(key, None)
+        self._last_used.pop(key, None)
+        self.total_bytes -= self._sizes.pop(key, 0)
+        for name in self._names.pop(key, ()):
+            index = self._name_index.get(name)
+            if index is not None and index.get(key[0]) == key:
+                del index[key[0]]
+                if not index:
+                    del self._name_index[name]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            entries, bytes, hits, misses, hit_ratio, evictions, evicted_bytes
+        """
+        total = self._stats["hits"] + self._stats["misses"]
+        return dict(self._stats, entries=len(self._entries), bytes=self.total_bytes,
+                    hit_ratio=round(self._stats["hits"] / total, 4) if total else 0.0)
+
+    def clear(self) -> None:
+        """캐시와 색인을 비웁니다. (통계는 유지)"""
+        self._entries.clear()
+        self._sizes.clear()
+        self._names.clear()
+        self._name_index.clear()
+        self._last_used.clear()
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._entries
@@ -0,0 +1,286 @@
+"""
+시뮬레이션 결과 컬럼형 저장소 모듈
+
+대량의 정책 시뮬레이션 결과를 들여쓰기된 JSON 대신 Parquet 또는 Arrow IPC 파일로 저장합니다.
+결과는 요약(summaries), 일별 상세(daily_details), 컴플라이언스 알림(alerts) 세 테이블로 나뉘며,
+필요한 컬럼과 조건만 골라 읽고(컬럼 투영, 필터) 메모리 맵으로 읽을 수 있습니다.
+"""
+
+import os
+import json
+import logging
+import datetime
+from decimal import Decimal
+from typing import Dict, List, Any, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from .Worktime.schema import (
+    WorkTimeCalculationResult, TimeSummary, WorkDayDetail, ComplianceAlert, ErrorDetails
+)
+from .simulation_checkpoint import _canonical_default
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+STORE_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+TIME_SUMMARY_FIELDS = ("regular_hours", "overtime_hours", "night_hours", "holiday_hours",
+                       "holiday_overtime_hours", "total_net_work_hours")
+DAILY_DETAIL_FIELDS = ("regular_hours", "overtime_hours", "night_hours", "holiday_hours",
+                       "holiday_overtime_hours", "actual_work_minutes", "break_minutes_applied",
+                       "carried_in_minutes")
+
+TABLE_SCHEMAS = {
+    "summaries": pa.schema(
+        [("policy_name", pa.string()), ("policy_set", pa.string()), ("timestamp", pa.string()),
+         ("employee_id", pa.string()), ("period", pa.string()), ("processing_mode", pa.string())]
+        + [(name, pa.float64()) for name in TIME_SUMMARY_FIELDS]
+        + [("warnings", pa.list_(pa.string())), ("alert_count", pa.int32()),
+           ("error_code", pa.string()), ("error_message", pa.string()), ("custom_fields", pa.string())]
+    ),
+    "daily_details": pa.schema(
+        [("policy_name", pa.string()), ("date", pa.date32())]
+        + [(name, pa.float64()) for name in DAILY_DETAIL_FIELDS]
+    ),
+    "alerts": pa.schema([
+        ("policy_name", pa.string()), ("alert_code", pa.string()), ("message", pa.string()),
+        ("severity", pa.string()), ("details", pa.string())
+    ]),
+}
+
+Filters = List[Tuple[str, str, Any]]
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Decimal/숫자 값을 float로 변환합니다. (None은 유지)"""
+    return None if value is None else float(value)
+
+
+def _to_json(value: Any) -> Optional[str]:
+    """값을 JSON 문자열로 변환합니다. (None은 유지)"""
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=_canonical_default)
+
+
+def _daily_details_of(result: Any) -> List[Any]:
+    """결과의 일별 상세 목록 (daily_calculation_details 목록 또는 날짜별 daily_details 딕셔너리)"""
+    details = getattr(result, "daily_calculation_details", None)
+    if details is not None:
+        return list(details)
+    return list((getattr(result, "daily_details", None) or {}).values())
+
+
+def build_result_tables(results: Dict[str, Dict[str, Any]]) -> Dict[str, pa.Table]:
+    """
+    시뮬레이션 결과 딕셔너리를 요약/일별 상세/알림 Arrow 테이블로 변환합니다.
+
+    Args:
+        results: 정책 조합 이름 -> {"result": WorkTimeCalculationResult, "policy_set", "timestamp"}
+
+    Returns:
+        테이블 이름 -> pa.Table
+    """
+    columns: Dict[str, Dict[str, list]] = {
+        table: {name: [] for name in schema.names} for table, schema in TABLE_SCHEMAS.items()
+    }
+    summaries, daily, alerts = columns["summaries"], columns["daily_details"], columns["alerts"]
+
+    for policy_name, entry in results.items():
+        result = entry["result"]
+        time_summary = result.time_summary
+        error = result.error
+
+        summaries["policy_name"].append(policy_name)
+        summaries["policy_set"].append(_to_json(entry.get("policy_set")))
+        summaries["timestamp"].append(entry.get("timestamp"))
+        summaries["employee_id"].append(getattr(result, "employee_id", None))
+        summaries["period"].append(getattr(result, "period", None))
+        summaries["processing_mode"].append(result.processing_mode)
+        for name in TIME_SUMMARY_FIELDS:
+            summaries[name].append(_to_float(getattr(time_summary, name, None)) if time_summary else None)
+        summaries["warnings"].append(list(result.warnings))
+        summaries["alert_count"].append(len(result.compliance_alerts))
+        summaries["error_code"].append(error.error_code if error else None)
+        summaries["error_message"].append(error.message if error else None)
+        summaries["custom_fields"].append(_to_json(getattr(result, "custom_fields", None)))
+
+        for detail in _daily_details_of(result):
+            daily["policy_name"].append(policy_name)
+            daily["date"].append(detail.date)
+            for name in DAILY_DETAIL_FIELDS:
+                daily[name].append(_to_float(getattr(detail, name, None)))
+
+        for alert in result.compliance_alerts:
+            alerts["policy_name"].append(policy_name)
+            alerts["alert_code"].append(alert.alert_code)
+            alerts["message"].append(alert.message)
+            alerts["severity"].append(alert.severity)
+            alerts["details"].append(_to_json(alert.details))
+
+    return {table: pa.table(columns[table], schema=schema) for table, schema in TABLE_SCHEMAS.items()}
+
+
+def save_results_columnar(results: Dict[str, Dict[str, Any]], output_dir: str, format: str = "parquet",
+                          compression: Optional[str] = "zstd") -> Dict[str, str]:
+    """
+    시뮬레이션 결과를 컬럼형 파일로 저장합니다.
+
+    Args:
+        results: 정책 조합 이름 -> 결과 항목
+        output_dir: 출력 디렉터리 (테이블별 파일과 manifest.json 생성)
+        format: "parquet" 또는 "arrow" (Arrow IPC, 압축 없이 저장하면 메모리 맵 읽기 시 복사 없음)
+        compression: 압축 방식 (Parquet 기본값 zstd, Arrow는 None 권장)
+
+    Returns:
+        테이블 이름 -> 저장된 파일 경로
+    """
+    if format not in STORE_FORMATS:
+        raise ValueError(f"지원하지 않는 저장 형식: {format} (사용 가능: {', '.join(STORE_FORMATS)})")
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {}
+    for table_name, table in build_result_tables(results).items():
+        path = os.path.join(output_dir, table_name + STORE_FORMATS[format])
+        if format == "parquet":
+            pq.write_table(table, path, compression=compression or "none")
+        else:
+            options = ipc.IpcWriteOptions(compression=compression) if compression else None
+            with pa.OSFile(path, "wb") as sink, ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        paths[table_name] = path
+
+    manifest = {
+        "version": STORE_VERSION,
+        "format": format,
+        "tables": {name: os.path.basename(path) for name, path in paths.items()},
+        "policy_count": len(results),
+        "created_at": datetime.datetime.now().isoformat()
+    }
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    logger.info(f"시뮬레이션 결과 {len(results)}건을 {format} 형식으로 저장했습니다: {output_dir}")
+    return paths
+
+
+def is_columnar_store(path: str) -> bool:
+    """경로가 컬럼형 결과 저장소 디렉터리인지 확인합니다."""
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, MANIFEST_FILE))
+
+
+def _read_manifest(input_dir: str) -> Dict[str, Any]:
+    """저장소 manifest를 읽습니다."""
+    if not is_columnar_store(input_dir):
+        raise FileNotFoundError(f"컬럼형 결과 저장소가 아닙니다: {input_dir}")
+    with open(os.path.join(input_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_results_table(input_dir: str, table: str = "summaries", columns: Optional[List[str]] = None,
+                       filters: Optional[Filters] = None, memory_map: bool = True) -> pa.Table:
+    """
+    저장소에서 테이블 하나를 읽습니다.
+
+    Args:
+        input_dir: 저장소 디렉터리
+        table: 테이블 이름 ("summaries", "daily_details", "alerts")
+        columns: 읽을 컬럼 목록 (None이면 전체)
+        filters: (컬럼, 연산자, 값) 조건 목록 (AND 결합, 예: [("policy_name", "in", ["A", "B"])])
+        memory_map: 메모리 맵으로 파일을 읽을지 여부
+
+    Returns:
+        pa.Table
+    """
+    manifest = _read_manifest(input_dir)
+    if table not in manifest["tables"]:
+        raise ValueError(f"알 수 없는 테이블: {table} (사용 가능: {', '.join(manifest['tables'])})")
+    path = os.path.join(input_dir, manifest["tables"][table])
+
+    if manifest["format"] == "parquet":
+        return pq.read_table(path, columns=columns, filters=filters or None, memory_map=memory_map)
+
+    source = pa.memory_map(path, "r") if memory_map else pa.OSFile(path, "rb")
+    with source:
+        data = ipc.open_file(source).read_all()
+    if filters:
+        data = data.filter(pq.filters_to_expression(filters))
+    return data.select(columns) if columns is not None else data
+
+
+def load_results_frame(input_dir: str, table: str = "summaries", columns: Optional[List[str]] = None,
+                       filters: Optional[Filters] = None, memory_map: bool = True):
+    """
+    저장소에서 테이블 하나를 pandas DataFrame으로 읽습니다. (인자는 load_results_table과 동일)
+
+    Returns:
+        pd.DataFrame
+    """
+    return load_results_table(input_dir, table, columns, filters, memory_map).to_pandas()
+
+
+def _decimal(value: Optional[float]) -> Decimal:
+    """float 값을 Decimal로 변환합니다. (None은 0)"""
+    return Decimal(str(value)) if value is not None else Decimal("0.0")
+
+
+def load_results_columnar(input_dir: str, policy_names: Optional[List[str]] = None,
+                          include_daily_details: bool = True, memory_map: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    저장소에서 시뮬레이션 결과 딕셔너리를 복원합니다.
+    저장 시 검증된 값이므로 pydantic 검증 없이(model_construct) 객체를 만듭니다.
+
+    Args:
+        input_dir: 저장소 디렉터리
+        policy_names: 복원할 정책 조합 이름 목록 (None이면 전체)
+        include_daily_details: 일별 상세 복원 여부
+        memory_map: 메모리 맵으로 파일을 읽을지 여부
+
+    Returns:
+        정책 조합 이름 -> {"result": WorkTimeCalculationResult, "policy_set", "timestamp"}
+    """
+    filters = [("policy_name", "in", list(policy_names))] if policy_names is not None else None
+    summaries = load_results_table(input_dir, "summaries", filters=filters, memory_map=memory_map).to_pylist()
+
+    alerts_by_policy: Dict[str, List[ComplianceAlert]] = {}
+    for row in load_results_table(input_dir, "alerts", filters=filters, memory_map=memory_map).to_pylist():
+        alerts_by_policy.setdefault(row["policy_name"], []).append(ComplianceAlert.model_construct(
+            alert_code=row["alert_code"], message=row["message"], severity=row["severity"],
+            details=json.loads(row["details"]) if row["details"] is not None else None
+        ))
+
+    daily_by_policy: Dict[str, List[WorkDayDetail]] = {}
+    if include_daily_details:
+        for row in load_results_table(input_dir, "daily_details", filters=filters, memory_map=memory_map).to_pylist():
+            daily_by_policy.setdefault(row["policy_name"], []).append(WorkDayDetail.model_construct(
+                date=row["date"], warnings=[], **{name: _decimal(row[name]) for name in DAILY_DETAIL_FIELDS}
+            ))
+
+    results = {}
+    for row in summaries:
+        name = row["policy_name"]
+        has_summary = any(row[field] is not None for field in TIME_SUMMARY_FIELDS)
+        result = WorkTimeCalculationResult.model_construct(
+            employee_id=row["employee_id"],
+            period=row["period"],
+            processing_mode=row["processing_mode"],
+            attendance_summary=None,
+            time_summary=TimeSummary.model_construct(**{f: _decimal(row[f]) for f in TIME_SUMMARY_FIELDS})
+            if has_summary else None,
+            salary_basis=None,
+            daily_calculation_details=daily_by_policy.get(name, []) if include_daily_details else None,
+            warnings=list(row["warnings"] or []),
+            compliance_alerts=alerts_by_policy.get(name, []),
+            error=ErrorDetails.model_construct(error_code=row["error_code"], message=row["error_message"],
+                                               details=None, log_ref_id=None) if row["error_code"] else None,
+            processed_timestamp=row["timestamp"] or "",
+            custom_fields=json.loads(row["custom_fields"]) if row["custom_fields"] is not None else None
+        )
+        results[name] = {
+            "result": result,
+            "policy_set": json.loads(row["policy_set"]) if row["policy_set"] is not None else {},
+            "timestamp": row["timestamp"]
+        }
+    return results
@@ -11,6 +11,8 @@ import logging
 import json
 from datetime import datetime
 
+from Payslip.result_comparator import compare_results_nway, nway_diff_table, nway_heatmap
+
 logger = logging.getLogger(__name__)
 
 def compare_worktime_outputs(result1: Dict[str, Any], result2: Dict[str, Any]) -> Dict[str, Any]:
@@ -167,11 +169,15 @@ def generate_diff_table(comparison: Dict[str, Any]) -> pd.DataFrame:
     비교 결과를 테이블 형태로 변환합니다.
     
     Args:
-        comparison: 비교 결과
+        comparison: 비교 결과 (compare_worktime_outputs 또는 compare_results_nway 반환값)
         
     Returns:
         비교 결과 테이블
     """
+    # N개 비교 결과(compare_results_nway)는 차이 텐서에서 바로 테이블 생성
+    if "delta_tensor" in comparison:
+        return nway_diff_table(comparison)
+    
     # 시간 및 급여 지표 통합
     all_metrics = {}
     all_metrics.update(comparison.get("time_metrics", {}))
@@ -375,6 +381,24 @@ def visualize_worktime_diff(result_a: Dict[str, Any], result_b: Dict[str, Any])
     
     return visualization_data
 
+def visualize_nway_diff(results: Dict[str, Any], baseline: Optional[str] = None) -> Dict[str, Any]:
+    """
+    N개 계산 결과의 차이를 한 번에 계산하여 테이블과 히트맵 데이터를 생성합니다.
+    
+    Args:
+        results: 결과 이름 -> 계산 결과
+        baseline: 기준 결과 이름 (None이면 모든 쌍 비교, 테이블은 첫 번째 결과 기준)
+        
+    Returns:
+        비교 결과, 차이 테이블, 히트맵 데이터
+    """
+    comparison = compare_results_nway(results, baseline=baseline)
+    return {
+        "comparison": comparison,
+        "diff_table": generate_diff_table(comparison),
+        "heatmap": nway_heatmap(comparison)
+    }
+
 def highlight_policy_diff(policy_a: Dict[str, Any], policy_b: Dict[str, Any]) -> Dict[str, Any]:
     """
     두 정책 간의 차이점을 강조합니다.
@@ -444,6 +468,31 @@ def export_comparison_to_html(comparison: Dict[str, Any], output_path: str) -> b
         # 비교 테이블 생성
         diff_table = generate_diff_table(comparison)
         
+        # 비교 대상 행 (두 결과 비교는 메타데이터, N개 비교는 결과 이름 목록 사용)
+        if "delta_tensor" in comparison:
+            target_rows = "".join(
+                f"<tr><td>정책 {i + 1}</td><td>{name}</td><td>{name}</td></tr>"
+                for i, name in enumerate(comparison["names"])
+            )
+        else:
+            metadata = comparison.get("metadata", {})
+            target_rows = "".join(
+                f"<tr><td>정책 {i}</td><td>{metadata.get(f'result{i}_policy_set', '')}</td>"
+                f"<td>{metadata.get(f'result{i}_id', '')}</td></tr>"
+                for i in (1, 2)
+            )
+        
+        # 중요 차이점 및 정책 변경 목록
+        significant_items = "".join(
+            f"<li class=\"significant\">{diff.get('description', '')}</li>"
+            for diff in comparison.get("significant_differences", [])
+            if isinstance(diff, dict)
+        )
+        policy_items = "".join(
+            f"<div class=\"policy-diff {diff.get('change_type', '')}\">{diff.get('description', '')}</div>"
+            for diff in comparison.get("policy_differences", [])
+        )
+        
         # HTML 템플릿
         html_content = f"""
         <!DOCTYPE html>
@@ -478,8 +527,27 @@ def export_comparison_to_html(comparison: Dict[str, Any], output_path: str) -> b
                     <th>정책 세트</th>
                     <th>ID</th>
                 </tr>
-                <tr>
-                    <td>정책 1</td>
-                    <td>{comparison.get("metadata", {}).get("result1_policy_set", "")}</td>
-                    <td>{comparison.get("metadata", {}).get("result1_id", 
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+                {target_rows}
+            </table>
+            
+            <h2>지표 비교</h2>
+            {diff_table.to_html(index=False, border=0)}
+            
+            <h2>중요 차이점</h2>
+            <ul>{significant_items or "<li>없음</li>"}</ul>
+            
+            <h2>정책 변경 사항</h2>
+            {policy_items or "<p>없음</p>"}
+        </body>
+        </html>
+        """
+        
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(html_content)
+        
+        logger.info(f"비교 결과 HTML 저장 완료: {output_path}")
+        return True
+    
+    except Exception as e:
+        logger.error(f"비교 결과 HTML 저장 중 오류 발생: {e}")
+        return False
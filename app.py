@@ -299,9 +299,14 @@ def single_simulation_page():
             if input_data_obj and st.button("시뮬레이션 실행", key="run_single_sim"):
                 with st.spinner("시뮬레이션 실행 중..."):
                     output_dir = setup_output_dir("single_simulation")
-                    simulator = PolicySimulator() # PolicyManager는 Simulator 내부에서 생성/관리
-                    # PolicySimulator의 simulate 메서드는 policy_set을 dict로 받음
-                    result = simulator.simulate(input_data_obj, policy_set_dict) # policy_set_dict를 직접 전달
+                    # 시뮬레이터를 세션에 유지하여 정책을 바꿔 다시 실행할 때 바뀐 정책의 하위 단계만 재계산
+                    if "incremental_simulator" not in st.session_state:
+                        st.session_state["incremental_simulator"] = PolicySimulator()
+                    simulator = st.session_state["incremental_simulator"]
+                    incremental = simulator.simulate_incremental(input_data_obj, policy_set_dict)
+                    result = dict(incremental["results"]["worktime"], time_summary=incremental["results"]["time_summary"])
+                    with st.expander("단계별 재사용/재계산 내역"):
+                        st.dataframe(pd.DataFrame(incremental["trace"]))
 
                     # 결과가 WorkTimeCalculationResult 객체이므로 dict로 변환하여 저장/표시
                     result_dict = result.model_dump() if hasattr(result, 'model_dump') else result
@@ -0,0 +1,138 @@
+# tests/test_baseline_delta_store.py
+"""
+기준 결과 대비 차이 저장소(BaselineDeltaStore) 테스트
+"""
+
+import unittest
+import datetime
+import sys
+import os
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.schema import WorkTimeCalculationResult, TimeSummary, WorkDayDetail, ComplianceAlert
+from Payslip.baseline_delta_store import BaselineDeltaStore, to_calculation_result
+from Payslip.combination_runner import run_simulations_on_combinations
+
+
+def make_result(overrides=None, days=range(1, 31), alerts=None):
+    overrides = overrides or {}
+    details = []
+    for day in days:
+        values = {"regular_hours": Decimal("8"), "actual_work_minutes": Decimal("480")}
+        values.update(overrides.get(day, {}))
+        details.append(WorkDayDetail(date=datetime.date(2025, 6, day), **values))
+    total = sum(detail.regular_hours + detail.overtime_hours for detail in details)
+    return WorkTimeCalculationResult(
+        period="2025-06", processing_mode="timecard",
+        time_summary=TimeSummary(regular_hours=Decimal(8 * len(details)), total_net_work_hours=total),
+        daily_calculation_details=details, compliance_alerts=alerts or []
+    )
+
+
+class TestBaselineDeltaStore(unittest.TestCase):
+    """BaselineDeltaStore 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.baseline = make_result()
+        self.store = BaselineDeltaStore("기본", self.baseline)
+
+    def test_round_trip(self):
+        """차이만 저장한 뒤 전체 결과 복원 테스트"""
+        result = make_result({3: {"overtime_hours": Decimal("1.5")}, 4: {"night_hours": Decimal("2"), "warnings": ["야간"]}},
+                             alerts=[ComplianceAlert(alert_code="NIGHT", message="야간 근로")])
+        counts = self.store.add("연장", result, {"name": "연장"})
+        self.assertEqual(counts, {"stored_values": 2, "dense_values": 30 * 8})
+
+        restored = self.store.get("연장")
+        self.assertEqual(restored.model_dump(exclude={"processed_timestamp"}),
+                         result.model_dump(exclude={"processed_timestamp"}))
+        self.assertIs(self.store.get("기본"), self.baseline)
+        self.assertEqual(self.store.policy_set("연장"), {"name": "연장"})
+
+    def test_carried_in_minutes_round_trip(self):
+        """전 기간에서 이월된 근무시간(carried_in_minutes)이 차이로 저장되고 복원되는지 테스트"""
+        result = make_result({1: {"actual_work_minutes": Decimal("600"), "carried_in_minutes": Decimal("120")}})
+        self.assertEqual(self.store.add("이월", result)["stored_values"], 2)
+
+        restored = self.store.get("이월")
+        self.assertEqual(restored.daily_calculation_details[0].carried_in_minutes, Decimal("120"))
+        self.assertEqual(self.store.diff("이월")["daily_diffs"]["2025-06-01"]["carried_in_minutes"],
+                         {"a": 0.0, "b": 120.0, "diff": 120.0})
+
+    def test_added_and_removed_days(self):
+        """기준에 없는 날짜/기준에만 있는 날짜 처리 테스트"""
+        result = make_result(days=range(2, 31))
+        extra = WorkDayDetail(date=datetime.date(2025, 7, 1), regular_hours=Decimal("4"))
+        result = result.model_copy(update={"daily_calculation_details": result.daily_calculation_details + [extra]})
+        self.store.add("변경", result)
+
+        restored = self.store.get("변경")
+        self.assertEqual([d.date for d in restored.daily_calculation_details],
+                         [d.date for d in result.daily_calculation_details])
+        self.assertEqual(restored.daily_calculation_details[-1].regular_hours, Decimal("4.0"))
+
+        diff = self.store.diff("변경")
+        self.assertEqual(diff["only_in_a"], ["2025-06-01"])
+        self.assertEqual(diff["only_in_b"], ["2025-07-01"])
+        self.assertEqual(diff["daily_diffs"], {})
+
+    def test_diff_matches_dense_comparison(self):
+        """희소 차이가 일별 전체 비교 결과와 같은지 및 저장 통계 테스트"""
+        result = make_result({10: {"overtime_hours": Decimal("2"), "actual_work_minutes": Decimal("600")}})
+        self.store.add("연장", result)
+        self.store.add("동일", make_result())
+
+        diff = self.store.diff("연장")
+        self.assertEqual(diff["daily_diffs"], {"2025-06-10": {
+            "overtime_hours": {"a": 0.0, "b": 2.0, "diff": 2.0},
+            "actual_work_minutes": {"a": 480.0, "b": 600.0, "diff": 120.0},
+        }})
+        self.assertEqual(self.store.diff("동일")["daily_diffs"], {})
+        self.assertEqual(self.store.get("동일").daily_calculation_details, self.baseline.daily_calculation_details)
+
+        stats = self.store.stats()
+        self.assertEqual((stats["entries"], stats["stored_values"], stats["dense_values"]), (2, 2, 2 * 30 * 8))
+        self.assertEqual(self.store.names, ["기본", "연장", "동일"])
+        self.assertIn("동일", self.store)
+
+
+class TestStreamingDeltaStore(unittest.TestCase):
+    """조합 실행 중 기준 대비 차이 저장 테스트 케이스"""
+
+    def test_combinations_stream_into_delta_store(self):
+        """기준 조합만 전체 결과로 남고 나머지는 차이 저장소에서 같은 결과로 복원되는지 테스트"""
+        input_data = {"employee_id": "EMP001", "period": "2025-05", "records": [
+            {"date": f"2025-05-{day:02d}", "start_time": "09:00", "end_time": "19:00", "break_time_minutes": 60}
+            for day in (12, 13, 14)
+        ]}
+        combinations = [
+            {"name": "5시간", "company_settings.daily_work_minutes_standard": 300},
+            {"name": "8시간"},
+            {"name": "7시간", "company_settings.daily_work_minutes_standard": 420},
+            {"name": "7시간_중첩", "company_settings": {"daily_work_minutes_standard": 420}},
+        ]
+        dense = run_simulations_on_combinations(input_data, combinations, backend="inline")
+        streamed = run_simulations_on_combinations(input_data, combinations, backend="thread", max_workers=2,
+                                                   chunk_size=1, delta_baseline=1)
+
+        store = streamed["delta_store"]
+        self.assertEqual(store.baseline_name, "8시간")
+        self.assertEqual(sorted(store.names), sorted(["8시간", "5시간", "7시간"]))
+        self.assertIn("daily_details", streamed["results"][1]["result"])
+        for item, dense_item in zip(streamed["results"], dense["results"]):
+            name = item.get("delta_name", "8시간")
+            if "delta_name" in item:
+                self.assertEqual(set(item["result"]), {"time_summary"})
+            self.assertEqual(item["result"]["time_summary"], dense_item["result"]["time_summary"])
+            expected = to_calculation_result(dense_item["result"], "EMP001", "2025-05")
+            restored = store.get(name)
+            self.assertEqual(restored.time_summary, expected.time_summary)
+            self.assertEqual(restored.daily_calculation_details, expected.daily_calculation_details)
+        self.assertEqual(streamed["results"][3]["delta_name"], "7시간")
+        self.assertEqual(streamed["metrics_summary"], dense["metrics_summary"])
+
+
+if __name__ == '__main__':
+    unittest.main()
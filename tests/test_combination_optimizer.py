@@ -0,0 +1,116 @@
+# tests/test_combination_optimizer.py
+"""
+정책 조합 최적화(top_k / pareto) 테스트
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.combination_runner import iter_valid_combinations, run_simulations_on_combinations
+from Payslip.combination_optimizer import optimize_policy_combinations, PolicyCombinationOptimizer
+
+
+class ConfigSumSimulator:
+    """옵션 설정 값의 합으로 근무시간과 급여를 만드는 테스트용 시뮬레이터"""
+
+    def simulate(self, input_data, policy_set):
+        values = [(key.split(".")[-1], value) for p in policy_set["policies"] for key, value in p["config"].items()]
+        hours = input_data["base_hours"] + sum(value for key, value in values if key == "hours")
+        pay = sum(value for key, value in values if key == "pay")
+        return {"time_summary": {"total_hours": hours, "total_pay": pay}}
+
+
+def config_sum_simulator_factory():
+    return ConfigSumSimulator()
+
+
+class TestPolicyCombinationOptimizer(unittest.TestCase):
+    """optimize_policy_combinations 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.input_data = {"id": "sample", "base_hours": 160}
+        self.policy_options = {
+            f"category_{c}": [
+                {"name": f"C{c}_O{o}", "config": {f"category_{c}.hours": (o * 7 + c * 3) % 5,
+                                                  f"category_{c}.pay": ((o + 2) * (c + 3)) % 7}}
+                for o in range(5)
+            ]
+            for c in range(5)
+        }
+        self.policy_options["category_0"][1]["conflicts_with"] = ["C1_O0", "C2_O2"]
+        self.policy_options["category_3"][4]["conflicts_with"] = ["C4_O1"]
+        exhaustive = run_simulations_on_combinations(self.input_data, list(iter_valid_combinations(self.policy_options)),
+                                                     backend="inline", simulator_factory=config_sum_simulator_factory)
+        self.all_results = [(item["policy_set"]["name"], item["result"]["time_summary"]) for item in exhaustive["results"]]
+
+    def test_top_k_matches_exhaustive(self):
+        """top_k 결과가 전수 평가 결과와 같은 목표 값을 갖는지 테스트"""
+        result = optimize_policy_combinations(self.input_data, self.policy_options, {"total_pay": "max"}, k=3,
+                                              simulator_factory=config_sum_simulator_factory)
+        expected = sorted((summary["total_pay"] for _, summary in self.all_results), reverse=True)[:3]
+        self.assertEqual([item["objectives"]["total_pay"] for item in result["results"]], expected)
+        self.assertLess(result["metadata"]["evaluations"], result["metadata"]["valid_combinations"])
+        self.assertEqual(result["metadata"]["stopped_reason"], "stable_frontier")
+
+    def test_pareto_front_is_non_dominated(self):
+        """파레토 결과가 전수 평가 기준 지배되지 않는 조합인지 테스트"""
+        result = optimize_policy_combinations(self.input_data, self.policy_options,
+                                              {"total_hours": "min", "total_pay": "max"}, mode="pareto",
+                                              simulator_factory=config_sum_simulator_factory)
+        self.assertTrue(result["results"])
+        for item in result["results"]:
+            hours, pay = item["objectives"]["total_hours"], item["objectives"]["total_pay"]
+            for _, summary in self.all_results:
+                dominated = (summary["total_hours"] <= hours and summary["total_pay"] >= pay and
+                             (summary["total_hours"] < hours or summary["total_pay"] > pay))
+                self.assertFalse(dominated, item["policy_set"])
+
+    def test_invalid_arguments_and_budget(self):
+        """잘못된 인자 검증 및 평가 횟수 한도 테스트"""
+        with self.assertRaises(ValueError):
+            PolicyCombinationOptimizer(self.policy_options, {"total_pay": "maximize"})
+        with self.assertRaises(ValueError):
+            PolicyCombinationOptimizer(self.policy_options, {"total_pay": "max"}, mode="greedy")
+
+        result = optimize_policy_combinations(self.input_data, self.policy_options, {"total_hours": "min"},
+                                              max_evaluations=10, simulator_factory=config_sum_simulator_factory)
+        self.assertEqual(result["metadata"]["evaluations"], 10)
+        self.assertEqual(result["metadata"]["stopped_reason"], "max_evaluations")
+        optimizer = PolicyCombinationOptimizer(self.policy_options, {"total_hours": "min"})
+        self.assertFalse(optimizer.is_valid((1, 0, 0, 0, 0)))
+
+
+class TestOptimizerWithPolicySimulator(unittest.TestCase):
+    """기본 시뮬레이터(PolicySimulator)로 급여 지표를 최적화하는 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        # 하루 10시간(휴게 1시간) x 3일 -> 연장 3시간
+        self.input_data = {"employee_id": "EMP001", "period": "2025-05", "records": [
+            {"date": f"2025-05-{day:02d}", "start_time": "09:00", "end_time": "19:00", "break_time_minutes": 60}
+            for day in (12, 13, 14)
+        ]}
+        self.policy_options = {"overtime": [
+            {"name": f"x{multiplier}", "config": {"calculation_mode.simple_mode_options.overtime_multiplier": multiplier}}
+            for multiplier in (1.5, 2.0)
+        ]}
+
+    def test_total_pay_uses_hourly_wage(self):
+        """시급을 지정하면 조합별 total_pay가 계산되어 연장 배수가 큰 조합이 선택되는지 테스트"""
+        result = optimize_policy_combinations(self.input_data, self.policy_options, {"total_pay": "max"}, k=2,
+                                              hourly_wage=10000)
+        pays = [item["objectives"]["total_pay"] for item in result["results"]]
+        self.assertEqual(pays[0] - pays[1], 3 * 10000 * 0.5)
+        self.assertEqual(result["results"][0]["policy_set"], "x2.0")
+
+    def test_missing_objective_metric_raises(self):
+        """시급 없이 급여 지표를 목표로 하면 0으로 채우지 않고 오류가 나는지 테스트"""
+        with self.assertRaises(ValueError):
+            optimize_policy_combinations(self.input_data, self.policy_options, {"total_pay": "max"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,276 @@
+# tests/test_combination_runner.py
+"""
+정책 조합 시뮬레이션 실행 백엔드 테스트
+"""
+
+import unittest
+import json
+import tempfile
+import sys
+import os
+
+from unittest import mock
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.combination_runner import (
+    run_simulations_on_combinations,
+    benchmark_execution_backends,
+    generate_policy_combination_matrix,
+    filter_valid_combinations,
+    iter_valid_combinations,
+    count_valid_combinations,
+    run_workforce_simulation_matrix,
+    generate_heatmap,
+    export_simulation_results_to_json,
+    build_metrics_matrix
+)
+
+
+class HoursSimulator:
+    """정책 값으로 결과를 만드는 테스트용 시뮬레이터"""
+
+    def simulate(self, input_data, policy_set):
+        if policy_set.get("fail"):
+            raise ValueError("simulation failed")
+        total_hours = input_data["base_hours"] + policy_set["extra_hours"]
+        alerts = ["EXCESSIVE_WORK"] if total_hours > 170 else []
+        return {"time_summary": {"total_hours": total_hours, "overtime_hours": policy_set["extra_hours"],
+                                 "night_hours": 1, "total_pay": total_hours * 10000},
+                "compliance_alerts": alerts}
+
+
+def hours_simulator_factory():
+    return HoursSimulator()
+
+
+class TestExecutionBackends(unittest.TestCase):
+    """run_simulations_on_combinations 실행 백엔드 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.input_data = {"id": "sample", "base_hours": 160}
+        self.combinations = [{"name": f"조합_{i}", "extra_hours": i} for i in range(20)]
+
+    def _total_hours(self, simulation_results):
+        return [item["result"]["time_summary"]["total_hours"] for item in simulation_results["results"]]
+
+    def test_backends_return_results_in_input_order(self):
+        """모든 백엔드가 입력 순서대로 동일한 결과를 반환하는지 테스트"""
+        expected = [160 + i for i in range(20)]
+        for backend in ("process", "thread", "inline"):
+            results = run_simulations_on_combinations(self.input_data, self.combinations, max_workers=2,
+                                                      backend=backend, chunk_size=3,
+                                                      simulator_factory=hours_simulator_factory)
+            self.assertEqual(results["metadata"]["execution_backend"], backend)
+            self.assertEqual(self._total_hours(results), expected, backend)
+            self.assertEqual(results["metrics_summary"]["total_hours"]["min"], 160)
+            self.assertEqual(results["best_combinations"]["min_total_hours"][0]["policy_set"], "조합_0")
+
+    def test_process_backend_falls_back_to_threads(self):
+        """pickle 불가능한 정책 조합은 스레드 백엔드로 전환되는지 테스트"""
+        combinations = [dict(combo, formatter=lambda value: f"{value}h") for combo in self.combinations]
+        results = run_simulations_on_combinations(self.input_data, combinations, max_workers=2,
+                                                  backend="process", simulator_factory=hours_simulator_factory)
+        self.assertEqual(results["metadata"]["execution_backend"], "thread")
+        self.assertEqual(len(results["results"]), 20)
+
+    def test_callback_errors_are_not_swallowed(self):
+        """진행 콜백의 예외가 백엔드 전환으로 숨겨지지 않고 호출자에게 전달되는지 테스트"""
+        calls = []
+
+        def failing_callback(progress):
+            calls.append(progress)
+            if len(calls) == 1:
+                raise TypeError("callback failed")
+
+        with self.assertRaises(TypeError):
+            run_simulations_on_combinations(self.input_data, self.combinations, max_workers=2, backend="process",
+                                            simulator_factory=hours_simulator_factory,
+                                            progress_callback=failing_callback)
+        self.assertEqual(len(calls), 1)
+
+    def test_default_backend_is_thread(self):
+        """기본 실행 백엔드가 스레드인지 테스트"""
+        results = run_simulations_on_combinations(self.input_data, self.combinations[:2],
+                                                  simulator_factory=hours_simulator_factory)
+        self.assertEqual(results["metadata"]["execution_backend"], "thread")
+
+    def test_errors_are_recorded_per_combination(self):
+        """조합별 오류가 결과에 기록되는지 테스트"""
+        combinations = self.combinations[:3] + [{"name": "실패", "fail": True}]
+        results = run_simulations_on_combinations(self.input_data, combinations, backend="inline",
+                                                  simulator_factory=hours_simulator_factory)
+        self.assertEqual(results["results"][3]["error"], "simulation failed")
+        self.assertEqual(results["metrics_summary"]["total_hours"]["max"], 162)
+
+    def test_metrics_matrix_summary(self):
+        """지표 행렬 기반 요약 통계 및 행렬 노출 테스트"""
+        combinations = self.combinations[:4] + [{"name": "실패", "fail": True}]
+        results = run_simulations_on_combinations(self.input_data, combinations, backend="inline",
+                                                  simulator_factory=hours_simulator_factory)
+        matrix = results["metrics_matrix"]
+        self.assertEqual(matrix["values"].shape, (5, len(matrix["metrics"])))
+        self.assertTrue(np.isnan(matrix["values"][4]).all())
+        self.assertEqual(matrix["policy_sets"][4], "실패")
+
+        summary = results["metrics_summary"]["total_hours"]
+        self.assertEqual((summary["min"], summary["max"], summary["avg"]), (160, 163, 161.5))
+        self.assertEqual(summary["median"], 162)  # sorted(values)[n // 2]
+        self.assertAlmostEqual(summary["std"], float(np.std([160, 161, 162, 163])))
+        self.assertEqual(results["metrics_summary"]["base_pay"]["max"], 0)
+        self.assertEqual([item["policy_set"] for item in results["best_combinations"]["max_total_pay"]], ["조합_3"])
+        self.assertEqual(len(results["best_combinations"]["best_efficiency"]), 4)
+
+        heatmap = generate_heatmap(results)
+        self.assertEqual(heatmap["heatmaps"]["total_hours"]["values"], [160.0, 161.0, 162.0, 163.0, 0.0])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "results.json")
+            self.assertTrue(export_simulation_results_to_json(results, output_path))
+            with open(output_path, "r", encoding="utf-8") as f:
+                exported = json.load(f)
+        self.assertIsNone(exported["metrics_matrix"]["values"][4][0])
+
+    def test_metrics_matrix_is_filled_while_streaming(self):
+        """체크포인트 복원 결과와 새 결과의 지표 행이 실행 중에 채워져 두 번째 계산 없이 요약되는지 테스트"""
+        combinations = self.combinations[:6] + [{"name": "실패", "fail": True}]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, "checkpoint.jsonl")
+            run_simulations_on_combinations(self.input_data, combinations[:3], backend="inline",
+                                            simulator_factory=hours_simulator_factory,
+                                            checkpoint_path=checkpoint_path)
+            with mock.patch("Payslip.combination_runner.build_metrics_matrix") as rebuild:
+                results = run_simulations_on_combinations(self.input_data, combinations, max_workers=2,
+                                                          backend="thread", chunk_size=2,
+                                                          simulator_factory=hours_simulator_factory,
+                                                          checkpoint_path=checkpoint_path)
+            rebuild.assert_not_called()
+        np.testing.assert_array_equal(results["metrics_matrix"]["values"], build_metrics_matrix(results["results"]))
+        self.assertEqual(results["metrics_summary"]["total_hours"]["max"], 165)
+
+    def test_benchmark(self):
+        """백엔드 벤치마크 결과 구조 테스트"""
+        benchmark = benchmark_execution_backends(self.input_data, self.combinations, max_workers=2,
+                                                 simulator_factory=hours_simulator_factory)
+        self.assertEqual(set(benchmark["backends"]), {"process", "thread", "inline"})
+        self.assertEqual(benchmark["backends"]["thread"]["speedup_vs_thread"], 1.0)
+        self.assertGreater(benchmark["backends"]["inline"]["throughput"], 0)
+
+class TestWorkforceSimulationMatrix(unittest.TestCase):
+    """run_workforce_simulation_matrix 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.employees = [{"id": f"EMP{i:03d}", "base_hours": 160 + i % 5} for i in range(40)]
+        self.combinations = [{"name": f"조합_{i}", "extra_hours": i * 4} for i in range(4)]
+
+    def test_aggregates_match_across_backends(self):
+        """백엔드와 묶음 크기에 관계없이 조합별 집계가 같은지 테스트"""
+        expected_base = sum(emp["base_hours"] for emp in self.employees)
+        for backend, shard_size in (("process", 7), ("thread", 3), ("inline", None)):
+            matrix = run_workforce_simulation_matrix(self.employees, self.combinations, max_workers=2, backend=backend,
+                                                     shard_size=shard_size, simulator_factory=hours_simulator_factory)
+            self.assertEqual(matrix["metadata"]["execution_backend"], backend)
+            for i, aggregate in enumerate(matrix["aggregates"]):
+                self.assertEqual(aggregate["employees"], 40)
+                self.assertEqual(aggregate["totals"]["total_hours"], expected_base + 40 * i * 4)
+                self.assertEqual(aggregate["totals"]["premium_hours"], 40 * (i * 4 + 1))
+            self.assertEqual(matrix["best_combinations"]["min_total_hours"][0]["policy_set"], "조합_0")
+
+    def test_alert_and_error_counts(self):
+        """조합별 경고 수와 오류 수 집계 테스트"""
+        combinations = self.combinations + [{"name": "실패", "fail": True}]
+        matrix = run_workforce_simulation_matrix(self.employees, combinations, backend="inline",
+                                                 simulator_factory=hours_simulator_factory)
+        alerts = [aggregate["compliance_alerts"] for aggregate in matrix["aggregates"]]
+        # 조합_2(+8h): 기본 163h 이상 직원, 조합_3(+12h): 전원
+        self.assertEqual(alerts, [0, 0, 16, 40, 0])
+        self.assertEqual(matrix["aggregates"][4]["errors"], 40)
+        self.assertEqual(matrix["aggregates"][4]["averages"]["total_hours"], 0.0)
+
+
+class TestDefaultSimulator(unittest.TestCase):
+    """기본 시뮬레이터(PolicySimulator)로 조합 행렬을 실행하는 테스트 케이스"""
+
+    def test_option_configs_are_applied(self):
+        """딕셔너리 입력과 조합 행렬 옵션의 config가 실제 계산에 반영되는지 테스트"""
+        input_data = {"employee_id": "EMP001", "period": "2025-05", "records": [
+            {"date": f"2025-05-{day:02d}", "start_time": "09:00", "end_time": "18:00", "break_time_minutes": 60}
+            for day in (12, 13, 14)
+        ]}
+        combinations = generate_policy_combination_matrix({
+            "daily_standard": [
+                {"name": "8시간", "config": {"company_settings.daily_work_minutes_standard": 480}},
+                {"name": "5시간", "config": {"company_settings": {"daily_work_minutes_standard": 300}}},
+            ]
+        })
+        results = run_simulations_on_combinations(input_data, combinations, backend="inline")
+        summaries = {item["policy_set"]["name"]: item["result"]["time_summary"] for item in results["results"]}
+        self.assertEqual(summaries["8시간"]["overtime_hours"], 0.0)
+        self.assertEqual(summaries["5시간"]["overtime_hours"], 9.0)
+        self.assertEqual(summaries["5시간"]["regular_hours"], 15.0)
+
+    def test_workforce_total_pay_uses_hourly_wage(self):
+        """매트릭스 total_pay가 직원별 시급으로 계산되고, 시급이 없으면 집계에서 빠지는지 테스트"""
+        employees = [{"employee_id": employee_id, "period": "2025-05", "records": [
+            {"date": f"2025-05-{day:02d}", "start_time": "09:00", "end_time": "18:00", "break_time_minutes": 60}
+            for day in (12, 13, 14)
+        ]} for employee_id in ("EMP001", "EMP002")]
+        combinations = [{"name": "8시간"}, {"name": "5시간", "company_settings.daily_work_minutes_standard": 300}]
+        wages = {"EMP001": 10000, "EMP002": 20000}
+
+        matrix = run_workforce_simulation_matrix(employees, combinations, backend="inline", hourly_wage=wages)
+        totals = {item["policy_set"]: item["totals"] for item in matrix["aggregates"]}
+        # 주 24시간 -> 비례 주휴 4.8시간, 8시간: 정규 24시간, 5시간: 정규 15시간 + 연장 9시간 x 1.5
+        self.assertAlmostEqual(totals["8시간"]["total_pay"], (24 + 4.8) * 30000)
+        self.assertAlmostEqual(totals["5시간"]["total_pay"], (15 + 9 * 1.5 + 4.8) * 30000)
+        self.assertEqual(matrix["best_combinations"]["min_total_pay"][0]["policy_set"], "8시간")
+
+        without_wage = run_workforce_simulation_matrix(employees, combinations, backend="inline")
+        self.assertNotIn("total_pay", without_wage["aggregates"][0]["totals"])
+        self.assertNotIn("min_total_pay", without_wage["best_combinations"])
+
+
+class TestLazyCombinationGenerator(unittest.TestCase):
+    """iter_valid_combinations / count_valid_combinations 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.policy_options = {
+            f"category_{c}": [
+                {"name": f"C{c}_O{o}", "config": {f"policies.c{c}": o}}
+                for o in range(4)
+            ]
+            for c in range(6)
+        }
+        # 단방향으로만 선언된 충돌도 양방향으로 적용
+        self.policy_options["category_0"][0]["conflicts_with"] = ["C1_O0", "C3_O2"]
+        self.policy_options["category_2"][1]["conflicts_with"] = ["C5_O3"]
+        self.policy_options["category_4"][3]["conflicts_with"] = ["C0_O1", "C2_O2"]
+
+    def test_matches_eager_filtering(self):
+        """기존 생성 후 필터링 결과와 동일한 조합/순서인지 테스트"""
+        expected = filter_valid_combinations(generate_policy_combination_matrix(self.policy_options))
+        self.assertEqual(list(iter_valid_combinations(self.policy_options)), expected)
+
+    def test_counts_without_materializing(self):
+        """조합 수 계산 테스트"""
+        expected_valid = len(filter_valid_combinations(generate_policy_combination_matrix(self.policy_options)))
+        counts = count_valid_combinations(self.policy_options)
+        self.assertEqual(counts["total"], 4 ** 6)
+        self.assertEqual(counts["valid"], expected_valid)
+        self.assertEqual(counts["pruned"], 4 ** 6 - expected_valid)
+
+    def test_generator_is_lazy(self):
+        """생성기가 필요한 만큼만 조합을 만드는지 테스트"""
+        large_options = {f"category_{c}": [{"name": f"L{c}_{o}"} for o in range(4)] for c in range(16)}
+        generator = iter_valid_combinations(large_options)
+        first = next(generator)
+        self.assertEqual(first["name"], " + ".join(f"L{c}_0" for c in range(16)))
+        self.assertEqual(count_valid_combinations(large_options)["valid"], 4 ** 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
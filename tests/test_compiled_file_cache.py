@@ -0,0 +1,72 @@
+# tests/test_compiled_file_cache.py
+"""
+컴파일된 설정 파일 캐시(CompiledFileCache) 테스트
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.compiled_file_cache import CompiledFileCache, load_yaml_fast
+
+
+class TestCompiledFileCache(unittest.TestCase):
+    """CompiledFileCache 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "scenario.yaml")
+        self._write("policy_schema:\n  policies.weekly_holiday.min_hours:\n    default: 15\n")
+        self.compile_calls = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _compile(self, path):
+        self.compile_calls += 1
+        with open(path, "r", encoding="utf-8") as f:
+            return {"data": load_yaml_fast(f.read())}
+
+    def test_hit_after_first_compile(self):
+        """같은 파일은 한 번만 컴파일되고 내용이 바뀌면 다시 컴파일되는지 테스트"""
+        cache = CompiledFileCache("scenario", "1")
+        first = cache.get_or_compile(self.path, self._compile)
+        second = cache.get_or_compile(self.path, self._compile)
+        self.assertEqual(first, second)
+        self.assertEqual(self.compile_calls, 1)
+        self.assertEqual(cache.stats, {"hits": 1, "misses": 1})
+        self.assertTrue(os.path.isdir(os.path.join(self.tmp.name, ".compiled_cache")))
+
+        self._write("policy_schema: {}\n")
+        self.assertEqual(cache.get_or_compile(self.path, self._compile), {"data": {"policy_schema": {}}})
+        self.assertEqual(self.compile_calls, 2)
+
+    def test_version_change_invalidates(self):
+        """로더 버전이 바뀌면 캐시를 사용하지 않는지 테스트"""
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        CompiledFileCache("scenario", "1", cache_dir).get_or_compile(self.path, self._compile)
+        CompiledFileCache("scenario", "2", cache_dir).get_or_compile(self.path, self._compile)
+        self.assertEqual(self.compile_calls, 2)
+        CompiledFileCache("scenario", "2", cache_dir).get_or_compile(self.path, self._compile)
+        self.assertEqual(self.compile_calls, 2)
+
+    def test_corrupt_cache_is_recompiled(self):
+        """손상된 캐시 파일은 무시하고 다시 컴파일하는지 테스트"""
+        cache = CompiledFileCache("scenario", "1")
+        cache.get_or_compile(self.path, self._compile)
+        with open(cache.cache_path(self.path), "wb") as f:
+            f.write(b"\x80\x05broken")
+        result = cache.get_or_compile(self.path, self._compile)
+        self.assertEqual(result["data"]["policy_schema"]["policies.weekly_holiday.min_hours"]["default"], 15)
+        self.assertEqual(self.compile_calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# tests/test_config_registry.py
+"""
+설정 파일 레지스트리(ConfigRegistry) 테스트
+"""
+
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.config_registry import ConfigRegistry
+from Payslip.policy_manager import PolicyManager
+
+CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Config'))
+
+
+class TestConfigRegistry(unittest.TestCase):
+    """ConfigRegistry 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = {}
+        for name in ("settings.yaml", "minimum_wage.yaml", "holidays.yaml"):
+            self.paths[name] = os.path.join(self.tmp.name, name)
+            shutil.copy(os.path.join(CONFIG_DIR, name), self.paths[name])
+        self.registry = ConfigRegistry()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _manager(self):
+        return PolicyManager(settings_path=self.paths["settings.yaml"],
+                             minimum_wage_path=self.paths["minimum_wage.yaml"],
+                             holidays_path=self.paths["holidays.yaml"], registry=self.registry)
+
+    def _rewrite(self, name, old, new):
+        path = self.paths[name]
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn(old, text)
+        stat = os.stat(path)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text.replace(old, new, 1))
+        # 같은 시각 안에 다시 쓴 경우에도 변경이 감지되도록 mtime을 확실히 바꿈
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_managers_share_parsed_files(self):
+        """여러 PolicyManager가 파일을 한 번만 읽고 같은 객체를 공유하는지 테스트"""
+        first, second = self._manager(), self._manager()
+        self.assertIs(first.settings, second.settings)
+        self.assertEqual(first.holidays, second.holidays)
+        self.assertEqual(first.minimum_wages, second.minimum_wages)
+        self.assertEqual(self.registry.stats["loads"], 3)
+        self.assertEqual(self.registry.stats["hits"], 3)
+        self.assertTrue(first.is_simple_mode() in (True, False))
+
+    def test_handed_out_values_do_not_leak(self):
+        """한 관리자가 받은 하위 트리/공휴일/최저임금을 수정해도 공유 데이터에 반영되지 않는지 테스트"""
+        first, second = self._manager(), self._manager()
+        overlay = first.freeze().overlay({"policies.weekly_holiday.min_hours": 20})
+
+        first.get("policies.weekly_holiday")["min_hours"] = 99
+        first.get("company_settings")["daily_work_minutes_standard"] = 1
+        overlay.get("policies.weekly_holiday")["allowance_hours"] = 99
+        first.holidays.append({"date": "2025-07-07", "name": "임의", "type": "company"})
+        first.holidays[0]["date"] = "1999-01-01"
+        next(iter(first.minimum_wages.values()))["hourly_rate"] = 1
+        year = next(iter(second.minimum_wages))
+        first.get_minimum_wage(year)["hourly_rate"] = 1
+        overlay.holidays.clear()
+
+        self.assertEqual(second.get("policies.weekly_holiday.min_hours"), 15)
+        self.assertEqual(second.get("company_settings.daily_work_minutes_standard"), 480)
+        self.assertEqual(overlay.get("policies.weekly_holiday.allowance_hours"), 8)
+        self.assertEqual(second.holidays, self._manager().holidays)
+        self.assertNotIn("1999-01-01", [holiday["date"] for holiday in second.holidays])
+        self.assertGreater(len(overlay.holidays), 0)
+        self.assertGreater(second.get_minimum_wage(year)["hourly_rate"], 1)
+        self.assertTrue(all(wage["hourly_rate"] > 1 for wage in second.minimum_wages.values()))
+
+    def test_set_copies_shared_settings(self):
+        """set으로 수정하면 공유 설정을 복사하여 다른 관리자에 영향을 주지 않는지 테스트"""
+        first, second = self._manager(), self._manager()
+        first.set("policies.weekly_holiday.min_hours", 20)
+        self.assertEqual(first.get("policies.weekly_holiday.min_hours"), 20)
+        self.assertEqual(second.get("policies.weekly_holiday.min_hours"), 15)
+        self.assertEqual(self._manager().get("policies.weekly_holiday.min_hours"), 15)
+        self.assertIsNot(first.settings, second.settings)
+        # 수정한 설정은 파일 변경으로 덮어쓰지 않음
+        self._rewrite("settings.yaml", "min_hours: 15", "min_hours: 12")
+        self.assertFalse(first.reload_if_changed())
+        self.assertEqual(first.get("policies.weekly_holiday.min_hours"), 20)
+
+    def test_reload_when_file_changes(self):
+        """파일이 바뀌면 다음 조회 때 다시 읽는지 테스트"""
+        manager = self._manager().freeze()
+        self.assertFalse(manager.reload_if_changed())
+        self._rewrite("settings.yaml", "min_hours: 15", "min_hours: 12")
+        self.assertEqual(self._manager().get("policies.weekly_holiday.min_hours"), 12)
+        self.assertEqual(self.registry.stats["reloads"], 1)
+
+        self.assertEqual(manager.get("policies.weekly_holiday.min_hours"), 15)
+        self.assertTrue(manager.reload_if_changed())
+        self.assertEqual(manager.get("policies.weekly_holiday.min_hours"), 12)
+        self.assertEqual(manager.get_weekly_holiday_policy()["min_hours"], 12)
+
+        self._rewrite("holidays.yaml", "holidays:", "holidays: []\nunused:")
+        self.assertEqual(self.registry.reload_if_changed(), 1)
+        self.assertEqual(self._manager().holidays, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
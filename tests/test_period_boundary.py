@@ -0,0 +1,139 @@
+# tests/test_period_boundary.py
+"""
+기간 경계(말일 자정 넘김 근무) 분할 및 이월 파일 테스트
+"""
+
+import unittest
+import datetime
+import tempfile
+import shutil
+import sys
+import os
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.schema import TimeCardInputData, TimeCardRecord
+from Payslip.Worktime.calculator import TimeCardBasedCalculator
+from Payslip.Worktime.period_boundary import PeriodCarryStore
+from Payslip.Worktime.period_calendar import get_period_bounds, get_next_period
+
+
+class TestPeriodBoundarySplit(unittest.TestCase):
+    """기간 경계 분할 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.carry_dir = tempfile.mkdtemp()
+        self.calculator = TimeCardBasedCalculator({
+            "company_settings": {"daily_work_minutes_standard": 480},
+            "period_carry_dir": self.carry_dir
+        })
+        # 2025-06-30(월) 14:00 ~ 07-01 02:00, 휴게 60분 -> 실근로 660분 (자정 이후 120분)
+        self.june = TimeCardInputData(employee_id="EMP001", period="2025-06", records=[
+            TimeCardRecord(date=datetime.date(2025, 6, 27), start_time="09:00", end_time="18:00", break_time_minutes=60),
+            TimeCardRecord(date=datetime.date(2025, 6, 30), start_time="14:00", end_time="02:00", break_time_minutes=60),
+        ])
+        self.july = TimeCardInputData(employee_id="EMP001", period="2025-07", records=[
+            TimeCardRecord(date=datetime.date(2025, 7, 1), start_time="13:00", end_time="18:00", break_time_minutes=30),
+            TimeCardRecord(date=datetime.date(2025, 7, 2), start_time="09:00", end_time="18:00", break_time_minutes=60),
+        ])
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        shutil.rmtree(self.carry_dir, ignore_errors=True)
+
+    def test_period_helpers(self):
+        """기간 경계 계산 테스트"""
+        self.assertEqual(get_period_bounds("2024-02"), (datetime.date(2024, 2, 1), datetime.date(2024, 2, 29)))
+        self.assertEqual(get_next_period("2025-12"), "2026-01")
+
+    def test_last_day_minutes_are_carried(self):
+        """말일 자정 이후 근무가 연장근무에서 먼저 차감되어 이월되는지 테스트"""
+        result = self.calculator.calculate(self.june)
+        last_day = result["daily_details"][-1]
+        self.assertEqual(last_day.actual_work_minutes, Decimal("540"))
+        self.assertEqual(last_day.regular_hours, Decimal("8.00"))
+        self.assertEqual(last_day.overtime_hours, Decimal("1.00"))
+
+        carry = PeriodCarryStore(self.carry_dir).load("EMP001", "2025-07")
+        self.assertEqual(carry["minutes"], Decimal("120"))
+        self.assertEqual(carry["overtime_minutes"], Decimal("120"))
+        self.assertEqual(carry["target_date"], datetime.date(2025, 7, 1))
+
+    def test_consecutive_periods_keep_total_minutes(self):
+        """연속된 두 기간에 걸쳐 근로시간이 보존되는지 테스트"""
+        plain = TimeCardBasedCalculator({"company_settings": {"daily_work_minutes_standard": 480}})
+        expected = (plain.calculate(self.june)["time_summary"].total_net_work_hours
+                    + plain.calculate(self.july)["time_summary"].total_net_work_hours)
+
+        # 이월 파일을 먼저 준비하면 7월을 6월보다 먼저 계산해도 결과가 같아야 함
+        self.assertEqual(self.calculator.prepare_period_carry([self.june, self.july]), 1)
+        july = self.calculator.calculate(self.july)
+        june = self.calculator.calculate(self.june)
+
+        self.assertEqual(june["time_summary"].total_net_work_hours + july["time_summary"].total_net_work_hours,
+                         expected)
+        first_day = july["daily_details"][0]
+        self.assertEqual(first_day.date, datetime.date(2025, 7, 1))
+        self.assertEqual(first_day.actual_work_minutes, Decimal("390"))
+        self.assertEqual(first_day.overtime_hours, Decimal("2.00"))
+
+    def test_carried_minutes_skip_break_check(self):
+        """이월분만 있는 첫날과 이월분이 합쳐진 날에 휴게시간 부족 경고가 생기지 않는지 테스트"""
+        # 2025-05-31(토) 20:00 ~ 06-01 06:00, 휴게 60분 -> 자정 이후 360분 이월 (그날 계산된 야간 시간 없음)
+        may = TimeCardInputData(employee_id="EMP002", period="2025-05", records=[
+            TimeCardRecord(date=datetime.date(2025, 5, 31), start_time="20:00", end_time="06:00", break_time_minutes=60),
+        ])
+        june = TimeCardInputData(employee_id="EMP002", period="2025-06", records=[
+            TimeCardRecord(date=datetime.date(2025, 6, 2), start_time="09:00", end_time="13:00", break_time_minutes=0),
+        ])
+        self.calculator.prepare_period_carry([may])
+        carry = PeriodCarryStore(self.carry_dir).load("EMP002", "2025-06")
+        self.assertEqual(carry["minutes"], Decimal("360"))
+        self.assertEqual(carry["night_minutes"], Decimal("0"))
+
+        result = self.calculator.calculate(june)
+        first_day = result["daily_details"][0]
+        self.assertEqual(first_day.date, datetime.date(2025, 6, 1))
+        self.assertEqual(first_day.carried_in_minutes, Decimal("360"))
+        self.assertEqual(first_day.night_hours, Decimal("0.00"))
+        self.assertEqual(result["compliance_alerts"], [])
+
+        # 이월분이 기존 근무일에 합쳐져도 그날 근무(7시간, 휴게 30분)만으로 휴게시간을 판정
+        july_first = TimeCardInputData(employee_id="EMP001", period="2025-07", records=[
+            TimeCardRecord(date=datetime.date(2025, 7, 1), start_time="09:00", end_time="16:30", break_time_minutes=30),
+        ])
+        self.calculator.prepare_period_carry([self.june])
+        merged = self.calculator.calculate(july_first)
+        self.assertEqual(merged["daily_details"][0].actual_work_minutes, Decimal("540"))
+        self.assertEqual(merged["daily_details"][0].carried_in_minutes, Decimal("120"))
+        self.assertEqual(merged["compliance_alerts"], [])
+
+    def test_split_conserves_every_hour_field(self):
+        """분할 전후 두 기간의 시간 항목별 합계가 같은지 테스트 (야간 시간 포함)"""
+        plain = TimeCardBasedCalculator({"company_settings": {"daily_work_minutes_standard": 480}})
+        june = TimeCardInputData(employee_id="EMP003", period="2025-06", records=[
+            TimeCardRecord(date=datetime.date(2025, 6, 2), start_time="09:00", end_time="13:00", break_time_minutes=0),
+        ])
+        for start_time, end_time in (("20:00", "06:00"), ("22:00", "06:00"), ("14:00", "02:00")):
+            may = TimeCardInputData(employee_id="EMP003", period="2025-05", records=[
+                TimeCardRecord(date=datetime.date(2025, 5, 31), start_time=start_time, end_time=end_time,
+                               break_time_minutes=60),
+            ])
+            self.calculator.prepare_period_carry([may])
+            split = [self.calculator.calculate(may)["time_summary"], self.calculator.calculate(june)["time_summary"]]
+            unsplit = [plain.calculate(may)["time_summary"], plain.calculate(june)["time_summary"]]
+            for field in type(split[0]).model_fields:
+                self.assertEqual(sum(getattr(summary, field) for summary in split),
+                                 sum(getattr(summary, field) for summary in unsplit), (start_time, field))
+
+    def test_without_carry_dir_behavior_is_unchanged(self):
+        """이월 디렉토리 미설정 시 기존 동작 유지 테스트"""
+        plain = TimeCardBasedCalculator({"company_settings": {"daily_work_minutes_standard": 480}})
+        result = plain.calculate(self.june)
+        self.assertEqual(result["daily_details"][-1].actual_work_minutes, Decimal("660"))
+        self.assertEqual(os.listdir(self.carry_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# tests/test_policy_canonical.py
+"""
+정책 조합 정규화 및 중복 제거 테스트
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.policy_canonical import (
+    normalize_policy_set,
+    canonical_policy_hash,
+    plan_policy_dedupe,
+    policy_set_overrides,
+    schema_defaults
+)
+from Payslip.combination_runner import run_simulations_on_combinations
+
+
+class CountingSimulator:
+    """호출 횟수를 세는 테스트용 시뮬레이터"""
+
+    calls = []
+
+    def simulate(self, input_data, policy_set):
+        CountingSimulator.calls.append(policy_set.get("name"))
+        return {"total_hours": float(policy_set.get("policies.weekly_holiday.min_hours", 15))}
+
+
+class TestPolicyCanonical(unittest.TestCase):
+    """policy_canonical 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.defaults = schema_defaults({
+            "policies.weekly_holiday.min_hours": {"type": "number", "default": 15},
+            "policies.night_work.enabled": {"type": "boolean", "default": True},
+            "policies.memo": {"type": "string"},
+        })
+
+    def test_normalize_equivalent_forms(self):
+        """점 표기/중첩/기본값 명시/숫자 형식이 달라도 같은 정규형이 되는지 테스트"""
+        flat = {"name": "A", "policies.weekly_holiday.min_hours": 20.0, "policies.night_work.enabled": True}
+        nested = {"name": "B", "policies": {"weekly_holiday": {"min_hours": 20}}}
+        generated = {"name": "C", "policies": [{"name": "주휴", "config": {"policies.weekly_holiday": {"min_hours": 20}}}],
+                     "categories": ["주휴"]}
+
+        self.assertEqual(normalize_policy_set(flat, self.defaults), {"policies.weekly_holiday.min_hours": 20})
+        hashes = {canonical_policy_hash(p, self.defaults) for p in (flat, nested, generated)}
+        self.assertEqual(len(hashes), 1)
+        self.assertNotEqual(canonical_policy_hash(flat), canonical_policy_hash(nested))
+        self.assertEqual(normalize_policy_set({"policies.weekly_holiday.min_hours": 15}, self.defaults), {})
+
+    def test_dedupe_matches_applied_overrides(self):
+        """중복 제거가 시뮬레이터에 적용되는 덮어쓰기 값(뒤 옵션 우선)과 같은 기준으로 판정하는지 테스트"""
+        overlapping = {"name": "8h + 5h", "categories": {"a": "8h", "b": "5h"}, "description": "겹침",
+                       "policies": [{"name": "8h", "config": {"company_settings.daily_work_minutes_standard": 480}},
+                                    {"name": "5h", "config": {"company_settings": {"daily_work_minutes_standard": 300}}}]}
+        single = {"name": "5h", "policies": [{"name": "5h", "config": {"company_settings.daily_work_minutes_standard": 300.0}}]}
+
+        self.assertEqual(policy_set_overrides(overlapping), {"company_settings.daily_work_minutes_standard": 300})
+        self.assertEqual(normalize_policy_set(overlapping), normalize_policy_set(single))
+        plan = plan_policy_dedupe([overlapping, single])
+        self.assertEqual(plan.unique_indices, [0])
+
+    def test_dedupe_plan(self):
+        """중복 제거 계획과 결과 분배 테스트"""
+        policy_sets = [
+            {"name": "기본"},
+            {"name": "기본_명시", "policies.weekly_holiday.min_hours": 15},
+            {"name": "완화", "policies.weekly_holiday.min_hours": 10},
+            {"name": "완화_중첩", "policies": {"weekly_holiday": {"min_hours": 10}}},
+        ]
+        plan = plan_policy_dedupe(policy_sets, self.defaults)
+        self.assertEqual(plan.unique_indices, [0, 2])
+        self.assertEqual(plan.aliases(policy_sets), {"기본": ["기본_명시"], "완화": ["완화_중첩"]})
+        self.assertEqual(plan.fan_out(["r0", "r2"]), ["r0", "r0", "r2", "r2"])
+
+    def test_run_simulations_fans_out_aliases(self):
+        """조합 실행 시 같은 정책은 한 번만 시뮬레이션되고 모든 별칭에 결과가 분배되는지 테스트"""
+        CountingSimulator.calls = []
+        policy_sets = [
+            {"name": "기본"},
+            {"name": "완화", "policies.weekly_holiday.min_hours": 10},
+            {"name": "기본_명시", "policies.weekly_holiday.min_hours": 15.0},
+        ]
+        results = run_simulations_on_combinations({"id": "t"}, policy_sets, backend="inline",
+                                                  simulator_factory=CountingSimulator,
+                                                  policy_defaults=self.defaults)
+
+        self.assertEqual(CountingSimulator.calls, ["기본", "완화"])
+        self.assertEqual([item["policy_set"]["name"] for item in results["results"]], ["기본", "완화", "기본_명시"])
+        self.assertEqual(results["results"][2]["result"], results["results"][0]["result"])
+        self.assertEqual(results["metadata"]["unique_combinations"], 2)
+        self.assertEqual(results["metadata"]["policy_aliases"], {"기본": ["기본_명시"]})
+
+        CountingSimulator.calls = []
+        run_simulations_on_combinations({"id": "t"}, policy_sets, backend="inline",
+                                        simulator_factory=CountingSimulator, dedupe=False)
+        self.assertEqual(len(CountingSimulator.calls), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# tests/test_policy_conditions.py
+"""
+정책 적용 조건 컴파일(policy_conditions) 테스트
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.policy_conditions import (
+    compile_condition,
+    applicable_policy_matrix,
+    employee_attribute_frame,
+    ConditionError
+)
+
+
+class TestPolicyConditions(unittest.TestCase):
+    """policy_conditions 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        rng = np.random.default_rng(0)
+        self.employees = pd.DataFrame({
+            "employee_id": [f"EMP{i:05d}" for i in range(10000)],
+            "company_size": rng.integers(1, 50, 10000),
+            "weekly_hours": rng.integers(5, 52, 10000),
+            "employment_type": rng.choice(["regular", "part_time", "contract"], 10000),
+        })
+        self.expressions = [
+            "true",
+            "num_employees >= 5",
+            "weekly_hours < 15 and employment_type == 'part_time'",
+            "not (company_size < 5 or weekly_hours >= 40)",
+            "employment_type in ['regular', 'contract'] and 10 <= weekly_hours < 40",
+            "weekly_hours * 4 > 100",
+        ]
+
+    def test_vectorized_matches_scalar(self):
+        """벡터화 평가가 직원별 스칼라 평가와 일치하는지 테스트"""
+        records = self.employees.head(500).to_dict("records")
+        for expression in self.expressions:
+            condition = compile_condition(expression)
+            mask = condition.evaluate_frame(self.employees)
+            self.assertEqual(mask.shape, (10000,))
+            self.assertEqual(mask.dtype, bool)
+            expected = [condition(record) for record in records]
+            self.assertEqual(mask[:500].tolist(), expected, expression)
+
+    def test_unsafe_expressions_rejected(self):
+        """허용되지 않은 구문과 구문 오류 테스트"""
+        for expression in ("__import__('os').system('ls')", "employee.salary > 0", "weekly_hours[0] > 1",
+                           "(lambda: 1)()", "weekly_hours <"):
+            with self.assertRaises(ConditionError, msg=expression):
+                compile_condition(expression)
+        with self.assertRaises(ConditionError):
+            compile_condition("unknown_field > 1").evaluate({"weekly_hours": 10})
+        self.assertIs(compile_condition("num_employees >= 5"), compile_condition("num_employees >= 5"))
+        self.assertEqual(compile_condition("weekly_hours < 15 and num_employees >= 5").names,
+                         frozenset({"weekly_hours", "num_employees"}))
+
+    def test_applicable_policy_matrix(self):
+        """정책 적용 행렬 테스트"""
+        conditions = {
+            "policies.weekly_holiday.min_hours": "true",
+            "policies.overtime.premium": "num_employees >= 5",
+            "policies.overtime.small_business": "num_employees < 5",
+            "policies.part_time.severance_pay_eligibility": "weekly_hours < 15",
+            "policies.night_work.enabled": None,
+        }
+        matrix = applicable_policy_matrix(conditions, self.employees)
+        self.assertEqual(list(matrix.columns), list(conditions))
+        self.assertEqual(len(matrix), 10000)
+        self.assertTrue(matrix["policies.weekly_holiday.min_hours"].all())
+        self.assertTrue(matrix["policies.night_work.enabled"].all())
+        self.assertTrue((matrix["policies.overtime.premium"] ^ matrix["policies.overtime.small_business"]).all())
+        np.testing.assert_array_equal(matrix["policies.part_time.severance_pay_eligibility"].to_numpy(),
+                                      (self.employees["weekly_hours"] < 15).to_numpy())
+
+        class Input:
+            employee_id = "EMP001"
+            custom_fields = {"company_size": 3, "weekly_hours": 12, "metadata": {"team": "A"}}
+        frame = employee_attribute_frame([Input()])
+        self.assertEqual(list(frame.columns), ["employee_id", "company_size", "weekly_hours"])
+        self.assertFalse(applicable_policy_matrix(conditions, frame).loc[0, "policies.overtime.premium"])
+
+
+if __name__ == '__main__':
+    unittest.main()
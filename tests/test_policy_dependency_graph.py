@@ -0,0 +1,93 @@
+# tests/test_policy_dependency_graph.py
+"""
+정책 의존성 그래프 및 증분 재계산(policy_dependency_graph) 테스트
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.policy_manager import PolicyManager
+from Payslip.policy_dependency_graph import PolicyDependencyGraph, IncrementalRecomputer
+
+
+class TestPolicyDependencyGraph(unittest.TestCase):
+    """PolicyDependencyGraph/IncrementalRecomputer 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.dependencies = {
+            "policies.overtime.premium": {"depends_on": ["company_settings.weekly_work_minutes_standard"],
+                                          "affects": ["연장 근로수당"]},
+            "policies.annual_leave.days": {"depends_on": [], "affects": ["연차유급휴가"]},
+        }
+        self.graph = PolicyDependencyGraph(self.dependencies)
+        self.calls = []
+
+    def _stage(self, name, key=None):
+        def function(policy_manager, upstream):
+            self.calls.append(name)
+            value = policy_manager.get(key) if key else None
+            return {"value": value, "upstream": {k: v and v["value"] for k, v in upstream.items()}}
+        return function
+
+    def test_stage_order_and_affected_stages(self):
+        """위상 순서와 정책 키별 하위 단계 테스트"""
+        order = self.graph.stage_order
+        self.assertLess(order.index("worktime"), order.index("time_summary"))
+        self.assertLess(order.index("time_summary"), order.index("pay"))
+        self.assertLess(order.index("weekly_holiday"), order.index("pay"))
+
+        self.assertEqual(self.graph.affected_stages(["policies.weekly_holiday.min_hours"]), ["weekly_holiday", "pay"])
+        self.assertEqual(self.graph.affected_stages(["policies.overtime.premium"]), ["pay"])
+        self.assertEqual(self.graph.affected_stages(["calculation_mode.simple_mode_options.overtime_multiplier"]), ["pay"])
+        self.assertEqual(set(self.graph.affected_stages(["company_settings.weekly_work_minutes_standard"])),
+                         set(order))
+        # 그래프에 없는 키는 안전하게 전체 재계산
+        self.assertEqual(self.graph.affected_stages(["policies.unknown"]), order)
+        self.assertEqual(self.graph.affected_stages([]), [])
+
+    def test_cycle_detection(self):
+        """정책/단계 의존성 순환 검출 테스트"""
+        with self.assertRaises(ValueError):
+            PolicyDependencyGraph({"a": {"depends_on": ["b"]}, "b": {"depends_on": ["a"]}})
+        with self.assertRaises(ValueError):
+            PolicyDependencyGraph(stages={"x": {"upstream": ["y"]}, "y": {"upstream": ["x"]}})
+        with self.assertRaises(ValueError):
+            PolicyDependencyGraph(stages={"x": {"upstream": ["missing"]}})
+
+    def test_incremental_recompute_trace(self):
+        """바뀐 정책 키의 하위 단계만 재계산하고 나머지는 재사용하는지 테스트"""
+        recomputer = IncrementalRecomputer(self.graph, {
+            "worktime": self._stage("worktime", "company_settings.daily_work_minutes_standard"),
+            "time_summary": self._stage("time_summary"),
+            "weekly_holiday": self._stage("weekly_holiday", "policies.weekly_holiday.min_hours"),
+            "pay": self._stage("pay", "calculation_mode.simple_mode_options.overtime_multiplier"),
+        })
+        base = PolicyManager().freeze()
+        first = recomputer.run(base.overlay({"policies.weekly_holiday.min_hours": 15}))
+        self.assertEqual(sorted(first["recomputed"]), ["pay", "time_summary", "weekly_holiday", "worktime"])
+        self.assertTrue(all(item["reason"] == "initial" for item in first["trace"]))
+
+        self.calls.clear()
+        second = recomputer.run(base.overlay({"policies.weekly_holiday.min_hours": 12}))
+        self.assertEqual(self.calls, ["weekly_holiday", "pay"])
+        self.assertEqual(sorted(second["reused"]), ["time_summary", "worktime"])
+        trace = {item["stage"]: item for item in second["trace"]}
+        self.assertEqual(trace["weekly_holiday"]["reason"], "policy_changed")
+        self.assertEqual(trace["weekly_holiday"]["changed_keys"], ["policies.weekly_holiday"])
+        self.assertEqual(trace["pay"]["reason"], "upstream_recomputed")
+        self.assertEqual(second["results"]["weekly_holiday"]["value"], 12)
+
+        self.calls.clear()
+        third = recomputer.run(base.overlay({"policies.weekly_holiday.min_hours": 12}))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(third["reused"]), 4)
+
+        third = recomputer.run(base.overlay({"policies.weekly_holiday.min_hours": 12}), changed_keys=["policies.memo"])
+        self.assertEqual(len(third["recomputed"]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# tests/test_policy_impact_batch.py
+"""
+정책 영향도 일괄 분석(policy_impact_batch) 테스트
+"""
+
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.policy_impact_batch import analyze_impact_batch, percentage_diff, impact_levels
+from Payslip.policy_impact_analyzer import PolicyImpactAnalyzer
+
+
+def _result(regular=160.0, overtime=10.0, night=0.0, warnings=(), policies=()):
+    summary = SimpleNamespace(regular_hours=regular, overtime_hours=overtime, night_hours=night, holiday_hours=0.0,
+                              total_net_work_hours=regular + overtime)
+    return SimpleNamespace(
+        time_summary=summary,
+        warnings=[{"message": message, "severity": "warning"} for message in warnings],
+        trace=[{"type": "policy_applied", "policy_key": key, "value": value} for key, value in policies],
+    )
+
+
+class TestPolicyImpactBatch(unittest.TestCase):
+    """policy_impact_batch 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.base = {"result": _result(warnings=["주 52시간 초과"], policies=[("a", 1), ("b", 2)])}
+
+    def test_levels_and_percentage(self):
+        """백분율 차이와 영향도 수준 구간 테스트"""
+        percentage = percentage_diff(np.array([0.0, 0.0, 100.0, 100.0, 100.0, 100.0]),
+                                     np.array([5.0, -5.0, 125.0, 89.0, 95.0, 100.0]))
+        np.testing.assert_allclose(percentage, [100.0, 0.0, 25.0, -11.0, -5.0, 0.0])
+        levels, scores = impact_levels(np.append(percentage, np.nan))
+        self.assertEqual(list(levels), ['high', 'none', 'high', 'medium', 'low', 'none', None])
+        np.testing.assert_array_equal(scores[:6], [100, 0, 100, 60, 30, 0])
+        self.assertTrue(np.isnan(scores[6]))
+
+    def test_scores_match_scalar_rules(self):
+        """일괄 점수가 analyze_impact의 항목별 점수 규칙과 같은지 테스트"""
+        comparisons = {
+            "same": {"result": _result(warnings=["주 52시간 초과"], policies=[("a", 1), ("b", 2)])},
+            "more_overtime": {"result": _result(overtime=13.0, warnings=["주 52시간 초과", "야간 근로"],
+                                                policies=[("a", 1), ("b", 3), ("c", 1)]),
+                              "description": "연장근로 증가"},
+            "resolved": {"result": _result(regular=150.0, overtime=0.0, policies=[("a", 1)])},
+            "no_result": {"result": None},
+        }
+        frame = analyze_impact_batch(self.base, comparisons)
+        self.assertEqual(set(frame.index), {"same", "more_overtime", "resolved"})
+        self.assertEqual(list(frame["rank"]), [1, 2, 3])
+        self.assertTrue(frame["overall_impact_score"].is_monotonic_decreasing)
+
+        same = frame.loc["same"]
+        self.assertEqual(same["overall_impact_score"], 0.5 * 0 + 0.3 * 50 + 0.2 * 0)
+        self.assertTrue(np.isnan(same["total_hours_percentage_diff"]))
+
+        more = frame.loc["more_overtime"]
+        # overtime +30% (high), total +1.76% (low): (100*0.2 + 30*0.4) / 1.0
+        self.assertAlmostEqual(more["time_impact_score"], 32.0)
+        self.assertEqual(more["overtime_hours_impact_level"], "high")
+        # 경고 증가(70) + 새 경고 1/2 * 30
+        self.assertAlmostEqual(more["compliance_impact_score"], 85.0)
+        self.assertEqual(more["compliance_delta"], 1)
+        self.assertEqual((more["new_policies"], more["modified_policies"], more["unchanged_policies"]), (1, 1, 1))
+        self.assertAlmostEqual(more["policy_application_impact_score"], 200 / 3)
+        self.assertAlmostEqual(more["overall_impact_score"], 0.5 * 32 + 0.3 * 85 + 0.2 * 200 / 3)
+
+        resolved = frame.loc["resolved"]
+        # 경고 감소(30) - 해결 1/1 * 30
+        self.assertEqual(resolved["compliance_impact_score"], 0.0)
+        self.assertEqual(resolved["removed_policies"], 1)
+
+    def test_large_batch(self):
+        """수백 개 비교 결과 일괄 분석 테스트"""
+        rng = np.random.default_rng(0)
+        comparisons = {
+            f"policy_{i}": {"result": _result(regular=float(rng.integers(140, 180)), overtime=float(rng.integers(0, 20)),
+                                              warnings=["주 52시간 초과"] * int(rng.integers(0, 2)),
+                                              policies=[("a", int(rng.integers(0, 2))), ("b", 2)])}
+            for i in range(500)
+        }
+        frame = analyze_impact_batch(self.base, comparisons)
+        self.assertEqual(len(frame), 500)
+        self.assertTrue(frame["overall_impact_score"].is_monotonic_decreasing)
+        self.assertTrue(frame["overall_impact_score"].between(0, 100).all())
+        self.assertEqual(frame["rank"].tolist(), list(range(1, 501)))
+
+
+    def test_analyzer_batch_matches_scalar_analysis(self):
+        """PolicyImpactAnalyzer의 일괄 분석 점수가 항목별 analyze_impact 점수와 같은지 테스트"""
+        rng = np.random.default_rng(1)
+        comparisons = {
+            f"policy_{i}": {"result": _result(regular=float(rng.integers(140, 180)), overtime=float(rng.integers(0, 20)),
+                                              night=float(rng.integers(0, 3)),
+                                              warnings=["주 52시간 초과", "야간 근로"][:int(rng.integers(0, 3))],
+                                              policies=[("a", int(rng.integers(0, 2))), ("b", 2)])}
+            for i in range(50)
+        }
+        analyzer = PolicyImpactAnalyzer()
+        scalar = analyzer.analyze_impact(self.base, comparisons)["overall_impact_score"]
+        frame = analyzer.analyze_impact_batch(self.base, comparisons)
+        self.assertEqual(set(frame.index), set(scalar))
+        for name, score in scalar.items():
+            self.assertAlmostEqual(frame.loc[name, "overall_impact_score"], score, msg=name)
+
+if __name__ == '__main__':
+    unittest.main()
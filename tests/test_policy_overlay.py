@@ -0,0 +1,76 @@
+# tests/test_policy_overlay.py
+"""
+PolicyOverlay(기반 정책 공유 오버레이) 테스트
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.policy_manager import PolicyManager, PolicyOverlay
+
+CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Config'))
+
+
+class TestPolicyOverlay(unittest.TestCase):
+    """PolicyOverlay 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.base = PolicyManager(
+            settings_path=os.path.join(CONFIG_DIR, "settings.yaml"),
+            minimum_wage_path=os.path.join(CONFIG_DIR, "minimum_wage.yaml"),
+            holidays_path=os.path.join(CONFIG_DIR, "holidays.yaml"),
+        )
+
+    def test_overlay_lookup_order(self):
+        """오버레이 우선 조회 및 하위 트리 병합 테스트"""
+        overlay = self.base.overlay({"policies.weekly_holiday.min_hours": 20})
+        self.assertEqual(overlay.get("policies.weekly_holiday.min_hours"), 20)
+        self.assertEqual(overlay.get("policies.weekly_holiday.allowance_hours"), 8)
+        self.assertEqual(overlay.get("policies.weekly_holiday"),
+                         {"min_hours": 20, "allowance_hours": 8, "include_first_week": False})
+        self.assertEqual(overlay.get_weekly_holiday_policy()["min_hours"], 20)
+        self.assertEqual(overlay.get("policies.unknown.key", "default"), "default")
+
+        # 기반은 변경되지 않음
+        self.assertEqual(self.base.get("policies.weekly_holiday.min_hours"), 15)
+        self.assertEqual(overlay.holidays, self.base.holidays)
+
+    def test_parent_key_override(self):
+        """상위 키를 통째로 덮어쓴 경우 하위 키 조회 테스트"""
+        overlay = self.base.overlay({"policies.tardiness_early_leave": {"deduction_unit": 10}})
+        self.assertEqual(overlay.get("policies.tardiness_early_leave.deduction_unit"), 10)
+        self.assertIsNone(overlay.get("policies.tardiness_early_leave.standard_start_time"))
+        self.assertEqual(overlay.settings["policies"]["tardiness_early_leave"], {"deduction_unit": 10})
+
+    def test_immutability(self):
+        """기반 고정 및 오버레이 수정 불가 테스트"""
+        overlay = self.base.overlay({"calculation_mode.simple_mode": False})
+        self.assertTrue(self.base.is_frozen)
+        with self.assertRaises(RuntimeError):
+            self.base.set("calculation_mode.simple_mode", False)
+        with self.assertRaises(RuntimeError):
+            overlay.set("calculation_mode.simple_mode", True)
+        with self.assertRaises(ValueError):
+            PolicyOverlay(PolicyManager(settings_path=os.path.join(CONFIG_DIR, "settings.yaml")), {})
+
+        extended = overlay.with_overrides({"company_settings.daily_work_minutes_standard": 420})
+        self.assertEqual(extended.get_daily_work_minutes_standard(), 420)
+        self.assertFalse(extended.get("calculation_mode.simple_mode"))
+        self.assertEqual(overlay.get_daily_work_minutes_standard(), 480)
+
+    def test_hashable_cache_key(self):
+        """동일한 덮어쓰기 값의 오버레이가 같은 캐시 키를 갖는지 테스트"""
+        a = self.base.overlay({"policies.weekly_holiday.min_hours": 20, "company_settings.weekly_holiday_days": ["Sunday"]})
+        b = self.base.overlay({"company_settings.weekly_holiday_days": ["Sunday"], "policies.weekly_holiday.min_hours": 20})
+        c = self.base.overlay({"policies.weekly_holiday.min_hours": 25})
+        cache = {a: "result"}
+        self.assertEqual(a, b)
+        self.assertEqual(cache[b], "result")
+        self.assertNotIn(c, cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/test_policy_snapshot.py
+"""
+평탄화된 정책 스냅샷(PolicySnapshot) 테스트
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.policy_manager import PolicyManager, PolicySnapshot
+
+CONFIG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Config'))
+
+
+def _walk(settings, key, default=None):
+    """점 표기 키로 설정 트리를 직접 탐색 (기존 get 동작)"""
+    value = settings
+    for k in key.split('.'):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return default
+    return value
+
+
+class TestPolicySnapshot(unittest.TestCase):
+    """PolicySnapshot 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.manager = PolicyManager(
+            settings_path=os.path.join(CONFIG_DIR, "settings.yaml"),
+            minimum_wage_path=os.path.join(CONFIG_DIR, "minimum_wage.yaml"),
+            holidays_path=os.path.join(CONFIG_DIR, "holidays.yaml"),
+        )
+
+    def test_flattened_index_matches_tree_walk(self):
+        """평탄화 인덱스 조회가 트리 탐색과 같은 값을 반환하는지 테스트"""
+        snapshot = self.manager.snapshot
+        self.assertIsInstance(snapshot, PolicySnapshot)
+        self.assertGreater(len(snapshot), 0)
+        for key in snapshot.values:
+            self.assertEqual(self.manager.get(key), _walk(self.manager.settings, key))
+        for key in ("policies.unknown", "company_settings.daily_work_minutes_standard.x", "policies..weekly_holiday"):
+            self.assertEqual(self.manager.get(key, "default"), _walk(self.manager.settings, key, "default"))
+        self.assertIs(self.manager.snapshot, snapshot)
+        with self.assertRaises(TypeError):
+            snapshot.values["policies"] = {}
+
+    def test_accessors_precomputed_and_invalidated_on_set(self):
+        """접근자 값이 스냅샷 속성으로 미리 계산되고 set 호출 시 무효화되는지 테스트"""
+        snapshot = self.manager.snapshot
+        self.assertEqual(self.manager.get_night_shift_times(), snapshot.night_shift_times)
+        self.assertEqual(self.manager.get_daily_work_minutes_standard(), snapshot.daily_work_minutes_standard)
+        self.assertEqual(self.manager.get_weekly_holiday_policy()["min_hours"], 15)
+
+        self.manager.set("company_settings.night_shift_start_time", "21:00")
+        self.manager.set("policies.weekly_holiday.min_hours", 12)
+        self.assertIsNot(self.manager.snapshot, snapshot)
+        self.assertEqual(self.manager.get_night_shift_times()[0], "21:00")
+        self.assertEqual(self.manager.get_weekly_holiday_policy()["min_hours"], 12)
+        self.assertEqual(self.manager.get("policies.weekly_holiday")["min_hours"], 12)
+
+        # 반환된 정책 딕셔너리를 수정해도 스냅샷은 변하지 않음
+        self.manager.get_weekly_holiday_policy()["min_hours"] = 99
+        self.assertEqual(self.manager.get_weekly_holiday_policy()["min_hours"], 12)
+
+    def test_overlay_snapshot_matches_overlay_lookup(self):
+        """오버레이 스냅샷이 오버레이 조회 규칙과 같은 값을 반환하는지 테스트"""
+        base = self.manager.freeze()
+        overlay = base.overlay({
+            "policies.weekly_holiday.min_hours": 20,
+            "policies.tardiness_early_leave": {"deduction_unit": 10},
+            "company_settings.night_shift_end_time": "05:00",
+            "policies.new_policy.enabled": True,
+        })
+        keys = set(base.snapshot.values) | set(overlay.snapshot.values) | {"policies.tardiness_early_leave.standard_start_time"}
+        for key in keys:
+            self.assertEqual(overlay.get(key, "missing"), overlay._resolve(key, "missing"), key)
+        self.assertEqual(overlay.get_night_shift_times(), ("22:00", "05:00"))
+        self.assertEqual(overlay.get_weekly_holiday_policy()["min_hours"], 20)
+        self.assertEqual(overlay.get_tardiness_early_leave_policy()["deduction_unit"], 10)
+        self.assertEqual(base.get_weekly_holiday_policy()["min_hours"], 15)
+
+        # 오버레이 스냅샷은 기반 인덱스를 복사하지 않고 덮어쓴 경로만 따로 보관
+        overlay_values = overlay.snapshot._values
+        self.assertIs(overlay_values._base_values, base.snapshot._values)
+        self.assertLess(len(overlay_values._overlay_values), len(base.snapshot))
+        self.assertNotIn("policies.tardiness_early_leave.standard_start_time", overlay.snapshot)
+        self.assertEqual(set(overlay.snapshot.values), {key for key in keys if key in overlay.snapshot})
+
+
+if __name__ == '__main__':
+    unittest.main()
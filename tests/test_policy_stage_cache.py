@@ -0,0 +1,133 @@
+# tests/test_policy_stage_cache.py
+"""
+정책 단계별 계산 캐시(PolicyStageCache) 테스트
+"""
+
+import unittest
+import datetime
+import threading
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.schema import TimeCardInputData, TimeCardRecord
+from Payslip.Worktime.calculator import TimeCardBasedCalculator
+from Payslip.policy_stage_cache import PolicyStageCache
+
+
+class TestPolicyStageCache(unittest.TestCase):
+    """PolicyStageCache 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        records = [
+            TimeCardRecord(date=datetime.date(2025, 5, day), start_time="09:00", end_time="19:00", break_time_minutes=60)
+            for day in range(5, 10)
+        ]
+        records.append(TimeCardRecord(date=datetime.date(2025, 5, 12), start_time="22:00", end_time="06:00",
+                                      break_time_minutes=60))
+        self.input_data = TimeCardInputData(employee_id="EMP001", period="2025-05", records=records)
+        self.company_settings = {"daily_work_minutes_standard": 480, "weekly_work_minutes_standard": 2400}
+
+    def _settings(self, company_overrides=None, policies=None):
+        return {"company_settings": dict(self.company_settings, **(company_overrides or {})),
+                "policies": policies or {}}
+
+    def test_results_match_uncached_calculation(self):
+        """캐시 사용 결과가 캐시 미사용 결과와 일치하는지 테스트"""
+        cache = PolicyStageCache()
+        for daily_minutes in (480, 420):
+            settings = self._settings({"daily_work_minutes_standard": daily_minutes})
+            expected = TimeCardBasedCalculator(settings).calculate(self.input_data)
+            for _ in range(2):
+                cached = TimeCardBasedCalculator(settings, stage_cache=cache).calculate(self.input_data)
+                self.assertEqual(cached["time_summary"], expected["time_summary"])
+                self.assertEqual(cached["daily_details"], expected["daily_details"])
+                self.assertEqual(cached["warnings"], expected["warnings"])
+                self.assertEqual(cached["compliance_alerts"], expected["compliance_alerts"])
+
+    def test_unrelated_policy_changes_reuse_daily_results(self):
+        """일별 계산이 읽지 않는 정책만 다른 조합은 결과를 재사용하는지 테스트"""
+        cache = PolicyStageCache()
+        for min_hours in (15, 20, 25):
+            settings = self._settings(policies={"weekly_holiday": {"min_hours": min_hours}})
+            TimeCardBasedCalculator(settings, stage_cache=cache).calculate(self.input_data)
+
+        stats = cache.stats()["daily"]
+        # 주간 패턴 1개 + 야간 패턴 1개만 계산
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 3 * 6 - 2)
+
+        TimeCardBasedCalculator(self._settings({"daily_work_minutes_standard": 420}), stage_cache=cache).calculate(self.input_data)
+        self.assertEqual(cache.stats()["daily"]["misses"], 4)
+
+    def test_night_policy_keys_only_affect_night_days(self):
+        """야간 정책 키가 야간 근무일 캐시 키에만 포함되는지 테스트"""
+        cache = PolicyStageCache()
+        for overlap_policy in ("separate", "merge"):
+            policies = {"work_classification": {"overlap_policy": overlap_policy}}
+            TimeCardBasedCalculator(self._settings(policies=policies), stage_cache=cache).calculate(self.input_data)
+
+        # 주간 패턴은 재사용, 야간 패턴만 정책 조합별로 재계산
+        self.assertEqual(cache.stats()["daily"]["misses"], 3)
+        self.assertIn("policies.work_classification.overlap_policy", cache.policy_keys_for("daily", is_night_day=True))
+        self.assertNotIn("policies.work_classification.overlap_policy", cache.policy_keys_for("daily"))
+
+    def test_lru_eviction(self):
+        """최대 항목 수 초과 시 오래된 항목 제거 테스트"""
+        cache = PolicyStageCache(max_entries=2)
+        for value in range(3):
+            cache.get_or_compute("weekly", value, {}, lambda: value)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_or_compute("weekly", 0, {}, lambda: "recomputed"), "recomputed")
+        self.assertEqual(cache.stats()["weekly"]["hits"], 0)
+
+
+    def test_concurrent_access_from_threads(self):
+        """여러 스레드가 같은 캐시를 공유해도 오류 없이 올바른 결과와 통계를 유지하는지 테스트"""
+        cache = PolicyStageCache(max_entries=4)
+
+        def worker(offset):
+            return [cache.get_or_compute("weekly", (offset + i) % 8, {}, lambda key=(offset + i) % 8: key * 2)
+                    == ((offset + i) % 8) * 2 for i in range(2000)]
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                outcomes = [ok for oks in executor.map(worker, range(8)) for ok in oks]
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertTrue(all(outcomes))
+        self.assertLessEqual(len(cache), 4)
+        stats = cache.stats()["weekly"]
+        self.assertEqual(stats["hits"] + stats["misses"], 8 * 2000)
+
+    def test_concurrent_compute_shares_first_stored_result(self):
+        """같은 키를 동시에 계산하면 잠금 밖에서 계산하되 먼저 저장된 결과를 공유하는지 테스트"""
+        cache = PolicyStageCache()
+        started, release = threading.Event(), threading.Event()
+        results = {}
+
+        def slow_compute():
+            started.set()
+            release.wait(timeout=5)
+            return "slow"
+
+        slow = threading.Thread(target=lambda: results.setdefault(
+            "slow", cache.get_or_compute("weekly", "key", {}, slow_compute)))
+        slow.start()
+        started.wait(timeout=5)
+        # 느린 계산이 진행 중이어도 캐시가 잠기지 않음
+        results["fast"] = cache.get_or_compute("weekly", "key", {}, lambda: "fast")
+        release.set()
+        slow.join(timeout=5)
+
+        self.assertEqual(results, {"fast": "fast", "slow": "fast"})
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()["weekly"]["misses"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
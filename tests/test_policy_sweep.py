@@ -0,0 +1,89 @@
+# tests/test_policy_sweep.py
+"""
+연속 정책 파라미터 스윕 테스트
+"""
+
+import unittest
+import datetime
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.schema import TimeCardInputData, TimeCardRecord
+from Payslip.Worktime.calculator import TimeCardBasedCalculator
+from Payslip.Worktime.period_calendar import PeriodCalendar
+from Payslip.Worktime.weekly_holiday import WeeklyHolidayAllowanceEngine
+from Payslip.policy_sweep import (
+    sweep_overtime_multiplier,
+    sweep_parameter,
+    daily_minutes_vector
+)
+
+
+class TestPolicySweep(unittest.TestCase):
+    """policy_sweep 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        records = []
+        # 주별로 근무일 수를 달리하여 주 근로시간이 서로 다르도록 구성 (2025-06-02 월요일 시작)
+        for week, days in enumerate([5, 3, 2, 4]):
+            for day in range(days):
+                date = datetime.date(2025, 6, 2) + datetime.timedelta(days=week * 7 + day)
+                records.append(TimeCardRecord(date=date, start_time="09:00", end_time="19:00", break_time_minutes=60))
+        self.input_data = TimeCardInputData(employee_id="EMP001", period="2025-06", records=records,
+                                            hire_date=datetime.date(2025, 6, 4))
+        self.result = TimeCardBasedCalculator({"company_settings": {"daily_work_minutes_standard": 480}}).calculate(self.input_data)
+        self.policies = {
+            "policies.weekly_holiday": {"min_hours": 15, "allowance_hours": 8, "include_first_week": True},
+            "company_settings.weekly_work_minutes_standard": 2400,
+            "calculation_mode.simple_mode_options": {"overtime_multiplier": 1.5, "apply_night_premium": True},
+        }
+
+    def _get_policy(self, key, default=None):
+        return self.policies.get(key, default)
+
+    def test_overtime_multiplier_sweep_matches_pointwise(self):
+        """연장근로 배수 스윕이 값별 계산과 일치하는지 테스트"""
+        values = np.linspace(1.0, 3.0, 1000)
+        frame = sweep_parameter(self.result, "calculation_mode.simple_mode_options.overtime_multiplier", values,
+                                self.input_data, self._get_policy, hourly_wage=10030)
+        self.assertEqual(len(frame), 1000)
+
+        summary = self.result["time_summary"]
+        for multiplier in (1.0, 1.5, 2.0):
+            expected_overtime = np.floor(float(summary.overtime_hours) * 10030 * multiplier)
+            row = sweep_overtime_multiplier(summary, [multiplier], 10030).iloc[0]
+            self.assertEqual(row["overtime_pay"], expected_overtime)
+            self.assertEqual(row["total_pay"], np.floor(float(summary.regular_hours) * 10030) + expected_overtime)
+        self.assertTrue(np.all(np.diff(frame["total_pay"].to_numpy()) >= 0))
+
+    def test_min_hours_sweep_matches_engine(self):
+        """min_hours 스윕이 주휴수당 엔진의 값별 계산과 일치하는지 테스트"""
+        values = np.arange(0, 50.5, 0.5)
+        frame = sweep_parameter(self.result, "policies.weekly_holiday.min_hours", values,
+                                self.input_data, self._get_policy, hourly_wage=10000)
+
+        calendar = PeriodCalendar("2025-06")
+        minutes = daily_minutes_vector(self.result["daily_details"], calendar)
+        for min_hours in values:
+            engine = WeeklyHolidayAllowanceEngine(dict(self.policies["policies.weekly_holiday"], min_hours=min_hours))
+            weekly = engine.calculate(calendar, ["EMP001"], minutes, hire_dates=[self.input_data.hire_date])
+            self.assertEqual(frame.loc[min_hours, "eligible_weeks"], int(weekly["eligible"].sum()), min_hours)
+            self.assertAlmostEqual(frame.loc[min_hours, "allowance_hours"], weekly["allowance_hours"].sum(), places=6)
+        self.assertEqual(frame.loc[15.0, "allowance_pay"], np.floor(frame.loc[15.0, "allowance_hours"] * 10000))
+
+    def test_unsupported_parameter(self):
+        """지원하지 않는 파라미터 및 시급 누락 오류 테스트"""
+        with self.assertRaises(ValueError):
+            sweep_parameter(self.result, "company_settings.daily_work_minutes_standard", [480], self.input_data,
+                            self._get_policy)
+        with self.assertRaises(ValueError):
+            sweep_parameter(self.result, "calculation_mode.simple_mode_options.overtime_multiplier", [1.5],
+                            self.input_data, self._get_policy)
+
+
+if __name__ == '__main__':
+    unittest.main()
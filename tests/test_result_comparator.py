@@ -0,0 +1,127 @@
+# tests/test_result_comparator.py
+"""
+N개 결과 비교(result_comparator) 테스트
+"""
+
+import unittest
+import datetime
+import tempfile
+import sys
+import os
+from decimal import Decimal
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.schema import WorkTimeCalculationResult, TimeSummary, WorkDayDetail
+from Payslip.result_comparator import compare_results_nway, nway_diff_table, nway_heatmap
+from Templates.compare_results import generate_diff_table, visualize_nway_diff, export_comparison_to_html
+
+
+def make_result(overtime, days):
+    details = [WorkDayDetail(date=datetime.date(2025, 5, day), regular_hours=Decimal("8"),
+                             overtime_hours=Decimal(str(overtime))) for day in days]
+    return WorkTimeCalculationResult(
+        period="2025-05", processing_mode="timecard",
+        time_summary=TimeSummary(regular_hours=Decimal(8 * len(days)), overtime_hours=Decimal(str(overtime * len(days))),
+                                 total_net_work_hours=Decimal(str((8 + overtime) * len(days)))),
+        daily_calculation_details=details
+    )
+
+
+class TestResultComparator(unittest.TestCase):
+    """compare_results_nway 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.results = {
+            "기본": make_result(0, [1, 2]),
+            "연장": make_result(1.5, [1, 2]),
+            "추가근무": make_result(2, [1, 2, 3]),
+        }
+
+    def test_pairwise_tensor_matches_pairwise_diff(self):
+        """모든 쌍 차이 텐서가 두 결과씩 계산한 차이와 일치하는지 테스트"""
+        comparison = compare_results_nway(self.results)
+        names, metrics = comparison["names"], comparison["metrics"]
+        self.assertEqual(comparison["delta_tensor"].shape, (3, 3, len(metrics)))
+
+        for i, name_a in enumerate(names):
+            for j, name_b in enumerate(names):
+                for m, metric in enumerate(metrics):
+                    expected = float(getattr(self.results[name_b].time_summary, metric)
+                                     - getattr(self.results[name_a].time_summary, metric))
+                    self.assertAlmostEqual(comparison["delta_tensor"][i, j, m], expected)
+        self.assertTrue(np.allclose(comparison["delta_tensor"], -comparison["delta_tensor"].transpose(1, 0, 2)))
+
+        overtime = metrics.index("overtime_hours")
+        self.assertEqual(comparison["percent_tensor"][0, 1, overtime], np.inf)
+        self.assertEqual(comparison["percent_tensor"][0, 0, overtime], 0.0)
+
+        daily = comparison["daily"]
+        self.assertEqual(daily["dates"], ["2025-05-01", "2025-05-02", "2025-05-03"])
+        # 기본 결과에는 5월 3일 상세가 없으므로 추가근무 결과의 정규시간 8시간이 그대로 차이
+        self.assertEqual(daily["delta_tensor"][0, 2, 2, 0], 8.0)
+
+    def test_baseline_mode_and_table(self):
+        """기준 결과 대비 비교 및 차이 테이블 테스트"""
+        comparison = compare_results_nway(self.results, baseline="연장", include_daily=False)
+        self.assertEqual(comparison["delta_tensor"].shape, (3, len(comparison["metrics"])))
+        self.assertNotIn("daily", comparison)
+        pairwise = compare_results_nway(self.results)
+        self.assertTrue(np.allclose(comparison["delta_tensor"], pairwise["delta_tensor"][1]))
+
+        table = nway_diff_table(comparison)
+        self.assertEqual(len(table), 2 * len(comparison["metrics"]))
+        self.assertEqual(set(table["기준 정책"]), {"연장"})
+        row = table[(table["비교 정책"] == "기본") & (table["지표"] == "연장 근무시간")].iloc[0]
+        self.assertEqual(row["차이"], "-3.0 시간")
+        self.assertEqual(row["중요 차이"], "예")
+
+        with self.assertRaises(ValueError):
+            compare_results_nway(self.results, baseline="없음")
+
+    def test_heatmap(self):
+        """히트맵 데이터 형식 테스트"""
+        heatmap = nway_heatmap(compare_results_nway(self.results))
+        overtime = heatmap["heatmaps"]["overtime_hours"]
+        self.assertEqual(overtime["policy_sets"], ["기본", "연장", "추가근무"])
+        self.assertEqual(overtime["min_value"], -6.0)
+        self.assertEqual(overtime["max_value"], 6.0)
+        self.assertEqual(overtime["normalized_values"][0][0], 0.5)
+
+
+
+class TestCompareResultsTemplate(unittest.TestCase):
+    """Templates.compare_results의 N개 비교 연동 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.results = {
+            "기본": make_result(0, [1, 2]),
+            "연장": make_result(1.5, [1, 2]),
+        }
+
+    def test_generate_diff_table_from_nway_comparison(self):
+        """generate_diff_table이 N개 비교 결과를 차이 테이블로 변환하는지 테스트"""
+        comparison = compare_results_nway(self.results, baseline="기본")
+        table = generate_diff_table(comparison)
+        self.assertTrue(table.equals(nway_diff_table(comparison)))
+        row = table[table["지표"] == "연장 근무시간"].iloc[0]
+        self.assertEqual((row["기준 정책"], row["비교 정책"], row["차이"]), ("기본", "연장", "+3.0 시간"))
+
+        visualization = visualize_nway_diff(self.results)
+        self.assertEqual(len(visualization["diff_table"]), len(comparison["metrics"]))
+
+    def test_export_nway_comparison_to_html(self):
+        """N개 비교 결과를 HTML로 내보내는지 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "comparison.html")
+            self.assertTrue(export_comparison_to_html(compare_results_nway(self.results), output_path))
+            with open(output_path, "r", encoding="utf-8") as f:
+                html = f.read()
+        self.assertIn("<td>연장</td>", html)
+        self.assertIn("연장 근무시간", html)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# tests/test_scenario_loader.py
+"""
+확장된 정책 시나리오 로더(EnhancedScenarioLoader) 테스트
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.scenario_loader import EnhancedScenarioLoader, PolicySetInfo, COMPILED_SCENARIO_FIELDS
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'policy_scenarios.yaml')
+V2_SCENARIO_PATH = os.path.join(os.path.dirname(__file__), '..', 'Config', 'enhanced_policy_scenarios_v2.yaml')
+
+
+class TestEnhancedScenarioLoader(unittest.TestCase):
+    """EnhancedScenarioLoader 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_load_hits_compiled_cache(self):
+        """같은 파일을 두 번 로드하면 두 번째는 컴파일 캐시를 사용하고 같은 구조를 얻는지 테스트"""
+        first = EnhancedScenarioLoader(cache_dir=self.tmp.name)
+        first_summary = first.load_scenario_file(FIXTURE_PATH)
+        self.assertEqual(first.compiled_cache.stats, {"hits": 0, "misses": 1})
+
+        second = EnhancedScenarioLoader(cache_dir=self.tmp.name)
+        second_summary = second.load_scenario_file(FIXTURE_PATH)
+        self.assertEqual(second.compiled_cache.stats, {"hits": 1, "misses": 0})
+
+        self.assertEqual(first_summary, second_summary)
+        for name in COMPILED_SCENARIO_FIELDS:
+            self.assertEqual(getattr(first, name), getattr(second, name), name)
+        self.assertEqual(first_summary["input_data_count"], 3)
+        self.assertEqual(second.input_data["default"].records[1].end_time, "20:00")
+
+    def test_validation_of_extended_scenarios(self):
+        """확장 시나리오 파일이 검증을 통과하고 잘못된 참조는 검증 오류로 기록되는지 테스트"""
+        loader = EnhancedScenarioLoader(use_compiled_cache=False)
+        summary = loader.load_scenario_file(V2_SCENARIO_PATH)
+        self.assertEqual(summary["validation_errors_count"], 0)
+        self.assertEqual(summary["policy_schema_count"], 12)
+
+        loader.scenarios["basic_comparison"].policy_sets.append("missing_set")
+        loader._validate_loaded_data()
+        self.assertEqual([error.error_type for error in loader.validation_errors], ["scenario_unknown_policy_set"])
+
+
+    def test_dedupe_uses_simulator_base_values(self):
+        """스키마 기본값이 아니라 시뮬레이터 기반 정책 값으로 별칭을 판정하는지 테스트"""
+        loader = EnhancedScenarioLoader(use_compiled_cache=False)
+        loader.load_scenario_file(V2_SCENARIO_PATH)
+        # 스키마 기본값(simple_mode=False)과 달리 기반 정책은 simple_mode=True로 계산하므로
+        # simple_mode=False를 명시한 조합들은 서로 다른 정책 조합으로 시뮬레이션되어야 함
+        self.assertIs(loader.simulator.base_policy_manager.get("calculation_mode.simple_mode"), True)
+        self.assertEqual(loader.plan_policy_set_dedupe()["aliases"], {})
+
+        # 기반 정책 값(일 소정근로 480분)을 생략한 조합은 simple_mode 조합의 별칭
+        loader.policy_sets["simple_mode_short"] = PolicySetInfo(
+            name="단순 모드 (생략 표기)", description="기반 정책과 같은 값 생략",
+            policies={"calculation_mode.simple_mode": True}
+        )
+        plan = loader.plan_policy_set_dedupe(["simple_mode", "night_priority", "simple_mode_short"])
+        self.assertEqual(plan["aliases"], {"simple_mode": ["simple_mode_short"]})
+
+if __name__ == '__main__':
+    unittest.main()
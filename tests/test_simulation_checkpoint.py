@@ -0,0 +1,138 @@
+# tests/test_simulation_checkpoint.py
+"""
+정책 조합 시뮬레이션 체크포인트/재개 테스트
+"""
+
+import unittest
+import datetime
+import tempfile
+import sys
+import os
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.combination_runner import run_simulations_on_combinations
+from Payslip.simulation_checkpoint import SimulationCheckpoint, canonical_hash
+from Payslip.Worktime.schema import WorkDayDetail, ComplianceAlert
+
+
+class InterruptedRun(Exception):
+    """테스트용 실행 중단 예외"""
+
+
+class CountingSimulator:
+    """시뮬레이션된 조합 이름을 기록하는 테스트용 시뮬레이터"""
+
+    calls = []
+
+    def simulate(self, input_data, policy_set):
+        CountingSimulator.calls.append(policy_set["name"])
+        if policy_set.get("fail"):
+            raise ValueError("simulation failed")
+        total_hours = input_data["base_hours"] + policy_set["extra_hours"]
+        return {"time_summary": {"total_hours": total_hours, "total_pay": total_hours * 10000}}
+
+
+class TestSimulationCheckpoint(unittest.TestCase):
+    """SimulationCheckpoint 및 run_simulations_on_combinations 재개 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        CountingSimulator.calls = []
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.temp_dir.name, "checkpoint.jsonl")
+        self.input_data = {"id": "sample", "base_hours": 160}
+        self.combinations = [{"name": f"조합_{i}", "extra_hours": i} for i in range(12)]
+
+    def tearDown(self):
+        """각 테스트 실행 후 정리"""
+        self.temp_dir.cleanup()
+
+    def _run(self, combinations, progress_callback=None):
+        return run_simulations_on_combinations(self.input_data, combinations, backend="inline", chunk_size=4,
+                                               simulator_factory=CountingSimulator,
+                                               checkpoint_path=self.checkpoint_path,
+                                               progress_callback=progress_callback)
+
+    def test_resume_skips_completed_combinations(self):
+        """중단 후 재실행 시 완료된 조합을 건너뛰는지 테스트"""
+        def interrupt_after_first_chunk(progress):
+            if progress["completed"] >= 4:
+                raise InterruptedRun()
+
+        with self.assertRaises(InterruptedRun):
+            self._run(self.combinations, interrupt_after_first_chunk)
+        self.assertEqual(len(CountingSimulator.calls), 4)
+
+        CountingSimulator.calls = []
+        reports = []
+        results = self._run(self.combinations, reports.append)
+        self.assertEqual(CountingSimulator.calls, [f"조합_{i}" for i in range(4, 12)])
+        self.assertEqual(results["metadata"]["resumed_combinations"], 4)
+        self.assertEqual([item["result"]["time_summary"]["total_hours"] for item in results["results"]],
+                         [160 + i for i in range(12)])
+        self.assertEqual([(r["completed"], r["total"]) for r in reports], [(8, 12), (12, 12)])
+        self.assertGreater(reports[-1]["throughput"], 0)
+
+    def test_errors_are_retried_and_inputs_are_isolated(self):
+        """오류 조합은 기록되지 않고, 다른 입력 데이터의 기록은 사용하지 않는지 테스트"""
+        combinations = self.combinations[:3] + [{"name": "실패", "fail": True, "extra_hours": 0}]
+        self._run(combinations)
+        CountingSimulator.calls = []
+        self._run(combinations)
+        self.assertEqual(CountingSimulator.calls, ["실패"])
+
+        CountingSimulator.calls = []
+        self.input_data = {"id": "other", "base_hours": 150}
+        results = self._run(combinations)
+        self.assertEqual(len(CountingSimulator.calls), 4)
+        self.assertEqual(results["results"][0]["result"]["time_summary"]["total_hours"], 150)
+
+    def test_canonical_hash_and_truncated_lines(self):
+        """정규화 해시 및 잘린 마지막 줄 무시 테스트"""
+        self.assertEqual(canonical_hash({"a": 1, "b": [1, 2]}), canonical_hash({"b": [1, 2], "a": 1}))
+        self.assertNotEqual(canonical_hash({"a": 1}), canonical_hash({"a": 2}))
+
+        checkpoint = SimulationCheckpoint(self.checkpoint_path, self.input_data)
+        checkpoint.append([("hash-1", {"time_summary": {"total_hours": 1}})])
+        with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+            f.write('{"input_hash": "trunc')
+        self.assertEqual(list(checkpoint.load()), ["hash-1"])
+        checkpoint.append([("hash-2", {"time_summary": {"total_hours": 2}})])
+        self.assertEqual(list(checkpoint.load()), ["hash-1", "hash-2"])
+
+
+    def test_restores_original_types(self):
+        """Decimal/날짜/집합/pydantic 모델 결과가 원래 형식으로 복원되는지 테스트"""
+        result = {
+            "time_summary": {"total_hours": 8.5, "regular_hours": Decimal("8.00")},
+            "daily_details": [WorkDayDetail(date=datetime.date(2025, 5, 12), regular_hours=Decimal("8.00"),
+                                            actual_work_minutes=Decimal("480"))],
+            "compliance_alerts": [ComplianceAlert(alert_code="EXCESSIVE_WEEKLY_WORK", message="초과",
+                                                  severity="error", details={"week": 20})],
+            "period_start": datetime.date(2025, 5, 1),
+            "policy_keys": {"a", "b"},
+        }
+        checkpoint = SimulationCheckpoint(self.checkpoint_path, self.input_data)
+        checkpoint.append([("hash-1", result)])
+        restored = checkpoint.load()["hash-1"]
+        self.assertEqual(restored, result)
+        self.assertIsInstance(restored["daily_details"][0], WorkDayDetail)
+        self.assertIsInstance(restored["time_summary"]["regular_hours"], Decimal)
+
+    def test_policy_version_isolates_runs(self):
+        """기반 정책 버전이 바뀌면 이전 기록을 재사용하지 않는지 테스트"""
+        def run(version):
+            return run_simulations_on_combinations(self.input_data, self.combinations[:3], backend="inline",
+                                                   simulator_factory=CountingSimulator,
+                                                   checkpoint_path=self.checkpoint_path, policy_version=version)
+        run("v1")
+        CountingSimulator.calls = []
+        run("v1")
+        self.assertEqual(CountingSimulator.calls, [])
+        run("v2")
+        self.assertEqual(len(CountingSimulator.calls), 3)
+        self.assertEqual(len(SimulationCheckpoint(self.checkpoint_path, self.input_data, "v1").load()), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# tests/test_simulation_result_cache.py
+"""
+시뮬레이션 결과 LRU 캐시(SimulationResultCache) 테스트
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.simulation_result_cache import SimulationResultCache
+
+
+def entry(value, size=10):
+    return {"result": value, "policy_set": {"value": value}, "timestamp": "2025-05-01T00:00:00", "size": size}
+
+
+class TestSimulationResultCache(unittest.TestCase):
+    """SimulationResultCache 테스트 케이스"""
+
+    def test_entry_limit_evicts_least_recently_used(self):
+        """항목 수 한도 초과 시 LRU 제거 테스트"""
+        cache = SimulationResultCache(max_entries=2, max_bytes=None)
+        cache.put("input", "p1", "조합_1", entry(1))
+        cache.put("input", "p2", "조합_2", entry(2))
+        self.assertEqual(cache.get("input", "p1")["result"], 1)  # p1을 최근 사용으로 표시
+        cache.put("input", "p3", "조합_3", entry(3))
+
+        self.assertIn(("input", "p1"), cache)
+        self.assertNotIn(("input", "p2"), cache)
+        self.assertIsNone(cache.find_by_names("조합_2"))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["evictions"], stats["hits"]), (2, 1, 1))
+
+    def test_byte_limit(self):
+        """바이트 한도 초과 시 제거 및 크기 통계 테스트"""
+        cache = SimulationResultCache(max_entries=None, max_bytes=25, size_estimator=lambda e: e["size"])
+        for i in range(3):
+            cache.put("input", f"p{i}", f"조합_{i}", entry(i))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["bytes"], 20)
+        self.assertEqual(cache.stats()["evicted_bytes"], 10)
+
+        cache.put("input", "huge", "거대", entry("huge", size=100))
+        self.assertNotIn(("input", "huge"), cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_find_by_names_uses_same_input(self):
+        """이름 색인 조회가 같은 입력의 결과 쌍을 반환하는지 테스트"""
+        cache = SimulationResultCache()
+        cache.put("emp1", "pa", "A", entry("emp1-A"))
+        cache.put("emp1", "pb", "B", entry("emp1-B"))
+        cache.put("emp2", "pa", "A", entry("emp2-A"))
+        cache.put("emp3", "pb", "B", entry("emp3-B"))
+
+        pair = cache.find_by_names("A", "B")
+        self.assertEqual([item["result"] for item in pair], ["emp1-A", "emp1-B"])
+
+        cache.put("emp2", "pb", "B", entry("emp2-B"))
+        pair = cache.find_by_names("A", "B")
+        self.assertEqual([item["result"] for item in pair], ["emp2-A", "emp2-B"])
+        self.assertIsNone(cache.find_by_names("A", "C"))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.find_by_names("A"))
+
+
+    def test_alias_names_share_entry(self):
+        """같은 항목에 여러 이름을 등록하고 제거 시 모든 이름이 해제되는지 테스트"""
+        cache = SimulationResultCache(max_entries=2, max_bytes=None)
+        cache.put("emp1", "pa", "A", entry("A"))
+        cache.put("emp1", "pb", "B", entry("B"))
+        self.assertTrue(cache.add_alias("emp1", "pa", "A2"))
+        self.assertFalse(cache.add_alias("emp1", "missing", "X"))
+        self.assertEqual([item["result"] for item in cache.find_by_names("A2", "B", "A")], ["A", "B", "A"])
+
+        # 다시 저장해도 별칭 유지, 이름을 다른 항목으로 옮기면 이전 항목에서 해제
+        cache.put("emp1", "pa", "A", entry("A'"))
+        self.assertEqual(cache.find_by_names("A2")[0]["result"], "A'")
+        cache.add_alias("emp1", "pb", "A2")
+        self.assertEqual(cache.find_by_names("A2")[0]["result"], "B")
+
+        cache.put("emp1", "pc", "C", entry("C"))  # pa 제거
+        self.assertIsNone(cache.find_by_names("A"))
+        self.assertEqual(cache.find_by_names("A2")[0]["result"], "B")
+
+    def test_simulator_registers_name_on_cache_hit(self):
+        """캐시 적중으로 얻은 결과도 요청한 이름으로 비교할 수 있는지 테스트"""
+        from Payslip.policy_simulator import PolicySimulator
+        from Payslip.Worktime.schema import TimeCardInputData
+        input_data = TimeCardInputData(employee_id="EMP001", period="2025-05", records=[
+            {"date": "2025-05-12", "start_time": "09:00", "end_time": "20:00", "break_time_minutes": 60}])
+        simulator = PolicySimulator()
+        policy_set = {"company_settings.daily_work_minutes_standard": 480}
+        simulator.simulate_across_policies(input_data, [policy_set], ["기본"])
+        results = simulator.simulate_across_policies(input_data, [policy_set], ["기본_복사"])
+        self.assertIs(results["기본_복사"], simulator.results_cache.find_by_names("기본")[0])
+
+        comparison = simulator.compare_results("기본", "기본_복사")
+        self.assertFalse(comparison["processing_mode_diff"])
+        self.assertIn("summary", comparison)
+        self.assertEqual(simulator.results_cache.stats()["entries"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# tests/test_simulation_result_store.py
+"""
+시뮬레이션 결과 컬럼형 저장소 테스트
+"""
+
+import unittest
+import tempfile
+import datetime
+import sys
+import os
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.schema import (
+    WorkTimeCalculationResult, TimeSummary, WorkDayDetail, ComplianceAlert, ErrorDetails
+)
+from Payslip.simulation_result_store import (
+    save_results_columnar,
+    load_results_table,
+    load_results_columnar,
+    is_columnar_store
+)
+
+
+def make_result(extra_hours, with_alert=False, error=False):
+    details = [
+        WorkDayDetail(date=datetime.date(2025, 5, day), regular_hours=Decimal("8"),
+                      overtime_hours=Decimal(str(extra_hours)), actual_work_minutes=Decimal(480 + extra_hours * 60),
+                      carried_in_minutes=Decimal(extra_hours * 30) if day == 1 else Decimal("0"))
+        for day in (1, 2)
+    ]
+    return WorkTimeCalculationResult(
+        employee_id="EMP001", period="2025-05", processing_mode="error" if error else "timecard",
+        time_summary=None if error else TimeSummary(regular_hours=Decimal("16"), overtime_hours=Decimal(str(extra_hours * 2)),
+                                                    total_net_work_hours=Decimal(str(16 + extra_hours * 2))),
+        daily_calculation_details=[] if error else details,
+        warnings=["주의"] if with_alert else [],
+        compliance_alerts=[ComplianceAlert(alert_code="WEEKLY_52H", message="주 52시간 초과",
+                                           details={"week": 1})] if with_alert else [],
+        error=ErrorDetails(error_code="CALC_ERROR", message="계산 실패") if error else None
+    )
+
+
+class TestSimulationResultStore(unittest.TestCase):
+    """simulation_result_store 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.results = {
+            f"조합_{i}": {"result": make_result(i, with_alert=(i == 2)), "policy_set": {"extra": i},
+                          "timestamp": "2025-05-31T00:00:00"}
+            for i in range(4)
+        }
+        self.results["실패"] = {"result": make_result(0, error=True), "policy_set": {"fail": True},
+                              "timestamp": "2025-05-31T00:00:00"}
+
+    def test_round_trip(self):
+        """Parquet/Arrow 저장 후 결과 객체 복원 테스트"""
+        for store_format in ("parquet", "arrow"):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "results")
+                save_results_columnar(self.results, path, format=store_format,
+                                      compression="zstd" if store_format == "parquet" else None)
+                self.assertTrue(is_columnar_store(path))
+
+                loaded = load_results_columnar(path)
+                self.assertEqual(list(loaded), list(self.results))
+                restored = loaded["조합_2"]["result"]
+                self.assertEqual(restored.time_summary.overtime_hours, Decimal("4.0"))
+                self.assertEqual(restored.daily_calculation_details[1].date, datetime.date(2025, 5, 2))
+                self.assertEqual(restored.daily_calculation_details[0].carried_in_minutes, Decimal("60.0"))
+                self.assertEqual(restored.compliance_alerts[0].details, {"week": 1})
+                self.assertEqual(loaded["조합_2"]["policy_set"], {"extra": 2})
+                self.assertIsNone(loaded["실패"]["result"].time_summary)
+                self.assertEqual(loaded["실패"]["result"].error.error_code, "CALC_ERROR")
+
+    def test_projected_filtered_load(self):
+        """컬럼 투영 및 필터 조건 로드 테스트"""
+        for store_format in ("parquet", "arrow"):
+            with tempfile.TemporaryDirectory() as tmp:
+                save_results_columnar(self.results, tmp, format=store_format)
+                table = load_results_table(tmp, "summaries", columns=["policy_name", "total_net_work_hours"],
+                                           filters=[("total_net_work_hours", ">=", 18)])
+                self.assertEqual(table.column_names, ["policy_name", "total_net_work_hours"])
+                self.assertEqual(table.column("policy_name").to_pylist(), ["조합_1", "조합_2", "조합_3"])
+
+                daily = load_results_table(tmp, "daily_details", filters=[("policy_name", "in", ["조합_3"])],
+                                           memory_map=False)
+                self.assertEqual(daily.num_rows, 2)
+
+                subset = load_results_columnar(tmp, policy_names=["조합_1"], include_daily_details=False)
+                self.assertEqual(list(subset), ["조합_1"])
+                self.assertIsNone(subset["조합_1"]["result"].daily_calculation_details)
+
+    def test_invalid_inputs(self):
+        """지원하지 않는 형식/테이블 및 저장소가 아닌 경로 오류 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(ValueError):
+                save_results_columnar(self.results, tmp, format="csv")
+            with self.assertRaises(FileNotFoundError):
+                load_results_table(tmp)
+            save_results_columnar(self.results, tmp)
+            with self.assertRaises(ValueError):
+                load_results_table(tmp, "unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/test_tardiness.py
+"""
+지각/조퇴 공제 계산 엔진 테스트
+"""
+
+import unittest
+import json
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.tardiness import TardinessDeductionEngine, apply_deductions_to_payroll_batch
+
+
+class TestTardinessDeductionEngine(unittest.TestCase):
+    """TardinessDeductionEngine 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.policy = {"standard_start_time": "09:00", "standard_end_time": "18:00",
+                       "deduction_unit": 30, "apply_deduction": True}
+        self.engine = TardinessDeductionEngine(self.policy)
+        self.timecards = {
+            "EMP001": [
+                {"date": "2025-07-01", "actual_clock_in": "09:10", "actual_clock_out": "18:00"},  # 지각 10분 -> 30분
+                {"date": "2025-07-02", "actual_clock_in": "09:31", "actual_clock_out": "17:00"},  # 지각 31분 -> 60분, 조퇴 60분
+                {"date": "2025-07-03", "actual_clock_in": "14:00", "actual_clock_out": "18:00",
+                 "leave_type": "annual_half_day_am"},  # 반차 제외
+                {"date": "2025-07-06", "day_type": "sunday", "actual_clock_in": "11:00",
+                 "actual_clock_out": "15:00"},  # 휴일 제외
+            ],
+            "EMP002": [
+                {"date": "2025-07-01", "actual_clock_in": "08:55", "actual_clock_out": "18:05"},
+                {"date": "2025-07-02", "actual_clock_in": "21:10", "actual_clock_out": "06:00",
+                 "shift_start_time": "21:00", "shift_end_time": "06:00"},  # 야간 스케줄 지각 10분
+            ],
+        }
+
+    def test_daily_rounding(self):
+        """공제 단위 올림 테스트"""
+        daily = self.engine.calculate_daily(self.timecards)
+        emp1 = daily.loc["EMP001"]
+        self.assertEqual(list(emp1["late_minutes"]), [10, 31, 0, 0])
+        self.assertEqual(list(emp1["late_deduction_minutes"]), [30, 60, 0, 0])
+        self.assertEqual(list(emp1["early_leave_deduction_minutes"]), [0, 60, 0, 0])
+        self.assertEqual(list(daily.loc["EMP002"]["late_minutes"]), [0, 10])
+        self.assertEqual(list(daily.loc["EMP002"]["early_leave_minutes"]), [0, 0])
+
+    def test_overnight_shift(self):
+        """자정을 넘기는 야간 근무의 조퇴와 자정 이후 출근(지각) 판정 테스트"""
+        night = {"shift_start_time": "21:00", "shift_end_time": "06:00"}
+        timecards = {"EMP003": [
+            dict(night, date="2025-07-01", actual_clock_in="21:00", actual_clock_out="05:00"),  # 조퇴 60분
+            dict(night, date="2025-07-02", actual_clock_in="00:30", actual_clock_out="06:00"),  # 지각 210분
+            dict(night, date="2025-07-03", actual_clock_in="20:50", actual_clock_out="23:30"),  # 조퇴 390분
+            dict(night, date="2025-07-04", actual_clock_in="20:45", actual_clock_out="06:30"),  # 정상
+            {"date": "2025-07-05", "actual_clock_in": "09:00", "actual_clock_out": "01:00"},  # 주간 근무 연장 퇴근
+        ]}
+        daily = self.engine.calculate_daily(timecards).loc["EMP003"]
+        self.assertEqual(list(daily["late_minutes"]), [0, 210, 0, 0, 0])
+        self.assertEqual(list(daily["early_leave_minutes"]), [60, 0, 390, 0, 0])
+        self.assertEqual(list(daily["early_leave_deduction_minutes"]), [60, 0, 390, 0, 0])
+
+    def test_batch_amounts(self):
+        """공제 금액 계산 테스트"""
+        summary = self.engine.calculate_batch(self.timecards, {"EMP001": 10030, "EMP002": 12000})
+        self.assertEqual(summary.loc["EMP001", "late_count"], 2)
+        self.assertEqual(summary.loc["EMP001", "late_deduction_minutes"], 90)
+        self.assertEqual(summary.loc["EMP001", "lateness_deduction"], 15045)
+        self.assertEqual(summary.loc["EMP001", "early_leave_deduction"], 10030)
+        self.assertEqual(summary.loc["EMP002", "lateness_deduction"], 6000)
+
+        no_deduction = TardinessDeductionEngine(dict(self.policy, apply_deduction=False))
+        summary = no_deduction.calculate_batch(self.timecards, {"EMP001": 10030})
+        self.assertEqual(summary.loc["EMP001", "late_deduction_minutes"], 90)
+        self.assertEqual(summary.loc["EMP001", "lateness_deduction"], 0)
+
+    def test_apply_to_payroll_json(self):
+        """급여 JSON 공제 항목 반영 테스트"""
+        json_path = os.path.join(os.path.dirname(__file__), '..', 'output', 'json', 'EMP001_202507_payroll.json')
+        with open(json_path, 'r', encoding='utf-8') as f:
+            payroll = json.load(f)
+        payroll["gross_pay"] = 2500000.0
+        payroll["deductions"]["total_statutory_deductions"] = 200000.0
+
+        summary = self.engine.calculate_batch(self.timecards, {"EMP001": 10030})
+        apply_deductions_to_payroll_batch({"EMP001": payroll}, summary)
+
+        deductions = payroll["deductions"]
+        self.assertEqual(deductions["lateness_deduction"], 15045.0)
+        self.assertEqual(deductions["early_leave_deduction"], 10030.0)
+        self.assertEqual(deductions["total_other_deductions"], 25075.0)
+        self.assertEqual(deductions["total_all_deductions"], 225075.0)
+        self.assertEqual(payroll["net_pay"], 2274925.0)
+        self.assertEqual(payroll["work_time_summary"]["summary"]["total_late_days"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# tests/test_timecard_batch.py
+"""
+TimeCardBasedCalculator 근무 패턴 중복 제거 배치 계산 테스트
+"""
+
+import unittest
+import datetime
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.schema import TimeCardInputData, TimeCardRecord
+from Payslip.Worktime.calculator import TimeCardBasedCalculator
+
+
+class TestTimeCardPatternBatch(unittest.TestCase):
+    """calculate_batch 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.calculator = TimeCardBasedCalculator({"company_settings": {"daily_work_minutes_standard": 480}})
+        self.inputs = []
+        for emp_idx in range(5):
+            records = [
+                TimeCardRecord(date=datetime.date(2025, 5, day), start_time="09:00", end_time="18:00", break_time_minutes=60)
+                for day in range(1, 11)
+            ]
+            records.append(TimeCardRecord(date=datetime.date(2025, 5, 12), start_time="09:00", end_time="21:00",
+                                          break_time_minutes=60))
+            self.inputs.append(TimeCardInputData(employee_id=f"EMP{emp_idx:03d}", period="2025-05", records=records))
+
+    def test_batch_matches_individual_calculation(self):
+        """패턴 배치 결과가 개별 계산 결과와 일치하는지 테스트"""
+        batch = self.calculator.calculate_batch(self.inputs)
+        for input_data, batch_result in zip(self.inputs, batch["results"]):
+            expected = self.calculator.calculate(input_data)
+            self.assertEqual(batch_result["time_summary"], expected["time_summary"])
+            self.assertEqual(batch_result["daily_details"], expected["daily_details"])
+            self.assertEqual(batch_result["warnings"], expected["warnings"])
+            self.assertEqual(batch_result["compliance_alerts"], expected["compliance_alerts"])
+
+    def test_pattern_report(self):
+        """압축률 보고서 테스트 (5월 4일은 일요일 휴일 패턴)"""
+        report = self.calculator.calculate_batch(self.inputs)["pattern_report"]
+        self.assertEqual(report["employees"], 5)
+        self.assertEqual(report["total_days"], 55)
+        self.assertEqual(report["unique_patterns"], 3)
+        self.assertAlmostEqual(report["compression_ratio"], round(55 / 3, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
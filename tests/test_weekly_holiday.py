@@ -0,0 +1,127 @@
+# tests/test_weekly_holiday.py
+"""
+주휴수당 일괄 계산 엔진 및 기간 달력 테스트
+"""
+
+import unittest
+import datetime
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.period_calendar import PeriodCalendar
+from Payslip.Worktime.weekly_holiday import WeeklyHolidayAllowanceEngine, build_minutes_matrix, build_leading_minutes
+from Payslip.Worktime.work_time_module import WorkTimeCalculator
+
+
+class TestWeeklyHolidayAllowanceEngine(unittest.TestCase):
+    """WeeklyHolidayAllowanceEngine 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        # 2025-06: 6/1(일)이 0주차, 6/2~6/8이 1주차, ..., 6/30(월)은 다음 기간에 판정
+        self.calendar = PeriodCalendar("2025-06", holiday_dates=[datetime.date(2025, 6, 6)])
+        self.engine = WeeklyHolidayAllowanceEngine(
+            {"min_hours": 15, "allowance_hours": 8, "include_first_week": False}
+        )
+        weekdays = (self.calendar.weekdays < 5).astype(np.float64)
+        self.minutes = np.vstack([
+            weekdays * 480,  # 주 40시간
+            weekdays * 180,  # 주 15시간 (비례 주휴)
+            weekdays * 120,  # 주 10시간 (미발생)
+        ])
+        self.employee_ids = ["FULL", "PART15", "PART10"]
+
+    def test_calendar_weeks_and_holidays(self):
+        """기간 달력 주차/휴일 테스트"""
+        self.assertEqual(self.calendar.num_days, 30)
+        self.assertEqual(self.calendar.num_weeks, 6)
+        self.assertEqual(self.calendar.week_starts[1], datetime.date(2025, 6, 2))
+        self.assertTrue(self.calendar.holiday_mask[5])   # 6/6 현충일
+        self.assertTrue(self.calendar.holiday_mask[0])   # 6/1 일요일
+        self.assertFalse(self.calendar.holiday_mask[1])  # 6/2 월요일
+        self.assertEqual(self.calendar.next_period(), "2025-07")
+
+    def test_eligibility_and_proportional_allowance(self):
+        """주 15시간 기준 발생 여부 및 비례 주휴 시간 테스트"""
+        frame = self.engine.calculate(self.calendar, self.employee_ids, self.minutes)
+        week = frame.xs(np.datetime64("2025-06-09"), level="week_start")
+        self.assertTrue(week.loc["FULL", "eligible"])
+        self.assertEqual(week.loc["FULL", "allowance_hours"], 8.0)
+        self.assertTrue(week.loc["PART15", "eligible"])
+        self.assertEqual(week.loc["PART15", "allowance_hours"], 3.0)
+        self.assertFalse(week.loc["PART10", "eligible"])
+
+        # 6/30이 속한 주는 7월에 판정
+        last_week = frame.xs(np.datetime64("2025-06-30"), level="week_start")
+        self.assertFalse(last_week["eligible"].any())
+
+        summary = self.engine.summarize(frame)
+        self.assertEqual(summary.loc["FULL", "eligible_weeks"], 4)
+        self.assertEqual(summary.loc["FULL", "allowance_hours"], 32.0)
+        self.assertEqual(summary.loc["PART10", "eligible_weeks"], 0)
+
+    def test_first_week_rule(self):
+        """입사 첫 주 제외/포함 정책 테스트"""
+        hire_dates = [datetime.date(2025, 6, 11), None, None]
+        frame = self.engine.calculate(self.calendar, self.employee_ids, self.minutes * 2, hire_dates=hire_dates)
+        hire_week = frame.loc[("FULL", np.datetime64("2025-06-09"))]
+        self.assertTrue(hire_week["is_first_week"])
+        self.assertFalse(hire_week["eligible"])
+        self.assertFalse(frame.loc[("FULL", np.datetime64("2025-06-02")), "eligible"])
+
+        including = WeeklyHolidayAllowanceEngine({"min_hours": 15, "allowance_hours": 8, "include_first_week": True})
+        frame = including.calculate(self.calendar, self.employee_ids, self.minutes * 2, hire_dates=hire_dates)
+        self.assertTrue(frame.loc[("FULL", np.datetime64("2025-06-09")), "eligible"])
+
+    def test_build_minutes_matrix_from_batch(self):
+        """WorkTimeCalculator 배치 결과로부터 분 행렬 생성 테스트"""
+        records = [
+            {"date": f"2025-06-{day:02d}", "actual_clock_in": "09:00", "actual_clock_out": "18:00",
+             "break_time_minutes": 60, "leave_type": "", "leave_hours": 0}
+            for day in range(9, 14)
+        ]
+        batch = WorkTimeCalculator().calculate_monthly_work_hours_batch({"EMP001": records}, "2025-06-01", "2025-06-30")
+        matrix = build_minutes_matrix(batch, self.calendar)
+        self.assertEqual(matrix["employee_ids"], ["EMP001"])
+        self.assertEqual(matrix["minutes"].shape, (1, 30))
+        self.assertEqual(matrix["minutes"][0, 8], 480)
+
+        frame = self.engine.calculate(self.calendar, matrix["employee_ids"], matrix["minutes"])
+        self.assertEqual(frame.loc[("EMP001", np.datetime64("2025-06-09")), "allowance_hours"], 8.0)
+
+    def test_leading_week_needs_previous_period(self):
+        """이전 기간에서 시작된 첫 주는 이전 기간 근로시간이 있을 때만 판정되는지 테스트"""
+        # 2025-07: 7/1(화)이 속한 0주차는 6/30(월)부터 시작
+        july = PeriodCalendar("2025-07")
+        july_records = [
+            {"date": f"2025-07-{day:02d}", "actual_clock_in": "09:00", "actual_clock_out": "18:00",
+             "break_time_minutes": 60, "leave_type": "", "leave_hours": 0}
+            for day in range(1, 5)
+        ]
+        june_records = [{"date": "2025-06-30", "actual_clock_in": "09:00", "actual_clock_out": "18:00",
+                         "break_time_minutes": 60, "leave_type": "", "leave_hours": 0}]
+        calculator = WorkTimeCalculator()
+        july_batch = calculator.calculate_monthly_work_hours_batch({"EMP001": july_records}, "2025-07-01", "2025-07-31")
+        june_batch = calculator.calculate_monthly_work_hours_batch({"EMP001": june_records}, "2025-06-01", "2025-06-30")
+        matrix = build_minutes_matrix(july_batch, july)
+
+        # 이전 기간 근로시간 없이는 미완결 주로 남아 미발생으로 판정하지 않음
+        frame = self.engine.calculate(july, matrix["employee_ids"], matrix["minutes"])
+        first_week = frame.loc[("EMP001", np.datetime64("2025-06-30"))]
+        self.assertFalse(first_week["is_complete"])
+        self.assertFalse(first_week["eligible"])
+
+        leading = build_leading_minutes(june_batch, july, matrix["employee_ids"])
+        self.assertEqual(list(leading), [480.0])
+        frame = self.engine.calculate(july, matrix["employee_ids"], matrix["minutes"], leading_minutes=leading)
+        first_week = frame.loc[("EMP001", np.datetime64("2025-06-30"))]
+        self.assertTrue(first_week["is_complete"])
+        self.assertEqual(first_week["week_hours"], 40.0)
+        self.assertEqual(first_week["allowance_hours"], 8.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# tests/test_work_time_batch.py
+"""
+WorkTimeCalculator 배치 API 테스트
+
+calculate_monthly_work_hours_batch가 일별 계산(calculate_daily_work_details)과
+동일한 결과를 내는지 검증합니다.
+"""
+
+import unittest
+import sys
+import os
+
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Payslip.Worktime.work_time_module import WorkTimeCalculator
+
+
+class TestWorkTimeCalculatorBatch(unittest.TestCase):
+    """calculate_monthly_work_hours_batch 테스트 케이스"""
+
+    def setUp(self):
+        """각 테스트 실행 전 설정"""
+        self.calculator = WorkTimeCalculator()
+        self.records = [
+            {"date": "2025-07-01", "day_type": "weekday", "actual_clock_in": "08:50", "actual_clock_out": "20:30",
+             "break_time_minutes": 60, "leave_type": "", "leave_hours": 0},
+            {"date": "2025-07-02", "day_type": "weekday", "actual_clock_in": "09:00", "actual_clock_out": "13:00",
+             "break_time_minutes": 0, "leave_type": "annual_half_day_pm", "leave_hours": 4},
+            {"date": "2025-07-06", "day_type": "sunday", "actual_clock_in": "10:00", "actual_clock_out": "19:30",
+             "break_time_minutes": 60, "is_holiday_work": True, "leave_type": "", "leave_hours": 0},
+            {"date": "2025-07-07", "day_type": "weekday", "actual_clock_in": "21:00", "actual_clock_out": "07:10",
+             "break_time_minutes": 60, "leave_type": "", "leave_hours": 0},
+            {"date": "2025-08-01", "day_type": "weekday", "actual_clock_in": "09:00", "actual_clock_out": "18:00",
+             "break_time_minutes": 60, "leave_type": "", "leave_hours": 0},
+        ]
+
+    def test_batch_matches_daily_calculation(self):
+        """배치 결과가 일별 계산 결과와 일치하는지 테스트"""
+        frame = self.calculator.calculate_monthly_work_hours_batch(
+            {"EMP001": self.records, "EMP002": self.records[:2]}, "2025-07-01", "2025-07-31"
+        )
+        columns = WorkTimeCalculator.BATCH_HOUR_COLUMNS + WorkTimeCalculator.BATCH_MINUTE_COLUMNS
+
+        for record in self.records[:4]:
+            expected = self.calculator.calculate_daily_work_details(record)
+            row = frame.loc[("EMP001", pd.Timestamp(record["date"]))]
+            for column in columns:
+                self.assertAlmostEqual(float(row[column]), float(expected[column]), places=6,
+                                       msg=f"{record['date']} {column}")
+
+    def test_batch_filters_period_and_indexes_by_employee_date(self):
+        """기간 밖 기록 제외 및 (직원, 날짜) 인덱스 테스트"""
+        frame = self.calculator.calculate_monthly_work_hours_batch(
+            {"EMP001": self.records, "EMP002": self.records[:2]}, "2025-07-01", "2025-07-31"
+        )
+        self.assertEqual(list(frame.index.names), ["employee_id", "date"])
+        self.assertEqual(len(frame), 6)
+        self.assertNotIn(("EMP001", pd.Timestamp("2025-08-01")), frame.index)
+
+    def test_batch_interns_repeated_time_strings(self):
+        """반복되는 시간 문자열이 한 번만 파싱되는지 테스트"""
+        self.calculator.calculate_monthly_work_hours_batch(
+            {f"EMP{i:03d}": self.records for i in range(50)}, "2025-07-01", "2025-07-31"
+        )
+        unique_times = {r["actual_clock_in"] for r in self.records} | {r["actual_clock_out"] for r in self.records}
+        unique_times |= {"09:00", "18:00"}
+        self.assertEqual(set(self.calculator._time_minutes_cache), unique_times)
+
+    def test_batch_invalid_time_produces_warning(self):
+        """시간 형식 오류 기록 처리 테스트"""
+        frame = self.calculator.calculate_monthly_work_hours_batch(
+            {"EMP001": [{"date": "2025-07-01", "actual_clock_in": "25:00", "actual_clock_out": "18:00"}]},
+            "2025-07-01", "2025-07-31"
+        )
+        row = frame.iloc[0]
+        self.assertEqual(row["warnings"], ["시간 형식 오류"])
+        self.assertEqual(row["regular_hours"], 0)
+
+    def test_summarize_monthly_batch(self):
+        """직원별 월 합계 집계 테스트"""
+        frame = self.calculator.calculate_monthly_work_hours_batch(
+            {"EMP001": self.records}, "2025-07-01", "2025-07-31"
+        )
+        summary = self.calculator.summarize_monthly_batch(frame)
+        monthly = self.calculator.calculate_monthly_work_hours("EMP001", self.records[:4], "2025-07-01", "2025-07-31")
+        self.assertEqual(int(summary.loc["EMP001", "total_work_days"]), monthly["total_work_days"])
+        self.assertAlmostEqual(float(summary.loc["EMP001", "regular_hours"]),
+                               float(monthly["detailed_hours"]["regular_hours"]), places=2)
+
+
+if __name__ == '__main__':
+    unittest.main()